@@ -0,0 +1,259 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""A closed-loop load-generating benchmark client.
+
+Each of a number of client processes opens a number of channels, each of
+which is driven by a number of threads that make round trips to the server
+back to back for the length of the run. Latencies and processor time are
+measured after a warm-up period and aggregated across processes into a JSON
+report written to standard output.
+
+The client processes are started as new interpreters running this module
+rather than forked from this process, because the C core initialized when this
+process imports the extension does not survive a fork.
+"""
+
+import argparse
+import pickle
+import subprocess
+import sys
+import threading
+import time
+
+from grpc.framework.foundation import histogram
+
+from benchmark import reporting
+from benchmark import workloads
+
+# The length of time allowed for the set-up and tear-down of a process's
+# channels beyond the warm-up and measurement periods.
+_GRACE = 10
+# The length of time allowed for client processes to start before they all
+# begin warming up.
+_START_DELAY = 2
+
+
+def _args():
+  parser = argparse.ArgumentParser()
+  parser.add_argument(
+      '--server_host', help='the host to which to connect', type=str,
+      default='localhost')
+  parser.add_argument(
+      '--server_port', help='the port to which to connect', type=int,
+      required=True)
+  parser.add_argument(
+      '--use_tls', help='require a secure connection', dest='use_tls',
+      action='store_true')
+  parser.add_argument(
+      '--use_test_ca', help='replace platform root CAs with ca.pem',
+      action='store_true')
+  parser.add_argument(
+      '--cardinality', help='the cardinality of the RPCs to make',
+      choices=workloads.CARDINALITIES, default=workloads.UNARY_UNARY)
+  parser.add_argument(
+      '--payload_size', help='the size in bytes of request and response',
+      type=int, default=0)
+  parser.add_argument(
+      '--processes', help='the number of client processes', type=int,
+      default=1)
+  parser.add_argument(
+      '--channels', help='the number of channels per client process',
+      type=int, default=1)
+  parser.add_argument(
+      '--concurrency', help='the number of outstanding RPCs per channel',
+      type=int, default=1)
+  parser.add_argument(
+      '--warmup', help='the length of the warm-up period in seconds',
+      type=float, default=2)
+  parser.add_argument(
+      '--duration', help='the length of the measurement period in seconds',
+      type=float, default=10)
+  # Given only to client processes, as the time at which to begin warming up.
+  parser.add_argument('--start', help=argparse.SUPPRESS, type=float)
+  return parser.parse_args()
+
+
+class _Outcomes(object):
+  """The outcomes of the measured round trips of one thread.
+
+  Attributes:
+    latencies: A histogram.Histogram of the latencies in seconds of the round
+      trips that succeeded.
+    failures: The number of round trips that failed.
+  """
+
+  def __init__(self):
+    self.latencies = histogram.Histogram()
+    self.failures = 0
+
+
+def _loop(round_trip, measurement_start, measurement_end, outcomes):
+  while True:
+    start = time.time()
+    if measurement_end <= start:
+      return
+    try:
+      round_trip()
+    except Exception:  # pylint: disable=broad-except
+      failed = True
+    else:
+      failed = False
+    end = time.time()
+    if measurement_start <= start:
+      if failed:
+        outcomes.failures += 1
+      else:
+        outcomes.latencies.record(end - start)
+
+
+def _drive(args, start):
+  """Drives the server from a single client process.
+
+  Args:
+    args: The parsed command-line arguments.
+    start: The time at which all processes begin warming up.
+
+  Returns:
+    A triple of the histogram.Snapshot of the latencies of measured round trips
+      that succeeded, the number of measured round trips that failed, and the
+      processor time used during the measurement period.
+  """
+  measurement_start = start + args.warmup
+  measurement_end = measurement_start + args.duration
+  timeout = args.warmup + args.duration + _GRACE
+  stubs = [
+      workloads.interop_stub(
+          args.server_host, args.server_port, args.use_tls, args.use_test_ca)
+      for _ in range(args.channels)]
+  for stub in stubs:
+    stub.__enter__()
+  try:
+    round_trips = [
+        workloads.round_trip(
+            stub, args.cardinality, args.payload_size, timeout)
+        for stub in stubs for _ in range(args.concurrency)]
+    thread_outcomes = [_Outcomes() for _ in round_trips]
+    threads = [
+        threading.Thread(
+            target=_loop,
+            args=(round_trip, measurement_start, measurement_end, outcomes))
+        for round_trip, outcomes in zip(round_trips, thread_outcomes)]
+    for thread in threads:
+      thread.daemon = True
+      thread.start()
+    time.sleep(max(0, measurement_start - time.time()))
+    cpu_start = reporting.cpu_seconds()
+    time.sleep(max(0, measurement_end - time.time()))
+    cpu_seconds = reporting.cpu_seconds() - cpu_start
+    for thread in threads:
+      thread.join()
+    for round_trip in round_trips:
+      round_trip.close()
+  finally:
+    for stub in stubs:
+      stub.__exit__(None, None, None)
+
+  latencies = histogram.Histogram()
+  failures = 0
+  for outcomes in thread_outcomes:
+    latencies.merge(outcomes.latencies.snapshot())
+    failures += outcomes.failures
+  return latencies.snapshot(), failures, cpu_seconds
+
+
+def _start_processes(args, start):
+  command = [sys.executable, '-m', 'benchmark.client'] + sys.argv[1:] + [
+      '--start', repr(start)]
+  return [
+      subprocess.Popen(command, stdout=subprocess.PIPE)
+      for _ in range(args.processes)]
+
+
+def _collect(processes):
+  """Collects the measurements of the client processes.
+
+  Args:
+    processes: The subprocess.Popens of the client processes.
+
+  Returns:
+    A list of the values returned by _drive in the client processes.
+
+  Raises:
+    RuntimeError: If any client process failed.
+  """
+  measurements = []
+  for process in processes:
+    output, _ = process.communicate()
+    if process.returncode != 0:
+      raise RuntimeError(
+          'A client process failed with exit status %d!' % process.returncode)
+    measurements.append(pickle.loads(output))
+  return measurements
+
+
+def _benchmark():
+  args = _args()
+  if args.start is not None:
+    pickle.dump(_drive(args, args.start), sys.stdout, pickle.HIGHEST_PROTOCOL)
+    return
+
+  processes = _start_processes(args, time.time() + _START_DELAY)
+  try:
+    measurements = _collect(processes)
+  except BaseException:
+    for process in processes:
+      if process.poll() is None:
+        process.terminate()
+    raise
+
+  latencies = histogram.Histogram()
+  failures = 0
+  cpu_seconds = 0
+  for process_latencies, process_failures, process_cpu_seconds in measurements:
+    latencies.merge(process_latencies)
+    failures += process_failures
+    cpu_seconds += process_cpu_seconds
+
+  parameters = {
+      'cardinality': args.cardinality,
+      'payload_size': args.payload_size,
+      'processes': args.processes,
+      'channels': args.channels,
+      'concurrency': args.concurrency,
+      'secure': args.use_tls,
+  }
+  report = reporting.report(
+      parameters, latencies.snapshot(), args.duration, cpu_seconds)
+  report['failures'] = failures
+  reporting.write(report)
+
+
+if __name__ == '__main__':
+  _benchmark()
@@ -0,0 +1,258 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Microbenchmarks of the packets and face layers of RPC Framework.
+
+A face-layer Stub and Servicer built over the stock test service are linked
+through a packets-based Front and Back without any transport, either through
+an in_memory.Link or with the Front and Back joined to one another directly
+(so that tickets are delivered synchronously in the transmitting thread). For
+each link, service style, and RPC cardinality a sequence of RPCs is made back
+to back and its throughput, its cyclic garbage, and the number of pieces of
+work it handed to thread pools are reported per RPC as JSON.
+
+Python 2 has no allocation counter, so allocation is measured as the number of
+objects left for the cycle collector: automatic garbage collection is disabled
+while the RPCs are made and the objects found unreachable afterward are
+counted.
+"""
+
+import argparse
+import gc
+import threading
+import time
+
+from grpc.framework.base.packets import implementations as packets_implementations
+from grpc.framework.base.packets import in_memory
+from grpc.framework.face import implementations as face_implementations
+from grpc.framework.face.testing import control
+from grpc.framework.face.testing import digest
+from grpc.framework.face.testing import stock_service
+from grpc.framework.foundation import logging_pool
+
+from benchmark import reporting
+
+IN_MEMORY = 'in_memory'
+DIRECT = 'direct'
+LINKS = (IN_MEMORY, DIRECT)
+
+INLINE = 'inline'
+EVENT = 'event'
+STYLES = (INLINE, EVENT)
+
+UNARY_UNARY = 'unary_unary'
+UNARY_STREAM = 'unary_stream'
+STREAM_UNARY = 'stream_unary'
+STREAM_STREAM = 'stream_stream'
+CARDINALITIES = (UNARY_UNARY, UNARY_STREAM, STREAM_UNARY, STREAM_STREAM)
+
+_POOL_SIZE = 20
+_DEFAULT_TIMEOUT = 30
+_MAXIMUM_TIMEOUT = 90
+_WARM_UP_OPERATIONS = 20
+
+
+class _CountingPool(object):
+  """A thread pool that counts the work submitted to it."""
+
+  def __init__(self, pool, counter):
+    self._pool = pool
+    self._counter = counter
+
+  def submit(self, fn, *args, **kwargs):
+    self._counter.increment()
+    return self._pool.submit(fn, *args, **kwargs)
+
+  def shutdown(self, wait=True):
+    self._pool.shutdown(wait=wait)
+
+
+class _Counter(object):
+
+  def __init__(self):
+    self._lock = threading.Lock()
+    self.count = 0
+
+  def increment(self):
+    with self._lock:
+      self.count += 1
+
+
+def _servicer(test_digest, style, pool):
+  if style == INLINE:
+    return face_implementations.servicer(
+        pool,
+        inline_value_in_value_out_methods=(
+            test_digest.inline_unary_unary_methods),
+        inline_value_in_stream_out_methods=(
+            test_digest.inline_unary_stream_methods),
+        inline_stream_in_value_out_methods=(
+            test_digest.inline_stream_unary_methods),
+        inline_stream_in_stream_out_methods=(
+            test_digest.inline_stream_stream_methods))
+  else:
+    return face_implementations.servicer(
+        pool,
+        event_value_in_value_out_methods=test_digest.event_unary_unary_methods,
+        event_value_in_stream_out_methods=(
+            test_digest.event_unary_stream_methods),
+        event_stream_in_value_out_methods=(
+            test_digest.event_stream_unary_methods),
+        event_stream_in_stream_out_methods=(
+            test_digest.event_stream_stream_methods))
+
+
+def _operation(stub, test_digest, cardinality):
+  """Creates a behavior that makes one RPC of the given cardinality."""
+  if cardinality == UNARY_UNARY:
+    name, messages_sequence = sorted(
+        test_digest.unary_unary_messages_sequences.iteritems())[0]
+    request = messages_sequence[0].request()
+    return lambda: stub.blocking_value_in_value_out(
+        name, request, _DEFAULT_TIMEOUT)
+  elif cardinality == UNARY_STREAM:
+    name, messages_sequence = sorted(
+        test_digest.unary_stream_messages_sequences.iteritems())[0]
+    request = messages_sequence[0].request()
+    return lambda: list(stub.inline_value_in_stream_out(
+        name, request, _DEFAULT_TIMEOUT))
+  elif cardinality == STREAM_UNARY:
+    name, messages_sequence = sorted(
+        test_digest.stream_unary_messages_sequences.iteritems())[0]
+    requests = messages_sequence[0].requests()
+    return lambda: stub.blocking_stream_in_value_out(
+        name, iter(requests), _DEFAULT_TIMEOUT)
+  else:
+    name, messages_sequence = sorted(
+        test_digest.stream_stream_messages_sequences.iteritems())[0]
+    requests = messages_sequence[0].requests()
+    return lambda: list(stub.inline_stream_in_stream_out(
+        name, iter(requests), _DEFAULT_TIMEOUT))
+
+
+def _measure(operation, operations, counter):
+  for _ in range(_WARM_UP_OPERATIONS):
+    operation()
+  gc.collect()
+  gc.disable()
+  try:
+    submissions = counter.count
+    start = time.time()
+    for _ in range(operations):
+      operation()
+    duration = time.time() - start
+    handoffs = counter.count - submissions
+    garbage = gc.collect()
+  finally:
+    gc.enable()
+  return {
+      'operations': operations,
+      'ops_per_second': operations / duration,
+      'garbage_per_operation': garbage / float(operations),
+      'handoffs_per_operation': handoffs / float(operations),
+  }
+
+
+def benchmark(link, style, cardinality, operations):
+  """Measures RPCs of one cardinality through one configuration.
+
+  Args:
+    link: One of LINKS.
+    style: One of STYLES.
+    cardinality: One of CARDINALITIES.
+    operations: The number of RPCs to measure.
+
+  Returns:
+    A dictionary of measurements suitable for serialization as JSON.
+  """
+  counter = _Counter()
+  pools = [
+      _CountingPool(logging_pool.pool(_POOL_SIZE), counter)
+      for _ in range(8)]
+  (link_pool, front_work_pool, front_transmission_pool, front_utility_pool,
+   back_work_pool, back_transmission_pool, back_utility_pool,
+   servicer_pool) = pools
+  test_digest = digest.digest(
+      stock_service.STOCK_TEST_SERVICE, control.PauseFailControl(),
+      servicer_pool if style == EVENT else None)
+  front = packets_implementations.front(
+      front_work_pool, front_transmission_pool, front_utility_pool)
+  back = packets_implementations.back(
+      _servicer(test_digest, style, servicer_pool), back_work_pool,
+      back_transmission_pool, back_utility_pool, _DEFAULT_TIMEOUT,
+      _MAXIMUM_TIMEOUT)
+  if link == IN_MEMORY:
+    memory_link = in_memory.Link(link_pool)
+    front.join_rear_link(memory_link)
+    memory_link.join_fore_link(front)
+    back.join_fore_link(memory_link)
+    memory_link.join_rear_link(back)
+  else:
+    front.join_rear_link(back)
+    back.join_fore_link(front)
+  stub = face_implementations.stub(front, servicer_pool)
+
+  try:
+    measurements = _measure(
+        _operation(stub, test_digest, cardinality), operations, counter)
+  finally:
+    for pool in pools:
+      pool.shutdown(wait=True)
+
+  measurements.update(link=link, style=style, cardinality=cardinality)
+  return measurements
+
+
+def _args():
+  parser = argparse.ArgumentParser()
+  parser.add_argument(
+      '--operations', help='the number of RPCs to measure per configuration',
+      type=int, default=1000)
+  parser.add_argument(
+      '--links', help='the links through which to make RPCs',
+      nargs='+', choices=LINKS, default=LINKS)
+  parser.add_argument(
+      '--styles', help='the service styles to measure',
+      nargs='+', choices=STYLES, default=STYLES)
+  parser.add_argument(
+      '--cardinalities', help='the RPC cardinalities to measure',
+      nargs='+', choices=CARDINALITIES, default=CARDINALITIES)
+  return parser.parse_args()
+
+
+def _benchmark():
+  args = _args()
+  reporting.write([
+      benchmark(link, style, cardinality, args.operations)
+      for link in args.links for style in args.styles
+      for cardinality in args.cardinalities])
+
+
+if __name__ == '__main__':
+  _benchmark()
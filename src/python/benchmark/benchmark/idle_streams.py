@@ -0,0 +1,136 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Measures the memory and threads held by idle streaming operations.
+
+A packets-based Front and Back are joined directly to one another and a
+number of stream-stream operations are commenced and left idle. The growth in
+the process's resident set size and thread count is reported, per operation,
+as JSON.
+"""
+
+import argparse
+import gc
+import resource
+import threading
+import time
+
+from grpc.framework.base import interfaces_test_case
+from grpc.framework.base import util
+from grpc.framework.base.packets import implementations
+from grpc.framework.foundation import logging_pool
+from grpc.framework.foundation import stream_testing
+
+from benchmark import reporting
+
+_POOL_SIZE = 8
+_TIMEOUT = 60 * 60
+_POLL_PERIOD = 0.1
+
+
+def _resident_bytes():
+  # The second field of statm is the resident set size in pages (Linux only).
+  with open('/proc/self/statm') as statm:
+    return int(statm.read().split()[1]) * resource.getpagesize()
+
+
+def benchmark(streams):
+  """Measures the cost of holding idle streams.
+
+  Args:
+    streams: The number of idle streams to hold open at once.
+
+  Returns:
+    A dictionary of measurements suitable for serialization as JSON.
+  """
+  pools = [logging_pool.pool(_POOL_SIZE) for _ in range(7)]
+  (front_work_pool, front_transmission_pool, front_utility_pool,
+   back_work_pool, back_transmission_pool, back_utility_pool,
+   servicer_pool) = pools
+  front = implementations.front(
+      front_work_pool, front_transmission_pool, front_utility_pool)
+  back = implementations.back(
+      interfaces_test_case.TestServicer(servicer_pool), back_work_pool,
+      back_transmission_pool, back_utility_pool, _TIMEOUT, _TIMEOUT)
+  front.join_rear_link(back)
+  back.join_fore_link(front)
+
+  def operate():
+    subscription = util.full_serviced_subscription(
+        interfaces_test_case.EasyServicedIngestor(
+            stream_testing.TestConsumer()))
+    return front.operate(
+        interfaces_test_case.SYNCHRONOUS_ECHO, None, False, _TIMEOUT,
+        subscription, None)
+
+  try:
+    operate().cancel()
+    util.wait_for_idle(back)
+    gc.collect()
+    resident_before = _resident_bytes()
+    threads_before = threading.active_count()
+    start = time.time()
+    operations = [operate() for _ in range(streams)]
+    while len(back.operations()) < streams:
+      time.sleep(_POLL_PERIOD)
+    duration = time.time() - start
+    gc.collect()
+    resident_growth = _resident_bytes() - resident_before
+    thread_growth = threading.active_count() - threads_before
+    for operation in operations:
+      operation.cancel()
+    util.wait_for_idle(back)
+    util.wait_for_idle(front)
+  finally:
+    for pool in pools:
+      pool.shutdown(wait=True)
+
+  return {
+      'streams': streams,
+      'streams_opened_per_second': streams / duration,
+      'resident_bytes_per_stream': resident_growth / float(streams),
+      'threads_per_stream': thread_growth / float(streams),
+  }
+
+
+def _args():
+  parser = argparse.ArgumentParser()
+  parser.add_argument(
+      '--streams', help='the numbers of idle streams to hold open',
+      nargs='+', type=int, default=(1000, 10000, 50000))
+  return parser.parse_args()
+
+
+def _benchmark():
+  args = _args()
+  reporting.write([benchmark(streams) for streams in args.streams])
+
+
+if __name__ == '__main__':
+  _benchmark()
@@ -0,0 +1,275 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Throughput benchmarks of the C extension beneath the _adapter links.
+
+A _low.Server and a _low.Channel are created in the same process and driven
+directly from a single thread through their completion queues, with no links,
+no framework, and no thread pools. Each RPC is invoked, serviced, accepted,
+echoes some number of messages of a given size, is completed, and has its
+status sent, exactly as the _low tests exercise the extension. The results
+are a baseline against which the fore and rear links and the framework layers
+above them can be compared.
+
+Time spent in the extension with the GIL held is estimated as all wall time
+outside CompletionQueue.get, the only _low call that releases the GIL (the
+construction of event objects after the GIL is reacquired within get is thus
+not counted). The extension copies every written message once (into a slice)
+and every read message twice (out of the byte buffer's slices and then into a
+bytes object); bytes copied are counted accordingly.
+"""
+
+import argparse
+import collections
+import time
+
+from grpc._adapter import _low
+
+from benchmark import reporting
+
+UNARY = 'unary'
+STREAMING = 'streaming'
+SCENARIOS = (UNARY, STREAMING)
+
+INVOKE = 'invoke'
+SERVICE = 'service'
+ACCEPT = 'accept'
+WRITE = 'write'
+READ = 'read'
+COMPLETE = 'complete'
+STATUS = 'status'
+PHASES = (INVOKE, SERVICE, ACCEPT, WRITE, READ, COMPLETE, STATUS)
+
+_HOST = 'localhost'
+_METHOD = 'benchmark method'
+_DETAILS = 'benchmark details'
+_FUTURE = time.time() + 60 * 60 * 24
+_WRITE_COPIES = 1
+_READ_COPIES = 2
+_WARM_UP_RPCS = 20
+# The driver waits for each write to be accepted before reading it at the other
+# end, so a message (with its five-byte gRPC frame header) must fit within the
+# initial HTTP/2 flow-control window of 65535 bytes.
+_MAXIMUM_MESSAGE_SIZE = 65535 - 5
+
+_METADATA_TAG = object()
+_FINISH_TAG = object()
+_SERVICE_TAG = object()
+_WRITE_TAG = object()
+_READ_TAG = object()
+_COMPLETE_TAG = object()
+_STATUS_TAG = object()
+
+
+class _Ledger(object):
+  """Accumulates the costs of driving the extension."""
+
+  def __init__(self):
+    self.events = 0
+    self.messages = 0
+    self.bytes_copied = 0
+    self.waiting = 0.0
+    self.phase_durations = collections.defaultdict(float)
+    self.phase_calls = collections.defaultdict(int)
+
+
+class _Driver(object):
+  """Drives one in-process server and channel through their queues."""
+
+  def __init__(self):
+    self._server_completion_queue = _low.CompletionQueue()
+    self._server = _low.Server(self._server_completion_queue, None)
+    port = self._server.add_http2_addr('[::]:0')
+    self._server.start()
+    self._client_completion_queue = _low.CompletionQueue()
+    self._channel = _low.Channel('%s:%d' % (_HOST, port), None)
+    self.ledger = _Ledger()
+
+  def _perform(self, phase, behavior, *args):
+    start = time.time()
+    behavior(*args)
+    self.ledger.phase_durations[phase] += time.time() - start
+    self.ledger.phase_calls[phase] += 1
+
+  def _events(self, completion_queue, count):
+    events = {}
+    start = time.time()
+    for _ in range(count):
+      event = completion_queue.get(_FUTURE)
+      events[event.kind] = event
+    self.ledger.waiting += time.time() - start
+    self.ledger.events += count
+    return events
+
+  def _echo(self, client_call, server_call, message):
+    self._perform(WRITE, client_call.write, message, _WRITE_TAG)
+    self._events(self._client_completion_queue, 1)
+    self._perform(READ, server_call.read, _READ_TAG)
+    received = self._events(self._server_completion_queue, 1)[
+        _low.Event.Kind.READ_ACCEPTED].bytes
+    self._perform(WRITE, server_call.write, received, _WRITE_TAG)
+    self._events(self._server_completion_queue, 1)
+    self._perform(READ, client_call.read, _READ_TAG)
+    self._events(self._client_completion_queue, 1)
+    self.ledger.messages += 2
+    self.ledger.bytes_copied += (
+        (_WRITE_COPIES + _READ_COPIES) * (len(message) + len(received)))
+
+  def rpc(self, messages):
+    """Performs one RPC that echoes each of the given messages.
+
+    Args:
+      messages: A sequence of bytes objects to be sent by the client and
+        echoed back by the server.
+
+    Raises:
+      ValueError: If the RPC did not complete with an OK status.
+    """
+    client_call = _low.Call(self._channel, _METHOD, _HOST, _FUTURE)
+    self._perform(
+        INVOKE, client_call.invoke, self._client_completion_queue,
+        _METADATA_TAG, _FINISH_TAG)
+    self._perform(SERVICE, self._server.service, _SERVICE_TAG)
+    server_call = self._events(self._server_completion_queue, 1)[
+        _low.Event.Kind.SERVICE_ACCEPTED].service_acceptance.call
+    self._perform(
+        ACCEPT, server_call.accept, self._server_completion_queue, _FINISH_TAG)
+    server_call.premetadata()
+    self._events(self._client_completion_queue, 1)
+
+    for message in messages:
+      self._echo(client_call, server_call, message)
+
+    self._perform(COMPLETE, client_call.complete, _COMPLETE_TAG)
+    self._events(self._client_completion_queue, 1)
+    self._perform(READ, server_call.read, _READ_TAG)
+    self._events(self._server_completion_queue, 1)
+    self._perform(
+        STATUS, server_call.status, _low.Status(_low.Code.OK, _DETAILS),
+        _STATUS_TAG)
+    self._events(self._server_completion_queue, 2)
+    self._perform(READ, client_call.read, _READ_TAG)
+    finish = self._events(self._client_completion_queue, 2)[
+        _low.Event.Kind.FINISH]
+    if finish.status.code is not _low.Code.OK:
+      raise ValueError('RPC completed with status %s!' % (finish.status,))
+
+  def stop(self):
+    """Stops the server and drains both completion queues."""
+    self._server.stop()
+    # NOTE: As in the _low tests, destroying the server is what tells its
+    # completion queue to release all pending events.
+    self._server = None
+    self._server_completion_queue.stop()
+    self._client_completion_queue.stop()
+    for completion_queue in (
+        self._server_completion_queue, self._client_completion_queue):
+      while True:
+        event = completion_queue.get(_FUTURE)
+        if event is not None and event.kind is _low.Event.Kind.STOP:
+          break
+
+
+def benchmark(scenario, message_size, stream_length, rpcs):
+  """Measures RPCs made directly through the C extension.
+
+  Args:
+    scenario: One of SCENARIOS.
+    message_size: The size in bytes of each message, at most
+      _MAXIMUM_MESSAGE_SIZE.
+    stream_length: The number of messages echoed by each RPC of the STREAMING
+      scenario (each UNARY RPC echoes exactly one).
+    rpcs: The number of RPCs to measure.
+
+  Returns:
+    A dictionary of measurements suitable for serialization as JSON.
+  """
+  messages = (b'\x07' * message_size,) * (
+      1 if scenario == UNARY else stream_length)
+  driver = _Driver()
+  try:
+    for _ in range(_WARM_UP_RPCS):
+      driver.rpc(messages)
+    driver.ledger = _Ledger()
+    start = time.time()
+    for _ in range(rpcs):
+      driver.rpc(messages)
+    duration = time.time() - start
+  finally:
+    driver.stop()
+
+  ledger = driver.ledger
+  held = duration - ledger.waiting
+  return {
+      'scenario': scenario,
+      'message_size': message_size,
+      'messages_per_rpc': len(messages),
+      'rpcs': rpcs,
+      'rpcs_per_second': rpcs / duration,
+      'events_per_second': ledger.events / duration,
+      'messages_per_second': ledger.messages / duration,
+      'gil_hold_seconds_per_rpc': held / rpcs,
+      'gil_hold_fraction': held / duration,
+      'bytes_copied_per_rpc': ledger.bytes_copied / float(rpcs),
+      'phase_microseconds': {
+          phase: 1e6 * ledger.phase_durations[phase] / ledger.phase_calls[phase]
+          for phase in PHASES if ledger.phase_calls[phase]},
+  }
+
+
+def _args():
+  parser = argparse.ArgumentParser()
+  parser.add_argument(
+      '--rpcs', help='the number of RPCs to measure per configuration',
+      type=int, default=1000)
+  parser.add_argument(
+      '--scenarios', help='the kinds of RPC to measure',
+      nargs='+', choices=SCENARIOS, default=SCENARIOS)
+  parser.add_argument(
+      '--message_sizes', help='the message sizes in bytes to measure',
+      nargs='+', type=int, default=(1, 1024, 16384))
+  parser.add_argument(
+      '--stream_length', help='the number of messages per streaming RPC',
+      type=int, default=100)
+  args = parser.parse_args()
+  if _MAXIMUM_MESSAGE_SIZE < max(args.message_sizes):
+    parser.error(
+        'message sizes may not exceed %d bytes' % _MAXIMUM_MESSAGE_SIZE)
+  return args
+
+
+def _benchmark():
+  args = _args()
+  reporting.write([
+      benchmark(scenario, message_size, args.stream_length, args.rpcs)
+      for scenario in args.scenarios for message_size in args.message_sizes])
+
+
+if __name__ == '__main__':
+  _benchmark()
@@ -0,0 +1,243 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""An open-loop load-generating benchmark client.
+
+RPCs are started at a target rate with constant or exponentially distributed
+(Poisson process) inter-arrival times, independently of the completion of
+earlier RPCs, and latency is measured from each RPC's intended start time so
+that time spent queued behind a slow server or an overloaded client is
+counted rather than omitted. Running at each of several target rates yields a
+JSON list of reports tracing latency against throughput.
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from grpc.framework.foundation import histogram
+from grpc.framework.foundation import logging_pool
+
+from benchmark import reporting
+from benchmark import workloads
+
+_POISSON = 'poisson'
+_CONSTANT = 'constant'
+_ARRIVALS = (_POISSON, _CONSTANT)
+
+# The number of threads in which to make RPCs that cannot be made
+# asynchronously; RPCs beyond this many in flight queue for a thread, which is
+# measured as latency because it is measured from intended start times.
+_POOL_SIZE = 200
+
+
+def _args():
+  parser = argparse.ArgumentParser()
+  parser.add_argument(
+      '--server_host', help='the host to which to connect', type=str,
+      default='localhost')
+  parser.add_argument(
+      '--server_port', help='the port to which to connect', type=int,
+      required=True)
+  parser.add_argument(
+      '--use_tls', help='require a secure connection', dest='use_tls',
+      action='store_true')
+  parser.add_argument(
+      '--use_test_ca', help='replace platform root CAs with ca.pem',
+      action='store_true')
+  parser.add_argument(
+      '--cardinality', help='the cardinality of the RPCs to make',
+      choices=(
+          workloads.UNARY_UNARY, workloads.UNARY_STREAM,
+          workloads.STREAM_UNARY),
+      default=workloads.UNARY_UNARY)
+  parser.add_argument(
+      '--payload_size', help='the size in bytes of request and response',
+      type=int, default=0)
+  parser.add_argument(
+      '--rates', help='comma-separated target rates in RPCs per second',
+      type=lambda rates: [float(rate) for rate in rates.split(',')],
+      required=True)
+  parser.add_argument(
+      '--arrival', help='the distribution of inter-arrival times',
+      choices=_ARRIVALS, default=_POISSON)
+  parser.add_argument(
+      '--warmup', help='the length of the warm-up period in seconds per rate',
+      type=float, default=2)
+  parser.add_argument(
+      '--duration',
+      help='the length of the measurement period in seconds per rate',
+      type=float, default=10)
+  parser.add_argument(
+      '--timeout', help='the length of time in seconds to allow for an RPC',
+      type=float, default=30)
+  return parser.parse_args()
+
+
+def _intervals(arrival, rate):
+  if arrival == _POISSON:
+    while True:
+      yield random.expovariate(rate)
+  else:
+    while True:
+      yield 1.0 / rate
+
+
+class _Recorder(object):
+  """Records the outcomes of RPCs started at intended times."""
+
+  def __init__(self, measurement_start):
+    self._condition = threading.Condition()
+    self._measurement_start = measurement_start
+    self._latencies = histogram.Histogram()
+    self._failures = 0
+    self._outstanding = 0
+    self._maximum_lateness = 0
+
+  def start(self, intended_start, actual_start):
+    """Notes that an RPC has been started.
+
+    Args:
+      intended_start: The time at which the RPC was scheduled to start.
+      actual_start: The time at which the RPC was started.
+
+    Returns:
+      A callback to be passed the future describing the RPC upon its
+        completion.
+    """
+    measured = self._measurement_start <= intended_start
+    with self._condition:
+      self._outstanding += 1
+      if measured:
+        self._maximum_lateness = max(
+            self._maximum_lateness, actual_start - intended_start)
+
+    def done(rpc_future):
+      end = time.time()
+      failed = rpc_future.exception() is not None
+      with self._condition:
+        self._outstanding -= 1
+        if measured:
+          if failed:
+            self._failures += 1
+          else:
+            self._latencies.record(end - intended_start)
+        self._condition.notify_all()
+    return done
+
+  def drain(self, timeout):
+    """Waits for all started RPCs to complete.
+
+    Args:
+      timeout: The length of time in seconds to wait.
+    """
+    deadline = time.time() + timeout
+    with self._condition:
+      while self._outstanding:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+          return
+        self._condition.wait(remaining)
+
+  def results(self):
+    """Reports the outcomes of the measured RPCs.
+
+    Returns:
+      A triple of a histogram.Snapshot of the latencies of successful RPCs, the
+        number of failed RPCs, and the greatest delay in seconds observed in
+        starting an RPC after its intended start time.
+    """
+    with self._condition:
+      return (
+          self._latencies.snapshot(), self._failures, self._maximum_lateness)
+
+
+def _run(start_round_trip, args, rate):
+  """Drives the server at a single target rate.
+
+  Args:
+    start_round_trip: A no-argument callable that starts an RPC and returns a
+      future describing it.
+    args: The parsed command-line arguments.
+    rate: The target rate in RPCs per second.
+
+  Returns:
+    A report of the run as returned by reporting.report.
+  """
+  start = time.time()
+  measurement_start = start + args.warmup
+  measurement_end = measurement_start + args.duration
+  recorder = _Recorder(measurement_start)
+  intended_start = start
+  for interval in _intervals(args.arrival, rate):
+    intended_start += interval
+    if measurement_end <= intended_start:
+      break
+    delay = intended_start - time.time()
+    if 0 < delay:
+      time.sleep(delay)
+    done = recorder.start(intended_start, time.time())
+    start_round_trip().add_done_callback(done)
+  recorder.drain(args.timeout)
+
+  latencies, failures, maximum_lateness = recorder.results()
+  report = reporting.report(
+      {'target_rate': rate}, latencies, args.duration, None)
+  report['failures'] = failures
+  report['maximum_start_lateness'] = maximum_lateness
+  return report
+
+
+def _benchmark():
+  args = _args()
+  pool = logging_pool.pool(_POOL_SIZE)
+  stub = workloads.interop_stub(
+      args.server_host, args.server_port, args.use_tls, args.use_test_ca)
+  try:
+    with stub:
+      start_round_trip = workloads.round_trip_starter(
+          stub, args.cardinality, args.payload_size, args.timeout, pool)
+      reports = [_run(start_round_trip, args, rate) for rate in args.rates]
+  finally:
+    pool.shutdown(wait=True)
+
+  reporting.write({
+      'parameters': {
+          'cardinality': args.cardinality,
+          'payload_size': args.payload_size,
+          'arrival': args.arrival,
+          'secure': args.use_tls,
+      },
+      'curve': reports,
+  })
+
+
+if __name__ == '__main__':
+  _benchmark()
@@ -0,0 +1,91 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Summaries of benchmark measurements as JSON-compatible values."""
+
+import json
+import os
+import sys
+
+_PERCENTILES = (('p50', 50), ('p90', 90), ('p99', 99), ('p999', 99.9))
+
+
+def cpu_seconds():
+  """Returns the user and system processor time in seconds used so far."""
+  times = os.times()
+  return times[0] + times[1]
+
+
+def latency_summary(snapshot):
+  """Summarizes a histogram of latencies.
+
+  Args:
+    snapshot: A histogram.Snapshot of latencies in seconds.
+
+  Returns:
+    A dictionary from summary statistic name to value in seconds.
+  """
+  summary = {name: snapshot.percentile(percentile)
+             for name, percentile in _PERCENTILES}
+  summary['mean'] = snapshot.mean()
+  summary['max'] = snapshot.maximum
+  return summary
+
+
+def report(parameters, latencies, duration, cpu_seconds):
+  """Summarizes a benchmark run.
+
+  Args:
+    parameters: A dictionary describing the configuration of the run.
+    latencies: A histogram.Snapshot of the latencies in seconds of the round
+      trips completed during the run.
+    duration: The length of time in seconds over which round trips were
+      measured.
+    cpu_seconds: The processor time in seconds used by the measuring processes
+      during the run, or None if it was not measured.
+
+  Returns:
+    A dictionary suitable for serialization as JSON.
+  """
+  count = latencies.count
+  return {
+      'parameters': parameters,
+      'round_trips': count,
+      'qps': count / duration,
+      'latency': latency_summary(latencies),
+      'cpu_per_round_trip': (
+          cpu_seconds / count if count and cpu_seconds is not None else None),
+  }
+
+
+def write(value):
+  """Writes a JSON-compatible value to standard output."""
+  json.dump(value, sys.stdout, indent=2, sort_keys=True)
+  sys.stdout.write('\n')
+  sys.stdout.flush()
@@ -0,0 +1,94 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""A benchmark server serving the interop test methods.
+
+When stopped the server writes to standard output a JSON report of the number
+of RPCs it serviced and the processor time it used.
+"""
+
+import argparse
+import logging
+import time
+
+from grpc.early_adopter import implementations
+
+from benchmark import reporting
+from interop import methods
+from interop import resources
+
+_ONE_DAY_IN_SECONDS = 60 * 60 * 24
+
+
+def _args():
+  parser = argparse.ArgumentParser()
+  parser.add_argument(
+      '--port', help='the port on which to serve', type=int, required=True)
+  parser.add_argument(
+      '--use_tls', help='require a secure connection', dest='use_tls',
+      action='store_true')
+  parser.add_argument(
+      '--duration',
+      help='the length of time in seconds for which to serve (by default '
+      'until interrupted)', type=float, default=None)
+  return parser.parse_args()
+
+
+def serve():
+  args = _args()
+  if args.use_tls:
+    private_key = resources.private_key()
+    certificate_chain = resources.certificate_chain()
+    server = implementations.secure_server(
+        methods.SERVER_METHODS, args.port, private_key, certificate_chain)
+  else:
+    server = implementations.insecure_server(
+        methods.SERVER_METHODS, args.port)
+
+  server.start()
+  cpu_start = reporting.cpu_seconds()
+  logging.info('Server serving.')
+  try:
+    time.sleep(_ONE_DAY_IN_SECONDS if args.duration is None else args.duration)
+  except BaseException as e:
+    logging.info('Caught exception "%s"; stopping server...', e)
+  cpu_seconds = reporting.cpu_seconds() - cpu_start
+  rpcs = sum(stats.commenced for stats in server.method_stats().itervalues())
+  server.stop()
+  logging.info('Server stopped; exiting.')
+
+  reporting.write({
+      'rpcs': rpcs,
+      'cpu_seconds': cpu_seconds,
+      'cpu_per_rpc': cpu_seconds / rpcs if rpcs else None,
+  })
+
+
+if __name__ == '__main__':
+  serve()
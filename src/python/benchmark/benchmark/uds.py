@@ -0,0 +1,169 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Compares unary round-trip latency over Unix domain sockets and TCP loopback.
+
+For each transport a server is started in a child process, as a sidecar on the
+same host would be, and a single stub in this process makes unary round trips
+to it back to back. Latencies and the processor time of this process are
+measured after a warm-up period.
+
+The child process is started as a new interpreter running this module rather
+than forked from this process, because the C core initialized when this
+process imports the extension does not survive a fork.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from grpc.early_adopter import implementations
+from grpc.framework.foundation import histogram
+
+from benchmark import reporting
+from benchmark import workloads
+from interop import methods
+
+TCP = 'tcp'
+UDS = 'uds'
+TRANSPORTS = (TCP, UDS)
+
+_HOST = 'localhost'
+_SOCKET_PATH_TEMPLATE = '/tmp/grpc_benchmark_uds.%d'
+_UNIX_ADDRESS_PREFIX = 'unix:'
+_WARM_UP_ROUND_TRIPS = 100
+_TIMEOUT = 10
+
+
+def _serve(address):
+  """Serves until standard input is closed, having written the server's port.
+
+  Args:
+    address: A "unix:<path>" address on which to serve, or the string form of
+      the port on which to serve.
+  """
+  if address.startswith(_UNIX_ADDRESS_PREFIX):
+    port = address
+  else:
+    port = int(address)
+  server = implementations.insecure_server(methods.SERVER_METHODS, port)
+  with server:
+    sys.stdout.write('%s\n' % server.port())
+    sys.stdout.flush()
+    sys.stdin.read()
+
+
+def benchmark(transport, payload_size, round_trips):
+  """Measures unary round trips to a server in another process.
+
+  Args:
+    transport: One of TRANSPORTS.
+    payload_size: The size in bytes of each request and response payload.
+    round_trips: The number of round trips to measure.
+
+  Returns:
+    A dictionary of measurements suitable for serialization as JSON.
+  """
+  if transport == UDS:
+    socket_path = _SOCKET_PATH_TEMPLATE % os.getpid()
+    address = _UNIX_ADDRESS_PREFIX + socket_path
+  else:
+    socket_path = None
+    address = '0'
+  server_process = subprocess.Popen(
+      [sys.executable, '-m', 'benchmark.uds', '--serve', address],
+      stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+  try:
+    port = server_process.stdout.readline().strip()
+    if not port:
+      raise RuntimeError('The server process failed to start!')
+    if transport == UDS:
+      stub = implementations.insecure_stub(methods.CLIENT_METHODS, port, None)
+    else:
+      stub = implementations.insecure_stub(
+          methods.CLIENT_METHODS, _HOST, int(port))
+    latencies = histogram.Histogram()
+    with stub:
+      stub.connect(_TIMEOUT)
+      round_trip = workloads.round_trip(
+          stub, workloads.UNARY_UNARY, payload_size, _TIMEOUT)
+      for _ in range(_WARM_UP_ROUND_TRIPS):
+        round_trip()
+      cpu_start = reporting.cpu_seconds()
+      measurement_start = time.time()
+      for _ in range(round_trips):
+        start = time.time()
+        round_trip()
+        latencies.record(time.time() - start)
+      duration = time.time() - measurement_start
+      cpu_seconds = reporting.cpu_seconds() - cpu_start
+      round_trip.close()
+  finally:
+    server_process.stdin.close()
+    server_process.wait()
+    if socket_path is not None and os.path.exists(socket_path):
+      os.remove(socket_path)
+
+  return reporting.report(
+      {'transport': transport, 'payload_size': payload_size},
+      latencies.snapshot(), duration, cpu_seconds)
+
+
+def _args():
+  parser = argparse.ArgumentParser()
+  parser.add_argument(
+      '--round_trips', help='the number of round trips to measure per run',
+      type=int, default=2000)
+  parser.add_argument(
+      '--transports', help='the transports to measure',
+      nargs='+', choices=TRANSPORTS, default=TRANSPORTS)
+  parser.add_argument(
+      '--payload_sizes', help='the payload sizes in bytes to measure',
+      nargs='+', type=int, default=(0, 1024, 65536))
+  # Given only to server processes, as the address on which to serve.
+  parser.add_argument('--serve', help=argparse.SUPPRESS, type=str)
+  return parser.parse_args()
+
+
+def _benchmark():
+  args = _args()
+  if args.serve is not None:
+    _serve(args.serve)
+    return
+
+  reporting.write([
+      benchmark(transport, payload_size, args.round_trips)
+      for payload_size in args.payload_sizes
+      for transport in args.transports])
+
+
+if __name__ == '__main__':
+  _benchmark()
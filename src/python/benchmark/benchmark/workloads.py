@@ -0,0 +1,260 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Round trips of the interop test methods used to load a server."""
+
+import threading
+
+from grpc.early_adopter import implementations
+
+from interop import messages_pb2
+from interop import methods
+from interop import resources
+
+UNARY_UNARY = 'unary_unary'
+UNARY_STREAM = 'unary_stream'
+STREAM_UNARY = 'stream_unary'
+STREAM_STREAM = 'stream_stream'
+
+CARDINALITIES = (UNARY_UNARY, UNARY_STREAM, STREAM_UNARY, STREAM_STREAM)
+
+
+class _Pipe(object):
+
+  def __init__(self):
+    self._condition = threading.Condition()
+    self._values = []
+    self._open = True
+
+  def __iter__(self):
+    return self
+
+  def next(self):
+    with self._condition:
+      while not self._values and self._open:
+        self._condition.wait()
+      if self._values:
+        return self._values.pop(0)
+      else:
+        raise StopIteration()
+
+  def add(self, value):
+    with self._condition:
+      self._values.append(value)
+      self._condition.notify()
+
+  def close(self):
+    with self._condition:
+      self._open = False
+      self._condition.notify()
+
+
+def _simple_request(payload_size):
+  return messages_pb2.SimpleRequest(
+      response_type=messages_pb2.COMPRESSABLE, response_size=payload_size,
+      payload=messages_pb2.Payload(body=b'\x00' * payload_size))
+
+
+def _streaming_output_call_request(payload_size):
+  return messages_pb2.StreamingOutputCallRequest(
+      response_type=messages_pb2.COMPRESSABLE,
+      response_parameters=(messages_pb2.ResponseParameters(size=payload_size),),
+      payload=messages_pb2.Payload(body=b'\x00' * payload_size))
+
+
+def _streaming_input_call_request(payload_size):
+  return messages_pb2.StreamingInputCallRequest(
+      payload=messages_pb2.Payload(body=b'\x00' * payload_size))
+
+
+class _UnaryUnary(object):
+
+  def __init__(self, stub, payload_size, timeout):
+    self._behavior = stub.UnaryCall
+    self._request = _simple_request(payload_size)
+    self._timeout = timeout
+
+  def __call__(self):
+    self._behavior(self._request, self._timeout)
+
+  def close(self):
+    pass
+
+
+class _UnaryStream(object):
+
+  def __init__(self, stub, payload_size, timeout):
+    self._behavior = stub.StreamingOutputCall
+    self._request = _streaming_output_call_request(payload_size)
+    self._timeout = timeout
+
+  def __call__(self):
+    for unused_response in self._behavior(self._request, self._timeout):
+      pass
+
+  def close(self):
+    pass
+
+
+class _StreamUnary(object):
+
+  def __init__(self, stub, payload_size, timeout):
+    self._behavior = stub.StreamingInputCall
+    self._request = _streaming_input_call_request(payload_size)
+    self._timeout = timeout
+
+  def __call__(self):
+    self._behavior(iter((self._request,)), self._timeout)
+
+  def close(self):
+    pass
+
+
+class _StreamStream(object):
+  """Ping-pongs single messages on one long-lived full-duplex RPC."""
+
+  def __init__(self, stub, payload_size, timeout):
+    self._behavior = stub.FullDuplexCall
+    self._timeout = timeout
+    self._request = _streaming_output_call_request(payload_size)
+    self._open()
+
+  def _open(self):
+    self._pipe = _Pipe()
+    self._responses = self._behavior(self._pipe, self._timeout)
+
+  def __call__(self):
+    self._pipe.add(self._request)
+    try:
+      next(self._responses)
+    except Exception:
+      # The RPC is over; later round trips are made on a new one.
+      self._pipe.close()
+      self._open()
+      raise
+
+  def close(self):
+    self._pipe.close()
+    for unused_response in self._responses:
+      pass
+
+
+_ROUND_TRIPS = {
+    UNARY_UNARY: _UnaryUnary,
+    UNARY_STREAM: _UnaryStream,
+    STREAM_UNARY: _StreamUnary,
+    STREAM_STREAM: _StreamStream,
+}
+
+
+def interop_stub(host, port, use_tls, use_test_ca):
+  """Creates a stub for the interop methods.
+
+  Args:
+    host: The host to which to connect.
+    port: The port to which to connect.
+    use_tls: Whether to require a secure connection.
+    use_test_ca: Whether to trust the test certificate authority in place of
+      the platform's root certificate authorities. Only meaningful if use_tls
+      is True.
+
+  Returns:
+    An early_adopter interfaces.Stub for the interop methods.
+  """
+  if use_tls:
+    if use_test_ca:
+      root_certificates = resources.test_root_certificates()
+    else:
+      root_certificates = resources.prod_root_certificates()
+    return implementations.secure_stub(
+        methods.CLIENT_METHODS, host, port, root_certificates, None, None)
+  else:
+    return implementations.insecure_stub(methods.CLIENT_METHODS, host, port)
+
+
+def round_trip(stub, cardinality, payload_size, timeout):
+  """Creates a behavior that makes one round trip to the server per call.
+
+  A round trip is a whole RPC carrying one request and one response for all
+  cardinalities but STREAM_STREAM, for which it is the exchange of one request
+  and one response on an RPC that lasts until the behavior is closed or a round
+  trip fails, after which a new RPC is begun.
+
+  Args:
+    stub: An early_adopter interfaces.Stub for the interop methods that is in
+      context.
+    cardinality: One of CARDINALITIES.
+    payload_size: The size in bytes of the request and response payloads.
+    timeout: The length of time in seconds to allow for an RPC. For
+      STREAM_STREAM this bounds the lifetime of the behavior.
+
+  Returns:
+    An object with a no-argument __call__ method that makes a round trip,
+      blocks until it completes, and raises an exception if it fails, and a
+      no-argument close method to be called once the object is no longer
+      needed.
+  """
+  return _ROUND_TRIPS[cardinality](stub, payload_size, timeout)
+
+
+def round_trip_starter(stub, cardinality, payload_size, timeout, pool):
+  """Creates a behavior that starts one whole RPC per call without blocking.
+
+  Args:
+    stub: An early_adopter interfaces.Stub for the interop methods that is in
+      context.
+    cardinality: One of CARDINALITIES other than STREAM_STREAM.
+    payload_size: The size in bytes of the request and response payloads.
+    timeout: The length of time in seconds to allow for an RPC.
+    pool: A thread pool in which to make RPCs of cardinalities that the stub
+      cannot make asynchronously.
+
+  Returns:
+    A no-argument callable that starts an RPC carrying one request and one
+      response and returns a future.Future-like object describing the RPC's
+      completion.
+
+  Raises:
+    ValueError: If cardinality is STREAM_STREAM, the round trips of which are
+      exchanges on a single long-lived RPC rather than independent RPCs.
+  """
+  if cardinality == UNARY_UNARY:
+    behavior = stub.UnaryCall
+    request = _simple_request(payload_size)
+    return lambda: behavior.async(request, timeout)
+  elif cardinality == STREAM_UNARY:
+    behavior = stub.StreamingInputCall
+    request = _streaming_input_call_request(payload_size)
+    return lambda: behavior.async(iter((request,)), timeout)
+  elif cardinality == UNARY_STREAM:
+    round_trip_behavior = _UnaryStream(stub, payload_size, timeout)
+    return lambda: pool.submit(round_trip_behavior)
+  else:
+    raise ValueError(
+        'Cardinality %s has no independent round trips!' % cardinality)
@@ -71,6 +71,20 @@ static void pygrpc_call_dealloc(Call *self) {
   self->ob_type->tp_free((PyObject *)self);
 }
 
+static const PyObject *pygrpc_call_add_metadata(Call *self, PyObject *args) {
+  grpc_metadata metadata;
+  int value_length;
+
+  if (!(PyArg_ParseTuple(args, "ss#:add_metadata", &metadata.key,
+                         &metadata.value, &value_length))) {
+    return NULL;
+  }
+  metadata.value_length = value_length;
+
+  return pygrpc_translate_call_error(
+      grpc_call_add_metadata_old(self->c_call, &metadata, 0));
+}
+
 static const PyObject *pygrpc_call_invoke(Call *self, PyObject *args) {
   const PyObject *completion_queue;
   const PyObject *metadata_tag;
@@ -229,6 +243,8 @@ static const PyObject *pygrpc_call_cancel(Call *self) {
 }
 
 static PyMethodDef methods[] = {
+    {"add_metadata", (PyCFunction)pygrpc_call_add_metadata, METH_VARARGS,
+     "Add metadata to be sent upon invocation of this call."},
     {"invoke", (PyCFunction)pygrpc_call_invoke, METH_VARARGS,
      "Invoke this call."},
     {"write", (PyCFunction)pygrpc_call_write, METH_VARARGS,
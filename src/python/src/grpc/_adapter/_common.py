@@ -29,7 +29,15 @@
 
 """State used by both invocation-side and service-side code."""
 
+import collections
 import enum
+import uuid
+
+from grpc.framework.foundation import tracing
+
+_UNIX_ADDRESS_PREFIX = 'unix:'
+_UNIX_AUTHORITY = 'localhost'
+_TRACE_ID_METADATA_KEY = 'trace-id'
 
 
 @enum.unique
@@ -49,6 +57,7 @@ class WriteState(object):
     pending: A list of bytestrings for the RPC waiting to be written to the
       other side of the RPC.
   """
+  __slots__ = ('low', 'high', 'pending')
 
   def __init__(self, low, high, pending):
     self.low = low
@@ -56,6 +65,65 @@ class WriteState(object):
     self.pending = pending
 
 
+class ByteCounts(collections.namedtuple('ByteCounts', ('received', 'sent'))):
+  """A snapshot of the numbers of payload bytes of an RPC method.
+
+  Attributes:
+    received: The number of serialized payload bytes taken off the wire.
+    sent: The number of serialized payload bytes put on the wire.
+  """
+
+
+class ByteCounter(object):
+  """A mutable count of the payload bytes of an RPC method.
+
+  Attributes:
+    received: The number of serialized payload bytes taken off the wire.
+    sent: The number of serialized payload bytes put on the wire.
+  """
+  __slots__ = ('received', 'sent')
+
+  def __init__(self):
+    self.received = 0
+    self.sent = 0
+
+  def snapshot(self):
+    return ByteCounts(self.received, self.sent)
+
+
+class RPCSnapshot(
+    collections.namedtuple(
+        'RPCSnapshot', ('method', 'pending_writes', 'writing'))):
+  """A snapshot of the state of writing to an RPC.
+
+  Attributes:
+    method: The RPC method name.
+    pending_writes: The number of serialized payloads waiting to be written to
+      the other side of the RPC.
+    writing: Whether or not a write to the other side of the RPC is underway.
+  """
+
+
+class MethodState(object):
+  """The state shared by all RPCs of one method.
+
+  Attributes:
+    method: The RPC method name.
+    deserializer: The behavior to be used to deserialize payload bytestreams
+      taken off the wire, or None if payloads are the bytestreams themselves.
+    serializer: The behavior to be used to serialize payloads to be sent on the
+      wire, or None if payloads are sent on the wire untouched.
+    byte_counter: The ByteCounter of the method.
+  """
+  __slots__ = ('method', 'deserializer', 'serializer', 'byte_counter')
+
+  def __init__(self, method, deserializer, serializer):
+    self.method = method
+    self.deserializer = deserializer
+    self.serializer = serializer
+    self.byte_counter = ByteCounter()
+
+
 class CommonRPCState(object):
   """A description of an RPC's state.
 
@@ -63,14 +131,128 @@ class CommonRPCState(object):
     write: A WriteState describing the state of writing to the RPC.
     sequence_number: The lowest-unused sequence number for use in generating
       tickets locally describing the progress of the RPC.
-    deserializer: The behavior to be used to deserialize payload bytestreams
-      taken off the wire.
-    serializer: The behavior to be used to serialize payloads to be sent on the
-      wire.
+    method_state: The MethodState of the RPC's method, shared with all other
+      RPCs of the method.
+    trace: The tracing.Trace of the RPC.
   """
+  __slots__ = ('write', 'sequence_number', 'method_state', 'trace')
 
-  def __init__(self, write, sequence_number, deserializer, serializer):
+  def __init__(self, write, sequence_number, method_state, trace):
     self.write = write
     self.sequence_number = sequence_number
-    self.deserializer = deserializer
-    self.serializer = serializer
+    self.method_state = method_state
+    self.trace = trace
+
+
+def serialize(rpc_state, payload):
+  """Serializes a payload to be sent on the wire, counting its bytes."""
+  serializer = rpc_state.method_state.serializer
+  if serializer is None:
+    serialized_payload = payload
+  else:
+    rpc_state.trace.start(tracing.Stage.SERIALIZATION)
+    serialized_payload = serializer(payload)
+    rpc_state.trace.finish(tracing.Stage.SERIALIZATION)
+  rpc_state.method_state.byte_counter.sent += len(serialized_payload)
+  return serialized_payload
+
+
+def deserialize(rpc_state, serialized_payload):
+  """Deserializes a payload taken off the wire, counting its bytes."""
+  rpc_state.method_state.byte_counter.received += len(serialized_payload)
+  deserializer = rpc_state.method_state.deserializer
+  if deserializer is None:
+    return serialized_payload
+  rpc_state.trace.start(tracing.Stage.DESERIALIZATION)
+  payload = deserializer(serialized_payload)
+  rpc_state.trace.finish(tracing.Stage.DESERIALIZATION)
+  return payload
+
+
+def add_trace_id(call, trace_id):
+  """Attaches a trace ID to an RPC yet to be invoked.
+
+  Args:
+    call: The _low.Call of the RPC.
+    trace_id: A uuid.UUID or None, in which case nothing is attached.
+  """
+  if trace_id is not None:
+    call.add_metadata(_TRACE_ID_METADATA_KEY, trace_id.hex)
+
+
+def trace_id(metadata):
+  """Recovers the trace ID attached to an RPC by its invoker.
+
+  Args:
+    metadata: The sequence of (key, value) metadata pairs received with the
+      RPC.
+
+  Returns:
+    The uuid.UUID attached to the RPC, or a new one if the invoker attached no
+      well-formed trace ID.
+  """
+  for key, value in metadata:
+    if key == _TRACE_ID_METADATA_KEY:
+      try:
+        return uuid.UUID(hex=value)
+      except ValueError:
+        break
+  return uuid.uuid4()
+
+
+def is_unix_address(address):
+  """Indicates whether an address names a Unix domain socket.
+
+  Args:
+    address: A host, a port, or an address string.
+
+  Returns:
+    True if the address is a string of the form "unix:<path>"; False otherwise.
+  """
+  return (
+      isinstance(address, basestring) and
+      address.startswith(_UNIX_ADDRESS_PREFIX))
+
+
+def server_address(port):
+  """Computes the address on which a server should listen.
+
+  Args:
+    port: A port number, a "unix:<path>" address, or None for a port to be
+      selected automatically.
+
+  Returns:
+    An address string suitable for _low.Server.add_http2_addr.
+  """
+  if is_unix_address(port):
+    return port
+  else:
+    return '[::]:%d' % (0 if port is None else port)
+
+
+def channel_target(host, port):
+  """Computes the target to which a channel should connect.
+
+  Args:
+    host: A host name or a "unix:<path>" address.
+    port: A port number, ignored if host is a "unix:<path>" address.
+
+  Returns:
+    A target string suitable for _low.Channel.
+  """
+  if is_unix_address(host):
+    return host
+  else:
+    return '%s:%d' % (host, port)
+
+
+def authority(host):
+  """Computes the authority with which to invoke RPCs on a host.
+
+  Args:
+    host: A host name or a "unix:<path>" address.
+
+  Returns:
+    The host name, or "localhost" if host is a "unix:<path>" address.
+  """
+  return _UNIX_AUTHORITY if is_unix_address(host) else host
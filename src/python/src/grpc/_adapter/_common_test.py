@@ -0,0 +1,93 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Tests for the address and payload handling of grpc._adapter._common."""
+
+import unittest
+
+from grpc._adapter import _common
+from grpc.framework.foundation import tracing
+
+
+class AddressTest(unittest.TestCase):
+
+  def testServerAddress(self):
+    self.assertEqual('[::]:0', _common.server_address(None))
+    self.assertEqual('[::]:0', _common.server_address(0))
+    self.assertEqual('[::]:50051', _common.server_address(50051))
+    self.assertEqual(
+        'unix:/tmp/grpc.sock', _common.server_address('unix:/tmp/grpc.sock'))
+
+  def testChannelTarget(self):
+    self.assertEqual(
+        'localhost:50051', _common.channel_target('localhost', 50051))
+    self.assertEqual(
+        'unix:/tmp/grpc.sock',
+        _common.channel_target('unix:/tmp/grpc.sock', None))
+
+  def testAuthority(self):
+    self.assertEqual('example.com', _common.authority('example.com'))
+    self.assertEqual('localhost', _common.authority('unix:/tmp/grpc.sock'))
+
+  def testIsUnixAddress(self):
+    self.assertTrue(_common.is_unix_address('unix:/tmp/grpc.sock'))
+    self.assertTrue(_common.is_unix_address(u'unix:/tmp/grpc.sock'))
+    self.assertFalse(_common.is_unix_address('localhost'))
+    self.assertFalse(_common.is_unix_address(50051))
+    self.assertFalse(_common.is_unix_address(None))
+
+
+class PayloadTest(unittest.TestCase):
+
+  def _rpc_state(self, deserializer, serializer):
+    return _common.CommonRPCState(
+        _common.WriteState(None, _common.HighWrite.OPEN, []), 0,
+        _common.MethodState('method', deserializer, serializer),
+        tracing.NULL_TRACER.trace(None, None))
+
+  def testSerialization(self):
+    rpc_state = self._rpc_state(int, str)
+
+    self.assertEqual('123', _common.serialize(rpc_state, 123))
+    self.assertEqual(456, _common.deserialize(rpc_state, '456'))
+    self.assertEqual(3, rpc_state.method_state.byte_counter.sent)
+    self.assertEqual(3, rpc_state.method_state.byte_counter.received)
+
+  def testRawPayloadsPassedUntouched(self):
+    rpc_state = self._rpc_state(None, None)
+    payload = b'\x00\x01\x02'
+
+    self.assertIs(payload, _common.serialize(rpc_state, payload))
+    self.assertIs(payload, _common.deserialize(rpc_state, payload))
+    self.assertEqual(3, rpc_state.method_state.byte_counter.sent)
+    self.assertEqual(3, rpc_state.method_state.byte_counter.received)
+
+
+if __name__ == '__main__':
+  unittest.main()
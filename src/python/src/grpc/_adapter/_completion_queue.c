@@ -134,6 +134,28 @@ static PyObject *pygrpc_complete_event_args(grpc_event *c_event) {
                       Py_None, complete_accepted, Py_None, Py_None, Py_None);
 }
 
+static PyObject *pygrpc_metadata_pairs(grpc_metadata *elements,
+                                       size_t count) {
+  PyObject *pairs;
+  PyObject *pair;
+  size_t index;
+
+  pairs = PyTuple_New(count);
+  if (pairs == NULL) {
+    return NULL;
+  }
+  for (index = 0; index < count; index++) {
+    pair = Py_BuildValue("(ss#)", elements[index].key, elements[index].value,
+                         (int)elements[index].value_length);
+    if (pair == NULL) {
+      Py_DECREF(pairs);
+      return NULL;
+    }
+    PyTuple_SET_ITEM(pairs, index, pair);
+  }
+  return pairs;
+}
+
 static PyObject *pygrpc_service_event_args(grpc_event *c_event) {
   if (c_event->data.server_rpc_new.method == NULL) {
     return PyTuple_Pack(7, service_event_kind, c_event->tag,
@@ -142,6 +164,7 @@ static PyObject *pygrpc_service_event_args(grpc_event *c_event) {
     PyObject *method = NULL;
     PyObject *host = NULL;
     PyObject *service_deadline = NULL;
+    PyObject *metadata = NULL;
     Call *call = NULL;
     PyObject *service_acceptance = NULL;
     PyObject *event_args = NULL;
@@ -159,6 +182,12 @@ static PyObject *pygrpc_service_event_args(grpc_event *c_event) {
     if (service_deadline == NULL) {
       goto error;
     }
+    metadata = pygrpc_metadata_pairs(
+        c_event->data.server_rpc_new.metadata_elements,
+        c_event->data.server_rpc_new.metadata_count);
+    if (metadata == NULL) {
+      goto error;
+    }
 
     call = PyObject_New(Call, &pygrpc_CallType);
     if (call == NULL) {
@@ -168,7 +197,7 @@ static PyObject *pygrpc_service_event_args(grpc_event *c_event) {
 
     service_acceptance =
         PyObject_CallFunctionObjArgs(service_acceptance_class, call, method,
-                                     host, service_deadline, NULL);
+                                     host, service_deadline, metadata, NULL);
     if (service_acceptance == NULL) {
       goto error;
     }
@@ -183,6 +212,7 @@ error:
     Py_XDECREF(method);
     Py_XDECREF(host);
     Py_XDECREF(service_deadline);
+    Py_XDECREF(metadata);
 
     return event_args;
   }
@@ -62,8 +62,18 @@ class Status(collections.namedtuple('Status', ['code', 'details'])):
 
 class ServiceAcceptance(
     collections.namedtuple(
-        'ServiceAcceptance', ['call', 'method', 'host', 'deadline'])):
-  """Describes an RPC on the service side at the start of service."""
+        'ServiceAcceptance',
+        ['call', 'method', 'host', 'deadline', 'metadata'])):
+  """Describes an RPC on the service side at the start of service.
+
+  Attributes:
+    call: The Call of the RPC.
+    method: The RPC method name.
+    host: The host named by the invoker of the RPC.
+    deadline: The deadline of the RPC in seconds since the epoch.
+    metadata: A sequence of (key, value) pairs of the metadata sent by the
+      invoker of the RPC.
+  """
 
 
 class Event(
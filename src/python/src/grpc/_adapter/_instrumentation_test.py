@@ -0,0 +1,103 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Tests for grpc._adapter.instrumentation."""
+
+import time
+import unittest
+
+from grpc._adapter import _datatypes
+from grpc._adapter import instrumentation
+
+_INTERVAL = 0.05
+
+
+class _Dump(object):
+
+  def __init__(self):
+    self.dumped = []
+
+  def __call__(self, name, stats):
+    self.dumped.append((name, stats))
+
+
+class SpinInstrumentTest(unittest.TestCase):
+
+  def testNullSpinInstrument(self):
+    spin_instrument = instrumentation.NULL_SPIN_INSTRUMENT
+    spin_instrument.get_started()
+    spin_instrument.get_finished(_datatypes.Event.Kind.READ_ACCEPTED)
+    spin_instrument.handling_started()
+    spin_instrument.handling_finished(lambda: self.fail('Gauges read!'))
+
+    self.assertIsNone(spin_instrument.stats())
+
+  def testPeriodicDump(self):
+    dump = _Dump()
+    gauge_readings = []
+    def gauges():
+      gauge_readings.append(None)
+      return 3, 5
+    spin_instrument = instrumentation.spin_instrument(
+        'test loop', _INTERVAL, dump=dump)
+
+    spin_instrument.get_started()
+    time.sleep(_INTERVAL / 2)
+    spin_instrument.get_finished(_datatypes.Event.Kind.READ_ACCEPTED)
+    spin_instrument.handling_started()
+    spin_instrument.handling_finished(gauges)
+    self.assertIsNone(spin_instrument.stats())
+    self.assertFalse(gauge_readings)
+
+    spin_instrument.get_started()
+    spin_instrument.get_finished(_datatypes.Event.Kind.WRITE_ACCEPTED)
+    spin_instrument.handling_started()
+    time.sleep(_INTERVAL)
+    spin_instrument.handling_finished(gauges)
+
+    self.assertEqual(1, len(gauge_readings))
+    self.assertEqual(1, len(dump.dumped))
+    name, stats = dump.dumped[0]
+    self.assertEqual('test loop', name)
+    self.assertIs(stats, spin_instrument.stats())
+    self.assertLessEqual(_INTERVAL, stats.interval)
+    self.assertEqual(
+        set((_datatypes.Event.Kind.READ_ACCEPTED,
+             _datatypes.Event.Kind.WRITE_ACCEPTED)),
+        set(stats.event_rates))
+    self.assertLessEqual(_INTERVAL / 2, stats.blocked)
+    self.assertLessEqual(_INTERVAL, stats.handling)
+    self.assertLess(stats.blocked, stats.handling)
+    self.assertEqual(3, stats.rpc_states)
+    self.assertEqual(5, stats.pending_writes)
+    self.assertLess(0.5, stats.busy_fraction())
+
+
+if __name__ == '__main__':
+  unittest.main()
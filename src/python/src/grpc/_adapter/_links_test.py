@@ -35,6 +35,7 @@ import unittest
 from grpc._adapter import _proto_scenarios
 from grpc._adapter import _test_links
 from grpc._adapter import fore
+from grpc._adapter import instrumentation
 from grpc._adapter import rear
 from grpc.framework.base import interfaces
 from grpc.framework.base.packets import packets as tickets
@@ -44,6 +45,49 @@ _IDENTITY = lambda x: x
 _TIMEOUT = 2
 
 
+class _CountingSpinInstrument(instrumentation.SpinInstrument):
+
+  def __init__(self):
+    self.handlings_started = 0
+    self.handlings_finished = 0
+
+  def get_started(self):
+    pass
+
+  def get_finished(self, kind):
+    pass
+
+  def handling_started(self):
+    self.handlings_started += 1
+
+  def handling_finished(self, gauges):
+    self.handlings_finished += 1
+
+  def stats(self):
+    return None
+
+
+class QueueingDelayMonitorTest(unittest.TestCase):
+
+  def testSustainedDelayShedsUntilShorterDelayObserved(self):
+    monitor = fore._QueueingDelayMonitor(1, 10)  # pylint: disable=protected-access
+
+    monitor.observe(0, 2)
+    self.assertFalse(monitor.shedding(5))
+    monitor.observe(10, 2)
+    self.assertTrue(monitor.shedding(15))
+    monitor.observe(16, 0.5)
+    self.assertFalse(monitor.shedding(17))
+
+  def testSheddingLapsesWithoutObservations(self):
+    monitor = fore._QueueingDelayMonitor(1, 10)  # pylint: disable=protected-access
+
+    monitor.observe(0, 2)
+    monitor.observe(10, 2)
+    self.assertTrue(monitor.shedding(19))
+    self.assertFalse(monitor.shedding(20))
+
+
 class RoundTripTest(unittest.TestCase):
 
   def setUp(self):
@@ -96,6 +140,103 @@ class RoundTripTest(unittest.TestCase):
     with test_fore_link.condition:
       self.assertIs(test_fore_link.tickets[-1].kind, tickets.Kind.COMPLETION)
 
+  def testSpinInstrumentBalancedAtStop(self):
+    spin_instrument = _CountingSpinInstrument()
+    fore_link = fore.ForeLink(
+        self.fore_link_pool, {}, {}, None, (), spin_instrument=spin_instrument)
+
+    fore_link.start()
+    fore_link.stop()
+
+    self.assertLess(0, spin_instrument.handlings_started)
+    self.assertEqual(
+        spin_instrument.handlings_started, spin_instrument.handlings_finished)
+
+  def testRefusalWhenOverConcurrencyLimit(self):
+    test_operation_id = object()
+    test_method = 'test method'
+    test_fore_link = _test_links.ForeLink(None, None)
+    test_rear_link = _test_links.RearLink(None, None)
+
+    fore_link = fore.ForeLink(
+        self.fore_link_pool, {test_method: None}, {test_method: None}, None, (),
+        maximum_concurrent_rpcs=0)
+    fore_link.join_rear_link(test_rear_link)
+    test_rear_link.join_fore_link(fore_link)
+    fore_link.start()
+    port = fore_link.port()
+
+    rear_link = rear.RearLink(
+        'localhost', port, self.rear_link_pool, {test_method: None},
+        {test_method: None}, False, None, None, None)
+    rear_link.join_fore_link(test_fore_link)
+    test_fore_link.join_rear_link(rear_link)
+    rear_link.start()
+
+    front_to_back_ticket = tickets.FrontToBackPacket(
+        test_operation_id, 0, tickets.Kind.ENTIRE, test_method,
+        interfaces.ServicedSubscription.Kind.FULL, None, None, _TIMEOUT)
+    rear_link.accept_front_to_back_ticket(front_to_back_ticket)
+
+    with test_fore_link.condition:
+      while (not test_fore_link.tickets or
+             test_fore_link.tickets[-1].kind is tickets.Kind.CONTINUATION):
+        test_fore_link.condition.wait()
+
+    rear_link.stop()
+    fore_link.stop()
+
+    with test_fore_link.condition:
+      self.assertIsNot(
+          test_fore_link.tickets[-1].kind, tickets.Kind.COMPLETION)
+    with test_rear_link.condition:
+      self.assertFalse(test_rear_link.tickets)
+
+  def testRefusalOfRequestBearingRPC(self):
+    test_operation_id = object()
+    test_method = 'test method'
+    unknown_method = 'unknown method'
+    test_fore_link = _test_links.ForeLink(None, None)
+    test_rear_link = _test_links.RearLink(None, None)
+
+    fore_link = fore.ForeLink(
+        self.fore_link_pool, {test_method: None}, {test_method: None}, None, ())
+    fore_link.join_rear_link(test_rear_link)
+    test_rear_link.join_fore_link(fore_link)
+    fore_link.start()
+    port = fore_link.port()
+
+    rear_link = rear.RearLink(
+        'localhost', port, self.rear_link_pool, {unknown_method: None},
+        {unknown_method: None}, False, None, None, None)
+    rear_link.join_fore_link(test_fore_link)
+    test_fore_link.join_rear_link(rear_link)
+    rear_link.start()
+
+    front_to_back_ticket = tickets.FrontToBackPacket(
+        test_operation_id, 0, tickets.Kind.ENTIRE, unknown_method,
+        interfaces.ServicedSubscription.Kind.FULL, None, b'\x00', _TIMEOUT)
+    rear_link.accept_front_to_back_ticket(front_to_back_ticket)
+
+    with test_fore_link.condition:
+      while (not test_fore_link.tickets or
+             test_fore_link.tickets[-1].kind is tickets.Kind.CONTINUATION):
+        test_fore_link.condition.wait()
+
+    # The refused RPC must finish for the links to be able to stop.
+    rear_link.stop()
+    stopper = threading.Thread(target=fore_link.stop)
+    stopper.daemon = True
+    stopper.start()
+    stopper.join(_TIMEOUT)
+    self.assertFalse(stopper.is_alive())
+
+    with test_fore_link.condition:
+      self.assertIsNot(
+          test_fore_link.tickets[-1].kind, tickets.Kind.COMPLETION)
+    with test_rear_link.condition:
+      self.assertFalse(test_rear_link.tickets)
+
   def testEntireRoundTrip(self):
     test_operation_id = object()
     test_method = 'test method'
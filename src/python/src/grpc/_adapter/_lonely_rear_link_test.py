@@ -56,6 +56,14 @@ class LonelyRearLinkTest(unittest.TestCase):
     rear_link.start()
     rear_link.stop()
 
+  def testConnectFails(self):
+    rear_link = rear.RearLink(
+        'nonexistent', 54321, self.pool, {}, {}, False, None, None, None)
+
+    rear_link.start()
+    self.assertFalse(rear_link.connect(_TIMEOUT))
+    rear_link.stop()
+
   def _perform_lonely_client_test_with_ticket_kind(
       self, front_to_back_ticket_kind):
     test_operation_id = object()
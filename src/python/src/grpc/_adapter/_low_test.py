@@ -29,6 +29,7 @@
 
 """Tests for _adapter._low."""
 
+import os
 import time
 import unittest
 
@@ -129,6 +130,7 @@ class EchoTest(unittest.TestCase):
 
     client_call = _low.Call(self.channel, method, self.host, deadline)
 
+    client_call.add_metadata('test-key', 'test value')
     client_call.invoke(self.client_completion_queue, metadata_tag, finish_tag)
 
     self.server.service(service_tag)
@@ -139,6 +141,9 @@ class EchoTest(unittest.TestCase):
     self.assertEqual(method, service_accepted.service_acceptance.method)
     self.assertEqual(self.host, service_accepted.service_acceptance.host)
     self.assertIsNotNone(service_accepted.service_acceptance.call)
+    self.assertIn(
+        ('test-key', 'test value'),
+        service_accepted.service_acceptance.metadata)
     server_call = service_accepted.service_acceptance.call
     server_call.accept(self.server_completion_queue, finish_tag)
     server_call.premetadata()
@@ -254,6 +259,29 @@ class EchoTest(unittest.TestCase):
     self._perform_echo_test(_BYTE_SEQUENCE_SEQUENCE)
 
 
+class UnixDomainSocketEchoTest(EchoTest):
+
+  def setUp(self):
+    self.host = 'localhost'
+    self.socket_path = '/tmp/grpc_low_test.%d' % os.getpid()
+    address = 'unix:%s' % self.socket_path
+
+    self.server_completion_queue = _low.CompletionQueue()
+    self.server = _low.Server(self.server_completion_queue, None)
+    self.server.add_http2_addr(address)
+    self.server.start()
+
+    self.client_completion_queue = _low.CompletionQueue()
+    self.channel = _low.Channel(address, None)
+
+  def tearDown(self):
+    try:
+      EchoTest.tearDown(self)
+    finally:
+      if os.path.exists(self.socket_path):
+        os.remove(self.socket_path)
+
+
 class CancellationTest(unittest.TestCase):
 
   def setUp(self):
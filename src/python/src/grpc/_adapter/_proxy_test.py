@@ -0,0 +1,349 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Tests of the forwarding proxy."""
+
+import threading
+import time
+import unittest
+
+from grpc._adapter import _test_links
+from grpc._adapter import fore
+from grpc._adapter import proxy
+from grpc._adapter import rear
+from grpc.framework.base import interfaces
+from grpc.framework.base.packets import packets as tickets
+from grpc.framework.foundation import logging_pool
+
+_IDENTITY = lambda x: x
+_TIMEOUT = 2
+# The length of time allowed for a ticket to cross the proxy or for a write to
+# be drained.
+_WAIT_TIMEOUT = 2
+# The size of the messages sent to stalled peers, larger than the flow-control
+# windows of the transport so that each message blocks the write after it.
+_STALL_MESSAGE_SIZE = 256 * 1024
+_STALL_MESSAGE_COUNT = 10
+# The timeout of the RPCs made to stalled peers, long enough to never expire
+# during a test.
+_STALL_TIMEOUT = 60
+# The most messages of a stream to a stalled peer that may be written: the one
+# read by the peer and the one held by the proxy. The message after them cannot
+# be written because the transport has room for less than one message.
+_STALL_BOUND = 2
+_SERVICE = '/test.Service/'
+_METHOD = _SERVICE + 'Method'
+_UNROUTED_METHOD = '/test.OtherService/Method'
+_BACKEND = 'backend'
+
+
+def _reversing_rear_action(front_to_back_ticket, fore_link):
+  """Answers each request payload with its bytes reversed.
+
+  The next request is read after each request has been answered.
+  """
+  if front_to_back_ticket.kind is tickets.Kind.CONTINUATION:
+    fore_link.accept_back_to_front_ticket(
+        tickets.BackToFrontPacket(
+            front_to_back_ticket.operation_id,
+            front_to_back_ticket.sequence_number - 1,
+            tickets.Kind.CONTINUATION, front_to_back_ticket.payload[::-1]))
+    fore_link.resume_reading(front_to_back_ticket.operation_id)
+  elif front_to_back_ticket.kind is tickets.Kind.COMPLETION:
+    fore_link.accept_back_to_front_ticket(
+        tickets.BackToFrontPacket(
+            front_to_back_ticket.operation_id,
+            front_to_back_ticket.sequence_number - 1,
+            tickets.Kind.COMPLETION, None))
+
+
+def _resuming_fore_action(back_to_front_ticket, rear_link):
+  """Reads the next response after each response."""
+  if back_to_front_ticket.kind is tickets.Kind.CONTINUATION:
+    rear_link.resume_reading(back_to_front_ticket.operation_id)
+
+
+def _await(condition, predicate):
+  """Waits on a condition for at most _WAIT_TIMEOUT for a predicate to hold.
+
+  Args:
+    condition: A threading.Condition notified when the predicate might have
+      come to hold.
+    predicate: A nullary callable returning whether or not the awaited state
+      has been reached. Called only while holding the condition.
+
+  Returns:
+    Whether or not the predicate held within _WAIT_TIMEOUT.
+  """
+  deadline = time.time() + _WAIT_TIMEOUT
+  with condition:
+    while not predicate():
+      remaining = deadline - time.time()
+      if remaining <= 0:
+        return False
+      condition.wait(remaining)
+    return True
+
+
+class _DrainCounter(object):
+  """Counts the drains of a link."""
+
+  def __init__(self):
+    self.condition = threading.Condition()
+    self.count = 0
+
+  def drained(self, unused_operation_id):
+    """A drain observer for the link."""
+    with self.condition:
+      self.count += 1
+      self.condition.notify_all()
+
+
+class PrefixRouterTest(unittest.TestCase):
+
+  def testLongestPrefixWins(self):
+    router = proxy.prefix_router(
+        {'/a.Service/': 'service', '/a.Service/Special': 'special'})
+
+    self.assertEqual('service', router.route('/a.Service/Ordinary'))
+    self.assertEqual('special', router.route('/a.Service/Special'))
+
+  def testDefault(self):
+    self.assertIsNone(
+        proxy.prefix_router({'/a.Service/': 'a'}).route('/b.Service/M'))
+    self.assertEqual(
+        'b', proxy.prefix_router({'/a.Service/': 'a'}, default='b').route(
+            '/b.Service/M'))
+
+
+class ProxyLifecycleTest(unittest.TestCase):
+
+  def testStopBeforeStart(self):
+    unstarted_proxy = proxy.Proxy(
+        None, {_BACKEND: ('localhost', 0)},
+        proxy.prefix_router({_SERVICE: _BACKEND}))
+
+    unstarted_proxy.stop()
+
+    self.assertIsNone(unstarted_proxy.port())
+
+
+class ProxyTest(unittest.TestCase):
+
+  def setUp(self):
+    self.backend_pool = logging_pool.pool(80)
+    self.client_pool = logging_pool.pool(80)
+
+    self.backend_rear_link = _test_links.RearLink(_reversing_rear_action, None)
+    self.backend_drains = _DrainCounter()
+    self.backend = fore.ForeLink(
+        self.backend_pool, {_METHOD: _IDENTITY}, {_METHOD: _IDENTITY}, None,
+        (), paced_reads=True, drain_observer=self.backend_drains.drained)
+    self.backend.join_rear_link(self.backend_rear_link)
+    self.backend_rear_link.join_fore_link(self.backend)
+    self.backend.start()
+
+    self.proxy = proxy.Proxy(
+        None, {_BACKEND: ('localhost', self.backend.port())},
+        proxy.prefix_router({_SERVICE: _BACKEND}))
+    self.proxy.start()
+
+    self.client_fore_link = _test_links.ForeLink(_resuming_fore_action, None)
+    self.client_drains = _DrainCounter()
+    self.client = rear.RearLink(
+        'localhost', self.proxy.port(), self.client_pool,
+        {_METHOD: _IDENTITY, _UNROUTED_METHOD: _IDENTITY},
+        {_METHOD: _IDENTITY, _UNROUTED_METHOD: _IDENTITY}, False, None, None,
+        None, paced_reads=True, drain_observer=self.client_drains.drained)
+    self.client.join_fore_link(self.client_fore_link)
+    self.client_fore_link.join_rear_link(self.client)
+    self.client.start()
+
+  def tearDown(self):
+    self.client.stop()
+    self.proxy.stop()
+    self.backend.stop()
+    self.client_pool.shutdown(wait=True)
+    self.backend_pool.shutdown(wait=True)
+
+  def _await_client_termination(self):
+    terminated = _await(
+        self.client_fore_link.condition,
+        lambda: self.client_fore_link.tickets and
+        self.client_fore_link.tickets[-1].kind is not
+        tickets.Kind.CONTINUATION)
+    self.assertTrue(terminated)
+    with self.client_fore_link.condition:
+      return self.client_fore_link.tickets[-1].kind
+
+  def _commence(self, operation_id, timeout):
+    self.client.accept_front_to_back_ticket(
+        tickets.FrontToBackPacket(
+            operation_id, 0, tickets.Kind.COMMENCEMENT, _METHOD,
+            interfaces.ServicedSubscription.Kind.FULL, None, None, timeout))
+    self.assertTrue(
+        _await(
+            self.backend_rear_link.condition,
+            lambda: self.backend_rear_link.tickets))
+    with self.backend_rear_link.condition:
+      return self.backend_rear_link.tickets[0].operation_id
+
+  def _drained_writes(self, write, drains):
+    """Writes messages one at a time until a message is not drained.
+
+    Args:
+      write: A callable accepting the index of a message and writing it.
+      drains: The _DrainCounter of the link written to by the given callable.
+
+    Returns:
+      The number of messages written and drained before one was not drained,
+        at most _STALL_MESSAGE_COUNT.
+    """
+    written = 0
+    while written < _STALL_MESSAGE_COUNT:
+      write(written)
+      if not _await(drains.condition, lambda: written < drains.count):
+        break
+      written += 1
+    return written
+
+  def testConnect(self):
+    self.assertEqual({_BACKEND: True}, self.proxy.connect(_TIMEOUT))
+
+  def testStreamingRoundTrip(self):
+    operation_id = object()
+    requests = (b'\x00\x01', b'\x02\x03\x04', b'\x05')
+
+    self._commence(operation_id, _TIMEOUT)
+    for sequence_number, request in enumerate(requests, start=1):
+      self.client.accept_front_to_back_ticket(
+          tickets.FrontToBackPacket(
+              operation_id, sequence_number, tickets.Kind.CONTINUATION, None,
+              None, None, request, None))
+    self.client.accept_front_to_back_ticket(
+        tickets.FrontToBackPacket(
+            operation_id, len(requests) + 1, tickets.Kind.COMPLETION, None,
+            None, None, None, None))
+
+    self.assertIs(tickets.Kind.COMPLETION, self._await_client_termination())
+    with self.backend_rear_link.condition:
+      forwarded = tuple(
+          ticket.payload for ticket in self.backend_rear_link.tickets
+          if ticket.payload is not None)
+    with self.client_fore_link.condition:
+      responses = tuple(
+          ticket.payload for ticket in self.client_fore_link.tickets
+          if ticket.payload is not None)
+    self.assertTupleEqual(requests, forwarded)
+    self.assertTupleEqual(
+        tuple(request[::-1] for request in requests), responses)
+
+  def testUnroutedMethodRefused(self):
+    self.client.accept_front_to_back_ticket(
+        tickets.FrontToBackPacket(
+            object(), 0, tickets.Kind.ENTIRE, _UNROUTED_METHOD,
+            interfaces.ServicedSubscription.Kind.FULL, None, b'\x00',
+            _TIMEOUT))
+
+    self.assertIsNot(tickets.Kind.COMPLETION, self._await_client_termination())
+    with self.backend_rear_link.condition:
+      self.assertFalse(self.backend_rear_link.tickets)
+
+  def testCancellationReachesBackend(self):
+    operation_id = object()
+    # The backend must not answer the end of the requests that the cancelled
+    # RPC may appear to have before it is seen to have been cancelled.
+    with self.backend_rear_link.condition:
+      self.backend_rear_link.action = None
+
+    self._commence(operation_id, _TIMEOUT)
+    self.client.accept_front_to_back_ticket(
+        tickets.FrontToBackPacket(
+            operation_id, 1, tickets.Kind.CANCELLATION, None, None, None, None,
+            None))
+
+    self.assertTrue(
+        _await(
+            self.backend_rear_link.condition,
+            lambda: self.backend_rear_link.tickets[-1].kind is
+            tickets.Kind.CANCELLATION))
+
+  def testStalledBackendHoldsBackRequests(self):
+    operation_id = object()
+    request = b'\x00' * _STALL_MESSAGE_SIZE
+    with self.backend_rear_link.condition:
+      self.backend_rear_link.action = None
+
+    self._commence(operation_id, _STALL_TIMEOUT)
+    written = self._drained_writes(
+        lambda index: self.client.accept_front_to_back_ticket(
+            tickets.FrontToBackPacket(
+                operation_id, index + 1, tickets.Kind.CONTINUATION, None, None,
+                None, request, None)),
+        self.client_drains)
+    self.client.accept_front_to_back_ticket(
+        tickets.FrontToBackPacket(
+            operation_id, written + 2, tickets.Kind.CANCELLATION, None, None,
+            None, None, None))
+
+    self.assertLessEqual(written, _STALL_BOUND)
+    with self.backend_rear_link.condition:
+      self.assertEqual(
+          1, sum(
+              1 for ticket in self.backend_rear_link.tickets
+              if ticket.payload is not None))
+
+  def testStalledClientHoldsBackResponses(self):
+    operation_id = object()
+    response = b'\x00' * _STALL_MESSAGE_SIZE
+    with self.client_fore_link.condition:
+      self.client_fore_link.action = None
+
+    backend_operation_id = self._commence(operation_id, _STALL_TIMEOUT)
+    written = self._drained_writes(
+        lambda index: self.backend.accept_back_to_front_ticket(
+            tickets.BackToFrontPacket(
+                backend_operation_id, index, tickets.Kind.CONTINUATION,
+                response)),
+        self.backend_drains)
+    self.client.accept_front_to_back_ticket(
+        tickets.FrontToBackPacket(
+            operation_id, 1, tickets.Kind.CANCELLATION, None, None, None, None,
+            None))
+
+    self.assertLessEqual(written, _STALL_BOUND)
+    with self.client_fore_link.condition:
+      self.assertEqual(
+          1, sum(
+              1 for ticket in self.client_fore_link.tickets
+              if ticket.payload is not None))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,313 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Byte rings in memory shared between two processes on the same host.
+
+A segment is a file (ideally on a memory-backed file system such as /dev/shm)
+mapped into the memory of both processes and holding two rings, one for each
+direction of traffic. Each ring is written by a single producer and read by a
+single consumer. Its head and tail are monotonically increasing byte positions
+kept on separate cache lines of the ring's header.
+
+A consumer with nothing to read raises a flag in the ring's header and blocks
+on a named pipe, the ring's doorbell, into which the producer writes a byte
+after publishing records while the flag is raised. Python code issues no
+memory barriers, so a producer's store of its head may become visible after
+its load of the flag (and likewise the consumer's store of the flag after its
+load of the head), and the doorbell can then be missed. A futex in the segment
+would not close this window without a fence in the producer, and a system call
+made for every record would cost more than the pipe write it replaces. A
+consumer instead blocks for no longer than a given timeout before looking at
+the ring again: a missed doorbell delays the records it announced by at most
+that timeout and never loses them, and an idle consumer wakes once per timeout.
+
+A producer with no room in its ring waits for its consumer to make room, but
+gives up once a given timeout has elapsed or either process has marked the
+segment closed in the segment's header.
+"""
+
+import errno
+import mmap
+import os
+import select
+import struct
+import time
+
+_MAGIC = b'GRPCRING'
+_SEGMENT_HEADER = struct.Struct('<8sQ')
+_SEGMENT_HEADER_SIZE = 64
+_CLOSED = 16
+_POSITION = struct.Struct('<Q')
+_FLAG = struct.Struct('<I')
+_RECORD = struct.Struct('<II')
+_HEAD = 0
+_TAIL = 64
+_SLEEPING = 128
+_RING_HEADER_SIZE = 192
+_DOORBELL_SUFFIXES = ('.0', '.1')
+_DRAIN_SIZE = 4096
+_FULL_BACKOFF = 0.0001
+
+
+class Ring(object):
+  """One direction of traffic through a segment."""
+
+  def __init__(self, memory, offset, capacity, doorbell_path):
+    self._memory = memory
+    self._offset = offset
+    self._data = offset + _RING_HEADER_SIZE
+    self._limit = self._data + capacity
+    self._capacity = capacity
+    self._doorbell = os.open(doorbell_path, os.O_RDWR | os.O_NONBLOCK)
+
+  def _load(self, field):
+    return _POSITION.unpack_from(self._memory, self._offset + field)[0]
+
+  def _store(self, field, position):
+    _POSITION.pack_into(self._memory, self._offset + field, position)
+
+  def _read(self, position, length):
+    start = self._data + position % self._capacity
+    end = start + length
+    if end <= self._limit:
+      return self._memory[start:end]
+    else:
+      first = self._limit - start
+      return (
+          self._memory[start:self._limit] +
+          self._memory[self._data:self._data + length - first])
+
+  def _write(self, position, value):
+    start = self._data + position % self._capacity
+    end = start + len(value)
+    if end <= self._limit:
+      self._memory[start:end] = value
+    else:
+      first = self._limit - start
+      self._memory[start:self._limit] = value[:first]
+      self._memory[self._data:self._data + len(value) - first] = value[first:]
+
+  def _ring(self):
+    try:
+      os.write(self._doorbell, b'\x00')
+    except OSError as error:
+      # A full doorbell will wake its consumer anyway.
+      if error.errno != errno.EAGAIN:
+        raise
+
+  def _drain(self):
+    try:
+      while os.read(self._doorbell, _DRAIN_SIZE):
+        pass
+    except OSError as error:
+      if error.errno != errno.EAGAIN:
+        raise
+
+  def put(self, header, payload, timeout):
+    """Copies a record into this ring, waiting for room if necessary.
+
+    Calls to this method must be serialized by the caller.
+
+    Args:
+      header: A bytestring.
+      payload: A bytestring.
+      timeout: The longest length of time in seconds for which to wait for
+        room in this ring.
+
+    Returns:
+      True if the record was copied into this ring, or False if there was no
+        room for it within the timeout or the segment was closed while there
+        was no room for it.
+
+    Raises:
+      ValueError: If the record could never fit in this ring.
+    """
+    length = _RECORD.size + len(header) + len(payload)
+    if self._capacity < length:
+      raise ValueError(
+          'Record of %d bytes exceeds ring capacity of %d bytes!' % (
+              length, self._capacity))
+    head = self._load(_HEAD)
+    if self._capacity < head + length - self._load(_TAIL):
+      self._ring()
+      deadline = time.time() + timeout
+      while self._capacity < head + length - self._load(_TAIL):
+        if (_FLAG.unpack_from(self._memory, _CLOSED)[0] or
+            deadline <= time.time()):
+          return False
+        time.sleep(_FULL_BACKOFF)
+    self._write(head, _RECORD.pack(length, len(header)))
+    self._write(head + _RECORD.size, header)
+    if payload:
+      self._write(head + _RECORD.size + len(header), payload)
+    self._store(_HEAD, head + length)
+    if _FLAG.unpack_from(self._memory, self._offset + _SLEEPING)[0]:
+      self._ring()
+    return True
+
+  def take(self, timeout):
+    """Takes all of the records in this ring, waiting for at least one.
+
+    Calls to this method must be serialized by the caller.
+
+    Args:
+      timeout: The longest length of time in seconds for which to wait.
+
+    Returns:
+      A list of (header, payload) pairs of bytestrings, empty if no record
+        arrived within the timeout.
+    """
+    tail = self._load(_TAIL)
+    head = self._load(_HEAD)
+    if head == tail:
+      _FLAG.pack_into(self._memory, self._offset + _SLEEPING, 1)
+      head = self._load(_HEAD)
+      if head == tail:
+        select.select((self._doorbell,), (), (), timeout)
+        self._drain()
+        head = self._load(_HEAD)
+      _FLAG.pack_into(self._memory, self._offset + _SLEEPING, 0)
+
+    records = []
+    while tail < head:
+      length, header_length = _RECORD.unpack(self._read(tail, _RECORD.size))
+      header_end = tail + _RECORD.size + header_length
+      records.append((
+          self._read(tail + _RECORD.size, header_length),
+          self._read(header_end, tail + length - header_end)))
+      tail += length
+    self._store(_TAIL, tail)
+    return records
+
+  def wake(self):
+    """Wakes this ring's consumer if it is waiting."""
+    self._ring()
+
+  def close(self):
+    os.close(self._doorbell)
+
+
+class Segment(object):
+  """A mapped segment holding a front-to-back and a back-to-front Ring.
+
+  Attributes:
+    front_to_back: The Ring carrying traffic from a RearLink to a ForeLink.
+    back_to_front: The Ring carrying traffic from a ForeLink to a RearLink.
+  """
+
+  def __init__(self, path, memory, capacity, owner):
+    self._path = path
+    self._memory = memory
+    self._owner = owner
+    ring_size = _RING_HEADER_SIZE + capacity
+    self.front_to_back = Ring(
+        memory, _SEGMENT_HEADER_SIZE, capacity,
+        path + _DOORBELL_SUFFIXES[0])
+    self.back_to_front = Ring(
+        memory, _SEGMENT_HEADER_SIZE + ring_size, capacity,
+        path + _DOORBELL_SUFFIXES[1])
+
+  def mark_closed(self):
+    """Marks this segment closed in both processes.
+
+    Producers waiting for room in either of the segment's rings give up rather
+    than wait for a consumer that will never make room.
+    """
+    _FLAG.pack_into(self._memory, _CLOSED, 1)
+
+  def close(self):
+    """Unmaps this segment, removing its files if it was created here."""
+    self.mark_closed()
+    self.front_to_back.close()
+    self.back_to_front.close()
+    self._memory.close()
+    if self._owner:
+      for path in (self._path,) + tuple(
+          self._path + suffix for suffix in _DOORBELL_SUFFIXES):
+        try:
+          os.unlink(path)
+        except OSError:
+          pass
+
+
+def _size(capacity):
+  return _SEGMENT_HEADER_SIZE + 2 * (_RING_HEADER_SIZE + capacity)
+
+
+def create(path, capacity):
+  """Creates a segment, replacing any existing segment at the same path.
+
+  Args:
+    path: The path of the file to create.
+    capacity: The capacity in bytes of each of the segment's rings.
+
+  Returns:
+    A Segment that removes its files when closed.
+  """
+  for suffix in _DOORBELL_SUFFIXES:
+    if os.path.exists(path + suffix):
+      os.unlink(path + suffix)
+    os.mkfifo(path + suffix, 0600)
+  file_descriptor = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0600)
+  try:
+    os.ftruncate(file_descriptor, _size(capacity))
+    memory = mmap.mmap(file_descriptor, _size(capacity))
+  finally:
+    os.close(file_descriptor)
+  _SEGMENT_HEADER.pack_into(memory, 0, _MAGIC, capacity)
+  return Segment(path, memory, capacity, True)
+
+
+def attach(path):
+  """Maps a segment created by another process.
+
+  The segment is marked open, ending any mark of closure left by a process
+  previously attached to it.
+
+  Args:
+    path: The path of the segment's file.
+
+  Returns:
+    A Segment.
+
+  Raises:
+    OSError: If there is no segment at the given path.
+    ValueError: If the file at the given path is not a segment.
+  """
+  file_descriptor = os.open(path, os.O_RDWR)
+  try:
+    magic, capacity = _SEGMENT_HEADER.unpack(
+        os.read(file_descriptor, _SEGMENT_HEADER.size))
+    if magic != _MAGIC:
+      raise ValueError('%s is not a shared-memory segment!' % path)
+    memory = mmap.mmap(file_descriptor, _size(capacity))
+  finally:
+    os.close(file_descriptor)
+  _FLAG.pack_into(memory, _CLOSED, 0)
+  return Segment(path, memory, capacity, False)
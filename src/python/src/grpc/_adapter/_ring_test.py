@@ -0,0 +1,148 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Tests of the shared-memory rings."""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from grpc._adapter import _ring
+
+_CAPACITY = 64
+_TIMEOUT = 2
+
+
+class RingTest(unittest.TestCase):
+
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+    self.path = os.path.join(self.directory, 'segment')
+    self.created = _ring.create(self.path, _CAPACITY)
+    self.attached = _ring.attach(self.path)
+
+  def tearDown(self):
+    self.attached.close()
+    self.created.close()
+    shutil.rmtree(self.directory)
+
+  def testEmpty(self):
+    self.assertEqual([], self.attached.front_to_back.take(0))
+
+  def testRecordsInOrder(self):
+    self.attached.front_to_back.put(b'first', b'payload', _TIMEOUT)
+    self.attached.front_to_back.put(b'second', b'', _TIMEOUT)
+    self.created.back_to_front.put(b'third', b'reply', _TIMEOUT)
+
+    self.assertEqual(
+        [(b'first', b'payload'), (b'second', b'')],
+        self.created.front_to_back.take(_TIMEOUT))
+    self.assertEqual(
+        [(b'third', b'reply')], self.attached.back_to_front.take(_TIMEOUT))
+    self.assertEqual([], self.created.front_to_back.take(0))
+
+  def testWrapAround(self):
+    ring = self.attached.front_to_back
+    for index in range(20):
+      header = b'header %d' % index
+      payload = bytes(bytearray(range(index)))
+      ring.put(header, payload, _TIMEOUT)
+      self.assertEqual(
+          [(header, payload)], self.created.front_to_back.take(_TIMEOUT))
+
+  def testOversizedRecord(self):
+    with self.assertRaises(ValueError):
+      self.attached.front_to_back.put(
+          b'header', b'\x00' * _CAPACITY, _TIMEOUT)
+
+  def testDoorbell(self):
+    records = []
+    def take():
+      records.extend(self.created.front_to_back.take(_TIMEOUT))
+    thread = threading.Thread(target=take)
+    thread.start()
+    time.sleep(0.1)
+    start = time.time()
+    self.attached.front_to_back.put(b'header', b'payload', _TIMEOUT)
+    thread.join()
+
+    self.assertLess(time.time() - start, _TIMEOUT / 2.0)
+    self.assertEqual([(b'header', b'payload')], records)
+
+  def testFullRingWaitsForRoom(self):
+    # Each record is of 24 bytes; two fit in the ring and a third must wait.
+    for _ in range(2):
+      self.attached.front_to_back.put(b'header', b'\x00' * 10, _TIMEOUT)
+    def drain():
+      time.sleep(0.1)
+      self.created.front_to_back.take(_TIMEOUT)
+    thread = threading.Thread(target=drain)
+    thread.start()
+    put = self.attached.front_to_back.put(b'header', b'\x00' * 10, _TIMEOUT)
+    thread.join()
+
+    self.assertTrue(put)
+    self.assertEqual(
+        [(b'header', b'\x00' * 10)], self.created.front_to_back.take(_TIMEOUT))
+
+  def testFullRingGivesUpAtTimeout(self):
+    for _ in range(2):
+      self.attached.front_to_back.put(b'header', b'\x00' * 10, _TIMEOUT)
+    start = time.time()
+    put = self.attached.front_to_back.put(b'header', b'\x00' * 10, 0.1)
+
+    self.assertFalse(put)
+    self.assertLess(time.time() - start, _TIMEOUT / 2.0)
+    self.assertEqual(2, len(self.created.front_to_back.take(_TIMEOUT)))
+
+  def testFullRingGivesUpWhenClosed(self):
+    for _ in range(2):
+      self.attached.front_to_back.put(b'header', b'\x00' * 10, _TIMEOUT)
+    def close():
+      time.sleep(0.1)
+      self.created.mark_closed()
+    thread = threading.Thread(target=close)
+    thread.start()
+    start = time.time()
+    put = self.attached.front_to_back.put(b'header', b'\x00' * 10, _TIMEOUT)
+    thread.join()
+
+    self.assertFalse(put)
+    self.assertLess(time.time() - start, _TIMEOUT / 2.0)
+
+  def testAttachToMissingSegment(self):
+    with self.assertRaises(OSError):
+      _ring.attach(os.path.join(self.directory, 'missing'))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -133,9 +133,10 @@ static PyObject *pygrpc_server_stop(Server *self) {
 
 static PyMethodDef methods[] = {
     {"add_http2_addr", (PyCFunction)pygrpc_server_add_http2_addr, METH_VARARGS,
-     "Add an HTTP2 address."},
+     "Add an HTTP2 address (\"host:port\" or \"unix:path\")."},
     {"add_secure_http2_addr", (PyCFunction)pygrpc_server_add_secure_http2_addr,
-     METH_VARARGS, "Add a secure HTTP2 address."},
+     METH_VARARGS,
+     "Add a secure HTTP2 address (\"host:port\" or \"unix:path\")."},
     {"start", (PyCFunction)pygrpc_server_start, METH_NOARGS,
      "Starts the server."},
     {"service", (PyCFunction)pygrpc_server_service, METH_O,
@@ -0,0 +1,299 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Tests of the shared-memory ForeLink and RearLink."""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+
+from grpc._adapter import _test_links
+from grpc._adapter import shared_memory
+from grpc._junkdrawer import math_pb2
+from grpc.framework.assembly import implementations
+from grpc.framework.assembly import utilities
+from grpc.framework.base import interfaces
+from grpc.framework.base.packets import packets as tickets
+
+DIV = 'Div'
+FIB = 'Fib'
+SUM = 'Sum'
+
+_TIMEOUT = 10
+_SMALL_CAPACITY = 1024
+
+
+def _div(request, unused_context):
+  return math_pb2.DivReply(
+      quotient=request.dividend / request.divisor,
+      remainder=request.dividend % request.divisor)
+
+
+def _fib(request, unused_context):
+  left, right = 0, 1
+  for _ in xrange(request.limit):
+    yield math_pb2.Num(num=left)
+    left, right = right, left + right
+
+
+def _sum(request_iterator, unused_context):
+  return math_pb2.Num(num=sum(request.num for request in request_iterator))
+
+
+_IMPLEMENTATIONS = {
+    DIV: utilities.unary_unary_inline(_div),
+    FIB: utilities.unary_stream_inline(_fib),
+    SUM: utilities.stream_unary_inline(_sum),
+}
+_REQUEST_DESERIALIZERS = {
+    DIV: math_pb2.DivArgs.FromString,
+    FIB: math_pb2.FibArgs.FromString,
+    SUM: math_pb2.Num.FromString,
+}
+_RESPONSE_SERIALIZERS = {
+    DIV: math_pb2.DivReply.SerializeToString,
+    FIB: math_pb2.Num.SerializeToString,
+    SUM: math_pb2.Num.SerializeToString,
+}
+_REQUEST_SERIALIZERS = {
+    DIV: math_pb2.DivArgs.SerializeToString,
+    FIB: math_pb2.FibArgs.SerializeToString,
+    SUM: math_pb2.Num.SerializeToString,
+}
+_RESPONSE_DESERIALIZERS = {
+    DIV: math_pb2.DivReply.FromString,
+    FIB: math_pb2.Num.FromString,
+    SUM: math_pb2.Num.FromString,
+}
+
+
+def _serve(path, ready, stop):
+  fore_link = shared_memory.ForeLink(
+      path, _REQUEST_DESERIALIZERS, _RESPONSE_SERIALIZERS)
+  with implementations.assemble_service(_IMPLEMENTATIONS, fore_link):
+    ready.set()
+    stop.wait()
+
+
+class SharedMemoryTest(unittest.TestCase):
+
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+    self.path = os.path.join(self.directory, 'segment')
+
+  def tearDown(self):
+    shutil.rmtree(self.directory)
+
+  def testZeroMessageRoundTrip(self):
+    test_operation_id = object()
+    test_method = 'test method'
+    test_fore_link = _test_links.ForeLink(None, None)
+    def rear_action(front_to_back_ticket, fore_link):
+      if front_to_back_ticket.kind in (
+          tickets.Kind.COMPLETION, tickets.Kind.ENTIRE):
+        back_to_front_ticket = tickets.BackToFrontPacket(
+            front_to_back_ticket.operation_id, 0, tickets.Kind.COMPLETION, None)
+        fore_link.accept_back_to_front_ticket(back_to_front_ticket)
+    test_rear_link = _test_links.RearLink(rear_action, None)
+
+    fore_link = shared_memory.ForeLink(
+        self.path, {test_method: None}, {test_method: None})
+    fore_link.join_rear_link(test_rear_link)
+    test_rear_link.join_fore_link(fore_link)
+    fore_link.start()
+
+    rear_link = shared_memory.RearLink(
+        self.path, {test_method: None}, {test_method: None})
+    rear_link.join_fore_link(test_fore_link)
+    test_fore_link.join_rear_link(rear_link)
+    rear_link.start()
+
+    front_to_back_ticket = tickets.FrontToBackPacket(
+        test_operation_id, 0, tickets.Kind.ENTIRE, test_method,
+        interfaces.ServicedSubscription.Kind.FULL, None, None, _TIMEOUT)
+    rear_link.accept_front_to_back_ticket(front_to_back_ticket)
+
+    with test_fore_link.condition:
+      while not test_fore_link.tickets:
+        test_fore_link.condition.wait()
+
+    rear_link.stop()
+    fore_link.stop()
+
+    with test_rear_link.condition:
+      self.assertEqual(1, len(test_rear_link.tickets))
+      self.assertIs(tickets.Kind.ENTIRE, test_rear_link.tickets[0].kind)
+      self.assertEqual(test_method, test_rear_link.tickets[0].name)
+      self.assertIs(
+          interfaces.ServicedSubscription.Kind.FULL,
+          test_rear_link.tickets[0].subscription)
+      self.assertEqual(_TIMEOUT, test_rear_link.tickets[0].timeout)
+    with test_fore_link.condition:
+      self.assertEqual(1, len(test_fore_link.tickets))
+      self.assertIs(test_operation_id, test_fore_link.tickets[0].operation_id)
+      self.assertIs(tickets.Kind.COMPLETION, test_fore_link.tickets[0].kind)
+    self.assertFalse(os.path.exists(self.path))
+
+  def testUnknownMethod(self):
+    test_fore_link = _test_links.ForeLink(None, None)
+    fore_link = shared_memory.ForeLink(self.path, {}, {})
+    rear_link = shared_memory.RearLink(
+        self.path, {'test method': None}, {'test method': None})
+    rear_link.join_fore_link(test_fore_link)
+
+    with fore_link, rear_link:
+      rear_link.accept_front_to_back_ticket(tickets.FrontToBackPacket(
+          object(), 0, tickets.Kind.ENTIRE, 'test method',
+          interfaces.ServicedSubscription.Kind.FULL, None, None, _TIMEOUT))
+      with test_fore_link.condition:
+        while not test_fore_link.tickets:
+          test_fore_link.condition.wait()
+        self.assertIs(
+            tickets.Kind.TRANSMISSION_FAILURE, test_fore_link.tickets[0].kind)
+
+  def testOversizedRequestFailsOperation(self):
+    test_method = 'test method'
+    test_fore_link = _test_links.ForeLink(None, None)
+    test_rear_link = _test_links.RearLink(None, None)
+    fore_link = shared_memory.ForeLink(
+        self.path, {test_method: None}, {test_method: None},
+        capacity=_SMALL_CAPACITY)
+    fore_link.join_rear_link(test_rear_link)
+    rear_link = shared_memory.RearLink(
+        self.path, {test_method: None}, {test_method: None})
+    rear_link.join_fore_link(test_fore_link)
+
+    with fore_link, rear_link:
+      rear_link.accept_front_to_back_ticket(tickets.FrontToBackPacket(
+          object(), 0, tickets.Kind.ENTIRE, test_method,
+          interfaces.ServicedSubscription.Kind.FULL, None,
+          b'\x00' * (_SMALL_CAPACITY + 1), _TIMEOUT))
+      with test_fore_link.condition:
+        while not test_fore_link.tickets:
+          test_fore_link.condition.wait()
+        self.assertIs(
+            tickets.Kind.TRANSMISSION_FAILURE, test_fore_link.tickets[0].kind)
+
+    with test_rear_link.condition:
+      self.assertEqual([], test_rear_link.tickets)
+
+  def testOversizedResponseFailsOperationAtBothEnds(self):
+    test_method = 'test method'
+    test_fore_link = _test_links.ForeLink(None, None)
+    def rear_action(front_to_back_ticket, fore_link):
+      if front_to_back_ticket.kind is tickets.Kind.ENTIRE:
+        fore_link.accept_back_to_front_ticket(tickets.BackToFrontPacket(
+            front_to_back_ticket.operation_id, 0, tickets.Kind.CONTINUATION,
+            b'\x00' * (_SMALL_CAPACITY + 1)))
+    test_rear_link = _test_links.RearLink(rear_action, None)
+    fore_link = shared_memory.ForeLink(
+        self.path, {test_method: None}, {test_method: None},
+        capacity=_SMALL_CAPACITY)
+    fore_link.join_rear_link(test_rear_link)
+    test_rear_link.join_fore_link(fore_link)
+    rear_link = shared_memory.RearLink(
+        self.path, {test_method: None}, {test_method: None})
+    rear_link.join_fore_link(test_fore_link)
+
+    with fore_link, rear_link:
+      rear_link.accept_front_to_back_ticket(tickets.FrontToBackPacket(
+          object(), 0, tickets.Kind.ENTIRE, test_method,
+          interfaces.ServicedSubscription.Kind.FULL, None, None, _TIMEOUT))
+      with test_fore_link.condition:
+        while not test_fore_link.tickets:
+          test_fore_link.condition.wait()
+        self.assertIs(
+            tickets.Kind.TRANSMISSION_FAILURE, test_fore_link.tickets[0].kind)
+      with test_rear_link.condition:
+        while len(test_rear_link.tickets) < 2:
+          test_rear_link.condition.wait()
+        self.assertIs(
+            tickets.Kind.TRANSMISSION_FAILURE, test_rear_link.tickets[1].kind)
+        self.assertEqual(1, test_rear_link.tickets[1].sequence_number)
+
+  def testStopBeforeStart(self):
+    fore_link = shared_memory.ForeLink(self.path, {}, {})
+    rear_link = shared_memory.RearLink(self.path, {}, {})
+
+    fore_link.stop()
+    rear_link.stop()
+
+    self.assertFalse(os.path.exists(self.path))
+
+  def testAssembled(self):
+    fore_link = shared_memory.ForeLink(
+        self.path, _REQUEST_DESERIALIZERS, _RESPONSE_SERIALIZERS)
+    rear_link = shared_memory.RearLink(
+        self.path, _REQUEST_SERIALIZERS, _RESPONSE_DESERIALIZERS)
+    server = implementations.assemble_service(_IMPLEMENTATIONS, fore_link)
+    stub = implementations.assemble_dynamic_inline_stub(
+        _IMPLEMENTATIONS, rear_link)
+
+    with server, stub:
+      response = stub.Div(math_pb2.DivArgs(dividend=973, divisor=59), _TIMEOUT)
+      numbers = [
+          number.num for number in stub.Fib(
+              math_pb2.FibArgs(limit=10), _TIMEOUT)]
+      total = stub.Sum(
+          iter(math_pb2.Num(num=number) for number in range(100)), _TIMEOUT)
+      byte_counts = rear_link.byte_counts()
+
+    self.assertEqual(973 / 59, response.quotient)
+    self.assertEqual(973 % 59, response.remainder)
+    self.assertEqual([0, 1, 1, 2, 3, 5, 8, 13, 21, 34], numbers)
+    self.assertEqual(sum(range(100)), total.num)
+    self.assertEqual(
+        len(math_pb2.DivArgs(dividend=973, divisor=59).SerializeToString()),
+        byte_counts[DIV].sent)
+
+  def testAcrossProcesses(self):
+    ready = multiprocessing.Event()
+    stop = multiprocessing.Event()
+    server_process = multiprocessing.Process(
+        target=_serve, args=(self.path, ready, stop))
+    server_process.start()
+    try:
+      self.assertTrue(ready.wait(_TIMEOUT))
+      rear_link = shared_memory.RearLink(
+          self.path, _REQUEST_SERIALIZERS, _RESPONSE_DESERIALIZERS)
+      with implementations.assemble_dynamic_inline_stub(
+          _IMPLEMENTATIONS, rear_link) as stub:
+        for dividend in range(50):
+          response = stub.Div(
+              math_pb2.DivArgs(dividend=dividend, divisor=7), _TIMEOUT)
+          self.assertEqual(dividend / 7, response.quotient)
+    finally:
+      stop.set()
+      server_process.join()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -36,14 +36,20 @@ import time
 
 from grpc._adapter import _common
 from grpc._adapter import _low
+from grpc._adapter import instrumentation
 from grpc.framework.base import interfaces
 from grpc.framework.base.packets import interfaces as ticket_interfaces
 from grpc.framework.base.packets import null
 from grpc.framework.base.packets import packets as tickets
 from grpc.framework.foundation import activated
-from grpc.framework.foundation import logging_pool
+from grpc.framework.foundation import adaptive_pool
+from grpc.framework.foundation import tracing
 
 _THREAD_POOL_SIZE = 100
+_MINIMUM_THREAD_POOL_SIZE = 4
+# The length of time in seconds for which observed queueing delay must remain
+# above its target before RPCs begin to be shed, after CoDel's "interval".
+_QUEUEING_DELAY_INTERVAL = 0.1
 
 
 @enum.unique
@@ -56,9 +62,10 @@ class _LowWrite(enum.Enum):
 
 
 def _write(call, rpc_state, payload):
-  serialized_payload = rpc_state.serializer(payload)
+  serialized_payload = _common.serialize(rpc_state, payload)
   if rpc_state.write.low is _LowWrite.OPEN:
     call.write(serialized_payload, call)
+    rpc_state.trace.start(tracing.Stage.WRITE)
     rpc_state.write.low = _LowWrite.ACTIVE
   else:
     rpc_state.write.pending.append(serialized_payload)
@@ -69,26 +76,104 @@ def _status(call, rpc_state):
   rpc_state.write.low = _LowWrite.CLOSED
 
 
+def _reject(call, code, details):
+  """Terminates an accepted RPC without servicing it."""
+  call.status(_low.Status(code, details), call)
+
+
+class _QueueingDelayMonitor(object):
+  """Decides from observed queueing delays whether to shed load.
+
+  After CoDel, load is shed once observed queueing delay has remained above its
+  target for at least an interval, and shedding ceases as soon as a queueing
+  delay below the target is observed or no queueing delay at all has been
+  observed for an interval.
+
+  The monitor keeps its own lock so that observations, which are made for every
+  work item a service runs, contend neither with a ForeLink's completion-queue
+  thread nor with its ticket traffic.
+  """
+
+  def __init__(self, target, interval):
+    self._lock = threading.Lock()
+    self._target = target
+    self._interval = interval
+    self._above_target_since = None
+    self._shedding = False
+    self._last_observation = None
+
+  def observe(self, now, delay):
+    """Records an observed queueing delay.
+
+    Args:
+      now: The time at which the queueing delay was observed.
+      delay: The observed queueing delay in seconds.
+    """
+    with self._lock:
+      self._last_observation = now
+      if delay < self._target:
+        self._above_target_since = None
+        self._shedding = False
+      elif self._above_target_since is None:
+        self._above_target_since = now
+      elif self._interval <= now - self._above_target_since:
+        self._shedding = True
+
+  def shedding(self, now):
+    """Indicates whether or not load should currently be shed.
+
+    Args:
+      now: The current time.
+    """
+    with self._lock:
+      return self._shedding and now - self._last_observation < self._interval
+
+
 class ForeLink(ticket_interfaces.ForeLink, activated.Activated):
   """A service-side bridge between RPC Framework and the C-ish _low code."""
 
   def __init__(
       self, pool, request_deserializers, response_serializers,
-      root_certificates, key_chain_pairs, port=None):
+      root_certificates, key_chain_pairs, port=None,
+      maximum_concurrent_rpcs=None, maximum_queueing_delay=None,
+      spin_instrument=None, tracer=None, paced_reads=False,
+      drain_observer=None):
     """Constructor.
 
     Args:
       pool: A thread pool.
       request_deserializers: A dict from RPC method names to request object
-        deserializer behaviors.
+        deserializer behaviors, or to None for methods with requests passed on
+        as the bytestrings taken off the wire.
       response_serializers: A dict from RPC method names to response object
-        serializer behaviors.
+        serializer behaviors, or to None for methods with responses that are
+        already bytestrings.
       root_certificates: The PEM-encoded client root certificates as a
         bytestring or None.
       key_chain_pairs: A sequence of PEM-encoded private key-certificate chain
         pairs.
-      port: The port on which to serve, or None to have a port selected
+      port: The port on which to serve, a "unix:<path>" address naming a Unix
+        domain socket on which to serve, or None to have a port selected
         automatically.
+      maximum_concurrent_rpcs: The largest number of RPCs to service at once,
+        with RPCs arriving in excess of this number being refused with status
+        code RESOURCE_EXHAUSTED, or None for no limit.
+      maximum_queueing_delay: A length of time in seconds, or None for no
+        limit. When the queueing delays passed to observe_queueing_delay have
+        exceeded this duration for a sustained interval, newly-arriving RPCs
+        are refused with status code UNAVAILABLE until a shorter delay is again
+        observed or until no delay has been observed for an interval.
+      spin_instrument: An instrumentation.SpinInstrument with which to observe
+        this object's completion-queue loop, or None.
+      tracer: A tracing.Tracer with which to sample RPCs and record the timing
+        of their serialization, wire writes and reads, and deserialization, or
+        None.
+      paced_reads: Whether or not to read each message of an RPC after the
+        first only once resume_reading has been called for the RPC rather than
+        as soon as the message before it has been read.
+      drain_observer: A callable to be called in the thread pool with an
+        operation ID each time all the payloads passed to this ForeLink for the
+        operation's RPC have been written to the wire, or None.
     """
     self._condition = threading.Condition()
     self._pool = pool
@@ -97,11 +182,26 @@ class ForeLink(ticket_interfaces.ForeLink, activated.Activated):
     self._root_certificates = root_certificates
     self._key_chain_pairs = key_chain_pairs
     self._requested_port = port
+    self._maximum_concurrent_rpcs = maximum_concurrent_rpcs
+    self._queueing_delay_monitor = None if maximum_queueing_delay is None else (
+        _QueueingDelayMonitor(maximum_queueing_delay, _QUEUEING_DELAY_INTERVAL))
+    self._spin_instrument = (
+        instrumentation.NULL_SPIN_INSTRUMENT if spin_instrument is None
+        else spin_instrument)
+    self._tracer = tracing.NULL_TRACER if tracer is None else tracer
+    self._paced_reads = paced_reads
+    self._drain_observer = drain_observer
 
     self._rear_link = null.NULL_REAR_LINK
     self._completion_queue = None
     self._server = None
     self._rpc_states = {}
+    # Dictionary from method name to _common.MethodState.
+    self._method_states = {}
+    # Set of calls with reads awaiting a call to resume_reading.
+    self._paused_calls = set()
+    # Set of the calls of RPCs refused without being serviced.
+    self._rejected_calls = set()
     self._spinning = False
     self._port = None
 
@@ -109,6 +209,31 @@ class ForeLink(ticket_interfaces.ForeLink, activated.Activated):
     self._spinning = False
     self._condition.notify_all()
 
+  def _refusal(self, method, deadline, now):
+    """Determines whether or not to refuse an RPC.
+
+    Args:
+      method: The RPC's method name.
+      deadline: The RPC's deadline.
+      now: The current time.
+
+    Returns:
+      None if the RPC should be serviced, or a pair of _low.Code and details
+        string with which to refuse the RPC.
+    """
+    if method not in self._request_deserializers:
+      return _low.Code.UNIMPLEMENTED, 'Method not found!'
+    elif deadline <= now:
+      return _low.Code.EXPIRED, 'Deadline passed before service!'
+    elif (self._maximum_concurrent_rpcs is not None and
+          self._maximum_concurrent_rpcs <= len(self._rpc_states)):
+      return _low.Code.RESOURCE_EXHAUSTED, 'Too many concurrent RPCs!'
+    elif (self._queueing_delay_monitor is not None and
+          self._queueing_delay_monitor.shedding(now)):
+      return _low.Code.UNAVAILABLE, 'Queueing delay too long!'
+    else:
+      return None
+
   def _on_service_acceptance_event(self, event, server):
     """Handle a service invocation event."""
     service_acceptance = event.service_acceptance
@@ -119,18 +244,36 @@ class ForeLink(ticket_interfaces.ForeLink, activated.Activated):
     call.accept(self._completion_queue, call)
     # TODO(nathaniel): Metadata support.
     call.premetadata()
-    call.read(call)
     method = service_acceptance.method
+    deadline = service_acceptance.deadline
+    now = time.time()
+    refusal = self._refusal(method, deadline, now)
+    if refusal is not None:
+      # The RPC's requests are read and discarded so that the RPC can finish.
+      self._rejected_calls.add(call)
+      call.read(call)
+      _reject(call, *refusal)
+      server.service(None)
+      return
+    call.read(call)
 
+    method_state = self._method_states.get(method, None)
+    if method_state is None:
+      method_state = _common.MethodState(
+          method, self._request_deserializers[method],
+          self._response_serializers[method])
+      self._method_states[method] = method_state
+    trace_id = _common.trace_id(service_acceptance.metadata)
+    trace = self._tracer.trace(trace_id, call)
+    trace.start(tracing.Stage.READ)
     self._rpc_states[call] = _common.CommonRPCState(
         _common.WriteState(_LowWrite.OPEN, _common.HighWrite.OPEN, []), 1,
-        self._request_deserializers[method],
-        self._response_serializers[method])
+        method_state, trace)
 
     ticket = tickets.FrontToBackPacket(
         call, 0, tickets.Kind.COMMENCEMENT, method,
-        interfaces.ServicedSubscription.Kind.FULL, None, None,
-        service_acceptance.deadline - time.time())
+        interfaces.ServicedSubscription.Kind.FULL, trace_id, None,
+        deadline - now)
     self._rear_link.accept_front_to_back_ticket(ticket)
 
     server.service(None)
@@ -138,10 +281,17 @@ class ForeLink(ticket_interfaces.ForeLink, activated.Activated):
   def _on_read_event(self, event):
     """Handle data arriving during an RPC."""
     call = event.tag
+    if call in self._rejected_calls:
+      if event.bytes is None:
+        self._rejected_calls.discard(call)
+      else:
+        call.read(call)
+      return
     rpc_state = self._rpc_states.get(call, None)
     if rpc_state is None:
       return
 
+    rpc_state.trace.finish(tracing.Stage.READ)
     sequence_number = rpc_state.sequence_number
     rpc_state.sequence_number += 1
     if event.bytes is None:
@@ -149,10 +299,14 @@ class ForeLink(ticket_interfaces.ForeLink, activated.Activated):
           call, sequence_number, tickets.Kind.COMPLETION, None, None, None,
           None, None)
     else:
-      call.read(call)
+      if self._paced_reads:
+        self._paused_calls.add(call)
+      else:
+        call.read(call)
+        rpc_state.trace.start(tracing.Stage.READ)
       ticket = tickets.FrontToBackPacket(
           call, sequence_number, tickets.Kind.CONTINUATION, None, None, None,
-          rpc_state.deserializer(event.bytes), None)
+          _common.deserialize(rpc_state, event.bytes), None)
 
     self._rear_link.accept_front_to_back_ticket(ticket)
 
@@ -162,19 +316,24 @@ class ForeLink(ticket_interfaces.ForeLink, activated.Activated):
     if rpc_state is None:
       return
 
+    rpc_state.trace.finish(tracing.Stage.WRITE)
     if rpc_state.write.pending:
       serialized_payload = rpc_state.write.pending.pop(0)
       call.write(serialized_payload, call)
+      rpc_state.trace.start(tracing.Stage.WRITE)
     elif rpc_state.write.high is _common.HighWrite.CLOSED:
       _status(call, rpc_state)
     else:
       rpc_state.write.low = _LowWrite.OPEN
+      if self._drain_observer is not None:
+        self._pool.submit(self._drain_observer, call)
 
   def _on_complete_event(self, event):
     if not event.complete_accepted:
       logging.error('Complete not accepted! %s', (event,))
       call = event.tag
       rpc_state = self._rpc_states.pop(call, None)
+      self._paused_calls.discard(call)
       if rpc_state is None:
         return
 
@@ -188,7 +347,9 @@ class ForeLink(ticket_interfaces.ForeLink, activated.Activated):
   def _on_finish_event(self, event):
     """Handle termination of an RPC."""
     call = event.tag
+    self._rejected_calls.discard(call)
     rpc_state = self._rpc_states.pop(call, None)
+    self._paused_calls.discard(call)
     if rpc_state is None:
       return
 
@@ -213,28 +374,41 @@ class ForeLink(ticket_interfaces.ForeLink, activated.Activated):
           None, None, None)
     self._rear_link.accept_front_to_back_ticket(ticket)
 
+  def _spin_gauges(self):
+    return len(self._rpc_states), sum(
+        len(rpc_state.write.pending)
+        for rpc_state in self._rpc_states.itervalues())
+
   def _spin(self, completion_queue, server):
+    spin_instrument = self._spin_instrument
+    spin_gauges = self._spin_gauges
     while True:
+      spin_instrument.get_started()
       event = completion_queue.get(None)
+      spin_instrument.get_finished(event.kind)
 
       with self._condition:
-        if event.kind is _low.Event.Kind.STOP:
-          self._on_stop_event()
-          return
-        elif self._server is None:
-          continue
-        elif event.kind is _low.Event.Kind.SERVICE_ACCEPTED:
-          self._on_service_acceptance_event(event, server)
-        elif event.kind is _low.Event.Kind.READ_ACCEPTED:
-          self._on_read_event(event)
-        elif event.kind is _low.Event.Kind.WRITE_ACCEPTED:
-          self._on_write_event(event)
-        elif event.kind is _low.Event.Kind.COMPLETE_ACCEPTED:
-          self._on_complete_event(event)
-        elif event.kind is _low.Event.Kind.FINISH:
-          self._on_finish_event(event)
-        else:
-          logging.error('Illegal event! %s', (event,))
+        spin_instrument.handling_started()
+        try:
+          if event.kind is _low.Event.Kind.STOP:
+            self._on_stop_event()
+            return
+          elif self._server is None:
+            continue
+          elif event.kind is _low.Event.Kind.SERVICE_ACCEPTED:
+            self._on_service_acceptance_event(event, server)
+          elif event.kind is _low.Event.Kind.READ_ACCEPTED:
+            self._on_read_event(event)
+          elif event.kind is _low.Event.Kind.WRITE_ACCEPTED:
+            self._on_write_event(event)
+          elif event.kind is _low.Event.Kind.COMPLETE_ACCEPTED:
+            self._on_complete_event(event)
+          elif event.kind is _low.Event.Kind.FINISH:
+            self._on_finish_event(event)
+          else:
+            logging.error('Illegal event! %s', (event,))
+        finally:
+          spin_instrument.handling_finished(spin_gauges)
 
   def _continue(self, call, payload):
     rpc_state = self._rpc_states.get(call, None)
@@ -256,7 +430,7 @@ class ForeLink(ticket_interfaces.ForeLink, activated.Activated):
         _write(call, rpc_state, payload)
     elif rpc_state.write.low is _LowWrite.ACTIVE:
       if payload is not None:
-        rpc_state.write.pending.append(rpc_state.serializer(payload))
+        rpc_state.write.pending.append(_common.serialize(rpc_state, payload))
     else:
       raise ValueError('Called to complete after having already completed!')
     rpc_state.write.high = _common.HighWrite.CLOSED
@@ -264,6 +438,7 @@ class ForeLink(ticket_interfaces.ForeLink, activated.Activated):
   def _cancel(self, call):
     call.cancel()
     self._rpc_states.pop(call, None)
+    self._paused_calls.discard(call)
 
   def join_rear_link(self, rear_link):
     """See ticket_interfaces.ForeLink.join_rear_link for specification."""
@@ -276,17 +451,17 @@ class ForeLink(ticket_interfaces.ForeLink, activated.Activated):
     object.
     """
     with self._condition:
-      address = '[::]:%d' % (
-          0 if self._requested_port is None else self._requested_port)
+      address = _common.server_address(self._requested_port)
       self._completion_queue = _low.CompletionQueue()
       if self._root_certificates is None and not self._key_chain_pairs:
         self._server = _low.Server(self._completion_queue, None)
-        self._port = self._server.add_http2_addr(address)
+        port = self._server.add_http2_addr(address)
       else:
         server_credentials = _low.ServerCredentials(
           self._root_certificates, self._key_chain_pairs)
         self._server = _low.Server(self._completion_queue, server_credentials)
-        self._port = self._server.add_secure_http2_addr(address)
+        port = self._server.add_secure_http2_addr(address)
+      self._port = address if _common.is_unix_address(address) else port
       self._server.start()
 
       self._server.service(None)
@@ -338,12 +513,71 @@ class ForeLink(ticket_interfaces.ForeLink, activated.Activated):
     """Identifies the port on which this ForeLink is servicing RPCs.
 
     Returns:
-      The number of the port on which this ForeLink is servicing RPCs, or None
-        if this ForeLink is not currently activated and servicing RPCs.
+      The number of the port on which this ForeLink is servicing RPCs, the
+        "unix:<path>" address of the Unix domain socket on which it is
+        servicing RPCs, or None if this ForeLink is not currently activated and
+        servicing RPCs.
     """
     with self._condition:
       return self._port
 
+  def byte_counts(self):
+    """Reports the numbers of payload bytes this ForeLink has exchanged.
+
+    Returns:
+      A dictionary from RPC method name to an object with "received" and "sent"
+        attributes counting the serialized payload bytes of the RPC method
+        taken off and put on the wire.
+    """
+    with self._condition:
+      return {
+          method: method_state.byte_counter.snapshot()
+          for method, method_state in self._method_states.iteritems()}
+
+  def rpcs(self):
+    """Describes the RPCs this ForeLink is servicing.
+
+    Returns:
+      A dictionary from operation ID to _common.RPCSnapshot for each RPC in
+        progress.
+    """
+    with self._condition:
+      return {
+          call: _common.RPCSnapshot(
+              rpc_state.method_state.method, len(rpc_state.write.pending),
+              rpc_state.write.low is _LowWrite.ACTIVE)
+          for call, rpc_state in self._rpc_states.iteritems()}
+
+  def observe_queueing_delay(self, delay):
+    """Records how long work servicing an RPC waited for a thread.
+
+    The delays observed by this method decide whether or not RPCs are refused
+    when this ForeLink was given a maximum_queueing_delay; they should be the
+    waits of work in the service's thread pools, not including the time spent
+    running handlers or waiting for requests from clients.
+
+    Args:
+      delay: A length of time in seconds.
+    """
+    if self._queueing_delay_monitor is not None:
+      self._queueing_delay_monitor.observe(time.time(), delay)
+
+  def resume_reading(self, call):
+    """Reads the next message of an RPC whose reads are paced.
+
+    Args:
+      call: The operation ID of an RPC serviced by this ForeLink. Nothing is
+        done if the RPC is no longer in progress or is not awaiting a call of
+        this method.
+    """
+    with self._condition:
+      if self._server is None or call not in self._paused_calls:
+        return
+
+      self._paused_calls.remove(call)
+      call.read(call)
+      self._rpc_states[call].trace.start(tracing.Stage.READ)
+
   def accept_back_to_front_ticket(self, ticket):
     """See ticket_interfaces.ForeLink.accept_back_to_front_ticket for spec."""
     with self._condition:
@@ -362,12 +596,17 @@ class _ActivatedForeLink(ticket_interfaces.ForeLink, activated.Activated):
 
   def __init__(
       self, port, request_deserializers, response_serializers,
-      root_certificates, key_chain_pairs):
+      root_certificates, key_chain_pairs, maximum_concurrent_rpcs,
+      maximum_queueing_delay, spin_instrument, tracer):
     self._port = port
     self._request_deserializers = request_deserializers
     self._response_serializers = response_serializers
     self._root_certificates = root_certificates
     self._key_chain_pairs = key_chain_pairs
+    self._maximum_concurrent_rpcs = maximum_concurrent_rpcs
+    self._maximum_queueing_delay = maximum_queueing_delay
+    self._spin_instrument = spin_instrument
+    self._tracer = tracer
 
     self._lock = threading.Lock()
     self._pool = None
@@ -382,10 +621,14 @@ class _ActivatedForeLink(ticket_interfaces.ForeLink, activated.Activated):
 
   def _start(self):
     with self._lock:
-      self._pool = logging_pool.pool(_THREAD_POOL_SIZE)
+      self._pool = adaptive_pool.pool(
+          _THREAD_POOL_SIZE, minimum_workers=_MINIMUM_THREAD_POOL_SIZE)
       self._fore_link = ForeLink(
           self._pool, self._request_deserializers, self._response_serializers,
-          self._root_certificates, self._key_chain_pairs, port=self._port)
+          self._root_certificates, self._key_chain_pairs, port=self._port,
+          maximum_concurrent_rpcs=self._maximum_concurrent_rpcs,
+          maximum_queueing_delay=self._maximum_queueing_delay,
+          spin_instrument=self._spin_instrument, tracer=self._tracer)
       self._fore_link.join_rear_link(self._rear_link)
       self._fore_link.start()
       return self
@@ -414,6 +657,22 @@ class _ActivatedForeLink(ticket_interfaces.ForeLink, activated.Activated):
     with self._lock:
       return None if self._fore_link is None else self._fore_link.port()
 
+  def byte_counts(self):
+    with self._lock:
+      return {} if self._fore_link is None else self._fore_link.byte_counts()
+
+  def rpcs(self):
+    with self._lock:
+      return {} if self._fore_link is None else self._fore_link.rpcs()
+
+  def observe_queueing_delay(self, delay):
+    # Called for every work item a service runs, so without taking the lock:
+    # an observation racing a start or stop may be dropped harmlessly.
+    if self._maximum_queueing_delay is not None:
+      fore_link = self._fore_link
+      if fore_link is not None:
+        fore_link.observe_queueing_delay(delay)
+
   def accept_back_to_front_ticket(self, ticket):
     with self._lock:
       if self._fore_link is not None:
@@ -422,14 +681,16 @@ class _ActivatedForeLink(ticket_interfaces.ForeLink, activated.Activated):
 
 def activated_fore_link(
     port, request_deserializers, response_serializers, root_certificates,
-    key_chain_pairs):
+    key_chain_pairs, maximum_concurrent_rpcs=None, maximum_queueing_delay=None,
+    spin_instrument=None, tracer=None):
   """Creates a ForeLink that is also an activated.Activated.
 
   The returned object is only valid for use between calls to its start and stop
   methods (or in context when used as a context manager).
 
   Args:
-    port: The port on which to serve RPCs, or None for a port to be
+    port: The port on which to serve RPCs, a "unix:<path>" address naming a
+      Unix domain socket on which to serve RPCs, or None for a port to be
       automatically selected.
     request_deserializers: A dictionary from RPC method names to request object
       deserializer behaviors.
@@ -439,7 +700,17 @@ def activated_fore_link(
       or None.
     key_chain_pairs: A sequence of PEM-encoded private key-certificate chain
       pairs.
+    maximum_concurrent_rpcs: The largest number of RPCs to service at once, or
+      None for no limit. See ForeLink.__init__ for details.
+    maximum_queueing_delay: The longest sustained queueing delay in seconds to
+      tolerate before refusing RPCs, or None for no limit. See
+      ForeLink.__init__ for details.
+    spin_instrument: An instrumentation.SpinInstrument with which to observe
+      the ForeLink's completion-queue loop, or None.
+    tracer: A tracing.Tracer with which to sample RPCs, or None. See
+      ForeLink.__init__ for details.
   """
   return _ActivatedForeLink(
       port, request_deserializers, response_serializers, root_certificates,
-      key_chain_pairs)
+      key_chain_pairs, maximum_concurrent_rpcs, maximum_queueing_delay,
+      spin_instrument, tracer)
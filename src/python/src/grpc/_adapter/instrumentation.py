@@ -0,0 +1,219 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Instrumentation of the completion-queue loops of ForeLinks and RearLinks."""
+
+import abc
+import collections
+import logging
+import time
+
+
+class SpinStats(
+    collections.namedtuple(
+        'SpinStats',
+        ('interval', 'event_rates', 'blocked', 'waiting', 'handling',
+         'rpc_states', 'pending_writes'))):
+  """A summary of a completion-queue loop's behavior over an interval.
+
+  Durations are measured in seconds.
+
+  Attributes:
+    interval: The length of the summarized interval.
+    event_rates: A dictionary from _low.Event.Kind to the number of events of
+      that kind taken off the completion queue per second.
+    blocked: The time spent blocked in CompletionQueue.get.
+    waiting: The time spent waiting to acquire the link's condition.
+    handling: The time spent handling events while holding the link's
+      condition.
+    rpc_states: The number of RPCs tracked by the link at the end of the
+      interval.
+    pending_writes: The number of serialized payloads waiting to be written at
+      the end of the interval.
+  """
+
+  def busy_fraction(self):
+    """Computes the fraction of the interval not spent blocked on the queue."""
+    if not self.interval:
+      return 0
+    return (self.waiting + self.handling) / self.interval
+
+
+class SpinInstrument(object):
+  """Observes the completion-queue loop of a link.
+
+  All methods other than stats are called only from the loop's thread.
+  """
+  __metaclass__ = abc.ABCMeta
+
+  @abc.abstractmethod
+  def get_started(self):
+    """Indicates that the loop is about to block on its completion queue."""
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def get_finished(self, kind):
+    """Indicates that the loop has taken an event off its completion queue.
+
+    Args:
+      kind: The _low.Event.Kind of the event.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def handling_started(self):
+    """Indicates that the loop has acquired its link's condition."""
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def handling_finished(self, gauges):
+    """Indicates that the loop has finished handling an event.
+
+    Args:
+      gauges: A nullary callable, to be called only while the link's condition
+        is held, that returns a pair of the number of RPCs tracked by the link
+        and the number of serialized payloads waiting to be written.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def stats(self):
+    """Reports the most recently completed interval's summary.
+
+    Returns:
+      A SpinStats, or None if no interval has yet been completed.
+    """
+    raise NotImplementedError()
+
+
+class _NullSpinInstrument(SpinInstrument):
+
+  def get_started(self):
+    pass
+
+  def get_finished(self, kind):
+    pass
+
+  def handling_started(self):
+    pass
+
+  def handling_finished(self, gauges):
+    pass
+
+  def stats(self):
+    return None
+
+
+def _log(name, stats):
+  logging.info(
+      '%s completion queue: %.1f%% busy (%.6fs blocked, %.6fs waiting, '
+      '%.6fs handling) %s; %d RPCs, %d pending writes', name,
+      100 * stats.busy_fraction(), stats.blocked, stats.waiting,
+      stats.handling,
+      ', '.join(
+          '%s %.1f/s' % (kind.name, rate)
+          for kind, rate in sorted(
+              stats.event_rates.iteritems(), key=lambda item: item[0].name)),
+      stats.rpc_states, stats.pending_writes)
+
+
+class _SpinInstrument(SpinInstrument):
+
+  def __init__(self, name, interval, dump):
+    self._name = name
+    self._interval = interval
+    self._dump = _log if dump is None else dump
+
+    self._mark = time.time()
+    self._interval_start = self._mark
+    self._counts = collections.defaultdict(int)
+    self._blocked = 0
+    self._waiting = 0
+    self._handling = 0
+    self._stats = None
+
+  def get_started(self):
+    self._mark = time.time()
+
+  def get_finished(self, kind):
+    now = time.time()
+    self._blocked += now - self._mark
+    self._counts[kind] += 1
+    self._mark = now
+
+  def handling_started(self):
+    now = time.time()
+    self._waiting += now - self._mark
+    self._mark = now
+
+  def handling_finished(self, gauges):
+    now = time.time()
+    self._handling += now - self._mark
+    self._mark = now
+    interval = now - self._interval_start
+    if self._interval <= interval:
+      rpc_states, pending_writes = gauges()
+      self._stats = SpinStats(
+          interval,
+          {kind: count / interval for kind, count in self._counts.iteritems()},
+          self._blocked, self._waiting, self._handling, rpc_states,
+          pending_writes)
+      self._interval_start = now
+      self._counts = collections.defaultdict(int)
+      self._blocked = 0
+      self._waiting = 0
+      self._handling = 0
+      try:
+        self._dump(self._name, self._stats)
+      except Exception:  # pylint: disable=broad-except
+        logging.exception('Exception dumping completion queue statistics!')
+
+  def stats(self):
+    return self._stats
+
+
+NULL_SPIN_INSTRUMENT = _NullSpinInstrument()
+
+
+def spin_instrument(name, interval, dump=None):
+  """Creates a SpinInstrument that summarizes a loop at a regular interval.
+
+  Intervals are closed as events are handled, so a loop that handles no events
+  produces no summaries.
+
+  Args:
+    name: A name for the instrumented loop, used when dumping summaries.
+    interval: The length of time in seconds to summarize at once.
+    dump: A callable to be passed the name and each SpinStats as it is
+      produced, or None to log each SpinStats at INFO level.
+
+  Returns:
+    A SpinInstrument.
+  """
+  return _SpinInstrument(name, interval, dump)
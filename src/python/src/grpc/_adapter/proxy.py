@@ -0,0 +1,348 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""A proxy that forwards RPCs to backends without deserializing messages.
+
+A Proxy services RPCs with a fore.ForeLink and forwards each of them over one
+of a pool of rear.RearLinks, chosen for the RPC's method by a Router. Neither
+link is given serializers so that messages cross the proxy as the very bytes
+that arrived on the wire, and both are made to pace their reads so that a
+message is read from one side only after the message before it has been written
+to the other side. Cancellation, expiration and failure of an RPC on
+either side terminate the RPC on the other side.
+"""
+
+import abc
+import threading
+
+from grpc._adapter import fore
+from grpc._adapter import rear
+from grpc.framework.base.packets import in_memory
+from grpc.framework.base.packets import interfaces as ticket_interfaces
+from grpc.framework.base.packets import null
+from grpc.framework.base.packets import packets as tickets
+from grpc.framework.foundation import activated
+from grpc.framework.foundation import adaptive_pool
+
+_THREAD_POOL_SIZE = 100
+_MINIMUM_THREAD_POOL_SIZE = 4
+
+_COMMENCING_KINDS = (tickets.Kind.COMMENCEMENT, tickets.Kind.ENTIRE)
+_FRONT_TO_BACK_TERMINAL_KINDS = (
+    tickets.Kind.CANCELLATION,
+    tickets.Kind.EXPIRATION,
+    tickets.Kind.SERVICED_FAILURE,
+    tickets.Kind.RECEPTION_FAILURE,
+    tickets.Kind.TRANSMISSION_FAILURE,
+)
+
+
+class Router(object):
+  """Chooses the backend to which to forward each RPC."""
+  __metaclass__ = abc.ABCMeta
+
+  @abc.abstractmethod
+  def route(self, method):
+    """Chooses the backend to which to forward an RPC.
+
+    This method is called often and from the threads that move RPCs through
+    the proxy; it should be fast and must not block.
+
+    Args:
+      method: The RPC's method name.
+
+    Returns:
+      The name of the backend to which to forward the RPC, or None if the RPC
+        should be refused as unimplemented.
+    """
+    raise NotImplementedError()
+
+
+class _PrefixRouter(Router):
+
+  def __init__(self, prefixes, default):
+    self._prefixes = sorted(prefixes.iteritems(), reverse=True)
+    self._default = default
+
+  def route(self, method):
+    for prefix, backend in self._prefixes:
+      if method.startswith(prefix):
+        return backend
+    return self._default
+
+
+def prefix_router(prefixes, default=None):
+  """Creates a Router that routes RPCs by the prefixes of their method names.
+
+  Args:
+    prefixes: A dictionary from method-name prefix (such as "/my.Service/") to
+      the name of the backend to which to forward the RPCs of the methods with
+      names beginning with that prefix. When several prefixes match a method
+      name the longest of them is used.
+    default: The name of the backend to which to forward RPCs matching none of
+      the given prefixes, or None to have such RPCs refused.
+
+  Returns:
+    A Router.
+  """
+  return _PrefixRouter(prefixes, default)
+
+
+class _Identities(object):
+  """Stands in for a dict from method names to serializer behaviors.
+
+  Methods routed to a known backend are present and have no behaviors, so
+  payloads are passed through the proxy as the bytestrings of messages.
+  """
+
+  def __init__(self, router, backends):
+    self._router = router
+    self._backends = backends
+
+  def __contains__(self, method):
+    return self._router.route(method) in self._backends
+
+  def __getitem__(self, method):
+    return None
+
+
+class _Switch(ticket_interfaces.RearLink, ticket_interfaces.ForeLink):
+  """Routes the tickets of each operation between a ForeLink and a RearLink.
+
+  The switch is the RearLink of the ForeLink of the proxy and the ForeLink of
+  every backend RearLink. Operations keep the IDs given them by the ForeLink of
+  the proxy so that tickets need no translation in either direction.
+  """
+
+  def __init__(self, router, rear_links):
+    """Constructor.
+
+    Args:
+      router: A Router.
+      rear_links: A dictionary from backend name to the RearLink forwarding
+        RPCs to that backend.
+    """
+    self._lock = threading.Lock()
+    self._router = router
+    self._rear_links = rear_links
+    self._fore_link = null.NULL_FORE_LINK
+    # Dictionary from operation ID to the RearLink carrying the operation.
+    self._routes = {}
+    self._terminated = False
+
+  def join_fore_link(self, fore_link):
+    """See ticket_interfaces.RearLink.join_fore_link for specification."""
+    with self._lock:
+      self._fore_link = null.NULL_FORE_LINK if fore_link is None else fore_link
+
+  def accept_front_to_back_ticket(self, ticket):
+    """See ticket_interfaces.RearLink.accept_front_to_back_ticket for spec."""
+    # The ticket is passed on while holding the lock so that no operation is
+    # commenced at its backend after its cancellation by terminate. The backend
+    # RearLinks never call back into the switch from this call.
+    with self._lock:
+      fore_link = self._fore_link
+      if ticket.kind in _COMMENCING_KINDS:
+        if self._terminated:
+          rear_link = None
+        else:
+          rear_link = self._rear_links.get(
+              self._router.route(ticket.name), None)
+        if rear_link is not None:
+          self._routes[ticket.operation_id] = rear_link
+      elif ticket.kind in _FRONT_TO_BACK_TERMINAL_KINDS:
+        rear_link = self._routes.pop(ticket.operation_id, None)
+      else:
+        rear_link = self._routes.get(ticket.operation_id, None)
+      if rear_link is not None:
+        rear_link.accept_front_to_back_ticket(ticket)
+        return
+
+    if ticket.kind in _COMMENCING_KINDS:
+      fore_link.accept_back_to_front_ticket(
+          tickets.BackToFrontPacket(
+              ticket.operation_id, 0, tickets.Kind.TRANSMISSION_FAILURE, None))
+
+  def join_rear_link(self, rear_link):
+    """See ticket_interfaces.ForeLink.join_rear_link for specification.
+
+    The backend RearLinks of a switch are those given at its construction, so
+    this method does nothing.
+    """
+
+  def accept_back_to_front_ticket(self, ticket):
+    """See ticket_interfaces.ForeLink.accept_back_to_front_ticket for spec."""
+    with self._lock:
+      if ticket.kind is not tickets.Kind.CONTINUATION:
+        self._routes.pop(ticket.operation_id, None)
+      fore_link = self._fore_link
+    fore_link.accept_back_to_front_ticket(ticket)
+
+  def terminate(self):
+    """Cancels the operations carried by this switch and refuses new ones.
+
+    This method is called once the ForeLink of the proxy has stopped, after
+    which it will never pass on the tickets that would end the operations it
+    was servicing.
+    """
+    with self._lock:
+      self._terminated = True
+      for operation_id, rear_link in self._routes.iteritems():
+        rear_link.accept_front_to_back_ticket(
+            tickets.FrontToBackPacket(
+                operation_id, 0, tickets.Kind.CANCELLATION, None, None, None,
+                None, None))
+      self._routes = {}
+
+  def resume_reading(self, operation_id):
+    """Has the RearLink carrying an operation read its next response."""
+    with self._lock:
+      rear_link = self._routes.get(operation_id, None)
+    if rear_link is not None:
+      rear_link.resume_reading(operation_id)
+
+
+class Proxy(activated.Activated):
+  """Forwards RPCs to backends without deserializing their messages."""
+
+  def __init__(self, port, backends, router):
+    """Constructor.
+
+    Args:
+      port: The port on which to serve, a "unix:<path>" address naming a Unix
+        domain socket on which to serve, or None to have a port selected
+        automatically.
+      backends: A dictionary from backend name to the (host, port) pair (or
+        ("unix:<path>", None) pair) of the server to which to forward the RPCs
+        routed to that backend.
+      router: A Router choosing among the names of the given backends.
+    """
+    self._requested_port = port
+    self._backends = dict(backends)
+    self._router = router
+
+    self._lock = threading.Lock()
+    self._pool = None
+    self._fore_link = None
+    self._switch = None
+    self._rear_links = None
+
+  def _start(self):
+    with self._lock:
+      self._pool = adaptive_pool.pool(
+          _THREAD_POOL_SIZE, minimum_workers=_MINIMUM_THREAD_POOL_SIZE)
+      identities = _Identities(self._router, self._backends)
+      self._rear_links = {}
+      self._switch = _Switch(self._router, self._rear_links)
+      # The fore and rear links pass tickets on while holding their own locks,
+      # so tickets cross between them on a link that hands each one off to
+      # another thread.
+      link = in_memory.Link(self._pool)
+
+      self._fore_link = fore.ForeLink(
+          self._pool, identities, identities, None, (),
+          port=self._requested_port, paced_reads=True,
+          drain_observer=self._switch.resume_reading)
+      for name, (host, port) in self._backends.iteritems():
+        rear_link = rear.RearLink(
+            host, port, self._pool, identities, identities, False, None, None,
+            None, paced_reads=True,
+            drain_observer=self._fore_link.resume_reading)
+        rear_link.join_fore_link(link)
+        self._rear_links[name] = rear_link
+      self._switch.join_fore_link(self._fore_link)
+      link.join_fore_link(self._switch)
+      link.join_rear_link(self._switch)
+      self._fore_link.join_rear_link(link)
+
+      for rear_link in self._rear_links.itervalues():
+        rear_link.start()
+      self._fore_link.start()
+    return self
+
+  def _stop(self):
+    with self._lock:
+      if self._fore_link is None:
+        return
+      self._fore_link.stop()
+      self._fore_link = None
+      self._switch.terminate()
+      self._switch = None
+      for rear_link in self._rear_links.itervalues():
+        rear_link.stop()
+      self._rear_links = None
+      self._pool.shutdown(wait=True)
+      self._pool = None
+
+  def __enter__(self):
+    """See activated.Activated.__enter__ for specification."""
+    return self._start()
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    """See activated.Activated.__exit__ for specification."""
+    self._stop()
+    return False
+
+  def start(self):
+    """See activated.Activated.start for specification."""
+    return self._start()
+
+  def stop(self):
+    """See activated.Activated.stop for specification."""
+    self._stop()
+
+  def port(self):
+    """Identifies the port on which this Proxy is servicing RPCs.
+
+    Returns:
+      The number of the port on which this Proxy is servicing RPCs, the
+        "unix:<path>" address of the Unix domain socket on which it is
+        servicing RPCs, or None if this Proxy is not currently activated.
+    """
+    with self._lock:
+      return None if self._fore_link is None else self._fore_link.port()
+
+  def connect(self, timeout):
+    """Establishes the connections of this Proxy to its backends.
+
+    Args:
+      timeout: A duration of time in seconds to allow for each connection to be
+        established.
+
+    Returns:
+      A dictionary from backend name to a boolean indicating whether or not the
+        connection to that backend was established within the given timeout.
+    """
+    with self._lock:
+      rear_links = self._rear_links
+    if rear_links is None:
+      raise ValueError('Connection attempted while not started!')
+    return {
+        name: rear_link.connect(timeout)
+        for name, rear_link in rear_links.iteritems()}
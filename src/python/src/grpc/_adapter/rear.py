@@ -36,19 +36,28 @@ import time
 
 from grpc._adapter import _common
 from grpc._adapter import _low
+from grpc._adapter import instrumentation
 from grpc.framework.base.packets import interfaces as ticket_interfaces
 from grpc.framework.base.packets import null
 from grpc.framework.base.packets import packets as tickets
 from grpc.framework.foundation import activated
-from grpc.framework.foundation import logging_pool
+from grpc.framework.foundation import adaptive_pool
+from grpc.framework.foundation import tracing
 
 _THREAD_POOL_SIZE = 100
+_MINIMUM_THREAD_POOL_SIZE = 4
 
 _INVOCATION_EVENT_KINDS = (
     _low.Event.Kind.METADATA_ACCEPTED,
     _low.Event.Kind.FINISH
 )
 
+# NOTE(nathaniel): No service is expected to implement this method; an RPC to
+# it is only ever made to have the channel establish its transport.
+_CONNECTION_PROBE_METHOD_NAME = '/grpc.python.ConnectionProbe/Connect'
+_CONNECTION_PROBE_GRACE = 1
+_UNCONNECTED_CODES = (_low.Code.EXPIRED, _low.Code.UNAVAILABLE)
+
 
 @enum.unique
 class _LowWrite(enum.Enum):
@@ -64,11 +73,12 @@ class _RPCState(object):
 
   Attributes:
     call: The _low.Call object for the RPC.
-    outstanding: The set of Event.Kind values describing expected future events
-      for the RPC.
+    outstanding: The number of events expected in the future for the RPC. At
+      most one event of each Event.Kind is ever outstanding at once.
     active: A boolean indicating whether or not the RPC is active.
     common: An _common.RPCState describing additional state for the RPC.
   """
+  __slots__ = ('call', 'outstanding', 'active', 'common')
 
   def __init__(self, call, outstanding, active, common):
     self.call = call
@@ -77,10 +87,12 @@ class _RPCState(object):
     self.common = common
 
 
-def _write(operation_id, call, outstanding, write_state, serialized_payload):
+def _write(operation_id, rpc_state, serialized_payload):
+  write_state = rpc_state.common.write
   if write_state.low is _LowWrite.OPEN:
-    call.write(serialized_payload, operation_id)
-    outstanding.add(_low.Event.Kind.WRITE_ACCEPTED)
+    rpc_state.call.write(serialized_payload, operation_id)
+    rpc_state.common.trace.start(tracing.Stage.WRITE)
+    rpc_state.outstanding += 1
     write_state.low = _LowWrite.ACTIVE
   elif write_state.low is _LowWrite.ACTIVE:
     write_state.pending.append(serialized_payload)
@@ -93,17 +105,23 @@ class RearLink(ticket_interfaces.RearLink, activated.Activated):
 
   def __init__(
       self, host, port, pool, request_serializers, response_deserializers,
-      secure, root_certificates, private_key, certificate_chain):
+      secure, root_certificates, private_key, certificate_chain,
+      spin_instrument=None, tracer=None, paced_reads=False,
+      drain_observer=None):
     """Constructor.
 
     Args:
-      host: The host to which to connect for RPC service.
-      port: The port to which to connect for RPC service.
+      host: The host to which to connect for RPC service, or a "unix:<path>"
+        address naming a Unix domain socket to which to connect.
+      port: The port to which to connect for RPC service, ignored if host is a
+        "unix:<path>" address.
       pool: A thread pool.
       request_serializers: A dict from RPC method names to request object
-        serializer behaviors.
+        serializer behaviors, or to None for methods with requests that are
+        already bytestrings.
       response_deserializers: A dict from RPC method names to response object
-        deserializer behaviors.
+        deserializer behaviors, or to None for methods with responses passed on
+        as the bytestrings taken off the wire.
       secure: A boolean indicating whether or not to use a secure connection.
       root_certificates: The PEM-encoded root certificates or None to ask for
         them to be retrieved from a default location.
@@ -111,18 +129,40 @@ class RearLink(ticket_interfaces.RearLink, activated.Activated):
         key should be used.
       certificate_chain: The PEM-encoded certificate chain to use or None if
         no certificate chain should be used.
+      spin_instrument: An instrumentation.SpinInstrument with which to observe
+        this object's completion-queue loop, or None.
+      tracer: A tracing.Tracer with which to sample RPCs and record the timing
+        of their serialization, wire writes and reads, and deserialization, or
+        None.
+      paced_reads: Whether or not to read each message of an RPC after the
+        first only once resume_reading has been called for the RPC rather than
+        as soon as the message before it has been read.
+      drain_observer: A callable to be called in the thread pool with an
+        operation ID each time all the payloads passed to this RearLink for the
+        operation's RPC have been written to the wire, or None.
     """
     self._condition = threading.Condition()
     self._host = host
     self._port = port
+    self._authority = _common.authority(host)
     self._pool = pool
     self._request_serializers = request_serializers
     self._response_deserializers = response_deserializers
+    self._spin_instrument = (
+        instrumentation.NULL_SPIN_INSTRUMENT if spin_instrument is None
+        else spin_instrument)
+    self._tracer = tracing.NULL_TRACER if tracer is None else tracer
+    self._paced_reads = paced_reads
+    self._drain_observer = drain_observer
 
     self._fore_link = null.NULL_FORE_LINK
     self._completion_queue = None
     self._channel = None
     self._rpc_states = {}
+    # Dictionary from method name to _common.MethodState.
+    self._method_states = {}
+    # Set of operation IDs of RPCs with reads awaiting a call to resume_reading.
+    self._paused_operation_ids = set()
     self._spinning = False
     if secure:
       self._client_credentials = _low.ClientCredentials(
@@ -134,17 +174,21 @@ class RearLink(ticket_interfaces.RearLink, activated.Activated):
     self._certificate_chain = certificate_chain
 
   def _on_write_event(self, operation_id, event, rpc_state):
+    rpc_state.common.trace.finish(tracing.Stage.WRITE)
     if event.write_accepted:
       if rpc_state.common.write.pending:
         rpc_state.call.write(
             rpc_state.common.write.pending.pop(0), operation_id)
-        rpc_state.outstanding.add(_low.Event.Kind.WRITE_ACCEPTED)
+        rpc_state.common.trace.start(tracing.Stage.WRITE)
+        rpc_state.outstanding += 1
       elif rpc_state.common.write.high is _common.HighWrite.CLOSED:
         rpc_state.call.complete(operation_id)
-        rpc_state.outstanding.add(_low.Event.Kind.COMPLETE_ACCEPTED)
+        rpc_state.outstanding += 1
         rpc_state.common.write.low = _LowWrite.CLOSED
       else:
         rpc_state.common.write.low = _LowWrite.OPEN
+        if self._drain_observer is not None:
+          self._pool.submit(self._drain_observer, operation_id)
     else:
       logging.error('RPC write not accepted! Event: %s', (event,))
       rpc_state.active = False
@@ -155,13 +199,19 @@ class RearLink(ticket_interfaces.RearLink, activated.Activated):
       self._fore_link.accept_back_to_front_ticket(ticket)
 
   def _on_read_event(self, operation_id, event, rpc_state):
+    rpc_state.common.trace.finish(tracing.Stage.READ)
     if event.bytes is not None:
-      rpc_state.call.read(operation_id)
-      rpc_state.outstanding.add(_low.Event.Kind.READ_ACCEPTED)
+      if self._paced_reads:
+        self._paused_operation_ids.add(operation_id)
+      else:
+        rpc_state.call.read(operation_id)
+        rpc_state.common.trace.start(tracing.Stage.READ)
+        rpc_state.outstanding += 1
 
       ticket = tickets.BackToFrontPacket(
           operation_id, rpc_state.common.sequence_number,
-          tickets.Kind.CONTINUATION, rpc_state.common.deserializer(event.bytes))
+          tickets.Kind.CONTINUATION,
+          _common.deserialize(rpc_state.common, event.bytes))
       rpc_state.common.sequence_number += 1
       self._fore_link.accept_back_to_front_ticket(ticket)
 
@@ -178,7 +228,8 @@ class RearLink(ticket_interfaces.RearLink, activated.Activated):
   # TODO(nathaniel): Metadata support.
   def _on_metadata_event(self, operation_id, event, rpc_state):  # pylint: disable=unused-argument
     rpc_state.call.read(operation_id)
-    rpc_state.outstanding.add(_low.Event.Kind.READ_ACCEPTED)
+    rpc_state.common.trace.start(tracing.Stage.READ)
+    rpc_state.outstanding += 1
 
   def _on_finish_event(self, operation_id, event, rpc_state):
     """Handle termination of an RPC."""
@@ -198,40 +249,56 @@ class RearLink(ticket_interfaces.RearLink, activated.Activated):
     rpc_state.common.sequence_number += 1
     self._fore_link.accept_back_to_front_ticket(ticket)
 
+  def _spin_gauges(self):
+    return len(self._rpc_states), sum(
+        len(rpc_state.common.write.pending)
+        for rpc_state in self._rpc_states.itervalues())
+
   def _spin(self, completion_queue):
+    spin_instrument = self._spin_instrument
+    spin_gauges = self._spin_gauges
     while True:
+      spin_instrument.get_started()
       event = completion_queue.get(None)
+      spin_instrument.get_finished(event.kind)
       operation_id = event.tag
 
       with self._condition:
-        rpc_state = self._rpc_states[operation_id]
-        rpc_state.outstanding.remove(event.kind)
-        if rpc_state.active and self._completion_queue is not None:
-          if event.kind is _low.Event.Kind.WRITE_ACCEPTED:
-            self._on_write_event(operation_id, event, rpc_state)
-          elif event.kind is _low.Event.Kind.METADATA_ACCEPTED:
-            self._on_metadata_event(operation_id, event, rpc_state)
-          elif event.kind is _low.Event.Kind.READ_ACCEPTED:
-            self._on_read_event(operation_id, event, rpc_state)
-          elif event.kind is _low.Event.Kind.COMPLETE_ACCEPTED:
-            self._on_complete_event(operation_id, event, rpc_state)
-          elif event.kind is _low.Event.Kind.FINISH:
-            self._on_finish_event(operation_id, event, rpc_state)
-          else:
-            logging.error('Illegal RPC event! %s', (event,))
-
-        if not rpc_state.outstanding:
-          self._rpc_states.pop(operation_id)
+        spin_instrument.handling_started()
+        try:
+          rpc_state = self._rpc_states[operation_id]
+          rpc_state.outstanding -= 1
+          if rpc_state.active and self._completion_queue is not None:
+            if event.kind is _low.Event.Kind.WRITE_ACCEPTED:
+              self._on_write_event(operation_id, event, rpc_state)
+            elif event.kind is _low.Event.Kind.METADATA_ACCEPTED:
+              self._on_metadata_event(operation_id, event, rpc_state)
+            elif event.kind is _low.Event.Kind.READ_ACCEPTED:
+              self._on_read_event(operation_id, event, rpc_state)
+            elif event.kind is _low.Event.Kind.COMPLETE_ACCEPTED:
+              self._on_complete_event(operation_id, event, rpc_state)
+            elif event.kind is _low.Event.Kind.FINISH:
+              self._on_finish_event(operation_id, event, rpc_state)
+            else:
+              logging.error('Illegal RPC event! %s', (event,))
+
+          if not rpc_state.outstanding:
+            self._rpc_states.pop(operation_id)
+            self._paused_operation_ids.discard(operation_id)
+        finally:
+          spin_instrument.handling_finished(spin_gauges)
         if not self._rpc_states:
           self._spinning = False
           self._condition.notify_all()
           return
 
-  def _invoke(self, operation_id, name, high_state, payload, timeout):
+  def _invoke(
+      self, operation_id, trace_id, name, high_state, payload, timeout):
     """Invoke an RPC.
 
     Args:
       operation_id: Any object to be used as an operation ID for the RPC.
+      trace_id: The trace ID of the RPC. May be None.
       name: The RPC method name.
       high_state: A _common.HighWrite value representing the "high write state"
         of the RPC.
@@ -239,36 +306,41 @@ class RearLink(ticket_interfaces.RearLink, activated.Activated):
         invocation-time.
       timeout: A duration of time in seconds to allow for the RPC.
     """
-    request_serializer = self._request_serializers[name]
-    call = _low.Call(self._channel, name, self._host, time.time() + timeout)
+    method_state = self._method_states.get(name, None)
+    if method_state is None:
+      method_state = _common.MethodState(
+          name, self._response_deserializers[name],
+          self._request_serializers[name])
+      self._method_states[name] = method_state
+    call = _low.Call(
+        self._channel, name, self._authority, time.time() + timeout)
+    _common.add_trace_id(call, trace_id)
     call.invoke(self._completion_queue, operation_id, operation_id)
-    outstanding = set(_INVOCATION_EVENT_KINDS)
 
+    write_state = _common.WriteState(_LowWrite.OPEN, high_state, [])
+    common_state = _common.CommonRPCState(
+        write_state, 0, method_state,
+        self._tracer.trace(trace_id, operation_id))
+    rpc_state = _RPCState(
+        call, len(_INVOCATION_EVENT_KINDS), True, common_state)
     if payload is None:
       if high_state is _common.HighWrite.CLOSED:
         call.complete(operation_id)
-        low_state = _LowWrite.CLOSED
-        outstanding.add(_low.Event.Kind.COMPLETE_ACCEPTED)
-      else:
-        low_state = _LowWrite.OPEN
+        write_state.low = _LowWrite.CLOSED
+        rpc_state.outstanding += 1
     else:
-      serialized_payload = request_serializer(payload)
-      call.write(serialized_payload, operation_id)
-      outstanding.add(_low.Event.Kind.WRITE_ACCEPTED)
-      low_state = _LowWrite.ACTIVE
+      _write(
+          operation_id, rpc_state, _common.serialize(common_state, payload))
 
-    write_state = _common.WriteState(low_state, high_state, [])
-    common_state = _common.CommonRPCState(
-        write_state, 0, self._response_deserializers[name], request_serializer)
-    self._rpc_states[operation_id] = _RPCState(
-        call, outstanding, True, common_state)
+    self._rpc_states[operation_id] = rpc_state
 
     if not self._spinning:
       self._pool.submit(self._spin, self._completion_queue)
       self._spinning = True
 
-  def _commence(self, operation_id, name, payload, timeout):
-    self._invoke(operation_id, name, _common.HighWrite.OPEN, payload, timeout)
+  def _commence(self, operation_id, trace_id, name, payload, timeout):
+    self._invoke(
+        operation_id, trace_id, name, _common.HighWrite.OPEN, payload, timeout)
 
   def _continue(self, operation_id, payload):
     rpc_state = self._rpc_states.get(operation_id, None)
@@ -276,8 +348,7 @@ class RearLink(ticket_interfaces.RearLink, activated.Activated):
       return
 
     _write(
-        operation_id, rpc_state.call, rpc_state.outstanding,
-        rpc_state.common.write, rpc_state.common.serializer(payload))
+        operation_id, rpc_state, _common.serialize(rpc_state.common, payload))
 
   def _complete(self, operation_id, payload):
     """Close writes associated with an ongoing RPC.
@@ -296,22 +367,24 @@ class RearLink(ticket_interfaces.RearLink, activated.Activated):
     if payload is None:
       if write_state.low is _LowWrite.OPEN:
         rpc_state.call.complete(operation_id)
-        rpc_state.outstanding.add(_low.Event.Kind.COMPLETE_ACCEPTED)
+        rpc_state.outstanding += 1
         write_state.low = _LowWrite.CLOSED
     else:
       _write(
-          operation_id, rpc_state.call, rpc_state.outstanding, write_state,
-          rpc_state.common.serializer(payload))
+          operation_id, rpc_state, _common.serialize(rpc_state.common, payload))
     write_state.high = _common.HighWrite.CLOSED
 
-  def _entire(self, operation_id, name, payload, timeout):
-    self._invoke(operation_id, name, _common.HighWrite.CLOSED, payload, timeout)
+  def _entire(self, operation_id, trace_id, name, payload, timeout):
+    self._invoke(
+        operation_id, trace_id, name, _common.HighWrite.CLOSED, payload,
+        timeout)
 
   def _cancel(self, operation_id):
     rpc_state = self._rpc_states.get(operation_id, None)
     if rpc_state is not None and rpc_state.active:
       rpc_state.call.cancel()
       rpc_state.active = False
+      self._paused_operation_ids.discard(operation_id)
 
   def join_fore_link(self, fore_link):
     """See ticket_interfaces.RearLink.join_fore_link for specification."""
@@ -327,7 +400,8 @@ class RearLink(ticket_interfaces.RearLink, activated.Activated):
     with self._condition:
       self._completion_queue = _low.CompletionQueue()
       self._channel = _low.Channel(
-          '%s:%d' % (self._host, self._port), self._client_credentials)
+          _common.channel_target(self._host, self._port),
+          self._client_credentials)
     return self
 
   def _stop(self):
@@ -344,6 +418,99 @@ class RearLink(ticket_interfaces.RearLink, activated.Activated):
       while self._spinning:
         self._condition.wait()
 
+  def connect(self, timeout):
+    """Establishes this RearLink's connection to its remote host.
+
+    The connection is probed with an RPC to a method that no service is
+    expected to implement; any termination of that RPC other than expiration or
+    unavailability indicates that the remote host was reached. This method may
+    only be called while this RearLink is started and blocks until the probe
+    RPC has terminated.
+
+    Args:
+      timeout: A duration of time in seconds to allow for the connection to be
+        established.
+
+    Returns:
+      True if the connection was established within the given timeout; False
+        otherwise.
+    """
+    with self._condition:
+      channel = self._channel
+    deadline = time.time() + timeout
+    completion_queue = _low.CompletionQueue()
+    call = _low.Call(
+        channel, _CONNECTION_PROBE_METHOD_NAME, self._authority, deadline)
+    call.invoke(completion_queue, call, call)
+    call.complete(call)
+
+    connected = False
+    while True:
+      event = completion_queue.get(deadline + _CONNECTION_PROBE_GRACE)
+      if event is None:
+        call.cancel()
+        break
+      elif event.kind is _low.Event.Kind.FINISH:
+        connected = event.status.code not in _UNCONNECTED_CODES
+        break
+
+    completion_queue.stop()
+    while True:
+      event = completion_queue.get(None)
+      if event is not None and event.kind is _low.Event.Kind.STOP:
+        return connected
+
+  def byte_counts(self):
+    """Reports the numbers of payload bytes this RearLink has exchanged.
+
+    Returns:
+      A dictionary from RPC method name to an object with "received" and "sent"
+        attributes counting the serialized payload bytes of the RPC method
+        taken off and put on the wire.
+    """
+    with self._condition:
+      return {
+          name: method_state.byte_counter.snapshot()
+          for name, method_state in self._method_states.iteritems()}
+
+  def rpcs(self):
+    """Describes the RPCs this RearLink has invoked.
+
+    Returns:
+      A dictionary from operation ID to _common.RPCSnapshot for each RPC in
+        progress.
+    """
+    with self._condition:
+      return {
+          operation_id: _common.RPCSnapshot(
+              rpc_state.common.method_state.method,
+              len(rpc_state.common.write.pending),
+              rpc_state.common.write.low is _LowWrite.ACTIVE)
+          for operation_id, rpc_state in self._rpc_states.iteritems()
+          if rpc_state.active}
+
+  def resume_reading(self, operation_id):
+    """Reads the next message of an RPC whose reads are paced.
+
+    Args:
+      operation_id: The operation ID of an RPC invoked by this RearLink.
+        Nothing is done if the RPC is no longer in progress or is not awaiting
+        a call of this method.
+    """
+    with self._condition:
+      if (self._completion_queue is None or
+          operation_id not in self._paused_operation_ids):
+        return
+
+      self._paused_operation_ids.remove(operation_id)
+      rpc_state = self._rpc_states[operation_id]
+      if not rpc_state.active:
+        return
+
+      rpc_state.call.read(operation_id)
+      rpc_state.common.trace.start(tracing.Stage.READ)
+      rpc_state.outstanding += 1
+
   def __enter__(self):
     """See activated.Activated.__enter__ for specification."""
     return self._start()
@@ -369,14 +536,16 @@ class RearLink(ticket_interfaces.RearLink, activated.Activated):
 
       if ticket.kind is tickets.Kind.COMMENCEMENT:
         self._commence(
-            ticket.operation_id, ticket.name, ticket.payload, ticket.timeout)
+            ticket.operation_id, ticket.trace_id, ticket.name, ticket.payload,
+            ticket.timeout)
       elif ticket.kind is tickets.Kind.CONTINUATION:
         self._continue(ticket.operation_id, ticket.payload)
       elif ticket.kind is tickets.Kind.COMPLETION:
         self._complete(ticket.operation_id, ticket.payload)
       elif ticket.kind is tickets.Kind.ENTIRE:
         self._entire(
-            ticket.operation_id, ticket.name, ticket.payload, ticket.timeout)
+            ticket.operation_id, ticket.trace_id, ticket.name, ticket.payload,
+            ticket.timeout)
       elif ticket.kind is tickets.Kind.CANCELLATION:
         self._cancel(ticket.operation_id)
       else:
@@ -388,7 +557,8 @@ class _ActivatedRearLink(ticket_interfaces.RearLink, activated.Activated):
 
   def __init__(
       self, host, port, request_serializers, response_deserializers, secure,
-      root_certificates, private_key, certificate_chain):
+      root_certificates, private_key, certificate_chain, spin_instrument,
+      tracer):
     self._host = host
     self._port = port
     self._request_serializers = request_serializers
@@ -397,6 +567,8 @@ class _ActivatedRearLink(ticket_interfaces.RearLink, activated.Activated):
     self._root_certificates = root_certificates
     self._private_key = private_key
     self._certificate_chain = certificate_chain
+    self._spin_instrument = spin_instrument
+    self._tracer = tracer
 
     self._lock = threading.Lock()
     self._pool = None
@@ -411,11 +583,13 @@ class _ActivatedRearLink(ticket_interfaces.RearLink, activated.Activated):
 
   def _start(self):
     with self._lock:
-      self._pool = logging_pool.pool(_THREAD_POOL_SIZE)
+      self._pool = adaptive_pool.pool(
+          _THREAD_POOL_SIZE, minimum_workers=_MINIMUM_THREAD_POOL_SIZE)
       self._rear_link = RearLink(
           self._host, self._port, self._pool, self._request_serializers,
           self._response_deserializers, self._secure, self._root_certificates,
-          self._private_key, self._certificate_chain)
+          self._private_key, self._certificate_chain,
+          spin_instrument=self._spin_instrument, tracer=self._tracer)
       self._rear_link.join_fore_link(self._fore_link)
       self._rear_link.start()
     return self
@@ -427,6 +601,21 @@ class _ActivatedRearLink(ticket_interfaces.RearLink, activated.Activated):
       self._pool.shutdown(wait=True)
       self._pool = None
 
+  def connect(self, timeout):
+    with self._lock:
+      rear_link = self._rear_link
+    if rear_link is None:
+      raise ValueError('Connection attempted while not started!')
+    return rear_link.connect(timeout)
+
+  def byte_counts(self):
+    with self._lock:
+      return {} if self._rear_link is None else self._rear_link.byte_counts()
+
+  def rpcs(self):
+    with self._lock:
+      return {} if self._rear_link is None else self._rear_link.rpcs()
+
   def __enter__(self):
     return self._start()
 
@@ -448,15 +637,18 @@ class _ActivatedRearLink(ticket_interfaces.RearLink, activated.Activated):
 
 # TODO(issue 726): reconcile these two creation functions.
 def activated_rear_link(
-    host, port, request_serializers, response_deserializers):
+    host, port, request_serializers, response_deserializers,
+    spin_instrument=None, tracer=None):
   """Creates a RearLink that is also an activated.Activated.
 
   The returned object is only valid for use between calls to its start and stop
   methods (or in context when used as a context manager).
 
   Args:
-    host: The host to which to connect for RPC service.
-    port: The port to which to connect for RPC service.
+    host: The host to which to connect for RPC service, or a "unix:<path>"
+      address naming a Unix domain socket to which to connect.
+    port: The port to which to connect for RPC service, ignored if host is a
+      "unix:<path>" address.
     request_serializers: A dictionary from RPC method name to request object
       serializer behavior.
     response_deserializers: A dictionary from RPC method name to response
@@ -468,24 +660,30 @@ def activated_rear_link(
       should be used.
     certificate_chain: The PEM-encoded certificate chain to use or None if no
       certificate chain should be used.
+    spin_instrument: An instrumentation.SpinInstrument with which to observe
+      the RearLink's completion-queue loop, or None.
+    tracer: A tracing.Tracer with which to sample RPCs, or None. See
+      RearLink.__init__ for details.
   """
   return _ActivatedRearLink(
       host, port, request_serializers, response_deserializers, False, None,
-      None, None)
+      None, None, spin_instrument, tracer)
 
 
 
 def secure_activated_rear_link(
     host, port, request_serializers, response_deserializers, root_certificates,
-    private_key, certificate_chain):
+    private_key, certificate_chain, spin_instrument=None, tracer=None):
   """Creates a RearLink that is also an activated.Activated.
 
   The returned object is only valid for use between calls to its start and stop
   methods (or in context when used as a context manager).
 
   Args:
-    host: The host to which to connect for RPC service.
-    port: The port to which to connect for RPC service.
+    host: The host to which to connect for RPC service, or a "unix:<path>"
+      address naming a Unix domain socket to which to connect.
+    port: The port to which to connect for RPC service, ignored if host is a
+      "unix:<path>" address.
     request_serializers: A dictionary from RPC method name to request object
       serializer behavior.
     response_deserializers: A dictionary from RPC method name to response
@@ -496,7 +694,12 @@ def secure_activated_rear_link(
       should be used.
     certificate_chain: The PEM-encoded certificate chain to use or None if no
       certificate chain should be used.
+    spin_instrument: An instrumentation.SpinInstrument with which to observe
+      the RearLink's completion-queue loop, or None.
+    tracer: A tracing.Tracer with which to sample RPCs, or None. See
+      RearLink.__init__ for details.
   """
   return _ActivatedRearLink(
       host, port, request_serializers, response_deserializers, True,
-      root_certificates, private_key, certificate_chain)
+      root_certificates, private_key, certificate_chain, spin_instrument,
+      tracer)
@@ -0,0 +1,491 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""A ForeLink and RearLink exchanging tickets through shared memory.
+
+A ForeLink creates a segment of memory (see _ring) at a path on the host, to
+which a RearLink in another process (or the same process) then attaches. Each
+ticket is carried as one record: a small marshalled header followed by the
+ticket's serialized payload, which is copied exactly once, from the bytestring
+returned by the payload serializer into the shared memory. Each link reads
+the records arriving for it in a thread of its own.
+
+A ticket that cannot be written (its payload does not fit in the ring, or no
+room is made for it within _WRITE_TIMEOUT) fails its operation: the link
+passes a TRANSMISSION_FAILURE ticket for the operation to its joined link and
+tries to tell the link at the other end of the segment the same.
+
+A segment joins exactly one ForeLink with one RearLink at a time.
+"""
+
+import abc
+import logging
+import marshal
+import threading
+import uuid
+
+from grpc._adapter import _common
+from grpc._adapter import _ring
+from grpc.framework.base import interfaces
+from grpc.framework.base.packets import interfaces as ticket_interfaces
+from grpc.framework.base.packets import null
+from grpc.framework.base.packets import packets as tickets
+from grpc.framework.foundation import activated
+from grpc.framework.foundation import callable_util
+
+_DEFAULT_CAPACITY = 4 * 1024 * 1024
+# The longest length of time for which a reading thread blocks on its doorbell
+# before looking at its ring again. It bounds the delay of a record whose
+# doorbell was missed (see _ring) and sets how often an idle link wakes.
+_POLL_INTERVAL = 0.01
+# The longest length of time for which to wait for room in the outgoing ring
+# before failing the operation of a record.
+_WRITE_TIMEOUT = 10
+
+_KINDS = {kind.value: kind for kind in tickets.Kind}
+_SUBSCRIPTIONS = {
+    kind.value: kind for kind in interfaces.ServicedSubscription.Kind}
+_COMMENCEMENT_KINDS = (tickets.Kind.COMMENCEMENT, tickets.Kind.ENTIRE)
+_FRONT_TO_BACK_TERMINAL_KINDS = (
+    tickets.Kind.CANCELLATION, tickets.Kind.EXPIRATION,
+    tickets.Kind.SERVICED_FAILURE, tickets.Kind.RECEPTION_FAILURE,
+    tickets.Kind.TRANSMISSION_FAILURE)
+_EMPTY = b''
+_ACCEPTANCE_EXCEPTION_LOG_MESSAGE = 'Exception handling shared-memory record!'
+
+
+def _serialize(method_state, payload):
+  serializer = method_state.serializer
+  return payload if serializer is None else serializer(payload)
+
+
+def _deserialize(method_state, serialized_payload):
+  deserializer = method_state.deserializer
+  return (
+      serialized_payload if deserializer is None
+      else deserializer(serialized_payload))
+
+
+class _Link(activated.Activated):
+  """Behavior common to both ends of a segment."""
+  __metaclass__ = abc.ABCMeta
+
+  def __init__(self, path):
+    self._path = path
+    # Guards the states of operations and methods.
+    self._lock = threading.Lock()
+    # Serializes the records written to the outgoing ring.
+    self._write_lock = threading.Lock()
+    # Dictionary from method name to _common.MethodState.
+    self._method_states = {}
+    self._segment = None
+    self._incoming = None
+    self._outgoing = None
+    self._thread = None
+
+  @abc.abstractmethod
+  def _open(self):
+    """Opens this link's segment.
+
+    Returns:
+      A triple of the _ring.Segment, the _ring.Ring from which this link reads
+        and the _ring.Ring to which this link writes.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def _accept(self, header, payload):
+    """Handles a record read from this link's incoming ring.
+
+    Args:
+      header: The unmarshalled header tuple of the record.
+      payload: The serialized payload of the record as a bytestring.
+    """
+    raise NotImplementedError()
+
+  def _spin(self, incoming):
+    while True:
+      records = incoming.take(_POLL_INTERVAL)
+      with self._lock:
+        if self._incoming is not incoming:
+          return
+      for header, payload in records:
+        callable_util.call_logging_exceptions(
+            self._accept, _ACCEPTANCE_EXCEPTION_LOG_MESSAGE,
+            marshal.loads(header), payload)
+
+  def _write(self, header, payload, timeout=_WRITE_TIMEOUT):
+    """Copies a record into the outgoing ring.
+
+    Args:
+      header: The header tuple of the record.
+      payload: The serialized payload of the record, or None.
+      timeout: The longest length of time in seconds for which to wait for room
+        in the outgoing ring.
+
+    Returns:
+      True if the record was written, or False if this link is not started,
+        the record could never fit in the ring, or no room was made for it
+        within the timeout.
+    """
+    with self._write_lock:
+      if self._outgoing is None:
+        return False
+      try:
+        if self._outgoing.put(
+            marshal.dumps(header), _EMPTY if payload is None else payload,
+            timeout):
+          return True
+      except ValueError:
+        logging.exception(
+            'Shared-memory record too large! Header: %s', (header,))
+        return False
+      logging.error('Shared-memory record dropped! Header: %s', (header,))
+      return False
+
+  def _start(self):
+    with self._lock:
+      self._segment, self._incoming, outgoing = self._open()
+      self._thread = threading.Thread(target=self._spin, args=(self._incoming,))
+      self._thread.daemon = True
+      self._thread.start()
+    with self._write_lock:
+      self._outgoing = outgoing
+    return self
+
+  def _stop(self):
+    with self._lock:
+      segment, incoming, thread = self._segment, self._incoming, self._thread
+      self._segment, self._incoming, self._thread = None, None, None
+    if segment is None:
+      return
+    segment.mark_closed()
+    incoming.wake()
+    thread.join()
+    with self._write_lock:
+      self._outgoing = None
+    segment.close()
+
+  def __enter__(self):
+    return self._start()
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    self._stop()
+    return False
+
+  def start(self):
+    return self._start()
+
+  def stop(self):
+    self._stop()
+
+  def byte_counts(self):
+    """Reports the numbers of payload bytes this link has exchanged.
+
+    Returns:
+      A dictionary from RPC method name to an object with "received" and "sent"
+        attributes counting the serialized payload bytes of the RPC method
+        taken out of and put into shared memory.
+    """
+    with self._lock:
+      return {
+          method: method_state.byte_counter.snapshot()
+          for method, method_state in self._method_states.iteritems()}
+
+
+class _Operation(object):
+  """The state of an operation at one end of a segment.
+
+  Attributes:
+    operation_id: The ID under which the joined link knows the operation.
+    key: The ID under which the operation is known in the segment.
+    method_state: The _common.MethodState of the operation's RPC method.
+    sequence_number: The sequence number of the next ticket to be passed to
+      the joined link.
+  """
+  __slots__ = ('operation_id', 'key', 'method_state', 'sequence_number')
+
+  def __init__(self, operation_id, key, method_state):
+    self.operation_id = operation_id
+    self.key = key
+    self.method_state = method_state
+    self.sequence_number = 0
+
+
+class ForeLink(_Link, ticket_interfaces.ForeLink):
+  """A service-side link creating a segment of shared memory."""
+
+  def __init__(
+      self, path, request_deserializers, response_serializers,
+      capacity=_DEFAULT_CAPACITY):
+    """Constructor.
+
+    Args:
+      path: The path at which to create the segment, such as a path under
+        /dev/shm. Any segment already at the path is replaced.
+      request_deserializers: A dict from RPC method names to request object
+        deserializer behaviors, or to None for methods with requests passed on
+        as the bytestrings taken off the wire.
+      response_serializers: A dict from RPC method names to response object
+        serializer behaviors, or to None for methods with responses that are
+        already bytestrings.
+      capacity: The capacity in bytes of the segment's ring in each direction.
+        No serialized payload may exceed this capacity.
+    """
+    super(ForeLink, self).__init__(path)
+    self._request_deserializers = request_deserializers
+    self._response_serializers = response_serializers
+    self._capacity = capacity
+    self._rear_link = null.NULL_REAR_LINK
+    # Dictionary from operation key to _Operation.
+    self._operations = {}
+
+  def _open(self):
+    segment = _ring.create(self._path, self._capacity)
+    return segment, segment.front_to_back, segment.back_to_front
+
+  def _accept(self, header, payload):
+    (key, sequence_number, kind_value, name, subscription_value, trace_bytes,
+     timeout, has_payload) = header
+    kind = _KINDS[kind_value]
+    with self._lock:
+      if kind in _COMMENCEMENT_KINDS:
+        method_state = self._method_states.get(name)
+        if method_state is None:
+          if name not in self._request_deserializers:
+            method_state = None
+          else:
+            method_state = _common.MethodState(
+                name, self._request_deserializers[name],
+                self._response_serializers[name])
+            self._method_states[name] = method_state
+        if method_state is None:
+          operation = None
+        else:
+          operation = _Operation(key, key, method_state)
+          self._operations[key] = operation
+      elif kind in _FRONT_TO_BACK_TERMINAL_KINDS:
+        operation = self._operations.pop(key, None)
+      else:
+        operation = self._operations.get(key)
+      if operation is not None:
+        operation.sequence_number = sequence_number + 1
+      rear_link = self._rear_link
+
+    if operation is None:
+      if kind in _COMMENCEMENT_KINDS:
+        self._write(
+            (key, 0, tickets.Kind.TRANSMISSION_FAILURE.value, False), None)
+      return
+    method_state = operation.method_state
+    if has_payload:
+      method_state.byte_counter.received += len(payload)
+      value = _deserialize(method_state, payload)
+    else:
+      value = None
+    rear_link.accept_front_to_back_ticket(tickets.FrontToBackPacket(
+        key, sequence_number, kind, name,
+        None if subscription_value is None else _SUBSCRIPTIONS[
+            subscription_value],
+        None if trace_bytes is None else uuid.UUID(bytes=trace_bytes), value,
+        timeout))
+
+  def join_rear_link(self, rear_link):
+    """See ticket_interfaces.ForeLink.join_rear_link for specification."""
+    with self._lock:
+      self._rear_link = null.NULL_REAR_LINK if rear_link is None else rear_link
+
+  def accept_back_to_front_ticket(self, ticket):
+    """See ticket_interfaces.ForeLink.accept_back_to_front_ticket for spec."""
+    with self._lock:
+      if ticket.kind is tickets.Kind.CONTINUATION:
+        operation = self._operations.get(ticket.operation_id)
+      else:
+        operation = self._operations.pop(ticket.operation_id, None)
+    if operation is None:
+      return
+    if ticket.payload is None:
+      serialized_payload = None
+    else:
+      serialized_payload = _serialize(operation.method_state, ticket.payload)
+      operation.method_state.byte_counter.sent += len(serialized_payload)
+    if not self._write(
+        (ticket.operation_id, ticket.sequence_number, ticket.kind.value,
+         serialized_payload is not None),
+        serialized_payload):
+      self._fail(ticket.operation_id, ticket.sequence_number)
+
+  def _fail(self, key, sequence_number):
+    """Fails an operation a ticket of which could not be written.
+
+    Args:
+      key: The key of the operation.
+      sequence_number: The sequence number of the ticket that was not written.
+    """
+    with self._lock:
+      operation = self._operations.pop(key, None)
+      rear_link = self._rear_link
+    self._write(
+        (key, sequence_number, tickets.Kind.TRANSMISSION_FAILURE.value, False),
+        None, timeout=0)
+    if operation is not None:
+      rear_link.accept_front_to_back_ticket(tickets.FrontToBackPacket(
+          key, operation.sequence_number, tickets.Kind.TRANSMISSION_FAILURE,
+          None, None, None, None, None))
+
+
+class RearLink(_Link, ticket_interfaces.RearLink):
+  """An invocation-side link attaching to a segment of shared memory."""
+
+  def __init__(self, path, request_serializers, response_deserializers):
+    """Constructor.
+
+    Args:
+      path: The path of a segment created by a started ForeLink.
+      request_serializers: A dict from RPC method names to request object
+        serializer behaviors, or to None for methods with requests that are
+        already bytestrings.
+      response_deserializers: A dict from RPC method names to response object
+        deserializer behaviors, or to None for methods with responses passed on
+        as the bytestrings taken off the wire.
+    """
+    super(RearLink, self).__init__(path)
+    self._request_serializers = request_serializers
+    self._response_deserializers = response_deserializers
+    self._fore_link = null.NULL_FORE_LINK
+    # Dictionaries from operation ID and from operation key to _Operation.
+    self._operations = {}
+    self._keys = {}
+
+  def _open(self):
+    segment = _ring.attach(self._path)
+    return segment, segment.back_to_front, segment.front_to_back
+
+  def _accept(self, header, payload):
+    key, sequence_number, kind_value, has_payload = header
+    kind = _KINDS[kind_value]
+    with self._lock:
+      if kind is tickets.Kind.CONTINUATION:
+        operation = self._keys.get(key)
+      else:
+        operation = self._keys.pop(key, None)
+        if operation is not None:
+          self._operations.pop(operation.operation_id, None)
+      if operation is not None:
+        operation.sequence_number = sequence_number + 1
+      fore_link = self._fore_link
+    if operation is None:
+      return
+    if has_payload:
+      operation.method_state.byte_counter.received += len(payload)
+      value = _deserialize(operation.method_state, payload)
+    else:
+      value = None
+    fore_link.accept_back_to_front_ticket(tickets.BackToFrontPacket(
+        operation.operation_id, sequence_number, kind, value))
+
+  def join_fore_link(self, fore_link):
+    """See ticket_interfaces.RearLink.join_fore_link for specification."""
+    with self._lock:
+      self._fore_link = null.NULL_FORE_LINK if fore_link is None else fore_link
+
+  def accept_front_to_back_ticket(self, ticket):
+    """See ticket_interfaces.RearLink.accept_front_to_back_ticket for spec."""
+    with self._lock:
+      if ticket.kind in _COMMENCEMENT_KINDS:
+        method_state = self._method_states.get(ticket.name)
+        if method_state is None:
+          method_state = _common.MethodState(
+              ticket.name, self._response_deserializers[ticket.name],
+              self._request_serializers[ticket.name])
+          self._method_states[ticket.name] = method_state
+        if isinstance(ticket.operation_id, uuid.UUID):
+          key = ticket.operation_id.bytes
+        else:
+          key = uuid.uuid4().bytes
+        operation = _Operation(ticket.operation_id, key, method_state)
+        self._operations[ticket.operation_id] = operation
+        self._keys[key] = operation
+      elif ticket.kind in _FRONT_TO_BACK_TERMINAL_KINDS:
+        operation = self._operations.pop(ticket.operation_id, None)
+        if operation is not None:
+          self._keys.pop(operation.key, None)
+      else:
+        operation = self._operations.get(ticket.operation_id)
+    if operation is None:
+      return
+    if ticket.payload is None:
+      serialized_payload = None
+    else:
+      serialized_payload = _serialize(operation.method_state, ticket.payload)
+      operation.method_state.byte_counter.sent += len(serialized_payload)
+    if not self._write(
+        (operation.key, ticket.sequence_number, ticket.kind.value, ticket.name,
+         None if ticket.subscription is None else ticket.subscription.value,
+         None if ticket.trace_id is None else ticket.trace_id.bytes,
+         ticket.timeout, serialized_payload is not None),
+        serialized_payload):
+      self._fail(operation, ticket.sequence_number)
+
+  def _fail(self, operation, sequence_number):
+    """Fails an operation a ticket of which could not be written.
+
+    Args:
+      operation: The _Operation of the operation.
+      sequence_number: The sequence number of the ticket that was not written.
+    """
+    with self._lock:
+      live = self._operations.pop(operation.operation_id, None) is operation
+      if live:
+        self._keys.pop(operation.key, None)
+      fore_link = self._fore_link
+    self._write(
+        (operation.key, sequence_number,
+         tickets.Kind.TRANSMISSION_FAILURE.value, None, None, None, None,
+         False),
+        None, timeout=0)
+    if live:
+      fore_link.accept_back_to_front_ticket(tickets.BackToFrontPacket(
+          operation.operation_id, operation.sequence_number,
+          tickets.Kind.TRANSMISSION_FAILURE, None))
+
+  def connect(self, timeout):  # pylint: disable=unused-argument
+    """Indicates whether this RearLink is attached to its segment.
+
+    Attachment happens as this RearLink is started, so this method does not
+    block.
+
+    Args:
+      timeout: Ignored.
+
+    Returns:
+      True if this RearLink is started; False otherwise.
+    """
+    with self._lock:
+      return self._segment is not None
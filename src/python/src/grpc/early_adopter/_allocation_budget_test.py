@@ -0,0 +1,103 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Budgets for the garbage and thread handoffs of a unary-unary RPC.
+
+A unary-unary RPC is made through the entire stack: an early_adopter stub, a
+packets-based Front, a rear link, the C extension, a fore link and a packets-
+based Back. Its mean costs are held under budgets checked in here; a change
+that raises them should either be reworked or raise the budget knowingly.
+"""
+
+import unittest
+
+from grpc._junkdrawer import math_pb2
+from grpc.early_adopter import implementations
+from grpc.early_adopter import utilities
+from grpc.framework.foundation import allocation_testing
+
+_DIV = 'Div'
+_TIMEOUT = 3
+_CALLS = 200
+
+# The budgets sit a little above the means observed over twenty runs of this
+# test, which are noted beside each. Retained objects and handoffs vary from
+# run to run with how much of the last RPC's work is still in flight when the
+# measurement ends.
+# The most objects that one RPC may leave for the cycle collector.
+_GARBAGE_BUDGET = 55  # Observed: 48.6 to 49.1.
+# The most objects tracked by the cycle collector that one RPC may leave alive.
+_RETAINED_BUDGET = 2  # Observed: 0.26 to 1.23.
+# The most tasks that one RPC may hand off to thread pools.
+_HANDOFF_BUDGET = 13  # Observed: 11.8 to 12.09.
+
+
+def _div(request, unused_context):
+  return math_pb2.DivReply(
+      quotient=request.dividend / request.divisor,
+      remainder=request.dividend % request.divisor)
+
+
+_INVOCATION_DESCRIPTIONS = {
+    _DIV: utilities.unary_unary_invocation_description(
+        math_pb2.DivArgs.SerializeToString, math_pb2.DivReply.FromString),
+}
+
+_SERVICE_DESCRIPTIONS = {
+    _DIV: utilities.unary_unary_service_description(
+        _div, math_pb2.DivArgs.FromString,
+        math_pb2.DivReply.SerializeToString),
+}
+
+
+class UnaryUnaryBudgetTest(unittest.TestCase):
+
+  def setUp(self):
+    self.server = implementations.insecure_server(_SERVICE_DESCRIPTIONS, 0)
+    self.server.start()
+    self.stub = implementations.insecure_stub(
+        _INVOCATION_DESCRIPTIONS, 'localhost', self.server.port())
+
+  def tearDown(self):
+    self.server.stop()
+
+  def testUnaryUnaryCosts(self):
+    request = math_pb2.DivArgs(divisor=7, dividend=59)
+
+    with self.stub:
+      costs = allocation_testing.measure(
+          lambda: self.stub.Div(request, _TIMEOUT), _CALLS)
+
+    self.assertLessEqual(costs.garbage, _GARBAGE_BUDGET)
+    self.assertLessEqual(costs.retained, _RETAINED_BUDGET)
+    self.assertLessEqual(costs.handoffs, _HANDOFF_BUDGET)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -48,9 +48,11 @@ class InvocationBreakdown(object):
     implementations: A dictionary from RPC method name to
       assembly_interfaces.MethodImplementation describing the method.
     request_serializers: A dictionary from RPC method name to callable
-      behavior to be used serializing request values for the RPC.
+      behavior to be used serializing request values for the RPC, or None if
+      request values are bytestrings to be sent untouched.
     response_deserializers: A dictionary from RPC method name to callable
-      behavior to be used deserializing response values for the RPC.
+      behavior to be used deserializing response values for the RPC, or None
+      if response values are the bytestrings taken off the wire.
   """
   __metaclass__ = abc.ABCMeta
 
@@ -71,9 +73,11 @@ class ServiceBreakdown(object):
     implementations: A dictionary from RPC method name
       assembly_interfaces.MethodImplementation implementing the RPC method.
     request_deserializers: A dictionary from RPC method name to callable
-      behavior to be used deserializing request values for the RPC.
+      behavior to be used deserializing request values for the RPC, or None if
+      request values are the bytestrings taken off the wire.
     response_serializers: A dictionary from RPC method name to callable
-      behavior to be used serializing response values for the RPC.
+      behavior to be used serializing response values for the RPC, or None if
+      response values are bytestrings to be sent untouched.
   """
   __metaclass__ = abc.ABCMeta
 
@@ -111,8 +115,12 @@ def break_down_invocation(method_descriptions):
       implementations[name] = assembly_utilities.stream_unary_inline(None)
     elif cardinality is interfaces.Cardinality.STREAM_STREAM:
       implementations[name] = assembly_utilities.stream_stream_inline(None)
-    request_serializers[name] = method_description.serialize_request
-    response_deserializers[name] = method_description.deserialize_response
+    if getattr(method_description, 'raw', False):
+      request_serializers[name] = None
+      response_deserializers[name] = method_description.view
+    else:
+      request_serializers[name] = method_description.serialize_request
+      response_deserializers[name] = method_description.deserialize_response
   return _EasyInvocationBreakdown(
       cardinalities, implementations, request_serializers,
       response_deserializers)
@@ -161,8 +169,41 @@ def break_down_service(method_descriptions):
         return service_behavior(
             request_iterator, _reexport.rpc_context(face_rpc_context))
       implementations[name] = assembly_utilities.stream_stream_inline(service)
-    request_deserializers[name] = method_description.deserialize_request
-    response_serializers[name] = method_description.serialize_response
+    if getattr(method_description, 'raw', False):
+      request_deserializers[name] = method_description.view
+      response_serializers[name] = None
+    else:
+      request_deserializers[name] = method_description.deserialize_request
+      response_serializers[name] = method_description.serialize_response
 
   return _EasyServiceBreakdown(
       implementations, request_deserializers, response_serializers)
+
+
+def break_down_executors(executor_descriptions, method_names):
+  """Derives assembly executors from several executor descriptions.
+
+  Args:
+    executor_descriptions: A dictionary from executor name to
+      interfaces.ExecutorDescription.
+    method_names: A collection of the names of the RPC methods serviced by the
+      server of the executors.
+
+  Returns:
+    A dictionary from executor name to assembly_interfaces.Executor.
+
+  Raises:
+    ValueError: If an executor description names an RPC method not among the
+      given method names.
+  """
+  for name, description in executor_descriptions.iteritems():
+    unknown_methods = set(description.methods()).difference(method_names)
+    if unknown_methods:
+      raise ValueError(
+          'Executor "%s" names unknown RPC methods: %s!' % (
+              name, ', '.join(sorted(unknown_methods))))
+  return {
+      name: assembly_utilities.executor(
+          description.methods(), description.maximum_concurrency(),
+          description.maximum_queue_length())
+      for name, description in executor_descriptions.iteritems()}
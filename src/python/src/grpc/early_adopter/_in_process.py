@@ -0,0 +1,362 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Links joining stubs to servers in the same process.
+
+Operations invoked through an in-process link exchange tickets with the
+server's Back directly: request and response values are passed by reference
+(or, optionally, copied) and are never serialized.
+"""
+
+import collections
+import copy
+import threading
+
+from grpc.framework.base.packets import in_memory
+from grpc.framework.base.packets import interfaces as ticket_interfaces
+from grpc.framework.base.packets import null
+from grpc.framework.base.packets import packets as tickets
+from grpc.framework.foundation import activated
+from grpc.framework.foundation import adaptive_pool
+
+_THREAD_POOL_SIZE = 100
+_MINIMUM_THREAD_POOL_SIZE = 4
+
+_COMMENCEMENT_KINDS = (tickets.Kind.COMMENCEMENT, tickets.Kind.ENTIRE)
+_FRONT_TO_BACK_TERMINAL_KINDS = (
+    tickets.Kind.CANCELLATION,
+    tickets.Kind.EXPIRATION,
+    tickets.Kind.SERVICED_FAILURE,
+    tickets.Kind.RECEPTION_FAILURE,
+    tickets.Kind.TRANSMISSION_FAILURE,
+)
+
+
+class _Route(collections.namedtuple('_Route', ('channel', 'operation_id'))):
+  """The operation ID under which a server knows an in-process operation.
+
+  Attributes:
+    channel: The _Channel through which the operation was invoked.
+    operation_id: The operation ID under which the channel's Front knows the
+      operation.
+  """
+  __slots__ = ()
+
+
+class ForeLink(ticket_interfaces.ForeLink, activated.Activated):
+  """A ForeLink accepting tickets both from the network and in-process.
+
+  Back-to-front tickets of operations invoked in-process are routed back to
+  the channels through which they were invoked; all others are passed to the
+  wrapped network ForeLink.
+  """
+
+  def __init__(self, fore_link):
+    """Constructor.
+
+    Args:
+      fore_link: An object that is both a ticket_interfaces.ForeLink and an
+        activated.Activated and that carries tickets to and from the network,
+        or None if the ForeLink is to serve only in-process operations.
+    """
+    self._fore_link = fore_link
+
+    self._lock = threading.Lock()
+    self._rear_link = null.NULL_REAR_LINK
+    self._serving = False
+
+  def join_rear_link(self, rear_link):
+    """See ticket_interfaces.ForeLink.join_rear_link for specification."""
+    with self._lock:
+      self._rear_link = null.NULL_REAR_LINK if rear_link is None else rear_link
+      if self._fore_link is not None:
+        self._fore_link.join_rear_link(rear_link)
+
+  def _start(self):
+    with self._lock:
+      if self._fore_link is not None:
+        self._fore_link.start()
+      self._serving = True
+    return self
+
+  def _stop(self):
+    with self._lock:
+      self._serving = False
+      if self._fore_link is not None:
+        self._fore_link.stop()
+
+  def __enter__(self):
+    return self._start()
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    self._stop()
+    return False
+
+  def start(self):
+    return self._start()
+
+  def stop(self):
+    self._stop()
+
+  def serving(self):
+    """Indicates whether this ForeLink is accepting in-process operations.
+
+    Returns:
+      True if this ForeLink is started; False otherwise.
+    """
+    with self._lock:
+      return self._serving
+
+  def port(self):
+    """Identifies the port on which the wrapped ForeLink is servicing RPCs.
+
+    Returns:
+      The number of the port, or None if this ForeLink has no wrapped ForeLink
+        or is not currently started.
+    """
+    return None if self._fore_link is None else self._fore_link.port()
+
+  def byte_counts(self):
+    """Reports the numbers of payload bytes exchanged over the network.
+
+    Returns:
+      A dictionary from RPC method name to an object with "received" and "sent"
+        attributes. In-process operations exchange no bytes and are not
+        counted.
+    """
+    return {} if self._fore_link is None else self._fore_link.byte_counts()
+
+  def rpcs(self):
+    """Describes the network RPCs the wrapped ForeLink is servicing.
+
+    Returns:
+      A dictionary from operation ID to an object with "pending_writes" and
+        "writing" attributes for each network RPC in progress.
+    """
+    return {} if self._fore_link is None else self._fore_link.rpcs()
+
+  def observe_queueing_delay(self, delay):
+    """Passes an observed queueing delay to the wrapped ForeLink, if any.
+
+    Args:
+      delay: A length of time in seconds that work servicing an RPC waited
+        for a thread.
+    """
+    if self._fore_link is not None:
+      self._fore_link.observe_queueing_delay(delay)
+
+  def accept_in_process_ticket(self, ticket):
+    """Accepts a front-to-back ticket of an operation invoked in-process.
+
+    The ticket is passed directly to the joined RearLink: in-process operations
+    bypass the admission control (maximum concurrency and queueing delay) that
+    the wrapped ForeLink applies to operations arriving over the network.
+
+    Args:
+      ticket: A packets.FrontToBackPacket with a _Route for its operation ID.
+    """
+    with self._lock:
+      serving = self._serving
+      rear_link = self._rear_link
+    if serving:
+      rear_link.accept_front_to_back_ticket(ticket)
+    elif ticket.kind in _COMMENCEMENT_KINDS:
+      ticket.operation_id.channel.deliver(tickets.BackToFrontPacket(
+          ticket.operation_id, 0, tickets.Kind.TRANSMISSION_FAILURE, None))
+
+  def accept_back_to_front_ticket(self, ticket):
+    """See ticket_interfaces.ForeLink.accept_back_to_front_ticket for spec."""
+    if isinstance(ticket.operation_id, _Route):
+      ticket.operation_id.channel.deliver(ticket)
+    elif self._fore_link is not None:
+      self._fore_link.accept_back_to_front_ticket(ticket)
+
+
+class _Transmitter(object):
+  """Passes a channel's front-to-back tickets to a server's ForeLink."""
+
+  def __init__(self, channel):
+    self._channel = channel
+
+  def accept_front_to_back_ticket(self, ticket):
+    self._channel.transmit(ticket)
+
+
+class _Channel(ticket_interfaces.RearLink, activated.Activated):
+  """A RearLink exchanging tickets with a server's in-process ForeLink."""
+
+  def __init__(self, fore_link, copy_payloads):
+    self._server_fore_link = fore_link
+    self._copy_payloads = copy_payloads
+
+    self._lock = threading.Lock()
+    self._pool = None
+    self._link = None
+    self._fore_link = null.NULL_FORE_LINK
+
+    # The server's ForeLink may deliver a ticket back to this channel from
+    # within accept_in_process_ticket, so the lock guarding transmission is
+    # reentrant.
+    self._transmission_lock = threading.RLock()
+    self._transmitting = False
+    # Dictionary from the ID of each operation this channel has commenced at
+    # the server and that has not yet terminated to the sequence number
+    # following the highest yet transmitted for it.
+    self._sequence_numbers = {}
+
+  def join_fore_link(self, fore_link):
+    with self._lock:
+      self._fore_link = null.NULL_FORE_LINK if fore_link is None else fore_link
+      if self._link is not None:
+        self._link.join_fore_link(self._fore_link)
+
+  def _start(self):
+    with self._lock:
+      self._pool = adaptive_pool.pool(
+          _THREAD_POOL_SIZE, minimum_workers=_MINIMUM_THREAD_POOL_SIZE)
+      self._link = in_memory.Link(self._pool)
+      self._link.join_fore_link(self._fore_link)
+      self._link.join_rear_link(_Transmitter(self))
+    with self._transmission_lock:
+      self._transmitting = True
+    return self
+
+  def _stop(self):
+    # The server will never again hear from the front of this channel, so the
+    # operations it is servicing for the channel are cancelled.
+    with self._transmission_lock:
+      self._transmitting = False
+      for operation_id, sequence_number in self._sequence_numbers.iteritems():
+        self._server_fore_link.accept_in_process_ticket(
+            tickets.FrontToBackPacket(
+                _Route(self, operation_id), sequence_number,
+                tickets.Kind.CANCELLATION, None, None, None, None, None))
+      self._sequence_numbers = {}
+    with self._lock:
+      pool = self._pool
+      self._link = None
+      self._pool = None
+    if pool is not None:
+      pool.shutdown(wait=True)
+
+  def __enter__(self):
+    return self._start()
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    self._stop()
+    return False
+
+  def start(self):
+    return self._start()
+
+  def stop(self):
+    self._stop()
+
+  def connect(self, timeout):  # pylint: disable=unused-argument
+    with self._lock:
+      if self._link is None:
+        raise ValueError('Connection attempted while not started!')
+    return self._server_fore_link.serving()
+
+  def byte_counts(self):
+    return {}
+
+  def rpcs(self):
+    return {}
+
+  def transmit(self, ticket):
+    """Passes a front-to-back ticket to the server's ForeLink.
+
+    The ticket is passed on while holding the transmission lock so that no
+    operation is commenced at the server after its cancellation by stop.
+
+    Args:
+      ticket: A packets.FrontToBackPacket from this channel's Front.
+    """
+    if self._copy_payloads and ticket.payload is not None:
+      routed_ticket = ticket._replace(
+          operation_id=_Route(self, ticket.operation_id),
+          payload=copy.deepcopy(ticket.payload))
+    else:
+      routed_ticket = ticket._replace(
+          operation_id=_Route(self, ticket.operation_id))
+    with self._transmission_lock:
+      if not self._transmitting:
+        return
+      if ticket.kind in _FRONT_TO_BACK_TERMINAL_KINDS:
+        self._sequence_numbers.pop(ticket.operation_id, None)
+      elif (ticket.kind in _COMMENCEMENT_KINDS or
+            ticket.operation_id in self._sequence_numbers):
+        self._sequence_numbers[ticket.operation_id] = max(
+            ticket.sequence_number + 1,
+            self._sequence_numbers.get(ticket.operation_id, 0))
+      self._server_fore_link.accept_in_process_ticket(routed_ticket)
+
+  def deliver(self, ticket):
+    """Accepts a back-to-front ticket from the server's ForeLink.
+
+    Args:
+      ticket: A packets.BackToFrontPacket with a _Route for its operation ID.
+    """
+    if ticket.kind is not tickets.Kind.CONTINUATION:
+      with self._transmission_lock:
+        self._sequence_numbers.pop(ticket.operation_id.operation_id, None)
+    if self._copy_payloads and ticket.payload is not None:
+      ticket = ticket._replace(
+          operation_id=ticket.operation_id.operation_id,
+          payload=copy.deepcopy(ticket.payload))
+    else:
+      ticket = ticket._replace(operation_id=ticket.operation_id.operation_id)
+    with self._lock:
+      if self._link is not None:
+        self._link.accept_back_to_front_ticket(ticket)
+
+  def accept_front_to_back_ticket(self, ticket):
+    with self._lock:
+      if self._link is not None:
+        self._link.accept_front_to_back_ticket(ticket)
+
+
+def activated_rear_link(fore_link, copy_payloads):
+  """Creates a RearLink that is also an activated.Activated.
+
+  The returned object is only valid for use between calls to its start and stop
+  methods (or in context when used as a context manager).
+
+  Args:
+    fore_link: The ForeLink of the server with which to exchange tickets.
+    copy_payloads: Whether or not to copy request and response values as they
+      pass between invoker and server. If False they are passed by reference
+      and must not be mutated after having been passed.
+
+  Returns:
+    A ticket_interfaces.RearLink that is also an activated.Activated and that
+      has "connect", "byte_counts", and "rpcs" methods.
+  """
+  return _Channel(fore_link, copy_payloads)
@@ -0,0 +1,175 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Tests of the in-process links joining stubs to servers."""
+
+import threading
+import unittest
+
+from grpc.early_adopter import _assembly_utilities
+from grpc.early_adopter import _in_process
+from grpc.early_adopter import _reexport
+from grpc.early_adopter import exceptions
+from grpc.early_adopter import interfaces
+from grpc.early_adopter import utilities
+from grpc.framework.assembly import implementations as assembly_implementations
+
+_APPEND = 'test/Append'
+_HANG = 'test/Hang'
+_SPLIT = 'test/Split'
+_TIMEOUT = 2
+_LONG_TIMEOUT = 5
+
+
+def _unserializable(unused_value):
+  raise AssertionError('Serialization attempted!')
+
+
+class _Servicer(object):
+
+  def __init__(self):
+    self.lock = threading.Lock()
+    self.requests = []
+    self.hanging = threading.Event()
+    self.aborted = threading.Event()
+    self.abortions = []
+
+  def append(self, request, unused_context):
+    with self.lock:
+      self.requests.append(request)
+    request.append(len(request))
+    return request
+
+  def _abort(self, abortion):
+    with self.lock:
+      self.abortions.append(abortion)
+    self.aborted.set()
+
+  def hang(self, request, context):
+    context.add_abortion_callback(self._abort)
+    self.hanging.set()
+    self.aborted.wait(_LONG_TIMEOUT)
+    return request
+
+  def split(self, request, unused_context):
+    with self.lock:
+      self.requests.append(request)
+    for element in request:
+      yield [element]
+
+
+class InProcessTest(unittest.TestCase):
+
+  def setUp(self):
+    self.servicer = _Servicer()
+    service_breakdown = _assembly_utilities.break_down_service({
+        _APPEND: utilities.unary_unary_service_description(
+            self.servicer.append, _unserializable, _unserializable),
+        _HANG: utilities.unary_unary_service_description(
+            self.servicer.hang, _unserializable, _unserializable),
+        _SPLIT: utilities.unary_stream_service_description(
+            self.servicer.split, _unserializable, _unserializable),
+    })
+    self.invocation_breakdown = _assembly_utilities.break_down_invocation({
+        _APPEND: utilities.unary_unary_invocation_description(
+            _unserializable, _unserializable),
+        _HANG: utilities.unary_unary_invocation_description(
+            _unserializable, _unserializable),
+        _SPLIT: utilities.unary_stream_invocation_description(
+            _unserializable, _unserializable),
+    })
+    self.fore_link = _in_process.ForeLink(None)
+    self.server = assembly_implementations.assemble_service(
+        service_breakdown.implementations, self.fore_link)
+
+  def _stub(self, copy_payloads):
+    rear_link = _in_process.activated_rear_link(self.fore_link, copy_payloads)
+    assembly_stub = assembly_implementations.assemble_dynamic_inline_stub(
+        self.invocation_breakdown.implementations, rear_link)
+    return _reexport.stub(
+        assembly_stub, self.invocation_breakdown.cardinalities, rear_link)
+
+  def testRequestsAndResponsesPassedByReference(self):
+    request = [3, 4]
+    with self.server, self._stub(False) as stub:
+      self.assertTrue(stub.connect(_TIMEOUT) < _TIMEOUT)
+      response = stub.Append(request, _TIMEOUT)
+      responses = list(stub.Split(request, _TIMEOUT))
+
+    self.assertIs(request, response)
+    self.assertEqual([3, 4, 2], response)
+    self.assertEqual([[3], [4], [2]], responses)
+    self.assertEqual([request, request], self.servicer.requests)
+    self.assertIs(request, self.servicer.requests[0])
+
+  def testRequestsAndResponsesCopied(self):
+    request = [3, 4]
+    with self.server, self._stub(True) as stub:
+      response = stub.Append(request, _TIMEOUT)
+
+    self.assertEqual([3, 4], request)
+    self.assertEqual([3, 4, 2], response)
+    self.assertIsNot(self.servicer.requests[0], response)
+    self.assertEqual([3, 4, 2], self.servicer.requests[0])
+
+  def testManyStubs(self):
+    with self.server, self._stub(False) as first_stub, self._stub(
+        False) as second_stub:
+      first_response = first_stub.Append([0], _TIMEOUT)
+      second_response = second_stub.Append([0, 0], _TIMEOUT)
+      first_responses = list(first_stub.Split([5, 6, 7], _TIMEOUT))
+
+    self.assertEqual([0, 1], first_response)
+    self.assertEqual([0, 0, 2], second_response)
+    self.assertEqual([[5], [6], [7]], first_responses)
+
+  def testServerNotServing(self):
+    with self._stub(False) as stub:
+      with self.assertRaises(exceptions.RpcError):
+        stub.connect(_TIMEOUT)
+      with self.assertRaises(exceptions.RpcError):
+        stub.Append([], _TIMEOUT)
+
+  def testStopCancelsOperationsAtServer(self):
+    with self.server:
+      with self._stub(False) as stub:
+        stub.Hang.async([], _LONG_TIMEOUT)
+        self.assertTrue(self.servicer.hanging.wait(_TIMEOUT))
+      self.assertTrue(self.servicer.aborted.wait(_TIMEOUT))
+
+    self.assertEqual([interfaces.Abortion.CANCELLED], self.servicer.abortions)
+
+  def testStopBeforeStart(self):
+    rear_link = _in_process.activated_rear_link(self.fore_link, False)
+
+    rear_link.stop()
+
+
+if __name__ == '__main__':
+  unittest.main()
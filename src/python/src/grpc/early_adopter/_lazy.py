@@ -0,0 +1,159 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Messages deserialized only when first looked at.
+
+A LazyMessage holds the bytestring of a message as it was taken off the wire
+and calls the message's deserializer only when one of the message's attributes
+is first accessed. The deserializer also identifies the message's type: until
+the message is changed through the LazyMessage, the bytestring is sent again
+as-is whenever the LazyMessage is serialized by a serializer made for the type
+with that deserializer, so a message that is merely inspected (or not looked
+at at all) and then forwarded is never serialized anew.
+"""
+
+# The attribute names of LazyMessage itself, which are never forwarded.
+_OWN_ATTRIBUTES = frozenset(
+    ('_serialized', '_deserializer', '_message', '_pristine'))
+
+
+class LazyMessage(object):
+  """A message deserialized on first attribute access.
+
+  Attribute reads, attribute assignments, string conversion and equality tests
+  with the LazyMessage as left operand are all passed to the deserialized
+  message. Assigning an attribute through a LazyMessage, or obtaining the
+  deserialized message with contents, marks the message as changed and so as
+  needing to be serialized anew; changes made through the values of the
+  message's attributes (such as appending to one of its repeated fields) are
+  not noticed and must not be made.
+  """
+  __slots__ = ('_serialized', '_deserializer', '_message', '_pristine')
+
+  def __init__(self, serialized, deserializer):
+    """Constructor.
+
+    Args:
+      serialized: The bytestring of the message.
+      deserializer: The behavior with which to deserialize the bytestring.
+    """
+    object.__setattr__(self, '_serialized', serialized)
+    object.__setattr__(self, '_deserializer', deserializer)
+    object.__setattr__(self, '_message', None)
+    object.__setattr__(self, '_pristine', True)
+
+  def _decoded(self):
+    message = self._message
+    if message is None:
+      message = self._deserializer(self._serialized)
+      object.__setattr__(self, '_message', message)
+    return message
+
+  def __getattr__(self, name):
+    return getattr(self._decoded(), name)
+
+  def __setattr__(self, name, value):
+    if name in _OWN_ATTRIBUTES:
+      object.__setattr__(self, name, value)
+    else:
+      setattr(self._decoded(), name, value)
+      object.__setattr__(self, '_pristine', False)
+
+  def __eq__(self, other):
+    if isinstance(other, LazyMessage):
+      other = other._decoded()  # pylint: disable=protected-access
+    return self._decoded() == other
+
+  def __ne__(self, other):
+    return not self == other
+
+  def __str__(self):
+    return str(self._decoded())
+
+  def __repr__(self):
+    return repr(self._decoded())
+
+
+def contents(value):
+  """Gives the message underlying a possibly-lazy message.
+
+  Args:
+    value: A LazyMessage or any other message.
+
+  Returns:
+    The deserialized message of the given LazyMessage, which from then on is
+      considered changed and is serialized anew, or the given value if it is
+      not a LazyMessage.
+  """
+  if isinstance(value, LazyMessage):
+    object.__setattr__(value, '_pristine', False)
+    return value._decoded()  # pylint: disable=protected-access
+  else:
+    return value
+
+
+def deserializer(behavior):
+  """Creates a deserializer that defers to another until first access.
+
+  Args:
+    behavior: A callable that when called on a bytestring returns the message
+      corresponding to that bytestring.
+
+  Returns:
+    A callable that when called on a bytestring returns a LazyMessage that will
+      deserialize the bytestring with the given behavior when first accessed.
+  """
+  return lambda serialized: LazyMessage(serialized, behavior)
+
+
+def serializer(behavior, deserializer):
+  """Creates a serializer that reuses the bytestrings of unchanged messages.
+
+  Args:
+    behavior: A callable that when called on a message returns the bytestring
+      corresponding to that message.
+    deserializer: The deserializer of the type of message serialized by the
+      given behavior. The original bytestrings of LazyMessages made with it
+      are sent in place of serialization with the given behavior.
+
+  Returns:
+    A callable that when called on an unchanged LazyMessage made with the given
+      deserializer returns the LazyMessage's original bytestring, and when
+      called on any other value (including a changed LazyMessage or one made
+      with some other deserializer) serializes the value's contents with the
+      given behavior.
+  """
+  def serialize(value):
+    # pylint: disable=protected-access
+    if (isinstance(value, LazyMessage) and value._pristine and
+        value._deserializer is deserializer):
+      return value._serialized
+    else:
+      return behavior(contents(value))
+  return serialize
@@ -0,0 +1,160 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Tests of lazily-deserialized messages."""
+
+import unittest
+
+from grpc._junkdrawer import math_pb2
+from grpc.early_adopter import _lazy
+from grpc.early_adopter import utilities
+
+
+class _CountingBehavior(object):
+
+  def __init__(self, behavior):
+    self._behavior = behavior
+    self.calls = 0
+
+  def __call__(self, value):
+    self.calls += 1
+    return self._behavior(value)
+
+
+class LazyMessageTest(unittest.TestCase):
+
+  def setUp(self):
+    self.serialized = math_pb2.DivArgs(
+        dividend=973, divisor=59).SerializeToString()
+    self.deserializer = _CountingBehavior(math_pb2.DivArgs.FromString)
+    self.serializer = _CountingBehavior(math_pb2.DivArgs.SerializeToString)
+    self.lazy_deserializer = _lazy.deserializer(self.deserializer)
+    self.lazy_serializer = _lazy.serializer(self.serializer, self.deserializer)
+
+  def testDeserializedOnFirstAccess(self):
+    message = self.lazy_deserializer(self.serialized)
+    self.assertEqual(0, self.deserializer.calls)
+
+    self.assertEqual(973, message.dividend)
+    self.assertEqual(59, message.divisor)
+    self.assertEqual(1, self.deserializer.calls)
+
+  def testUnchangedMessageSentAsOriginalBytes(self):
+    untouched = self.lazy_deserializer(self.serialized)
+    inspected = self.lazy_deserializer(self.serialized)
+    self.assertEqual(59, inspected.divisor)
+
+    self.assertIs(self.serialized, self.lazy_serializer(untouched))
+    self.assertIs(self.serialized, self.lazy_serializer(inspected))
+    self.assertEqual(0, self.serializer.calls)
+
+  def testChangedMessageSerializedAnew(self):
+    assigned = self.lazy_deserializer(self.serialized)
+    assigned.divisor = 7
+    extracted = self.lazy_deserializer(self.serialized)
+    utilities.decoded(extracted).divisor = 11
+
+    self.assertEqual(
+        math_pb2.DivArgs(dividend=973, divisor=7),
+        math_pb2.DivArgs.FromString(self.lazy_serializer(assigned)))
+    self.assertEqual(
+        math_pb2.DivArgs(dividend=973, divisor=11),
+        math_pb2.DivArgs.FromString(self.lazy_serializer(extracted)))
+    self.assertEqual(2, self.serializer.calls)
+
+  def testMessageOfOtherDeserializerSerializedAnew(self):
+    other = _lazy.deserializer(math_pb2.DivArgs.FromString)(self.serialized)
+
+    self.assertEqual(self.serialized, self.lazy_serializer(other))
+    self.assertEqual(1, self.serializer.calls)
+
+  def testReceivedRequestForwardedAsOriginalBytes(self):
+    service_description = utilities.unary_unary_service_description(
+        None, math_pb2.DivArgs.FromString, math_pb2.DivReply.SerializeToString,
+        lazy=True)
+    invocation_description = utilities.unary_unary_invocation_description(
+        self.serializer, math_pb2.DivReply.FromString, lazy=True,
+        request_deserializer=math_pb2.DivArgs.FromString)
+
+    request = service_description.deserialize_request(self.serialized)
+
+    self.assertIs(
+        self.serialized, invocation_description.serialize_request(request))
+    self.assertEqual(0, self.serializer.calls)
+
+  def testReceivedResponseReusedOnlyAsRequestOfItsType(self):
+    invocation_description = utilities.unary_unary_invocation_description(
+        self.serializer, math_pb2.DivArgs.FromString, lazy=True,
+        request_deserializer=_CountingBehavior(math_pb2.DivArgs.FromString))
+
+    response = invocation_description.deserialize_response(self.serialized)
+
+    self.assertEqual(
+        self.serialized, invocation_description.serialize_request(response))
+    self.assertEqual(1, self.serializer.calls)
+
+  def testMessageOfOtherClassRefused(self):
+    serialized_reply = math_pb2.DivReply(
+        quotient=16, remainder=29).SerializeToString()
+    reply = _lazy.deserializer(math_pb2.DivReply.FromString)(serialized_reply)
+
+    with self.assertRaises(TypeError):
+      self.lazy_serializer(reply)
+
+  def testComparison(self):
+    message = self.lazy_deserializer(self.serialized)
+
+    self.assertTrue(message == math_pb2.DivArgs(dividend=973, divisor=59))
+    self.assertTrue(message == self.lazy_deserializer(self.serialized))
+    self.assertTrue(message != math_pb2.DivArgs(dividend=973, divisor=7))
+
+  def testDecodedPassesOtherValues(self):
+    message = math_pb2.DivArgs(dividend=973, divisor=59)
+
+    self.assertIs(message, utilities.decoded(message))
+
+  def testLazyServiceDescription(self):
+    description = utilities.unary_unary_service_description(
+        lambda request, unused_context: request, math_pb2.DivArgs.FromString,
+        math_pb2.DivArgs.SerializeToString, lazy=True,
+        response_deserializer=math_pb2.DivArgs.FromString)
+
+    request = description.deserialize_request(self.serialized)
+    response = description.service_unary_unary(request, None)
+    other_response = math_pb2.DivArgs(dividend=1, divisor=1)
+
+    self.assertIsInstance(request, _lazy.LazyMessage)
+    self.assertIs(self.serialized, description.serialize_response(response))
+    self.assertEqual(
+        other_response.SerializeToString(),
+        description.serialize_response(other_response))
+
+
+if __name__ == '__main__':
+  unittest.main()
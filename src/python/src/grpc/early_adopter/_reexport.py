@@ -27,6 +27,9 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import collections
+import time
+
 from grpc.framework.face import exceptions as face_exceptions
 from grpc.framework.face import interfaces as face_interfaces
 from grpc.framework.foundation import future
@@ -45,6 +48,44 @@ _ABORTION_REEXPORT = {
 }
 
 
+class _MethodStats(
+    interfaces.MethodStats,
+    collections.namedtuple(
+        '_MethodStats',
+        ('in_flight', 'commenced', 'latency', 'queue_wait', 'servicer_time',
+         'payloads_ingested', 'payloads_emitted', 'bytes_received',
+         'bytes_sent'))):
+  """A trivial implementation of interfaces.MethodStats."""
+
+
+class _RpcSnapshot(
+    interfaces.RpcSnapshot,
+    collections.namedtuple(
+        '_RpcSnapshot',
+        ('method', 'age', 'time_remaining', 'payloads_received',
+         'payloads_emitted', 'ingestion_backlog', 'ingesting',
+         'transmission_backlog', 'transmitting', 'pending_writes',
+         'writing'))):
+  """A trivial implementation of interfaces.RpcSnapshot."""
+
+
+class _Interceptor(face_interfaces.Interceptor):
+
+  def __init__(self, interceptor):
+    self._interceptor = interceptor
+
+  def intercepts(self, name):
+    return self._interceptor.intercepts(name)
+
+  def before(self, name):
+    return self._interceptor.before(name)
+
+  def after(self, name, memo, duration, abortion):
+    self._interceptor.after(
+        name, memo, duration,
+        None if abortion is None else _ABORTION_REEXPORT[abortion])
+
+
 class _RpcError(exceptions.RpcError):
   pass
 
@@ -168,9 +209,10 @@ class _StreamUnarySyncAsync(interfaces.StreamUnarySyncAsync):
 
 class _Stub(interfaces.Stub):
 
-  def __init__(self, assembly_stub, cardinalities):
+  def __init__(self, assembly_stub, cardinalities, rear_link):
     self._assembly_stub = assembly_stub
     self._cardinalities = cardinalities
+    self._rear_link = rear_link
 
   def __enter__(self):
     self._assembly_stub.__enter__()
@@ -180,8 +222,35 @@ class _Stub(interfaces.Stub):
     self._assembly_stub.__exit__(exc_type, exc_val, exc_tb)
     return False
 
-  def __getattr__(self, attr):
-    underlying_attr = self._assembly_stub.__getattr__(attr)
+  def connect(self, timeout, warm_up_requests=None):
+    start_time = time.time()
+    deadline = start_time + timeout
+    if not self._rear_link.connect(timeout):
+      raise _RpcError()
+    if warm_up_requests is not None:
+      for name, request in warm_up_requests.iteritems():
+        behavior = self.__getattr__(name)
+        time_remaining = max(0, deadline - time.time())
+        cardinality = self._cardinality(name)
+        if cardinality is interfaces.Cardinality.UNARY_UNARY:
+          behavior(request, time_remaining)
+        elif cardinality is interfaces.Cardinality.UNARY_STREAM:
+          list(behavior(request, time_remaining))
+        elif cardinality is interfaces.Cardinality.STREAM_UNARY:
+          behavior(iter((request,)), time_remaining)
+        elif cardinality is interfaces.Cardinality.STREAM_STREAM:
+          list(behavior(iter((request,)), time_remaining))
+    return time.time() - start_time
+
+  def method_stats(self):
+    return method_stats(
+        self._assembly_stub.method_stats(), self._rear_link.byte_counts())
+
+  def in_flight_rpcs(self):
+    return rpc_snapshots(
+        self._assembly_stub.operations(), self._rear_link.rpcs())
+
+  def _cardinality(self, attr):
     cardinality = self._cardinalities.get(attr)
     # TODO(nathaniel): unify this trick with its other occurrence in the code.
     if cardinality is None:
@@ -191,6 +260,11 @@ class _Stub(interfaces.Stub):
           break
       else:
         raise AttributeError(attr)
+    return cardinality
+
+  def __getattr__(self, attr):
+    underlying_attr = self._assembly_stub.__getattr__(attr)
+    cardinality = self._cardinality(attr)
     if cardinality is interfaces.Cardinality.UNARY_UNARY:
       return _UnaryUnarySyncAsync(underlying_attr)
     elif cardinality is interfaces.Cardinality.UNARY_STREAM:
@@ -204,9 +278,75 @@ class _Stub(interfaces.Stub):
     else:
       raise AttributeError(attr)
 
+def method_stats(base_method_statistics, byte_counts):
+  """Combines End statistics and link byte counts into MethodStats.
+
+  Args:
+    base_method_statistics: A dictionary from RPC method name to
+      base_interfaces.MethodStatistics.
+    byte_counts: A dictionary from RPC method name to an object with "received"
+      and "sent" attributes.
+
+  Returns:
+    A dictionary from RPC method name to interfaces.MethodStats.
+  """
+  stats = {}
+  for name, statistics in base_method_statistics.iteritems():
+    counts = byte_counts.get(name)
+    stats[name] = _MethodStats(
+        statistics.in_flight, statistics.commenced, statistics.latency,
+        statistics.queue_wait, statistics.servicer_time,
+        statistics.payloads_ingested, statistics.payloads_emitted,
+        0 if counts is None else counts.received,
+        0 if counts is None else counts.sent)
+  return stats
+
+
+def rpc_snapshots(operation_snapshots, link_rpcs):
+  """Combines End operation snapshots and link RPC snapshots into RpcSnapshots.
+
+  Args:
+    operation_snapshots: A sequence of base_interfaces.OperationSnapshots.
+    link_rpcs: A dictionary from operation ID to an object with
+      "pending_writes" and "writing" attributes.
+
+  Returns:
+    A sequence of interfaces.RpcSnapshots in the order of the given operation
+      snapshots.
+  """
+  snapshots = []
+  for operation_snapshot in operation_snapshots:
+    link_rpc = link_rpcs.get(operation_snapshot.operation_id)
+    snapshots.append(_RpcSnapshot(
+        operation_snapshot.name, operation_snapshot.age,
+        operation_snapshot.time_remaining, operation_snapshot.payloads_received,
+        operation_snapshot.payloads_emitted,
+        operation_snapshot.ingestion_backlog, operation_snapshot.ingesting,
+        operation_snapshot.transmission_backlog,
+        operation_snapshot.transmitting,
+        0 if link_rpc is None else link_rpc.pending_writes,
+        False if link_rpc is None else link_rpc.writing))
+  return snapshots
+
+
+def face_interceptors(interceptors):
+  """Adapts interfaces.Interceptors to face_interfaces.Interceptors.
+
+  Args:
+    interceptors: A sequence of interfaces.Interceptors, or None.
+
+  Returns:
+    A tuple of face_interfaces.Interceptors, or None if interceptors is None.
+  """
+  if interceptors is None:
+    return None
+  else:
+    return tuple(_Interceptor(interceptor) for interceptor in interceptors)
+
+
 def rpc_context(face_rpc_context):
   return _RpcContext(face_rpc_context)
 
 
-def stub(assembly_stub, cardinalities):
-  return _Stub(assembly_stub, cardinalities)
+def stub(assembly_stub, cardinalities, rear_link):
+  return _Stub(assembly_stub, cardinalities, rear_link)
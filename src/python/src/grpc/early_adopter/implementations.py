@@ -34,34 +34,46 @@ import threading
 from grpc._adapter import fore as _fore
 from grpc._adapter import rear as _rear
 from grpc.early_adopter import _assembly_utilities
+from grpc.early_adopter import _in_process
 from grpc.early_adopter import _reexport
 from grpc.early_adopter import interfaces
 from grpc.framework.assembly import implementations as _assembly_implementations
+from grpc.framework.foundation import profiling
 
 
 class _Server(interfaces.Server):
 
-  def __init__(self, breakdown, port, private_key, certificate_chain):
+  def __init__(
+      self, breakdown, executors, port, private_key, certificate_chain,
+      maximum_concurrent_rpcs, maximum_queueing_delay, interceptors, tracer):
     self._lock = threading.Lock()
     self._breakdown = breakdown
-    self._port = port
+    self._executors = executors
+    self._interceptors = interceptors
+    self._tracer = tracer
     if private_key is None or certificate_chain is None:
-      self._key_chain_pairs = ()
+      key_chain_pairs = ()
     else:
-      self._key_chain_pairs = ((private_key, certificate_chain),)
-
-    self._fore_link = None
+      key_chain_pairs = ((private_key, certificate_chain),)
+
+    self._fore_link = _in_process.ForeLink(_fore.activated_fore_link(
+        port, breakdown.request_deserializers, breakdown.response_serializers,
+        None, key_chain_pairs, maximum_concurrent_rpcs=maximum_concurrent_rpcs,
+        maximum_queueing_delay=maximum_queueing_delay, tracer=tracer))
+    if maximum_queueing_delay is None:
+      self._queue_wait_observer = None
+    else:
+      self._queue_wait_observer = self._fore_link.observe_queueing_delay
     self._server = None
 
   def _start(self):
     with self._lock:
       if self._server is None:
-        self._fore_link = _fore.activated_fore_link(
-            self._port, self._breakdown.request_deserializers,
-            self._breakdown.response_serializers, None, self._key_chain_pairs)
-
         self._server = _assembly_implementations.assemble_service(
-            self._breakdown.implementations, self._fore_link)
+            self._breakdown.implementations, self._fore_link,
+            executors=self._executors, interceptors=self._interceptors,
+            queue_wait_observer=self._queue_wait_observer, tracer=self._tracer,
+            profiling_scope=self)
         self._server.start()
       else:
         raise ValueError('Server currently running!')
@@ -73,7 +85,6 @@ class _Server(interfaces.Server):
       else:
         self._server.stop()
         self._server = None
-        self._fore_link = None
 
   def __enter__(self):
     self._start()
@@ -93,26 +104,82 @@ class _Server(interfaces.Server):
     with self._lock:
       return self._fore_link.port()
 
-def _build_stub(breakdown, activated_rear_link):
+  def _in_process_fore_link(self):
+    """Gives the ForeLink through which in-process stubs reach this server."""
+    return self._fore_link
+
+  def _started_server(self):
+    if self._server is None:
+      raise ValueError('Server not running!')
+    return self._server
+
+  def method_stats(self):
+    with self._lock:
+      return _reexport.method_stats(
+          self._started_server().method_stats(),
+          self._fore_link.byte_counts())
+
+  def in_flight_rpcs(self):
+    with self._lock:
+      return _reexport.rpc_snapshots(
+          self._started_server().operations(), self._fore_link.rpcs())
+
+  def saturation(self):
+    with self._lock:
+      return self._started_server().saturation()
+
+  def profile(self, duration, path=None):
+    with self._lock:
+      self._started_server()
+    samples = profiling.profile(duration)
+    method_samples = {
+        activity[1]: stacks for activity, stacks in samples.iteritems()
+        if isinstance(activity, tuple) and activity[0] is self}
+    if path is not None:
+      profiling.write_folded(method_samples, path)
+    return method_samples
+
+def _build_stub(breakdown, activated_rear_link, linger, interceptors, tracer):
   assembly_stub = _assembly_implementations.assemble_dynamic_inline_stub(
-      breakdown.implementations, activated_rear_link)
-  return _reexport.stub(assembly_stub, breakdown.cardinalities)
+      breakdown.implementations, activated_rear_link, linger,
+      interceptors=_reexport.face_interceptors(interceptors), tracer=tracer)
+  return _reexport.stub(
+      assembly_stub, breakdown.cardinalities, activated_rear_link)
 
 
-def _build_server(methods, port, private_key, certificate_chain):
+def _build_server(
+    methods, port, private_key, certificate_chain, maximum_concurrent_rpcs,
+    maximum_queueing_delay, executors, interceptors, tracer):
   breakdown = _assembly_utilities.break_down_service(methods)
-  return _Server(breakdown, port, private_key, certificate_chain)
+  assembly_executors = _assembly_utilities.break_down_executors(
+      {} if executors is None else executors, methods)
+  return _Server(
+      breakdown, assembly_executors, port, private_key, certificate_chain,
+      maximum_concurrent_rpcs, maximum_queueing_delay,
+      _reexport.face_interceptors(interceptors), tracer)
 
 
-def insecure_stub(methods, host, port):
+def insecure_stub(
+    methods, host, port, linger=0, interceptors=None, tracer=None):
   """Constructs an insecure interfaces.Stub.
 
   Args:
     methods: A dictionary from RPC method name to
       interfaces.RpcMethodInvocationDescription describing the RPCs to be
       supported by the created stub.
-    host: The host to which to connect for RPC service.
-    port: The port to which to connect for RPC service.
+    host: The host to which to connect for RPC service, or a "unix:<path>"
+      address naming a Unix domain socket to which to connect.
+    port: The port to which to connect for RPC service, ignored if host is a
+      "unix:<path>" address.
+    linger: A length of time in seconds for which to keep the stub's channel
+      connected and its threads alive after the stub's last exit from context,
+      so that a prompt reentry into context may reuse them. If zero, they are
+      released immediately upon the stub's last exit from context.
+    interceptors: A sequence of interfaces.Interceptors with which to intercept
+      the RPCs invoked through the stub, or None.
+    tracer: A grpc.framework.foundation.tracing.Tracer with which to sample
+      the RPCs invoked through the stub and record the timing of their stages,
+      or None.
 
   Returns:
     An interfaces.Stub affording RPC invocation.
@@ -120,26 +187,39 @@ def insecure_stub(methods, host, port):
   breakdown = _assembly_utilities.break_down_invocation(methods)
   activated_rear_link = _rear.activated_rear_link(
       host, port, breakdown.request_serializers,
-      breakdown.response_deserializers)
-  return _build_stub(breakdown, activated_rear_link)
+      breakdown.response_deserializers, tracer=tracer)
+  return _build_stub(
+      breakdown, activated_rear_link, linger, interceptors, tracer)
 
 
 def secure_stub(
-    methods, host, port, root_certificates, private_key, certificate_chain):
+    methods, host, port, root_certificates, private_key, certificate_chain,
+    linger=0, interceptors=None, tracer=None):
   """Constructs an insecure interfaces.Stub.
 
   Args:
     methods: A dictionary from RPC method name to
       interfaces.RpcMethodInvocationDescription describing the RPCs to be
       supported by the created stub.
-    host: The host to which to connect for RPC service.
-    port: The port to which to connect for RPC service.
+    host: The host to which to connect for RPC service, or a "unix:<path>"
+      address naming a Unix domain socket to which to connect.
+    port: The port to which to connect for RPC service, ignored if host is a
+      "unix:<path>" address.
     root_certificates: The PEM-encoded root certificates or None to ask for
       them to be retrieved from a default location.
     private_key: The PEM-encoded private key to use or None if no private key
       should be used.
     certificate_chain: The PEM-encoded certificate chain to use or None if no
       certificate chain should be used.
+    linger: A length of time in seconds for which to keep the stub's channel
+      connected and its threads alive after the stub's last exit from context,
+      so that a prompt reentry into context may reuse them. If zero, they are
+      released immediately upon the stub's last exit from context.
+    interceptors: A sequence of interfaces.Interceptors with which to intercept
+      the RPCs invoked through the stub, or None.
+    tracer: A grpc.framework.foundation.tracing.Tracer with which to sample
+      the RPCs invoked through the stub and record the timing of their stages,
+      or None.
 
   Returns:
     An interfaces.Stub affording RPC invocation.
@@ -148,40 +228,130 @@ def secure_stub(
   activated_rear_link = _rear.secure_activated_rear_link(
       host, port, breakdown.request_serializers,
       breakdown.response_deserializers, root_certificates, private_key,
-      certificate_chain)
-  return _build_stub(breakdown, activated_rear_link)
+      certificate_chain, tracer=tracer)
+  return _build_stub(
+      breakdown, activated_rear_link, linger, interceptors, tracer)
+
+
+def in_process_stub(
+    methods, server, linger=0, interceptors=None, copy_messages=False,
+    tracer=None):
+  """Constructs an interfaces.Stub bound directly to a server in this process.
+
+  RPCs invoked through the returned stub are exchanged with the server without
+  sockets and without serialization: request and response objects are passed
+  between stub and server by reference, or copied if copy_messages is True.
+  The server need not be started when the stub is constructed but must be
+  serving for RPCs to be invoked. Such RPCs bypass the server's admission
+  control: they are neither counted against its maximum_concurrent_rpcs nor
+  refused when its maximum_queueing_delay is exceeded.
+
+  Args:
+    methods: A dictionary from RPC method name to
+      interfaces.RpcMethodInvocationDescription describing the RPCs to be
+      supported by the created stub.
+    server: An interfaces.Server created by insecure_server or secure_server.
+    linger: A length of time in seconds for which to keep the stub's threads
+      alive after the stub's last exit from context, so that a prompt reentry
+      into context may reuse them. If zero, they are released immediately upon
+      the stub's last exit from context.
+    interceptors: A sequence of interfaces.Interceptors with which to intercept
+      the RPCs invoked through the stub, or None.
+    copy_messages: Whether or not to pass copies of request and response
+      objects between stub and server. If False, neither side may mutate an
+      object after having passed it to the other.
+    tracer: A grpc.framework.foundation.tracing.Tracer with which to sample
+      the RPCs invoked through the stub and record the timing of their stages,
+      or None.
+
+  Returns:
+    An interfaces.Stub affording RPC invocation.
+  """
+  breakdown = _assembly_utilities.break_down_invocation(methods)
+  # pylint: disable=protected-access
+  activated_rear_link = _in_process.activated_rear_link(
+      server._in_process_fore_link(), copy_messages)
+  return _build_stub(
+      breakdown, activated_rear_link, linger, interceptors, tracer)
 
 
-def insecure_server(methods, port):
+def insecure_server(
+    methods, port, maximum_concurrent_rpcs=None, maximum_queueing_delay=None,
+    executors=None, interceptors=None, tracer=None):
   """Constructs an insecure interfaces.Server.
 
   Args:
     methods: A dictionary from RPC method name to
       interfaces.RpcMethodServiceDescription describing the RPCs to
       be serviced by the created server.
-    port: The desired port on which to serve or zero to ask for a port to
-      be automatically selected.
+    port: The desired port on which to serve, zero to ask for a port to
+      be automatically selected, or a "unix:<path>" address naming a Unix
+      domain socket on which to serve.
+    maximum_concurrent_rpcs: The largest number of RPCs to service at once,
+      with RPCs arriving in excess of this number being refused, or None for
+      no limit. Only RPCs arriving over the network are counted and refused;
+      those of in-process stubs are always admitted.
+    maximum_queueing_delay: A length of time in seconds, or None for no limit.
+      Once work servicing RPCs has waited longer than this for a thread for a
+      sustained interval, newly-arriving network RPCs are refused until waits
+      shorten.
+    executors: A dictionary from executor name to
+      interfaces.ExecutorDescription describing bounded executors in which to
+      service some of the RPC methods, or None. RPC methods not described by
+      any executor share a common pool of threads. A ValueError is raised if
+      an executor names a method not among the given methods.
+    interceptors: A sequence of interfaces.Interceptors with which to intercept
+      the RPCs serviced by the server, or None.
+    tracer: A grpc.framework.foundation.tracing.Tracer with which to sample
+      the RPCs serviced by the server and record the timing of their stages,
+      or None.
 
   Returns:
     An interfaces.Server that will run with no security and
       service unsecured raw requests.
   """
-  return _build_server(methods, port, None, None)
+  return _build_server(
+      methods, port, None, None, maximum_concurrent_rpcs,
+      maximum_queueing_delay, executors, interceptors, tracer)
 
 
-def secure_server(methods, port, private_key, certificate_chain):
+def secure_server(
+    methods, port, private_key, certificate_chain, maximum_concurrent_rpcs=None,
+    maximum_queueing_delay=None, executors=None, interceptors=None,
+    tracer=None):
   """Constructs a secure interfaces.Server.
 
   Args:
     methods: A dictionary from RPC method name to
       interfaces.RpcMethodServiceDescription describing the RPCs to
       be serviced by the created server.
-    port: The port on which to serve or zero to ask for a port to be
-      automatically selected.
+    port: The port on which to serve, zero to ask for a port to be
+      automatically selected, or a "unix:<path>" address naming a Unix domain
+      socket on which to serve.
     private_key: A pem-encoded private key.
     certificate_chain: A pem-encoded certificate chain.
+    maximum_concurrent_rpcs: The largest number of RPCs to service at once,
+      with RPCs arriving in excess of this number being refused, or None for
+      no limit. Only RPCs arriving over the network are counted and refused;
+      those of in-process stubs are always admitted.
+    maximum_queueing_delay: A length of time in seconds, or None for no limit.
+      Once work servicing RPCs has waited longer than this for a thread for a
+      sustained interval, newly-arriving network RPCs are refused until waits
+      shorten.
+    executors: A dictionary from executor name to
+      interfaces.ExecutorDescription describing bounded executors in which to
+      service some of the RPC methods, or None. RPC methods not described by
+      any executor share a common pool of threads. A ValueError is raised if
+      an executor names a method not among the given methods.
+    interceptors: A sequence of interfaces.Interceptors with which to intercept
+      the RPCs serviced by the server, or None.
+    tracer: A grpc.framework.foundation.tracing.Tracer with which to sample
+      the RPCs serviced by the server and record the timing of their stages,
+      or None.
 
   Returns:
     An interfaces.Server that will serve secure traffic.
   """
-  return _build_server(methods, port, private_key, certificate_chain)
+  return _build_server(
+      methods, port, private_key, certificate_chain, maximum_concurrent_rpcs,
+      maximum_queueing_delay, executors, interceptors, tracer)
@@ -31,17 +31,36 @@
 
 """Test of the GRPC-backed ForeLink and RearLink."""
 
+import threading
+import time
 import unittest
 
 from grpc.early_adopter import implementations
+from grpc.early_adopter import interfaces
 from grpc.early_adopter import utilities
 from grpc._junkdrawer import math_pb2
+from grpc.framework.foundation import tracing
 
 DIV = 'Div'
 DIV_MANY = 'DivMany'
+ECHO = 'Echo'
 FIB = 'Fib'
 SUM = 'Sum'
 
+
+class _CountingBehavior(object):
+
+  def __init__(self, behavior):
+    self._lock = threading.Lock()
+    self._behavior = behavior
+    self.calls = 0
+
+  def __call__(self, value):
+    with self._lock:
+      self.calls += 1
+    return self._behavior(value)
+
+
 def _fibbonacci(limit):
   left, right = 0, 1
   for _ in xrange(limit):
@@ -55,6 +74,11 @@ def _div(request, unused_context):
       remainder=request.dividend % request.divisor)
 
 
+def _slow_div(request, context):
+  time.sleep(_SLOW_HANDLER_DURATION)
+  return _div(request, context)
+
+
 def _div_many(request_iterator, unused_context):
   for request in request_iterator:
     yield math_pb2.DivReply(
@@ -62,6 +86,11 @@ def _div_many(request_iterator, unused_context):
         remainder=request.dividend % request.divisor)
 
 
+def _echo(request_iterator, unused_context):
+  for request in request_iterator:
+    yield request
+
+
 def _fib(request, unused_context):
   for number in _fibbonacci(request.limit):
     yield math_pb2.Num(num=number)
@@ -79,6 +108,8 @@ _INVOCATION_DESCRIPTIONS = {
         math_pb2.DivArgs.SerializeToString, math_pb2.DivReply.FromString),
     DIV_MANY: utilities.stream_stream_invocation_description(
         math_pb2.DivArgs.SerializeToString, math_pb2.DivReply.FromString),
+    ECHO: utilities.raw_invocation_description(
+        interfaces.Cardinality.STREAM_STREAM),
     FIB: utilities.unary_stream_invocation_description(
         math_pb2.FibArgs.SerializeToString, math_pb2.Num.FromString),
     SUM: utilities.stream_unary_invocation_description(
@@ -92,6 +123,8 @@ _SERVICE_DESCRIPTIONS = {
     DIV_MANY: utilities.stream_stream_service_description(
         _div_many, math_pb2.DivArgs.FromString,
         math_pb2.DivReply.SerializeToString),
+    ECHO: utilities.raw_service_description(
+        interfaces.Cardinality.STREAM_STREAM, _echo, views=True),
     FIB: utilities.unary_stream_service_description(
         _fib, math_pb2.FibArgs.FromString, math_pb2.Num.SerializeToString),
     SUM: utilities.stream_unary_service_description(
@@ -99,6 +132,8 @@ _SERVICE_DESCRIPTIONS = {
 }
 
 _TIMEOUT = 3
+_SLOW_HANDLER_DURATION = 1
+_PROFILE_DURATION = 0.2
 
 
 class EarlyAdopterImplementationsTest(unittest.TestCase):
@@ -128,6 +163,36 @@ class EarlyAdopterImplementationsTest(unittest.TestCase):
       self.assertEqual(expected_quotient, response.quotient)
       self.assertEqual(expected_remainder, response.remainder)
 
+  def testInProcessUnaryUnary(self):
+    request = math_pb2.DivArgs(divisor=59, dividend=973)
+
+    with implementations.in_process_stub(
+        _INVOCATION_DESCRIPTIONS, self.server) as stub:
+      response = stub.Div(request, _TIMEOUT)
+      self.assertEqual(973 / 59, response.quotient)
+      self.assertEqual(973 % 59, response.remainder)
+      self.assertEqual(0, stub.method_stats()[DIV].bytes_sent)
+
+  def testRawUnaryUnary(self):
+    request = math_pb2.DivArgs(divisor=59, dividend=973)
+    raw_stub = implementations.insecure_stub(
+        {DIV: utilities.raw_invocation_description(
+            interfaces.Cardinality.UNARY_UNARY)},
+        'localhost', self.server.port())
+
+    with raw_stub:
+      response = raw_stub.Div(request.SerializeToString(), _TIMEOUT)
+      self.assertEqual(
+          math_pb2.DivReply(quotient=973 / 59, remainder=973 % 59),
+          math_pb2.DivReply.FromString(response))
+
+  def testRawStreamStream(self):
+    requests = tuple(b'\x00' * index for index in range(1, 8))
+
+    with self.stub:
+      responses = tuple(self.stub.Echo(iter(requests), _TIMEOUT))
+      self.assertTupleEqual(requests, responses)
+
   def testUnaryStream(self):
     stream_length = 43
 
@@ -172,5 +237,119 @@ class EarlyAdopterImplementationsTest(unittest.TestCase):
       self.assertEqual(stream_length, index + 1)
 
 
+class LazyForwardingTest(unittest.TestCase):
+
+  def testForwardedMessagesNotSerializedAnew(self):
+    request_serializer = _CountingBehavior(math_pb2.DivArgs.SerializeToString)
+    response_serializer = _CountingBehavior(
+        math_pb2.DivReply.SerializeToString)
+    backend = implementations.insecure_server(_SERVICE_DESCRIPTIONS, 0)
+
+    with backend:
+      forwarding_stub = implementations.insecure_stub(
+          {DIV: utilities.unary_unary_invocation_description(
+              request_serializer, math_pb2.DivReply.FromString, lazy=True,
+              request_deserializer=math_pb2.DivArgs.FromString)},
+          'localhost', backend.port())
+
+      def forward(request, unused_context):
+        return forwarding_stub.Div(request, _TIMEOUT)
+
+      forwarder = implementations.insecure_server(
+          {DIV: utilities.unary_unary_service_description(
+              forward, math_pb2.DivArgs.FromString, response_serializer,
+              lazy=True, response_deserializer=math_pb2.DivReply.FromString)},
+          0)
+      with forwarding_stub, forwarder:
+        stub = implementations.insecure_stub(
+            {DIV: _INVOCATION_DESCRIPTIONS[DIV]}, 'localhost',
+            forwarder.port())
+        with stub:
+          response = stub.Div(
+              math_pb2.DivArgs(divisor=59, dividend=973), _TIMEOUT)
+
+    self.assertEqual(973 / 59, response.quotient)
+    self.assertEqual(973 % 59, response.remainder)
+    self.assertEqual(0, request_serializer.calls)
+    self.assertEqual(0, response_serializer.calls)
+
+
+class TracingTest(unittest.TestCase):
+
+  def testSpansOfBothEndsShareTraceId(self):
+    server_tracer = tracing.tracer(1.0)
+    client_tracer = tracing.tracer(1.0)
+    server = implementations.insecure_server(
+        _SERVICE_DESCRIPTIONS, 0, tracer=server_tracer)
+
+    with server:
+      stub = implementations.insecure_stub(
+          _INVOCATION_DESCRIPTIONS, 'localhost', server.port(),
+          tracer=client_tracer)
+      with stub:
+        stub.Div(math_pb2.DivArgs(divisor=59, dividend=973), _TIMEOUT)
+    client_spans = client_tracer.spans()
+    server_spans = server_tracer.spans()
+
+    client_trace_ids = set(span.trace_id for span in client_spans)
+    self.assertEqual(1, len(client_trace_ids))
+    self.assertEqual(
+        client_trace_ids, set(span.trace_id for span in server_spans))
+    client_stages = set(span.stage for span in client_spans)
+    server_stages = set(span.stage for span in server_spans)
+    self.assertIn(tracing.Stage.WRITE, client_stages)
+    self.assertIn(tracing.Stage.READ, server_stages)
+    self.assertIn(tracing.Stage.HANDLER, server_stages)
+
+
+class ProfileTest(unittest.TestCase):
+
+  def testProfileRequiresRunningServer(self):
+    server = implementations.insecure_server(_SERVICE_DESCRIPTIONS, 0)
+
+    with self.assertRaises(ValueError):
+      server.profile(_PROFILE_DURATION)
+
+  def testProfileSamplesOnlyItsOwnServer(self):
+    service_descriptions = {
+        DIV: utilities.unary_unary_service_description(
+            _slow_div, math_pb2.DivArgs.FromString,
+            math_pb2.DivReply.SerializeToString),
+    }
+    busy_server = implementations.insecure_server(service_descriptions, 0)
+    idle_server = implementations.insecure_server(service_descriptions, 0)
+
+    with busy_server, idle_server:
+      stub = implementations.insecure_stub(
+          {DIV: _INVOCATION_DESCRIPTIONS[DIV]}, 'localhost', busy_server.port())
+      with stub:
+        response_future = stub.Div.async(
+            math_pb2.DivArgs(divisor=59, dividend=973), _TIMEOUT)
+        idle_samples = idle_server.profile(_PROFILE_DURATION)
+        busy_samples = busy_server.profile(_PROFILE_DURATION)
+        response_future.result()
+
+    self.assertEqual({}, idle_samples)
+    self.assertIn(DIV, busy_samples)
+
+
+class ServerConstructionTest(unittest.TestCase):
+
+  def testExecutorNamingUnknownMethodRejected(self):
+    executors = {
+        'executor': utilities.executor_description(
+            (DIV, 'NoSuchMethod'), 1, 1)}
+
+    with self.assertRaises(ValueError):
+      implementations.insecure_server(
+          _SERVICE_DESCRIPTIONS, 0, executors=executors)
+
+  def testSaturationRequiresRunningServer(self):
+    server = implementations.insecure_server(_SERVICE_DESCRIPTIONS, 0)
+
+    with self.assertRaises(ValueError):
+      server.saturation()
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -345,6 +345,143 @@ class RpcMethodServiceDescription(RpcMethodDescription):
     raise NotImplementedError()
 
 
+class MethodStats(object):
+  """A snapshot of the RPCs of a single RPC method.
+
+  Latencies are measured in seconds and are summarized as objects with
+  "count", "total", "minimum", and "maximum" attributes and "mean" and
+  "percentile" methods.
+
+  Attributes:
+    in_flight: The number of RPCs currently in progress.
+    commenced: The number of RPCs commenced.
+    latency: A summary of the lengths of time from commencement to termination
+      of terminated RPCs.
+    queue_wait: A summary of the lengths of time for which application code
+      waited to be run in a thread pool.
+    servicer_time: A summary of the lengths of time spent in application code
+      handling values.
+    payloads_ingested: The number of values passed into application code.
+    payloads_emitted: The number of values passed out of application code.
+    bytes_received: The number of serialized value bytes taken off the wire.
+    bytes_sent: The number of serialized value bytes put on the wire.
+  """
+  __metaclass__ = abc.ABCMeta
+
+
+class RpcSnapshot(object):
+  """A snapshot of a single RPC in progress.
+
+  Times are measured in seconds.
+
+  Attributes:
+    method: The RPC method name.
+    age: The length of time since the RPC commenced.
+    time_remaining: The length of time remaining before the RPC expires.
+    payloads_received: The number of values received from the other side of
+      the RPC.
+    payloads_emitted: The number of values passed out of application code for
+      transmission to the other side of the RPC.
+    ingestion_backlog: The number of received values waiting to be passed into
+      application code.
+    ingesting: Whether or not application code is being run or waiting to be
+      run for the RPC.
+    transmission_backlog: The number of emitted values waiting to be handed to
+      the wire.
+    transmitting: Whether or not values are being handed to the wire.
+    pending_writes: The number of serialized values waiting to be written to
+      the wire.
+    writing: Whether or not a write to the wire is underway.
+  """
+  __metaclass__ = abc.ABCMeta
+
+
+class ExecutorDescription(object):
+  """A description of a bounded executor in which to service RPC methods."""
+  __metaclass__ = abc.ABCMeta
+
+  @abc.abstractmethod
+  def methods(self):
+    """Identifies the RPC methods to be serviced in the executor.
+
+    Returns:
+      A collection of RPC method names.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def maximum_concurrency(self):
+    """Reports the largest number of tasks the executor will run at once.
+
+    Returns:
+      A positive integer.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def maximum_queue_length(self):
+    """Reports the largest number of tasks the executor will hold waiting.
+
+    RPCs requiring tasks in excess of this number while the executor is fully
+    occupied are failed.
+
+    Returns:
+      A nonnegative integer.
+    """
+    raise NotImplementedError()
+
+
+class Interceptor(object):
+  """Observes the RPCs of the methods that it chooses to intercept.
+
+  Whether or not an Interceptor intercepts a method is asked once per method;
+  RPCs of methods that no Interceptor intercepts incur no cost from
+  interception.
+  """
+  __metaclass__ = abc.ABCMeta
+
+  @abc.abstractmethod
+  def intercepts(self, name):
+    """Describes whether or not this Interceptor intercepts an RPC method.
+
+    Args:
+      name: An RPC method name.
+
+    Returns:
+      True if the before and after methods of this Interceptor should be called
+        for RPCs of the named method; False otherwise.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def before(self, name):
+    """Called as an RPC of an intercepted method commences.
+
+    Args:
+      name: The RPC method name.
+
+    Returns:
+      A value to be passed to this Interceptor's after method when the RPC
+        terminates.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def after(self, name, memo, duration, abortion):
+    """Called after an RPC of an intercepted method has terminated.
+
+    Args:
+      name: The RPC method name.
+      memo: The value returned from this Interceptor's before method for the
+        RPC.
+      duration: The length of time in seconds from the RPC's commencement to
+        its termination.
+      abortion: None if the RPC completed successfully or an Abortion value
+        indicating why the RPC was aborted.
+    """
+    raise NotImplementedError()
+
+
 class Stub(object):
   """A stub with callable RPC method names for attributes.
 
@@ -371,6 +508,57 @@ class Stub(object):
   """
   __metaclass__ = abc.ABCMeta
 
+  @abc.abstractmethod
+  def connect(self, timeout, warm_up_requests=None):
+    """Connects this stub to its server ahead of its first RPC.
+
+    This method may only be called while this stub is in context. It blocks
+    until the connection has been established and any warm-up RPCs have
+    completed.
+
+    Args:
+      timeout: A duration of time in seconds to allow for connection and
+        warm-up.
+      warm_up_requests: A dictionary from RPC method name to a request value
+        with which to invoke that method once, discarding the response, so as
+        to prime serialization and threads on both sides of the connection.
+        Request-streaming methods are invoked with a single-request stream.
+        May be None.
+
+    Returns:
+      The duration of time in seconds spent connecting and warming up.
+
+    Raises:
+      exceptions.RpcError: If the connection could not be established within
+        the given timeout or a warm-up RPC was aborted.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def method_stats(self):
+    """Reports statistics of the RPCs invoked through this stub.
+
+    This method may only be called while this stub is in context. Statistics
+    are discarded when the stub releases its resources.
+
+    Returns:
+      A dictionary from RPC method name to a MethodStats for each RPC method
+        that has been invoked through this stub.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def in_flight_rpcs(self):
+    """Describes the RPCs in progress through this stub.
+
+    This method may only be called while this stub is in context.
+
+    Returns:
+      A sequence of RpcSnapshots, one for each RPC in progress, ordered from
+        oldest to youngest.
+    """
+    raise NotImplementedError()
+
 
 class Server(activated.Activated):
   """A GRPC Server."""
@@ -383,6 +571,65 @@ class Server(activated.Activated):
     This method may only be called while the server is activated.
 
     Returns:
-      The port on which the server is serving.
+      The port on which the server is serving, or the "unix:<path>" address
+        of the Unix domain socket on which the server is serving.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def method_stats(self):
+    """Reports statistics of the RPCs serviced by the server.
+
+    This method may only be called while the server is activated.
+
+    Returns:
+      A dictionary from RPC method name to a MethodStats for each RPC method
+        that has been serviced by the server.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def in_flight_rpcs(self):
+    """Describes the RPCs the server is servicing.
+
+    This method may only be called while the server is activated.
+
+    Returns:
+      A sequence of RpcSnapshots, one for each RPC in progress, ordered from
+        oldest to youngest.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def saturation(self):
+    """Reports the saturation of the server's executors.
+
+    This method may only be called while the server is activated.
+
+    Returns:
+      A dictionary from executor name to an object with "running", "queued",
+        "rejected", "maximum_concurrency", and "maximum_queue_length"
+        attributes describing the executor's current load.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def profile(self, duration, path=None):
+    """Samples the stacks of the threads running the server's application code.
+
+    Each sample is attributed to the RPC method the sampled thread is serving;
+    the work of other servers in the same process is not sampled. This method
+    may only be called while the server is activated, and blocks for the given
+    duration.
+
+    Args:
+      duration: The length of time in seconds for which to sample.
+      path: The path of a file to which to write the samples in the folded
+        format of flame graph tools, or None.
+
+    Returns:
+      A dictionary from RPC method name to a dictionary from folded stack (a
+        string of semicolon-separated frame descriptions, outermost first) to
+        the number of samples taken of that stack.
     """
     raise NotImplementedError()
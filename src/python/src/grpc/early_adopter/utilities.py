@@ -29,12 +29,34 @@
 
 """Utilities for use with GRPC."""
 
+from grpc.early_adopter import _lazy
 from grpc.early_adopter import interfaces
 
+try:
+  _VIEW = buffer
+except NameError:
+  _VIEW = memoryview
+
+
+def _lazily(serializer, deserializer, lazy, serialized_type_deserializer):
+  if serialized_type_deserializer is not None:
+    serializer = _lazy.serializer(serializer, serialized_type_deserializer)
+  if lazy:
+    deserializer = _lazy.deserializer(deserializer)
+  return serializer, deserializer
+
 
 class _RpcMethodDescription(
     interfaces.RpcMethodInvocationDescription,
     interfaces.RpcMethodServiceDescription):
+  """Describes an RPC method with messages serialized by given behaviors.
+
+  Attributes:
+    raw: False, indicating that messages of the RPC method are not their own
+      wire bytes.
+  """
+
+  raw = False
 
   def __init__(
       self, cardinality, unary_unary, unary_stream, stream_unary,
@@ -87,8 +109,70 @@ class _RpcMethodDescription(
     return self._stream_stream(request_iterator, context)
 
 
+class _RawRpcMethodDescription(_RpcMethodDescription):
+  """Describes an RPC method with messages that are their own wire bytes.
+
+  Attributes:
+    raw: True, indicating that messages of the RPC method are their own wire
+      bytes and may be passed to and from the wire without serialization.
+    view: A callable that when called on a bytestring taken off the wire returns
+      a zero-copy view of it, or None if bytestrings are passed on untouched.
+  """
+
+  raw = True
+
+  def __init__(
+      self, cardinality, unary_unary, unary_stream, stream_unary,
+      stream_stream, view):
+    super(_RawRpcMethodDescription, self).__init__(
+        cardinality, unary_unary, unary_stream, stream_unary, stream_stream,
+        None, None, None, None)
+    self.view = view
+
+  def serialize_request(self, request):
+    """See interfaces.RpcMethodInvocationDescription.serialize_request."""
+    return request
+
+  def deserialize_request(self, serialized_request):
+    """See interfaces.RpcMethodServiceDescription.deserialize_request."""
+    return (
+        serialized_request if self.view is None
+        else self.view(serialized_request))
+
+  def serialize_response(self, response):
+    """See interfaces.RpcMethodServiceDescription.serialize_response."""
+    return response
+
+  def deserialize_response(self, serialized_response):
+    """See interfaces.RpcMethodInvocationDescription.deserialize_response."""
+    return (
+        serialized_response if self.view is None
+        else self.view(serialized_response))
+
+
+class _ExecutorDescription(interfaces.ExecutorDescription):
+
+  def __init__(self, methods, maximum_concurrency, maximum_queue_length):
+    self._methods = methods
+    self._maximum_concurrency = maximum_concurrency
+    self._maximum_queue_length = maximum_queue_length
+
+  def methods(self):
+    """See interfaces.ExecutorDescription.methods for specification."""
+    return self._methods
+
+  def maximum_concurrency(self):
+    """See interfaces.ExecutorDescription.maximum_concurrency."""
+    return self._maximum_concurrency
+
+  def maximum_queue_length(self):
+    """See interfaces.ExecutorDescription.maximum_queue_length."""
+    return self._maximum_queue_length
+
+
 def unary_unary_invocation_description(
-    request_serializer, response_deserializer):
+    request_serializer, response_deserializer, lazy=False,
+    request_deserializer=None):
   """Creates an interfaces.RpcMethodInvocationDescription for an RPC method.
 
   Args:
@@ -97,18 +181,28 @@ def unary_unary_invocation_description(
     response_deserializer: A callable that when called on a
       bytestring returns the response value corresponding to
       that bytestring.
+    lazy: Whether or not to give responses as lazily-deserialized messages,
+      deserialized only when first accessed.
+    request_deserializer: The deserializer of request values (that with which
+      servers of the RPC method are described), or None. Requests that are
+      unchanged lazily-deserialized messages made with it, such as requests
+      received by a lazy service and forwarded, are sent as their original
+      bytestrings.
 
   Returns:
     An interfaces.RpcMethodInvocationDescription constructed from the given
       arguments representing a unary-request/unary-response RPC method.
   """
+  request_serializer, response_deserializer = _lazily(
+      request_serializer, response_deserializer, lazy, request_deserializer)
   return _RpcMethodDescription(
       interfaces.Cardinality.UNARY_UNARY, None, None, None, None,
       request_serializer, None, None, response_deserializer)
 
 
 def unary_stream_invocation_description(
-    request_serializer, response_deserializer):
+    request_serializer, response_deserializer, lazy=False,
+    request_deserializer=None):
   """Creates an interfaces.RpcMethodInvocationDescription for an RPC method.
 
   Args:
@@ -117,18 +211,28 @@ def unary_stream_invocation_description(
     response_deserializer: A callable that when called on a
       bytestring returns the response value corresponding to
       that bytestring.
+    lazy: Whether or not to give responses as lazily-deserialized messages,
+      deserialized only when first accessed.
+    request_deserializer: The deserializer of request values (that with which
+      servers of the RPC method are described), or None. Requests that are
+      unchanged lazily-deserialized messages made with it, such as requests
+      received by a lazy service and forwarded, are sent as their original
+      bytestrings.
 
   Returns:
     An interfaces.RpcMethodInvocationDescription constructed from the given
       arguments representing a unary-request/streaming-response RPC method.
   """
+  request_serializer, response_deserializer = _lazily(
+      request_serializer, response_deserializer, lazy, request_deserializer)
   return _RpcMethodDescription(
       interfaces.Cardinality.UNARY_STREAM, None, None, None, None,
       request_serializer, None, None, response_deserializer)
 
 
 def stream_unary_invocation_description(
-    request_serializer, response_deserializer):
+    request_serializer, response_deserializer, lazy=False,
+    request_deserializer=None):
   """Creates an interfaces.RpcMethodInvocationDescription for an RPC method.
 
   Args:
@@ -137,18 +241,28 @@ def stream_unary_invocation_description(
     response_deserializer: A callable that when called on a
       bytestring returns the response value corresponding to
       that bytestring.
+    lazy: Whether or not to give responses as lazily-deserialized messages,
+      deserialized only when first accessed.
+    request_deserializer: The deserializer of request values (that with which
+      servers of the RPC method are described), or None. Requests that are
+      unchanged lazily-deserialized messages made with it, such as requests
+      received by a lazy service and forwarded, are sent as their original
+      bytestrings.
 
   Returns:
     An interfaces.RpcMethodInvocationDescription constructed from the given
       arguments representing a streaming-request/unary-response RPC method.
   """
+  request_serializer, response_deserializer = _lazily(
+      request_serializer, response_deserializer, lazy, request_deserializer)
   return _RpcMethodDescription(
       interfaces.Cardinality.STREAM_UNARY, None, None, None, None,
       request_serializer, None, None, response_deserializer)
 
 
 def stream_stream_invocation_description(
-    request_serializer, response_deserializer):
+    request_serializer, response_deserializer, lazy=False,
+    request_deserializer=None):
   """Creates an interfaces.RpcMethodInvocationDescription for an RPC method.
 
   Args:
@@ -157,19 +271,29 @@ def stream_stream_invocation_description(
     response_deserializer: A callable that when called on a
       bytestring returns the response value corresponding to
       that bytestring.
+    lazy: Whether or not to give responses as lazily-deserialized messages,
+      deserialized only when first accessed.
+    request_deserializer: The deserializer of request values (that with which
+      servers of the RPC method are described), or None. Requests that are
+      unchanged lazily-deserialized messages made with it, such as requests
+      received by a lazy service and forwarded, are sent as their original
+      bytestrings.
 
   Returns:
     An interfaces.RpcMethodInvocationDescription constructed from the given
       arguments representing a  streaming-request/streaming-response RPC
       method.
   """
+  request_serializer, response_deserializer = _lazily(
+      request_serializer, response_deserializer, lazy, request_deserializer)
   return _RpcMethodDescription(
       interfaces.Cardinality.STREAM_STREAM, None, None, None, None,
       request_serializer, None, None, response_deserializer)
 
 
 def unary_unary_service_description(
-    behavior, request_deserializer, response_serializer):
+    behavior, request_deserializer, response_serializer, lazy=False,
+    response_deserializer=None):
   """Creates an interfaces.RpcMethodServiceDescription for the given behavior.
 
   Args:
@@ -182,19 +306,29 @@ def unary_unary_service_description(
     response_serializer: A callable that when called on a
       response value returns the bytestring corresponding to
       that value.
+    lazy: Whether or not to give the behavior requests as lazily-deserialized
+      messages, deserialized only when first accessed.
+    response_deserializer: The deserializer of response values (that with
+      which stubs of the RPC method are described), or None. Responses that
+      are unchanged lazily-deserialized messages made with it, such as
+      responses received through a lazy stub and relayed, are sent as their
+      original bytestrings.
 
   Returns:
     An interfaces.RpcMethodServiceDescription constructed from the given
       arguments representing a unary-request/unary-response RPC
       method.
   """
+  response_serializer, request_deserializer = _lazily(
+      response_serializer, request_deserializer, lazy, response_deserializer)
   return _RpcMethodDescription(
       interfaces.Cardinality.UNARY_UNARY, behavior, None, None, None,
       None, request_deserializer, response_serializer, None)
 
 
 def unary_stream_service_description(
-    behavior, request_deserializer, response_serializer):
+    behavior, request_deserializer, response_serializer, lazy=False,
+    response_deserializer=None):
   """Creates an interfaces.RpcMethodServiceDescription for the given behavior.
 
   Args:
@@ -207,19 +341,29 @@ def unary_stream_service_description(
     response_serializer: A callable that when called on a
       response value returns the bytestring corresponding to
       that value.
+    lazy: Whether or not to give the behavior requests as lazily-deserialized
+      messages, deserialized only when first accessed.
+    response_deserializer: The deserializer of response values (that with
+      which stubs of the RPC method are described), or None. Responses that
+      are unchanged lazily-deserialized messages made with it, such as
+      responses received through a lazy stub and relayed, are sent as their
+      original bytestrings.
 
   Returns:
     An interfaces.RpcMethodServiceDescription constructed from the given
       arguments representing a unary-request/streaming-response
       RPC method.
   """
+  response_serializer, request_deserializer = _lazily(
+      response_serializer, request_deserializer, lazy, response_deserializer)
   return _RpcMethodDescription(
       interfaces.Cardinality.UNARY_STREAM, None, behavior, None, None,
       None, request_deserializer, response_serializer, None)
 
 
 def stream_unary_service_description(
-    behavior, request_deserializer, response_serializer):
+    behavior, request_deserializer, response_serializer, lazy=False,
+    response_deserializer=None):
   """Creates an interfaces.RpcMethodServiceDescription for the given behavior.
 
   Args:
@@ -232,19 +376,29 @@ def stream_unary_service_description(
     response_serializer: A callable that when called on a
       response value returns the bytestring corresponding to
       that value.
+    lazy: Whether or not to give the behavior requests as lazily-deserialized
+      messages, deserialized only when first accessed.
+    response_deserializer: The deserializer of response values (that with
+      which stubs of the RPC method are described), or None. Responses that
+      are unchanged lazily-deserialized messages made with it, such as
+      responses received through a lazy stub and relayed, are sent as their
+      original bytestrings.
 
   Returns:
     An interfaces.RpcMethodServiceDescription constructed from the given
       arguments representing a streaming-request/unary-response
       RPC method.
   """
+  response_serializer, request_deserializer = _lazily(
+      response_serializer, request_deserializer, lazy, response_deserializer)
   return _RpcMethodDescription(
       interfaces.Cardinality.STREAM_UNARY, None, None, behavior, None,
       None, request_deserializer, response_serializer, None)
 
 
 def stream_stream_service_description(
-    behavior, request_deserializer, response_serializer):
+    behavior, request_deserializer, response_serializer, lazy=False,
+    response_deserializer=None):
   """Creates an interfaces.RpcMethodServiceDescription for the given behavior.
 
   Args:
@@ -258,12 +412,112 @@ def stream_stream_service_description(
     response_serializer: A callable that when called on a
       response value returns the bytestring corresponding to
       that value.
+    lazy: Whether or not to give the behavior requests as lazily-deserialized
+      messages, deserialized only when first accessed.
+    response_deserializer: The deserializer of response values (that with
+      which stubs of the RPC method are described), or None. Responses that
+      are unchanged lazily-deserialized messages made with it, such as
+      responses received through a lazy stub and relayed, are sent as their
+      original bytestrings.
 
   Returns:
     An interfaces.RpcMethodServiceDescription constructed from the given
       arguments representing a
       streaming-request/streaming-response RPC method.
   """
+  response_serializer, request_deserializer = _lazily(
+      response_serializer, request_deserializer, lazy, response_deserializer)
   return _RpcMethodDescription(
       interfaces.Cardinality.STREAM_STREAM, None, None, None, behavior,
       None, request_deserializer, response_serializer, None)
+
+
+def raw_invocation_description(cardinality, views=False):
+  """Creates an interfaces.RpcMethodInvocationDescription for an RPC method.
+
+  The described method's requests and responses are bytestrings that are put
+  on and taken off the wire untouched, with no serialization or
+  deserialization behavior called for them.
+
+  Args:
+    cardinality: An interfaces.Cardinality value.
+    views: Whether or not to give responses as zero-copy read-only views (buffer
+      objects where available, memoryview objects otherwise) of the bytestrings
+      taken off the wire rather than as the bytestrings themselves.
+
+  Returns:
+    An interfaces.RpcMethodInvocationDescription constructed from the given
+      arguments representing an RPC method of the given cardinality.
+  """
+  return _RawRpcMethodDescription(
+      cardinality, None, None, None, None, _VIEW if views else None)
+
+
+def raw_service_description(cardinality, behavior, views=False):
+  """Creates an interfaces.RpcMethodServiceDescription for the given behavior.
+
+  The described method's requests and responses are bytestrings that are taken
+  off and put on the wire untouched, with no serialization or deserialization
+  behavior called for them.
+
+  Args:
+    cardinality: An interfaces.Cardinality value.
+    behavior: A callable that implements an RPC method of the given
+      cardinality, accepting requests and returning responses as described
+      for the behaviors given to unary_unary_service_description and its
+      sibling functions. Responses must be bytestrings or objects exposing the
+      buffer interface (such as the views passed to the behavior).
+    views: Whether or not to give requests to the behavior as zero-copy
+      read-only views (buffer objects where available, memoryview objects
+      otherwise) of the bytestrings taken off the wire rather than as the
+      bytestrings themselves.
+
+  Returns:
+    An interfaces.RpcMethodServiceDescription constructed from the given
+      arguments representing an RPC method of the given cardinality.
+  """
+  return _RawRpcMethodDescription(
+      cardinality,
+      behavior if cardinality is interfaces.Cardinality.UNARY_UNARY else None,
+      behavior if cardinality is interfaces.Cardinality.UNARY_STREAM else None,
+      behavior if cardinality is interfaces.Cardinality.STREAM_UNARY else None,
+      behavior if cardinality is interfaces.Cardinality.STREAM_STREAM else None,
+      _VIEW if views else None)
+
+
+def decoded(message):
+  """Gives the message underlying a possibly lazily-deserialized message.
+
+  Lazily-deserialized messages pass attribute access, string conversion and
+  equality tests on to their deserialized messages, and may be changed by
+  attribute assignment, but they are not instances of their messages' classes.
+  This function gives the deserialized message itself; once it has been called
+  the message is considered changed and is serialized anew rather than sent as
+  its original bytestring.
+
+  Args:
+    message: A message given by an RPC method described with lazy=True, or any
+      other value.
+
+  Returns:
+    The deserialized message underlying the given lazily-deserialized message,
+      or the given value if it is not a lazily-deserialized message.
+  """
+  return _lazy.contents(message)
+
+
+def executor_description(methods, maximum_concurrency, maximum_queue_length):
+  """Creates an interfaces.ExecutorDescription.
+
+  Args:
+    methods: A collection of the names of the RPC methods to be serviced in the
+      described executor.
+    maximum_concurrency: The largest number of tasks to run at once.
+    maximum_queue_length: The largest number of tasks to hold waiting to be
+      run.
+
+  Returns:
+    An interfaces.ExecutorDescription constructed from the given arguments.
+  """
+  return _ExecutorDescription(
+      frozenset(methods), maximum_concurrency, maximum_queue_length)
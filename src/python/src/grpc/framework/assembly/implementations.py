@@ -29,11 +29,13 @@
 
 """Implementations for assembling RPC framework values."""
 
+import abc
 import threading
 
-# tickets_interfaces, face_interfaces, and activated are referenced from
-# specification in this module.
+# base_interfaces, tickets_interfaces, face_interfaces, and activated are
+# referenced from specification in this module.
 from grpc.framework.assembly import interfaces
+from grpc.framework.base import interfaces as base_interfaces  # pylint: disable=unused-import
 from grpc.framework.base import util as base_utilities
 from grpc.framework.base.packets import implementations as tickets_implementations
 from grpc.framework.base.packets import interfaces as tickets_interfaces  # pylint: disable=unused-import
@@ -43,52 +45,157 @@ from grpc.framework.face import implementations as face_implementations
 from grpc.framework.face import interfaces as face_interfaces  # pylint: disable=unused-import
 from grpc.framework.face import utilities as face_utilities
 from grpc.framework.foundation import activated  # pylint: disable=unused-import
-from grpc.framework.foundation import logging_pool
+from grpc.framework.foundation import adaptive_pool
+from grpc.framework.foundation import bulkhead
+from grpc.framework.foundation import later
+from grpc.framework.foundation import tracing  # pylint: disable=unused-import
 
 _ONE_DAY_IN_SECONDS = 60 * 60 * 24
 _THREAD_POOL_SIZE = 100
+_MINIMUM_THREAD_POOL_SIZE = 4
 
 
-class _FaceStub(object):
+class _ReferenceCountedStub(object):
+  """Activation behavior common to the stubs assembled in this module.
 
-  def __init__(self, rear_link):
+  Activation is reference-counted: the thread pool and Front underlying a stub
+  are created and its rear link started on the stub's first entry into context,
+  and are reused by all entries into context made before they are released. A
+  stub's underlying resources are released once the stub has spent its linger
+  time out of context; a pending linger does not keep the interpreter from
+  exiting.
+  """
+  __metaclass__ = abc.ABCMeta
+
+  def __init__(self, rear_link, linger, interceptors, tracer):
     self._rear_link = rear_link
+    self._linger = linger
+    self._interceptors = interceptors
+    self._tracer = tracer
     self._lock = threading.Lock()
+    self._activations = 0
     self._pool = None
     self._front = None
-    self._under_stub = None
+    self._index = 0
+    self._future = None
+
+  @abc.abstractmethod
+  def _activate(self, front, pool):
+    """Creates the RPC-invoking state of the stub.
+
+    This method is called with the stub's lock held.
+
+    Args:
+      front: The tickets_interfaces.Front with which to invoke RPCs.
+      pool: A thread pool.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def _deactivate(self):
+    """Discards the RPC-invoking state of the stub.
+
+    This method is called with the stub's lock held.
+    """
+    raise NotImplementedError()
+
+  def _release(self):
+    self._deactivate()
+    self._rear_link.stop()
+    base_utilities.wait_for_idle(self._front)
+    self._front = None
+    self._pool.shutdown(wait=True)
+    self._pool = None
+
+  def _expire(self, index):
+    with self._lock:
+      if self._future is not None and index == self._index:
+        self._future = None
+        self._release()
 
   def __enter__(self):
     with self._lock:
-      self._pool = logging_pool.pool(_THREAD_POOL_SIZE)
-      self._front = tickets_implementations.front(
-          self._pool, self._pool, self._pool)
-      self._rear_link.start()
-      self._rear_link.join_fore_link(self._front)
-      self._front.join_rear_link(self._rear_link)
-      self._under_stub = face_implementations.stub(self._front, self._pool)
+      self._index += 1
+      if self._future is not None:
+        self._future.cancel()
+        self._future = None
+      if self._front is None:
+        self._pool = adaptive_pool.pool(
+            _THREAD_POOL_SIZE, minimum_workers=_MINIMUM_THREAD_POOL_SIZE)
+        self._front = tickets_implementations.front(
+            self._pool, self._pool, self._pool, tracer=self._tracer)
+        self._rear_link.start()
+        self._rear_link.join_fore_link(self._front)
+        self._front.join_rear_link(self._rear_link)
+        self._activate(self._front, self._pool)
+      self._activations += 1
+      return self
 
   def __exit__(self, exc_type, exc_val, exc_tb):
     with self._lock:
-      self._under_stub = None
-      self._rear_link.stop()
-      base_utilities.wait_for_idle(self._front)
-      self._front = None
-      self._pool.shutdown(wait=True)
-      self._pool = None
+      self._activations -= 1
+      if not self._activations:
+        if self._linger:
+          index = self._index
+          self._future = later.later(
+              self._linger, lambda: self._expire(index), daemon=True)
+        else:
+          self._release()
     return False
 
+  def method_stats(self):
+    """Reports statistics about the RPCs invoked through this stub.
+
+    This method may only be called while the stub is in context.
+
+    Returns:
+      A dictionary from RPC method name to base_interfaces.MethodStatistics.
+    """
+    with self._lock:
+      if not self._activations:
+        raise ValueError('Called out of context!')
+      return self._front.method_stats()
+
+  def operations(self):
+    """Describes the RPCs in progress through this stub.
+
+    This method may only be called while the stub is in context.
+
+    Returns:
+      A sequence of base_interfaces.OperationSnapshots, one for each RPC in
+        progress, ordered from oldest to youngest.
+    """
+    with self._lock:
+      if not self._activations:
+        raise ValueError('Called out of context!')
+      return self._front.operations()
+
+
+class _FaceStub(_ReferenceCountedStub):
+
+  def __init__(self, rear_link, linger, interceptors, tracer):
+    super(_FaceStub, self).__init__(rear_link, linger, interceptors, tracer)
+    self._under_stub = None
+
+  def _activate(self, front, pool):
+    self._under_stub = face_implementations.stub(
+        front, pool, interceptors=self._interceptors)
+
+  def _deactivate(self):
+    self._under_stub = None
+
   def __getattr__(self, attr):
     with self._lock:
-      if self._under_stub is None:
+      if not self._activations:
         raise ValueError('Called out of context!')
       else:
         return getattr(self._under_stub, attr)
 
 
-def _behaviors(implementations, front, pool):
+def _behaviors(implementations, front, pool, interceptors):
   behaviors = {}
-  stub = face_implementations.stub(front, pool)
+  stub = face_implementations.stub(
+      front, pool, interceptors=interceptors, names=implementations.keys())
   for name, implementation in implementations.iteritems():
     if implementation.cardinality is cardinality.Cardinality.UNARY_UNARY:
       behaviors[name] = stub.unary_unary_sync_async(name)
@@ -104,40 +211,25 @@ def _behaviors(implementations, front, pool):
   return behaviors
 
 
-class _DynamicInlineStub(object):
+class _DynamicInlineStub(_ReferenceCountedStub):
 
-  def __init__(self, implementations, rear_link):
+  def __init__(self, implementations, rear_link, linger, interceptors, tracer):
+    super(_DynamicInlineStub, self).__init__(
+        rear_link, linger, interceptors, tracer)
     self._implementations = implementations
-    self._rear_link = rear_link
-    self._lock = threading.Lock()
-    self._pool = None
-    self._front = None
     self._behaviors = None
 
-  def __enter__(self):
-    with self._lock:
-      self._pool = logging_pool.pool(_THREAD_POOL_SIZE)
-      self._front = tickets_implementations.front(
-          self._pool, self._pool, self._pool)
-      self._rear_link.start()
-      self._rear_link.join_fore_link(self._front)
-      self._front.join_rear_link(self._rear_link)
-      self._behaviors = _behaviors(
-          self._implementations, self._front, self._pool)
-      return self
+  def _activate(self, front, pool):
+    self._behaviors = _behaviors(
+        self._implementations, front, pool, self._interceptors)
 
-  def __exit__(self, exc_type, exc_val, exc_tb):
-    with self._lock:
-      self._behaviors = None
-      self._rear_link.stop()
-      base_utilities.wait_for_idle(self._front)
-      self._front = None
-      self._pool.shutdown(wait=True)
-      self._pool = None
-    return False
+  def _deactivate(self):
+    self._behaviors = None
 
   def __getattr__(self, attr):
     with self._lock:
+      if not self._activations:
+        raise ValueError('Called out of context!')
       behavior = self._behaviors.get(attr)
       if behavior is None:
         for name, behavior in self._behaviors.iteritems():
@@ -151,7 +243,7 @@ class _DynamicInlineStub(object):
         return behavior
 
 
-def _servicer(implementations, pool):
+def _servicer(implementations, pool, method_pools, interceptors):
   inline_value_in_value_out_methods = {}
   inline_value_in_stream_out_methods = {}
   inline_stream_in_value_out_methods = {}
@@ -200,25 +292,66 @@ def _servicer(implementations, pool):
       event_value_in_value_out_methods=event_value_in_value_out_methods,
       event_value_in_stream_out_methods=event_value_in_stream_out_methods,
       event_stream_in_value_out_methods=event_stream_in_value_out_methods,
-      event_stream_in_stream_out_methods=event_stream_in_stream_out_methods)
+      event_stream_in_stream_out_methods=event_stream_in_stream_out_methods,
+      method_pools=method_pools, interceptors=interceptors)
+
+
+def _runs_in_face_pool(implementation):
+  """Indicates whether a method's implementation runs in the face layer's pool.
+
+  Inline implementations of stream-request methods are run in their entirety in
+  a thread of the face layer's pool, with their requests passed to them from
+  the base layer's pool; all other implementations are run in the base layer's
+  pool.
+  """
+  return (
+      implementation.style is style.Service.INLINE and
+      implementation.cardinality in (
+          cardinality.Cardinality.STREAM_UNARY,
+          cardinality.Cardinality.STREAM_STREAM))
 
 
 class _ServiceAssembly(interfaces.Server):
 
-  def __init__(self, implementations, fore_link):
+  def __init__(
+      self, implementations, fore_link, executors, interceptors,
+      queue_wait_observer, tracer, profiling_scope):
     self._implementations = implementations
     self._fore_link = fore_link
+    self._executors = executors
+    self._interceptors = interceptors
+    self._queue_wait_observer = queue_wait_observer
+    self._tracer = tracer
+    self._profiling_scope = profiling_scope
     self._lock = threading.Lock()
     self._pool = None
+    self._bulkheads = None
     self._back = None
 
   def _start(self):
     with self._lock:
-      self._pool = logging_pool.pool(_THREAD_POOL_SIZE)
-      servicer = _servicer(self._implementations, self._pool)
+      self._pool = adaptive_pool.pool(
+          _THREAD_POOL_SIZE, minimum_workers=_MINIMUM_THREAD_POOL_SIZE)
+      self._bulkheads = {}
+      face_pools = {}
+      base_pools = {}
+      for name, executor in self._executors.iteritems():
+        executor_bulkhead = bulkhead.bulkhead(
+            self._pool, executor.maximum_concurrency,
+            executor.maximum_queue_length)
+        self._bulkheads[name] = executor_bulkhead
+        for method in executor.methods:
+          if _runs_in_face_pool(self._implementations[method]):
+            face_pools[method] = executor_bulkhead
+          else:
+            base_pools[method] = executor_bulkhead
+      servicer = _servicer(
+          self._implementations, self._pool, face_pools, self._interceptors)
       self._back = tickets_implementations.back(
           servicer, self._pool, self._pool, self._pool, _ONE_DAY_IN_SECONDS,
-          _ONE_DAY_IN_SECONDS)
+          _ONE_DAY_IN_SECONDS, method_pools=base_pools, tracer=self._tracer,
+          queue_wait_observer=self._queue_wait_observer,
+          profiling_scope=self._profiling_scope)
       self._fore_link.start()
       self._fore_link.join_rear_link(self._back)
       self._back.join_fore_link(self._fore_link)
@@ -228,6 +361,9 @@ class _ServiceAssembly(interfaces.Server):
       self._fore_link.stop()
       base_utilities.wait_for_idle(self._back)
       self._back = None
+      for executor_bulkhead in self._bulkheads.itervalues():
+        executor_bulkhead.shutdown(wait=True)
+      self._bulkheads = None
       self._pool.shutdown(wait=True)
       self._pool = None
 
@@ -249,29 +385,59 @@ class _ServiceAssembly(interfaces.Server):
     with self._lock:
       return self._fore_link.port()
 
+  def method_stats(self):
+    with self._lock:
+      return self._back.method_stats()
+
+  def operations(self):
+    with self._lock:
+      return self._back.operations()
+
+  def saturation(self):
+    with self._lock:
+      return {
+          name: executor_bulkhead.saturation()
+          for name, executor_bulkhead in self._bulkheads.iteritems()}
+
 
-def assemble_face_stub(activated_rear_link):
+def assemble_face_stub(
+    activated_rear_link, linger=0, interceptors=None, tracer=None):
   """Assembles a face_interfaces.Stub.
 
   The returned object is a context manager and may only be used in context to
-  invoke RPCs.
+  invoke RPCs. It may be entered into context repeatedly and concurrently; all
+  entries into context made while the stub is active share the same started
+  rear link, Front, and thread pool.
 
   Args:
     activated_rear_link: An object that is both a tickets_interfaces.RearLink
       and an activated.Activated. The object should be in the inactive state
       when passed to this method.
+    linger: A length of time in seconds for which to keep the stub's rear link
+      started and its Front and thread pool alive after the stub's last exit
+      from context, so that a prompt reentry into context may reuse them. If
+      zero, they are released immediately upon the stub's last exit from
+      context.
+    interceptors: A sequence of face_interfaces.Interceptors with which to
+      intercept the RPCs invoked through the stub, or None.
+    tracer: A tracing.Tracer with which to sample the RPCs invoked through the
+      stub and record the timing of their stages in the stub's Front, or None.
 
   Returns:
     A face_interfaces.Stub on which, in context, RPCs can be invoked.
   """
-  return _FaceStub(activated_rear_link)
+  return _FaceStub(activated_rear_link, linger, interceptors, tracer)
 
 
-def assemble_dynamic_inline_stub(implementations, activated_rear_link):
+def assemble_dynamic_inline_stub(
+    implementations, activated_rear_link, linger=0, interceptors=None,
+    tracer=None):
   """Assembles a stub with method names for attributes.
 
   The returned object is a context manager and may only be used in context to
-  invoke RPCs.
+  invoke RPCs. It may be entered into context repeatedly and concurrently; all
+  entries into context made while the stub is active share the same started
+  rear link, Front, and thread pool.
 
   The returned object, when used in context, will respond to attribute access
   as follows: if the requested attribute is the name of a unary-unary RPC
@@ -294,14 +460,26 @@ def assemble_dynamic_inline_stub(implementations, activated_rear_link):
     activated_rear_link: An object that is both a tickets_interfaces.RearLink
       and an activated.Activated. The object should be in the inactive state
       when passed to this method.
+    linger: A length of time in seconds for which to keep the stub's rear link
+      started and its Front and thread pool alive after the stub's last exit
+      from context, so that a prompt reentry into context may reuse them. If
+      zero, they are released immediately upon the stub's last exit from
+      context.
+    interceptors: A sequence of face_interfaces.Interceptors with which to
+      intercept the RPCs invoked through the stub, or None.
+    tracer: A tracing.Tracer with which to sample the RPCs invoked through the
+      stub and record the timing of their stages in the stub's Front, or None.
 
   Returns:
     A stub on which, in context, RPCs can be invoked.
   """
-  return _DynamicInlineStub(implementations, activated_rear_link)
+  return _DynamicInlineStub(
+      implementations, activated_rear_link, linger, interceptors, tracer)
 
 
-def assemble_service(implementations, activated_fore_link):
+def assemble_service(
+    implementations, activated_fore_link, executors=None, interceptors=None,
+    queue_wait_observer=None, tracer=None, profiling_scope=None):
   """Assembles the service-side of the RPC Framework stack.
 
   Args:
@@ -310,8 +488,27 @@ def assemble_service(implementations, activated_fore_link):
     activated_fore_link: An object that is both a tickets_interfaces.ForeLink
       and an activated.Activated. The object should be in the inactive state
       when passed to this method.
+    executors: A dictionary from executor name to interfaces.Executor
+      describing bulkheads in which to service some of the RPC methods, or
+      None. RPC methods not described by any executor are serviced in a thread
+      pool shared among them.
+    interceptors: A sequence of face_interfaces.Interceptors with which to
+      intercept the RPCs serviced by the server, or None. Each RPC method is
+      checked against the interceptors once, as the server is started.
+    queue_wait_observer: A callable to be called with the length of time in
+      seconds that each piece of work servicing an RPC waited for a thread in
+      which to run, or None.
+    tracer: A tracing.Tracer with which to sample the RPCs serviced by the
+      server and record the timing of their stages in the server's Back, or
+      None.
+    profiling_scope: A value with which to qualify the method names to which
+      the server's work is attributed for profiling, or None. If given, work
+      is attributed to the pair of this value and the method name.
 
   Returns:
     An interfaces.Server encapsulating RPC service.
   """
-  return _ServiceAssembly(implementations, activated_fore_link)
+  return _ServiceAssembly(
+      implementations, activated_fore_link,
+      {} if executors is None else executors, interceptors,
+      queue_wait_observer, tracer, profiling_scope)
@@ -32,6 +32,7 @@
 """Test of the GRPC-backed ForeLink and RearLink."""
 
 import threading
+import time
 import unittest
 
 from grpc.framework.assembly import implementations
@@ -40,6 +41,7 @@ from grpc.framework.base import interfaces
 from grpc.framework.base.packets import packets as tickets
 from grpc.framework.base.packets import interfaces as tickets_interfaces
 from grpc.framework.base.packets import null
+from grpc.framework.face import interfaces as face_interfaces
 from grpc.framework.foundation import logging_pool
 from grpc._junkdrawer import math_pb2
 
@@ -88,6 +90,7 @@ _IMPLEMENTATIONS = {
 }
 
 _TIMEOUT = 10
+_LINGER = 0.5
 
 
 class PipeLink(tickets_interfaces.ForeLink, tickets_interfaces.RearLink):
@@ -127,6 +130,47 @@ class PipeLink(tickets_interfaces.ForeLink, tickets_interfaces.RearLink):
       self._fore_link = null.NULL_FORE_LINK if fore_link is None else fore_link
 
 
+class _RecordingInterceptor(face_interfaces.Interceptor):
+
+  def __init__(self, names):
+    self._names = names
+    self._condition = threading.Condition()
+    self.asked = []
+    self.records = []
+
+  def intercepts(self, name):
+    with self._condition:
+      self.asked.append(name)
+    return name in self._names
+
+  def before(self, name):
+    with self._condition:
+      self.records.append(('before', name))
+      return len(self.records)
+
+  def after(self, name, memo, duration, abortion):
+    with self._condition:
+      self.records.append(('after', name, memo, abortion))
+      self._condition.notify_all()
+
+  def wait_for_records(self, count):
+    deadline = time.time() + _TIMEOUT
+    with self._condition:
+      while len(self.records) < count and time.time() < deadline:
+        self._condition.wait(deadline - time.time())
+      return list(self.records)
+
+
+def _settled_method_stats(end, name):
+  deadline = time.time() + _TIMEOUT
+  while True:
+    stats = end.method_stats()[name]
+    if ((not stats.in_flight and stats.payloads_ingested) or
+        deadline < time.time()):
+      return stats
+    time.sleep(0.01)
+
+
 class FaceStubTest(unittest.TestCase):
 
   def testUnaryUnary(self):
@@ -203,6 +247,89 @@ class FaceStubTest(unittest.TestCase):
             response.remainder)
       self.assertEqual(stream_length, index + 1)
 
+  def testMethodStats(self):
+    pipe = PipeLink()
+    service = implementations.assemble_service(_IMPLEMENTATIONS, pipe)
+    face_stub = implementations.assemble_face_stub(pipe)
+
+    with service, face_stub:
+      face_stub.blocking_value_in_value_out(
+          DIV, math_pb2.DivArgs(divisor=3, dividend=7), _TIMEOUT)
+      stub_stats = _settled_method_stats(face_stub, DIV)
+      service_stats = _settled_method_stats(service, DIV)
+
+    self.assertEqual(1, stub_stats.commenced)
+    self.assertEqual(1, stub_stats.latency.count)
+    self.assertEqual(1, stub_stats.payloads_emitted)
+    self.assertEqual(1, stub_stats.payloads_ingested)
+    self.assertEqual(1, service_stats.commenced)
+    self.assertEqual(1, service_stats.latency.count)
+    self.assertEqual(1, service_stats.payloads_ingested)
+    self.assertEqual(1, service_stats.payloads_emitted)
+
+  def testExecutors(self):
+    stream_length = 11
+    pipe = PipeLink()
+    service = implementations.assemble_service(
+        _IMPLEMENTATIONS, pipe,
+        # A queue of one admits the stream-stream RPC should it arrive before
+        # the thread of the unary-unary RPC has given back its place.
+        executors={'division': utilities.executor((DIV, DIV_MANY), 1, 1)})
+    face_stub = implementations.assemble_face_stub(pipe)
+
+    with service, face_stub:
+      response = face_stub.blocking_value_in_value_out(
+          DIV, math_pb2.DivArgs(divisor=3, dividend=7), _TIMEOUT)
+      self.assertEqual(2, response.quotient)
+      responses = list(face_stub.inline_stream_in_stream_out(
+          DIV_MANY,
+          (math_pb2.DivArgs(divisor=3, dividend=index)
+           for index in range(stream_length)),
+          _TIMEOUT))
+      self.assertEqual(stream_length, len(responses))
+      saturation = service.saturation()['division']
+      self.assertEqual(0, saturation.rejected)
+      self.assertEqual(1, saturation.maximum_concurrency)
+
+
+  def testInterceptors(self):
+    pipe = PipeLink()
+    service_interceptor = _RecordingInterceptor((DIV,))
+    stub_interceptor = _RecordingInterceptor((DIV,))
+    service = implementations.assemble_service(
+        _IMPLEMENTATIONS, pipe, interceptors=(service_interceptor,))
+    face_stub = implementations.assemble_face_stub(
+        pipe, interceptors=(stub_interceptor,))
+
+    with service, face_stub:
+      for index in range(2):
+        face_stub.blocking_value_in_value_out(
+            DIV, math_pb2.DivArgs(divisor=3, dividend=7), _TIMEOUT)
+        list(face_stub.inline_value_in_stream_out(
+            FIB, math_pb2.FibArgs(limit=3), _TIMEOUT))
+        service_records = service_interceptor.wait_for_records(2 * index + 2)
+        stub_records = stub_interceptor.wait_for_records(2 * index + 2)
+
+    expected_records = [
+        ('before', DIV), ('after', DIV, 1, None),
+        ('before', DIV), ('after', DIV, 3, None),
+    ]
+    self.assertEqual(expected_records, service_records)
+    self.assertEqual(expected_records, stub_records)
+    self.assertEqual(
+        sorted(_IMPLEMENTATIONS.keys()), sorted(service_interceptor.asked))
+    self.assertEqual([DIV, FIB], stub_interceptor.asked)
+
+  def testDynamicInlineStubSelectsInterceptorsOnEntry(self):
+    stub_interceptor = _RecordingInterceptor((DIV,))
+    dynamic_stub = implementations.assemble_dynamic_inline_stub(
+        _IMPLEMENTATIONS, PipeLink(), interceptors=(stub_interceptor,))
+
+    with dynamic_stub:
+      asked_on_entry = list(stub_interceptor.asked)
+
+    self.assertEqual(sorted(_IMPLEMENTATIONS.keys()), sorted(asked_on_entry))
+
 
 class DynamicInlineStubTest(unittest.TestCase):
 
@@ -279,6 +406,31 @@ class DynamicInlineStubTest(unittest.TestCase):
             response.remainder)
       self.assertEqual(stream_length, index + 1)
 
+  def testReentryWhileLingering(self):
+    pipe = PipeLink()
+    service = implementations.assemble_service(_IMPLEMENTATIONS, pipe)
+    dynamic_stub = implementations.assemble_dynamic_inline_stub(
+        _IMPLEMENTATIONS, pipe, linger=_LINGER)
+
+    with service:
+      with dynamic_stub:
+        first_behavior = dynamic_stub.Div
+      with dynamic_stub:
+        with dynamic_stub:
+          second_behavior = dynamic_stub.Div
+          response = second_behavior(
+              math_pb2.DivArgs(divisor=3, dividend=7), _TIMEOUT)
+          self.assertEqual(2, response.quotient)
+        self.assertIs(first_behavior, dynamic_stub.Div)
+      self.assertIs(first_behavior, second_behavior)
+      with self.assertRaises(ValueError):
+        dynamic_stub.Div  # pylint: disable=pointless-statement
+
+      time.sleep(_LINGER * 2)
+      with dynamic_stub:
+        self.assertIsNot(first_behavior, dynamic_stub.Div)
+      time.sleep(_LINGER * 2)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -33,11 +33,13 @@
 
 import abc
 
-# cardinality, style, and stream are referenced from specification in this
-# module.
+# base_interfaces, cardinality, style, and stream are referenced from
+# specification in this module.
+from grpc.framework.base import interfaces as base_interfaces  # pylint: disable=unused-import
 from grpc.framework.common import cardinality  # pylint: disable=unused-import
 from grpc.framework.common import style  # pylint: disable=unused-import
 from grpc.framework.foundation import activated
+from grpc.framework.foundation import bulkhead  # pylint: disable=unused-import
 from grpc.framework.foundation import stream  # pylint: disable=unused-import
 
 
@@ -92,6 +94,21 @@ class MethodImplementation(object):
   __metaclass__ = abc.ABCMeta
 
 
+class Executor(object):
+  """A description of a bulkhead in which to service some RPC methods.
+
+  Attributes:
+    methods: A collection of the names of the RPC methods to be serviced in the
+      bulkhead.
+    maximum_concurrency: The largest number of tasks of the described methods
+      to run at once.
+    maximum_queue_length: The largest number of tasks of the described methods
+      to hold waiting to be run. RPCs requiring tasks in excess of this number
+      are failed.
+  """
+  __metaclass__ = abc.ABCMeta
+
+
 class Server(activated.Activated):
   """The server interface.
 
@@ -112,3 +129,37 @@ class Server(activated.Activated):
       The number of the port on which this Server is servicing RPCs.
     """
     raise NotImplementedError()
+
+  @abc.abstractmethod
+  def method_stats(self):
+    """Reports statistics about the RPCs serviced by this Server.
+
+    This method may only be called while the server is active.
+
+    Returns:
+      A dictionary from RPC method name to base_interfaces.MethodStatistics.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def operations(self):
+    """Describes the RPCs this Server is servicing.
+
+    This method may only be called while the server is active.
+
+    Returns:
+      A sequence of base_interfaces.OperationSnapshots, one for each RPC in
+        progress, ordered from oldest to youngest.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def saturation(self):
+    """Reports the saturation of this Server's executors.
+
+    This method may only be called while the server is active.
+
+    Returns:
+      A dictionary from executor name to bulkhead.Saturation.
+    """
+    raise NotImplementedError()
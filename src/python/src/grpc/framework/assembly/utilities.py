@@ -48,6 +48,14 @@ class _MethodImplementation(
   pass
 
 
+class _Executor(
+    interfaces.Executor,
+    collections.namedtuple(
+        '_Executor',
+        ['methods', 'maximum_concurrency', 'maximum_queue_length'])):
+  pass
+
+
 def unary_unary_inline(behavior):
   """Creates an interfaces.MethodImplementation for the given behavior.
 
@@ -177,3 +185,20 @@ def stream_stream_event(behavior):
   return _MethodImplementation(
       cardinality.Cardinality.STREAM_STREAM, style.Service.EVENT, None, None,
       None, None, None, None, None, behavior)
+
+
+def executor(methods, maximum_concurrency, maximum_queue_length):
+  """Creates an interfaces.Executor.
+
+  Args:
+    methods: A collection of the names of the RPC methods to be serviced in the
+      described bulkhead.
+    maximum_concurrency: The largest number of tasks of the given methods to
+      run at once.
+    maximum_queue_length: The largest number of tasks of the given methods to
+      hold waiting to be run.
+
+  Returns:
+    An interfaces.Executor describing the given values.
+  """
+  return _Executor(frozenset(methods), maximum_concurrency, maximum_queue_length)
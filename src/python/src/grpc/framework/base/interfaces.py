@@ -32,7 +32,8 @@
 import abc
 import enum
 
-# stream is referenced from specification in this module.
+# histogram and stream are referenced from specification in this module.
+from grpc.framework.foundation import histogram  # pylint: disable=unused-import
 from grpc.framework.foundation import stream  # pylint: disable=unused-import
 
 
@@ -49,6 +50,52 @@ class Outcome(enum.Enum):
   SERVICED_FAILURE = 'serviced failure'
 
 
+class MethodStatistics(object):
+  """A snapshot of the operations of a single method at an End.
+
+  Latencies are measured in seconds.
+
+  Attributes:
+    in_flight: The number of operations currently in progress.
+    commenced: The number of operations commenced.
+    latency: A histogram.Snapshot of the lengths of time from commencement to
+      termination of terminated operations.
+    queue_wait: A histogram.Snapshot of the lengths of time for which work
+      calling customer code waited to be run in a thread pool.
+    servicer_time: A histogram.Snapshot of the lengths of time spent in
+      customer code ingesting payloads.
+    payloads_ingested: The number of payloads passed into customer code.
+    payloads_emitted: The number of payloads passed out of customer code.
+  """
+  __metaclass__ = abc.ABCMeta
+
+
+class OperationSnapshot(object):
+  """A snapshot of a single in-progress operation at an End.
+
+  Times are measured in seconds.
+
+  Attributes:
+    operation_id: The operation's ID.
+    name: The name of the method of the operation.
+    age: The length of time since the operation commenced.
+    time_remaining: The length of time remaining before the operation expires.
+    payloads_received: The number of payloads received from the other side of
+      the operation.
+    payloads_emitted: The number of payloads passed out of customer code for
+      transmission to the other side of the operation.
+    ingestion_backlog: The number of received payloads waiting to be passed
+      into customer code.
+    ingesting: Whether or not work calling customer code is underway or
+      waiting to be run.
+    transmission_backlog: The number of emitted payloads waiting to be
+      transmitted to the other side of the operation.
+    transmitting: Whether or not transmission to the other side of the
+      operation is underway.
+  """
+  __metaclass__ = abc.ABCMeta
+
+
 class OperationContext(object):
   """Provides operation-related information and action.
 
@@ -56,6 +103,7 @@ class OperationContext(object):
     trace_id: A uuid.UUID identifying a particular set of related operations.
   """
   __metaclass__ = abc.ABCMeta
+  __slots__ = ()
 
   @abc.abstractmethod
   def is_active(self):
@@ -129,6 +177,7 @@ class Operation(object):
       operation.
   """
   __metaclass__ = abc.ABCMeta
+  __slots__ = ()
 
   @abc.abstractmethod
   def cancel(self):
@@ -191,6 +240,26 @@ class End(object):
     """
     raise NotImplementedError()
 
+  @abc.abstractmethod
+  def method_stats(self):
+    """Reports statistics about this End's operations broken down by method.
+
+    Returns:
+      A dictionary from method name to MethodStatistics for each method for
+        which an operation has commenced at this End.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def operations(self):
+    """Describes the operations currently in progress at this End.
+
+    Returns:
+      A sequence of OperationSnapshots, one for each operation in progress at
+        this End, ordered from oldest to youngest.
+    """
+    raise NotImplementedError()
+
   @abc.abstractmethod
   def add_idle_action(self, action):
     """Adds an action to be called when this End has no ongoing operations.
@@ -218,7 +287,8 @@ class Front(End):
       timeout: A length of time in seconds to allow for the operation.
       subscription: A ServicedSubscription for the operation.
       trace_id: A uuid.UUID identifying a set of related operations to which
-        this operation belongs.
+        this operation belongs, or None to have a new one made for the
+        operation.
 
     Returns:
       An Operation object affording information and action about the operation
@@ -211,6 +211,68 @@ class FrontAndBackTest(object):
         1, self.back.operation_stats()[interfaces.Outcome.COMPLETED])
     self.assertListEqual([(test_payload, True)], test_consumer.calls)
 
+  def testMethodStats(self):
+    """Tests the per-method statistics kept by the front and the back."""
+    test_payload = 'test payload'
+    test_consumer = stream_testing.TestConsumer()
+    subscription = util.full_serviced_subscription(
+        EasyServicedIngestor(test_consumer))
+
+    self.front.operate(
+        ASYNCHRONOUS_ECHO, test_payload, True, SMALL_TIMEOUT, subscription,
+        'test trace ID')
+
+    util.wait_for_idle(self.front)
+    util.wait_for_idle(self.back)
+    front_stats = self.front.method_stats()[ASYNCHRONOUS_ECHO]
+    back_stats = self.back.method_stats()[ASYNCHRONOUS_ECHO]
+    for stats in (front_stats, back_stats):
+      self.assertEqual(0, stats.in_flight)
+      self.assertEqual(1, stats.commenced)
+      self.assertEqual(1, stats.latency.count)
+      self.assertEqual(1, stats.payloads_ingested)
+      self.assertEqual(1, stats.payloads_emitted)
+      self.assertLessEqual(1, stats.queue_wait.count)
+      self.assertLessEqual(1, stats.servicer_time.count)
+
+  def testOperations(self):
+    """Tests the snapshots of operations in progress."""
+    test_payload = 'test payload'
+    test_consumer = stream_testing.TestConsumer()
+    subscription = util.full_serviced_subscription(
+        EasyServicedIngestor(test_consumer))
+
+    operation = self.front.operate(
+        WAIT_ON_CONDITION, test_payload, False, SMALL_TIMEOUT, subscription,
+        'test trace ID')
+    deadline = time.time() + SMALL_TIMEOUT
+    back_snapshots = self.back.operations()
+    while not back_snapshots and time.time() < deadline:
+      time.sleep(TICK)
+      back_snapshots = self.back.operations()
+    front_snapshots = self.front.operations()
+
+    self.assertEqual(1, len(front_snapshots))
+    self.assertEqual(1, len(back_snapshots))
+    front_snapshot, back_snapshot = front_snapshots[0], back_snapshots[0]
+    for snapshot in (front_snapshot, back_snapshot):
+      self.assertEqual(WAIT_ON_CONDITION, snapshot.name)
+      self.assertLessEqual(0, snapshot.age)
+      self.assertLess(0, snapshot.time_remaining)
+      self.assertLessEqual(snapshot.time_remaining, SMALL_TIMEOUT)
+    self.assertEqual(1, front_snapshot.payloads_emitted)
+    self.assertEqual(0, front_snapshot.payloads_received)
+    self.assertEqual(1, back_snapshot.payloads_received)
+    self.assertEqual(1, back_snapshot.ingestion_backlog)
+    self.assertTrue(back_snapshot.ingesting)
+
+    self.test_servicer.release()
+    operation.consumer.terminate()
+    util.wait_for_idle(self.front)
+    util.wait_for_idle(self.back)
+    self.assertEqual((), self.front.operations())
+    self.assertEqual((), self.back.operations())
+
   def testBidirectionalStreamingEcho(self):
     """Tests sending multiple packets each way."""
     test_payload_template = 'test_payload: %03d'
@@ -35,6 +35,9 @@ from grpc.framework.base.packets import packets
 
 class CancellationManager(_interfaces.CancellationManager):
   """An implementation of _interfaces.CancellationManager."""
+  __slots__ = (
+      '_lock', '_termination_manager', '_transmission_manager',
+      '_ingestion_manager', '_expiration_manager')
 
   def __init__(
       self, lock, termination_manager, transmission_manager, ingestion_manager,
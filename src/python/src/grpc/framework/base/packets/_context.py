@@ -39,6 +39,9 @@ from grpc.framework.base.packets import packets  # pylint: disable=unused-import
 
 class OperationContext(base_interfaces.OperationContext):
   """An implementation of base_interfaces.OperationContext."""
+  __slots__ = (
+      '_lock', 'operation_id', '_local_failure', '_termination_manager',
+      '_transmission_manager', '_ingestion_manager', '_expiration_manager')
 
   def __init__(
       self, lock, operation_id, local_failure, termination_manager,
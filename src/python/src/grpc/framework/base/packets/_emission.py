@@ -36,9 +36,14 @@ from grpc.framework.base.packets import packets  # pylint: disable=unused-import
 
 class _EmissionManager(_interfaces.EmissionManager):
   """An implementation of _interfaces.EmissionManager."""
+  __slots__ = (
+      '_lock', '_failure_kind', '_termination_manager', '_transmission_manager',
+      '_statistician', '_ingestion_manager', '_expiration_manager',
+      '_emission_complete')
 
   def __init__(
-      self, lock, failure_kind, termination_manager, transmission_manager):
+      self, lock, failure_kind, termination_manager, transmission_manager,
+      statistician):
     """Constructor.
 
     Args:
@@ -49,11 +54,14 @@ class _EmissionManager(_interfaces.EmissionManager):
       termination_manager: The _interfaces.TerminationManager for the operation.
       transmission_manager: The _interfaces.TransmissionManager for the
         operation.
+      statistician: The _statistics.MethodStatistician for the operation's
+        method.
     """
     self._lock = lock
     self._failure_kind = failure_kind
     self._termination_manager = termination_manager
     self._transmission_manager = transmission_manager
+    self._statistician = statistician
     self._ingestion_manager = None
     self._expiration_manager = None
 
@@ -76,6 +84,7 @@ class _EmissionManager(_interfaces.EmissionManager):
         self._abort()
       else:
         self._transmission_manager.inmit(value, False)
+        self._statistician.emit()
 
   def terminate(self):
     with self._lock:
@@ -92,35 +101,42 @@ class _EmissionManager(_interfaces.EmissionManager):
         self._termination_manager.emission_complete()
         self._transmission_manager.inmit(value, True)
         self._emission_complete = True
+        self._statistician.emit()
 
 
-def front_emission_manager(lock, termination_manager, transmission_manager):
+def front_emission_manager(
+    lock, termination_manager, transmission_manager, statistician):
   """Creates an _interfaces.EmissionManager appropriate for front-side use.
 
   Args:
     lock: The operation-wide lock.
     termination_manager: The _interfaces.TerminationManager for the operation.
     transmission_manager: The _interfaces.TransmissionManager for the operation.
+    statistician: The _statistics.MethodStatistician for the operation's
+      method.
 
   Returns:
     An _interfaces.EmissionManager appropriate for front-side use.
   """
   return _EmissionManager(
       lock, packets.Kind.SERVICED_FAILURE, termination_manager,
-      transmission_manager)
+      transmission_manager, statistician)
 
 
-def back_emission_manager(lock, termination_manager, transmission_manager):
+def back_emission_manager(
+    lock, termination_manager, transmission_manager, statistician):
   """Creates an _interfaces.EmissionManager appropriate for back-side use.
 
   Args:
     lock: The operation-wide lock.
     termination_manager: The _interfaces.TerminationManager for the operation.
     transmission_manager: The _interfaces.TransmissionManager for the operation.
+    statistician: The _statistics.MethodStatistician for the operation's
+      method.
 
   Returns:
     An _interfaces.EmissionManager appropriate for back-side use.
   """
   return _EmissionManager(
       lock, packets.Kind.SERVICER_FAILURE, termination_manager,
-      transmission_manager)
+      transmission_manager, statistician)
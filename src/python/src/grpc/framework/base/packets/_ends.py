@@ -31,6 +31,7 @@
 
 import collections
 import threading
+import time
 import uuid
 
 # _interfaces and packets are referenced from specification in this module.
@@ -40,13 +41,17 @@ from grpc.framework.base.packets import _context
 from grpc.framework.base.packets import _emission
 from grpc.framework.base.packets import _expiration
 from grpc.framework.base.packets import _ingestion
+from grpc.framework.base.packets import _inspection
 from grpc.framework.base.packets import _interfaces  # pylint: disable=unused-import
 from grpc.framework.base.packets import _reception
+from grpc.framework.base.packets import _statistics
 from grpc.framework.base.packets import _termination
 from grpc.framework.base.packets import _transmission
 from grpc.framework.base.packets import interfaces
 from grpc.framework.base.packets import packets  # pylint: disable=unused-import
 from grpc.framework.foundation import callable_util
+from grpc.framework.foundation import scheduling_pool
+from grpc.framework.foundation import tracing
 
 _IDLE_ACTION_EXCEPTION_LOG_MESSAGE = 'Exception calling idle action!'
 
@@ -63,6 +68,7 @@ _OPERATION_OUTCOMES = (
 
 class _EasyOperation(base_interfaces.Operation):
   """A trivial implementation of base_interfaces.Operation."""
+  __slots__ = ('consumer', 'context', '_cancellation_manager')
 
   def __init__(self, emission_manager, context, cancellation_manager):
     """Constructor.
@@ -86,19 +92,33 @@ class _EasyOperation(base_interfaces.Operation):
 class _Endlette(object):
   """Utility for stateful behavior common to Fronts and Backs."""
 
-  def __init__(self, pool):
+  def __init__(self, pool, tracer, queue_wait_observer=None):
     """Constructor.
 
     Args:
       pool: A thread pool to use when calling registered idle actions.
+      tracer: A tracing.Tracer with which to sample operations.
+      queue_wait_observer: A callable to be called with the length of time in
+        seconds that each piece of customer-code-calling work waited to be run,
+        or None.
     """
     self._lock = threading.Lock()
     self._pool = pool
+    self._tracer = tracer
+    self._queue_wait_observer = queue_wait_observer
     # Dictionary from operation IDs to ReceptionManager-or-None. A None value
     # indicates an in-progress fire-and-forget operation for which the customer
     # has chosen to ignore results.
     self._operations = {}
     self._stats = {outcome: 0 for outcome in _OPERATION_OUTCOMES}
+    # Dictionary from method name to _statistics.MethodStatistician.
+    self._statisticians = {}
+    # Dictionary from operation ID to a triple of the operation's method's
+    # _statistics.MethodStatistician, the time of the operation's commencement,
+    # and the operation's tracing.Trace.
+    self._commencements = {}
+    # Dictionary from operation ID to _inspection.OperationInspector.
+    self._inspectors = {}
     self._idle_actions = []
 
   def terminal_action(self, operation_id):
@@ -116,6 +136,15 @@ class _Endlette(object):
       with self._lock:
         self._stats[outcome] += 1
         self._operations.pop(operation_id, None)
+        self._inspectors.pop(operation_id, None)
+        commencement = self._commencements.pop(operation_id, None)
+        if commencement is not None:
+          statistician, commencement_time, trace = commencement
+          termination_time = time.time()
+          statistician.terminate(termination_time - commencement_time)
+          if trace.sampled:
+            trace.record(
+                tracing.Stage.OPERATION, commencement_time, termination_time)
         if not self._operations:
           for action in self._idle_actions:
             self._pool.submit(callable_util.with_exceptions_logged(
@@ -132,13 +161,54 @@ class _Endlette(object):
   def get_operation(self, operation_id):
     return self._operations.get(operation_id, None)
 
-  def add_operation(self, operation_id, operation_reception_manager):
+  def commence_operation(self, operation_id, name, trace_id):
+    """Records the commencement of an operation.
+
+    Args:
+      operation_id: The operation ID of the commencing operation.
+      name: The name of the method of the commencing operation.
+      trace_id: The trace ID of the commencing operation. May be None.
+
+    Returns:
+      A pair of the _statistics.MethodStatistician for the operation's method
+        and the tracing.Trace for the operation.
+    """
+    statistician = self._statisticians.get(name, None)
+    if statistician is None:
+      statistician = _statistics.MethodStatistician(
+          wait_observer=self._queue_wait_observer)
+      self._statisticians[name] = statistician
+    statistician.commence()
+    trace = self._tracer.trace(trace_id, operation_id)
+    self._commencements[operation_id] = statistician, time.time(), trace
+    return statistician, trace
+
+  def add_operation(
+      self, operation_id, operation_reception_manager, operation_inspector):
     self._operations[operation_id] = operation_reception_manager
+    self._inspectors[operation_id] = operation_inspector
 
   def operation_stats(self):
     with self._lock:
       return dict(self._stats)
 
+  def operations(self):
+    with self._lock:
+      now = time.time()
+      inspections = sorted(
+          ((self._commencements[operation_id][1], inspector)
+           for operation_id, inspector in self._inspectors.iteritems()),
+          key=lambda inspection: inspection[0])
+    return tuple(
+        inspector.snapshot(commencement, now)
+        for commencement, inspector in inspections)
+
+  def method_stats(self):
+    with self._lock:
+      return {
+          name: statistician.snapshot()
+          for name, statistician in self._statisticians.iteritems()}
+
   def add_idle_action(self, action):
     with self._lock:
       if self._operations:
@@ -148,17 +218,42 @@ class _Endlette(object):
             action, _IDLE_ACTION_EXCEPTION_LOG_MESSAGE))
 
 
+class _ScheduledWorkPool(object):
+  """Schedules the customer work of a single operation by its deadline."""
+  __slots__ = ('_pool', '_priority_class', '_expiration_manager')
+
+  def __init__(self, pool, priority_class):
+    """Constructor.
+
+    Args:
+      pool: A scheduling_pool.SchedulingPool.
+      priority_class: The priority class of the operation's work.
+    """
+    self._pool = pool
+    self._priority_class = priority_class
+    self._expiration_manager = None
+
+  def set_expiration_manager(self, expiration_manager):
+    self._expiration_manager = expiration_manager
+
+  def submit(self, fn, *args, **kwargs):
+    return self._pool.schedule(
+        self._expiration_manager.deadline(), self._priority_class, fn, *args,
+        **kwargs)
+
+
 class _FrontManagement(
     collections.namedtuple(
         '_FrontManagement',
-        ('reception', 'emission', 'operation', 'cancellation'))):
-  """Just a trivial helper class to bundle four fellow-traveling objects."""
+        ('reception', 'emission', 'operation', 'cancellation', 'inspection'))):
+  """Just a trivial helper class to bundle five fellow-traveling objects."""
+  __slots__ = ()
 
 
 def _front_operate(
     callback, work_pool, transmission_pool, utility_pool,
-    termination_action, operation_id, name, payload, complete, timeout,
-    subscription, trace_id):
+    termination_action, statistician, trace, operation_id, name, payload,
+    complete, timeout, subscription, trace_id):
   """Constructs objects necessary for front-side operation management.
 
   Args:
@@ -171,6 +266,9 @@ def _front_operate(
     utility_pool: A thread pool for utility tasks.
     termination_action: A no-arg behavior to be called upon operation
       completion.
+    statistician: The _statistics.MethodStatistician for the operation's
+      method.
+    trace: The tracing.Trace for the operation.
     operation_id: An object identifying the operation.
     name: The name of the method being called during the operation.
     payload: The first customer-significant value to be transmitted to the other
@@ -187,8 +285,8 @@ def _front_operate(
   Returns:
     A _FrontManagement object bundling together the
       _interfaces.ReceptionManager, _interfaces.EmissionManager,
-      _context.OperationContext, and _interfaces.CancellationManager for the
-      operation.
+      _context.OperationContext, _interfaces.CancellationManager, and
+      _inspection.OperationInspector for the operation.
   """
   lock = threading.Lock()
   with lock:
@@ -196,15 +294,15 @@ def _front_operate(
         work_pool, utility_pool, termination_action, subscription.kind)
     transmission_manager = _transmission.front_transmission_manager(
         lock, transmission_pool, callback, operation_id, name,
-        subscription.kind, trace_id, timeout, termination_manager)
+        subscription.kind, trace_id, timeout, termination_manager, trace)
     operation_context = _context.OperationContext(
         lock, operation_id, packets.Kind.SERVICED_FAILURE,
         termination_manager, transmission_manager)
     emission_manager = _emission.front_emission_manager(
-        lock, termination_manager, transmission_manager)
+        lock, termination_manager, transmission_manager, statistician)
     ingestion_manager = _ingestion.front_ingestion_manager(
-        lock, work_pool, subscription, termination_manager,
-        transmission_manager, operation_context)
+        lock, work_pool, name, subscription, termination_manager,
+        transmission_manager, operation_context, statistician, trace)
     expiration_manager = _expiration.front_expiration_manager(
         lock, termination_manager, transmission_manager, ingestion_manager,
         timeout)
@@ -214,6 +312,9 @@ def _front_operate(
     cancellation_manager = _cancellation.CancellationManager(
         lock, termination_manager, transmission_manager, ingestion_manager,
         expiration_manager)
+    inspector = _inspection.OperationInspector(
+        lock, operation_id, name, transmission_manager, ingestion_manager,
+        expiration_manager)
 
     termination_manager.set_expiration_manager(expiration_manager)
     transmission_manager.set_ingestion_and_expiration_managers(
@@ -225,6 +326,8 @@ def _front_operate(
     ingestion_manager.set_expiration_manager(expiration_manager)
 
     transmission_manager.inmit(payload, complete)
+    if payload is not None:
+      statistician.emit()
 
     if subscription.kind is base_interfaces.ServicedSubscription.Kind.NONE:
       returned_reception_manager = None
@@ -233,13 +336,13 @@ def _front_operate(
 
     return _FrontManagement(
         returned_reception_manager, emission_manager, operation_context,
-        cancellation_manager)
+        cancellation_manager, inspector)
 
 
 class Front(interfaces.Front):
   """An implementation of interfaces.Front."""
 
-  def __init__(self, work_pool, transmission_pool, utility_pool):
+  def __init__(self, work_pool, transmission_pool, utility_pool, tracer=None):
     """Constructor.
 
     Args:
@@ -247,8 +350,10 @@ class Front(interfaces.Front):
       transmission_pool: A thread pool to be used for transmitting values to
         the other side of the operation.
       utility_pool: A thread pool to be used for utility tasks.
+      tracer: A tracing.Tracer with which to sample operations, or None.
     """
-    self._endlette = _Endlette(utility_pool)
+    self._endlette = _Endlette(
+        utility_pool, tracing.NULL_TRACER if tracer is None else tracer)
     self._work_pool = work_pool
     self._transmission_pool = transmission_pool
     self._utility_pool = utility_pool
@@ -265,6 +370,14 @@ class Front(interfaces.Front):
     """See base_interfaces.End.operation_stats for specification."""
     return self._endlette.operation_stats()
 
+  def operations(self):
+    """See base_interfaces.End.operations for specification."""
+    return self._endlette.operations()
+
+  def method_stats(self):
+    """See base_interfaces.End.method_stats for specification."""
+    return self._endlette.method_stats()
+
   def add_idle_action(self, action):
     """See base_interfaces.End.add_idle_action for specification."""
     self._endlette.add_idle_action(action)
@@ -273,13 +386,18 @@ class Front(interfaces.Front):
       self, name, payload, complete, timeout, subscription, trace_id):
     """See base_interfaces.Front.operate for specification."""
     operation_id = uuid.uuid4()
+    if trace_id is None:
+      trace_id = uuid.uuid4()
     with self._endlette:
+      statistician, trace = self._endlette.commence_operation(
+          operation_id, name, trace_id)
       management = _front_operate(
           self._callback, self._work_pool, self._transmission_pool,
           self._utility_pool, self._endlette.terminal_action(operation_id),
-          operation_id, name, payload, complete, timeout, subscription,
-          trace_id)
-      self._endlette.add_operation(operation_id, management.reception)
+          statistician, trace, operation_id, name, payload, complete, timeout,
+          subscription, trace_id)
+      self._endlette.add_operation(
+          operation_id, management.reception, management.inspection)
       return _EasyOperation(
           management.emission, management.operation, management.cancellation)
 
@@ -292,8 +410,9 @@ class Front(interfaces.Front):
 
 
 def _back_operate(
-    servicer, callback, work_pool, transmission_pool, utility_pool,
-    termination_action, ticket, default_timeout, maximum_timeout):
+    servicer, callback, work_pool, method_pools, transmission_pool,
+    utility_pool, termination_action, statistician, trace, ticket,
+    default_timeout, maximum_timeout, profiling_scope):
   """Constructs objects necessary for back-side operation management.
 
   Also begins back-side operation by feeding the first received ticket into the
@@ -304,20 +423,32 @@ def _back_operate(
     callback: A callable that accepts packets.BackToFrontPackets and delivers
       them to the other side of the operation. Execution of this callable may
       take any arbitrary length of time.
-    work_pool: A thread pool in which to execute customer code.
+    work_pool: A thread pool in which to execute customer code. If a
+      scheduling_pool.SchedulingPool, the operation's ingestion of payloads
+      into customer code is scheduled by the operation's deadline in the
+      priority class named by the operation's method name.
+    method_pools: A dictionary from method name to thread pool to be used in
+      place of work_pool for the ingestion of payloads into customer code
+      during operations on that method.
     transmission_pool: A thread pool to use for transmitting to the other side
       of the operation.
     utility_pool: A thread pool for utility tasks.
     termination_action: A no-arg behavior to be called upon operation
       completion.
+    statistician: The _statistics.MethodStatistician for the operation's
+      method.
+    trace: The tracing.Trace for the operation.
     ticket: The first packets.FrontToBackPacket received for the operation.
     default_timeout: A length of time in seconds to be used as the default
       time alloted for a single operation.
     maximum_timeout: A length of time in seconds to be used as the maximum
       time alloted for a single operation.
+    profiling_scope: A value with which to qualify the method name to which
+      the work of the operation is attributed for profiling, or None.
 
   Returns:
-    The _interfaces.ReceptionManager to be used for the operation.
+    A pair of the _interfaces.ReceptionManager to be used for the operation and
+      the _inspection.OperationInspector for the operation.
   """
   lock = threading.Lock()
   with lock:
@@ -325,21 +456,34 @@ def _back_operate(
         work_pool, utility_pool, termination_action, ticket.subscription)
     transmission_manager = _transmission.back_transmission_manager(
         lock, transmission_pool, callback, ticket.operation_id,
-        termination_manager, ticket.subscription)
+        termination_manager, ticket.subscription, trace)
     operation_context = _context.OperationContext(
         lock, ticket.operation_id, packets.Kind.SERVICER_FAILURE,
         termination_manager, transmission_manager)
     emission_manager = _emission.back_emission_manager(
-        lock, termination_manager, transmission_manager)
+        lock, termination_manager, transmission_manager, statistician)
+    method_pool = method_pools.get(ticket.name, work_pool)
+    if isinstance(method_pool, scheduling_pool.SchedulingPool):
+      ingestion_pool = _ScheduledWorkPool(method_pool, ticket.name)
+    else:
+      ingestion_pool = method_pool
+    if profiling_scope is None:
+      activity = ticket.name
+    else:
+      activity = (profiling_scope, ticket.name)
     ingestion_manager = _ingestion.back_ingestion_manager(
-        lock, work_pool, servicer, termination_manager,
-        transmission_manager, operation_context, emission_manager)
+        lock, ingestion_pool, activity, servicer, termination_manager,
+        transmission_manager, operation_context, emission_manager,
+        statistician, trace)
     expiration_manager = _expiration.back_expiration_manager(
         lock, termination_manager, transmission_manager, ingestion_manager,
         ticket.timeout, default_timeout, maximum_timeout)
     reception_manager = _reception.back_reception_manager(
         lock, termination_manager, transmission_manager, ingestion_manager,
         expiration_manager)
+    inspector = _inspection.OperationInspector(
+        lock, ticket.operation_id, ticket.name, transmission_manager,
+        ingestion_manager, expiration_manager)
 
     termination_manager.set_expiration_manager(expiration_manager)
     transmission_manager.set_ingestion_and_expiration_managers(
@@ -349,10 +493,12 @@ def _back_operate(
     emission_manager.set_ingestion_manager_and_expiration_manager(
         ingestion_manager, expiration_manager)
     ingestion_manager.set_expiration_manager(expiration_manager)
+    if ingestion_pool is not method_pool:
+      ingestion_pool.set_expiration_manager(expiration_manager)
 
   reception_manager.receive_packet(ticket)
 
-  return reception_manager
+  return reception_manager, inspector
 
 
 class Back(interfaces.Back):
@@ -360,7 +506,8 @@ class Back(interfaces.Back):
 
   def __init__(
       self, servicer, work_pool, transmission_pool, utility_pool,
-      default_timeout, maximum_timeout):
+      default_timeout, maximum_timeout, method_pools=None, tracer=None,
+      queue_wait_observer=None, profiling_scope=None):
     """Constructor.
 
     Args:
@@ -373,14 +520,28 @@ class Back(interfaces.Back):
         time alloted for a single operation.
       maximum_timeout: A length of time in seconds to be used as the maximum
         time alloted for a single operation.
+      method_pools: A dictionary from method name to thread pool in which to
+        execute customer code servicing operations on that method in place of
+        work_pool, or None.
+      tracer: A tracing.Tracer with which to sample operations, or None.
+      queue_wait_observer: A callable to be called with the length of time in
+        seconds that each piece of customer code servicing an operation waited
+        to be run, or None.
+      profiling_scope: A value with which to qualify the method names to which
+        work servicing operations is attributed for profiling, or None. See
+        back for details.
     """
-    self._endlette = _Endlette(utility_pool)
+    self._endlette = _Endlette(
+        utility_pool, tracing.NULL_TRACER if tracer is None else tracer,
+        queue_wait_observer=queue_wait_observer)
     self._servicer = servicer
     self._work_pool = work_pool
+    self._method_pools = {} if method_pools is None else dict(method_pools)
     self._transmission_pool = transmission_pool
     self._utility_pool = utility_pool
     self._default_timeout = default_timeout
     self._maximum_timeout = maximum_timeout
+    self._profiling_scope = profiling_scope
     self._callback = None
 
   def join_fore_link(self, fore_link):
@@ -393,12 +554,16 @@ class Back(interfaces.Back):
     with self._endlette:
       reception_manager = self._endlette.get_operation(ticket.operation_id)
       if reception_manager is None:
-        reception_manager = _back_operate(
+        statistician, trace = self._endlette.commence_operation(
+            ticket.operation_id, ticket.name, ticket.trace_id)
+        reception_manager, inspector = _back_operate(
             self._servicer, self._callback, self._work_pool,
-            self._transmission_pool, self._utility_pool,
-            self._endlette.terminal_action(ticket.operation_id), ticket,
-            self._default_timeout, self._maximum_timeout)
-        self._endlette.add_operation(ticket.operation_id, reception_manager)
+            self._method_pools, self._transmission_pool, self._utility_pool,
+            self._endlette.terminal_action(ticket.operation_id), statistician,
+            trace, ticket, self._default_timeout, self._maximum_timeout,
+            self._profiling_scope)
+        self._endlette.add_operation(
+            ticket.operation_id, reception_manager, inspector)
       else:
         reception_manager.receive_packet(ticket)
 
@@ -406,6 +571,14 @@ class Back(interfaces.Back):
     """See base_interfaces.End.operation_stats for specification."""
     return self._endlette.operation_stats()
 
+  def operations(self):
+    """See base_interfaces.End.operations for specification."""
+    return self._endlette.operations()
+
+  def method_stats(self):
+    """See base_interfaces.End.method_stats for specification."""
+    return self._endlette.method_stats()
+
   def add_idle_action(self, action):
     """See base_interfaces.End.add_idle_action for specification."""
     self._endlette.add_idle_action(action)
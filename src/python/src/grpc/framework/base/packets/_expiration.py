@@ -29,15 +29,123 @@
 
 """State and behavior for operation expiration."""
 
+import atexit
+import heapq
+import itertools
+import threading
 import time
 
+from grpc.framework.base.packets import _constants
 from grpc.framework.base.packets import _interfaces
 from grpc.framework.base.packets import packets
-from grpc.framework.foundation import later
+from grpc.framework.foundation import callable_util
+
+
+class _Alarm(object):
+  """Calls behaviors at their due times from a single shared thread.
+
+  Scheduling an expiration through later.later would start a threading.Timer,
+  and so a thread, for every operation in progress; an _Alarm instead keeps
+  the due times of all operations in a heap served by one daemon thread.
+  """
+
+  def __init__(self):
+    self._condition = threading.Condition()
+    # Heap of (due time, sequence number, entry) triples. An entry is a
+    # one-element list holding the behavior to be called or None if the
+    # behavior has been cancelled or called.
+    self._heap = []
+    self._sequence = itertools.count()
+    self._cancelled = 0
+    self._thread = None
+    self._stopped = False
+
+  def _next(self):
+    with self._condition:
+      while True:
+        if self._stopped:
+          return None
+        elif self._heap:
+          due, unused_sequence_number, entry = self._heap[0]
+          if entry[0] is None:
+            heapq.heappop(self._heap)
+            self._cancelled -= 1
+            continue
+          delay = due - time.time()
+          if delay <= 0:
+            heapq.heappop(self._heap)
+            behavior = entry[0]
+            entry[0] = None
+            return behavior
+          self._condition.wait(delay)
+        else:
+          self._condition.wait()
+
+  def _run(self):
+    while True:
+      behavior = self._next()
+      if behavior is None:
+        return
+      callable_util.call_logging_exceptions(
+          behavior, _constants.INTERNAL_ERROR_LOG_MESSAGE)
+
+  def schedule(self, due, behavior):
+    """Schedules a behavior to be called.
+
+    Args:
+      due: The time in seconds since the epoch at which to call the behavior.
+      behavior: A callable that accepts no arguments.
+
+    Returns:
+      An opaque object to be passed to cancel to cancel the call.
+    """
+    entry = [behavior]
+    with self._condition:
+      heapq.heappush(self._heap, (due, next(self._sequence), entry))
+      if self._thread is None:
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+      self._condition.notify()
+    return entry
+
+  def cancel(self, entry):
+    """Cancels a scheduled call if it has not yet been made.
+
+    Args:
+      entry: An object returned from schedule.
+    """
+    with self._condition:
+      if entry[0] is not None:
+        entry[0] = None
+        self._cancelled += 1
+        # Cancelled entries are otherwise discarded only as they come due, so
+        # the heap is compacted once they make up most of it.
+        if len(self._heap) < 2 * self._cancelled:
+          self._heap = [item for item in self._heap if item[2][0] is not None]
+          heapq.heapify(self._heap)
+          self._cancelled = 0
+
+  def stop(self):
+    """Ceases calling behaviors and waits for the alarm's thread to exit."""
+    with self._condition:
+      self._stopped = True
+      self._condition.notify()
+      thread = self._thread
+    if thread is not None:
+      thread.join()
+
+
+_ALARM = _Alarm()
+atexit.register(_ALARM.stop)
 
 
 class _ExpirationManager(_interfaces.ExpirationManager):
   """An implementation of _interfaces.ExpirationManager."""
+  __slots__ = (
+      '_lock', '_termination_manager', '_transmission_manager',
+      '_ingestion_manager', '_commencement', '_maximum_timeout', '_timeout',
+      '_deadline', '_index', '_alarm_entry')
 
   def __init__(
       self, lock, termination_manager, transmission_manager, ingestion_manager,
@@ -67,40 +175,39 @@ class _ExpirationManager(_interfaces.ExpirationManager):
     self._timeout = timeout
     self._deadline = commencement + timeout
     self._index = None
-    self._future = None
+    self._alarm_entry = None
 
   def _expire(self, index):
     with self._lock:
-      if self._future is not None and index == self._index:
-        self._future = None
+      if self._alarm_entry is not None and index == self._index:
+        self._alarm_entry = None
         self._termination_manager.abort(packets.Kind.EXPIRATION)
         self._transmission_manager.abort(packets.Kind.EXPIRATION)
         self._ingestion_manager.abort()
 
   def start(self):
     self._index = 0
-    self._future = later.later(self._timeout, lambda: self._expire(0))
+    self._alarm_entry = _ALARM.schedule(
+        self._deadline, lambda: self._expire(0))
 
   def change_timeout(self, timeout):
-    if self._future is not None and timeout != self._timeout:
-      self._future.cancel()
+    if self._alarm_entry is not None and timeout != self._timeout:
+      _ALARM.cancel(self._alarm_entry)
       new_timeout = min(timeout, self._maximum_timeout)
       new_index = self._index + 1
       self._timeout = new_timeout
       self._deadline = self._commencement + new_timeout
       self._index = new_index
-      delay = self._deadline - time.time()
-      self._future = later.later(
-          delay, lambda: self._expire(new_index))
+      self._alarm_entry = _ALARM.schedule(
+          self._deadline, lambda: self._expire(new_index))
 
   def deadline(self):
     return self._deadline
 
   def abort(self):
-    if self._future:
-      self._future.cancel()
-      self._future = None
-    self._deadline_index = None
+    if self._alarm_entry is not None:
+      _ALARM.cancel(self._alarm_entry)
+      self._alarm_entry = None
 
 
 def front_expiration_manager(
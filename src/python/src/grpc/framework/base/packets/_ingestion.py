@@ -31,6 +31,7 @@
 
 import abc
 import collections
+import time
 
 from grpc.framework.base import exceptions
 from grpc.framework.base import interfaces
@@ -38,8 +39,11 @@ from grpc.framework.base.packets import _constants
 from grpc.framework.base.packets import _interfaces
 from grpc.framework.base.packets import packets
 from grpc.framework.foundation import abandonment
+from grpc.framework.foundation import bulkhead
 from grpc.framework.foundation import callable_util
+from grpc.framework.foundation import profiling
 from grpc.framework.foundation import stream
+from grpc.framework.foundation import tracing
 
 _CREATE_CONSUMER_EXCEPTION_LOG_MESSAGE = 'Exception initializing ingestion!'
 _CONSUME_EXCEPTION_LOG_MESSAGE = 'Exception during ingestion!'
@@ -58,10 +62,12 @@ class _ConsumerCreation(collections.namedtuple(
       due to an error on the remote side of the operation.
     abandoned: A boolean indicating that the consumer creation was abandoned.
   """
+  __slots__ = ()
 
 
 class _EmptyConsumer(stream.Consumer):
   """A no-operative stream.Consumer that ignores all inputs and calls."""
+  __slots__ = ()
 
   def consume(self, value):
     """See stream.Consumer.consume for specification."""
@@ -76,6 +82,7 @@ class _EmptyConsumer(stream.Consumer):
 class _ConsumerCreator(object):
   """Common specification of different consumer-creating behavior."""
   __metaclass__ = abc.ABCMeta
+  __slots__ = ()
 
   @abc.abstractmethod
   def create_consumer(self, requirement):
@@ -96,6 +103,7 @@ class _ConsumerCreator(object):
 
 class _FrontConsumerCreator(_ConsumerCreator):
   """A _ConsumerCreator appropriate for front-side use."""
+  __slots__ = ('_subscription', '_operation_context')
 
   def __init__(self, subscription, operation_context):
     """Constructor.
@@ -124,6 +132,7 @@ class _FrontConsumerCreator(_ConsumerCreator):
 
 class _BackConsumerCreator(_ConsumerCreator):
   """A _ConsumerCreator appropriate for back-side use."""
+  __slots__ = ('_servicer', '_operation_context', '_emission_consumer')
 
   def __init__(self, servicer, operation_context, emission_consumer):
     """Constructor.
@@ -162,6 +171,7 @@ class _BackConsumerCreator(_ConsumerCreator):
 
 class _WrappedConsumer(object):
   """Wraps a consumer to catch the exceptions that it is allowed to throw."""
+  __slots__ = ('_consumer',)
 
   def __init__(self, consumer):
     """Constructor.
@@ -204,15 +214,22 @@ class _WrappedConsumer(object):
 
 class _IngestionManager(_interfaces.IngestionManager):
   """An implementation of _interfaces.IngestionManager."""
+  __slots__ = (
+      '_lock', '_pool', '_activity', '_consumer_creator', '_failure_kind',
+      '_termination_manager', '_transmission_manager', '_expiration_manager',
+      '_statistician', '_trace', '_wrapped_ingestion_consumer',
+      '_pending_ingestion', '_ingestion_complete', '_processing', '_received')
 
   def __init__(
-      self, lock, pool, consumer_creator, failure_kind, termination_manager,
-      transmission_manager):
+      self, lock, pool, activity, consumer_creator, failure_kind,
+      termination_manager, transmission_manager, statistician, trace):
     """Constructor.
 
     Args:
       lock: The operation-wide lock.
       pool: A thread pool in which to execute customer code.
+      activity: The profiling activity to which work calling customer code
+        is attributed, derived from the name of the method of the operation.
       consumer_creator: A _ConsumerCreator wrapping the portion of customer code
         that when called returns the stream.Consumer with which the customer
         code will ingest payload values.
@@ -221,19 +238,26 @@ class _IngestionManager(_interfaces.IngestionManager):
       termination_manager: The _interfaces.TerminationManager for the operation.
       transmission_manager: The _interfaces.TransmissionManager for the
         operation.
+      statistician: The _statistics.MethodStatistician for the operation's
+        method.
+      trace: The tracing.Trace for the operation.
     """
     self._lock = lock
     self._pool = pool
+    self._activity = activity
     self._consumer_creator = consumer_creator
     self._failure_kind = failure_kind
     self._termination_manager = termination_manager
     self._transmission_manager = transmission_manager
+    self._statistician = statistician
+    self._trace = trace
     self._expiration_manager = None
 
     self._wrapped_ingestion_consumer = None
     self._pending_ingestion = []
     self._ingestion_complete = False
     self._processing = False
+    self._received = 0
 
   def set_expiration_manager(self, expiration_manager):
     self._expiration_manager = expiration_manager
@@ -248,6 +272,33 @@ class _IngestionManager(_interfaces.IngestionManager):
     self._transmission_manager.abort(outcome)
     self._expiration_manager.abort()
 
+  def _submit(self, behavior, *args):
+    """Submits customer-code-calling work to this object's pool.
+
+    If the pool is a saturated bulkhead.Bulkhead the operation is aborted.
+
+    Args:
+      behavior: The work to be done.
+      *args: Arguments to be passed to the behavior.
+    """
+    try:
+      self._pool.submit(self._run, time.time(), behavior, *args)
+    except bulkhead.Saturated:
+      self._abort_and_notify(self._failure_kind)
+    else:
+      self._processing = True
+
+  def _run(self, submission_time, behavior, *args):
+    run_time = time.time()
+    self._statistician.wait(run_time - submission_time)
+    if self._trace.sampled:
+      self._trace.record(
+          tracing.Stage.INGESTION_QUEUE, submission_time, run_time)
+    profiling.attribute(self._activity)
+    callable_util.call_logging_exceptions(
+        behavior, _constants.INTERNAL_ERROR_LOG_MESSAGE, *args)
+    profiling.unattribute()
+
   def _next(self):
     """Computes the next step for ingestion.
 
@@ -281,9 +332,18 @@ class _IngestionManager(_interfaces.IngestionManager):
         has concluded.
     """
     while True:
+      consumption_start_time = time.time()
       consumption_outcome = callable_util.call_logging_exceptions(
           wrapped_ingestion_consumer.moar, _CONSUME_EXCEPTION_LOG_MESSAGE,
           payload, complete)
+      consumption_end_time = time.time()
+      self._statistician.ingest(
+          consumption_end_time - consumption_start_time,
+          0 if payload is None else 1)
+      if self._trace.sampled:
+        self._trace.record(
+            tracing.Stage.HANDLER, consumption_start_time,
+            consumption_end_time)
       if consumption_outcome.exception is None:
         if consumption_outcome.return_value:
           with self._lock:
@@ -311,9 +371,15 @@ class _IngestionManager(_interfaces.IngestionManager):
   def start(self, requirement):
     if self._pending_ingestion is not None:
       def initialize():
+        creation_start_time = time.time()
         consumer_creation_outcome = callable_util.call_logging_exceptions(
             self._consumer_creator.create_consumer,
             _CREATE_CONSUMER_EXCEPTION_LOG_MESSAGE, requirement)
+        creation_end_time = time.time()
+        self._statistician.ingest(creation_end_time - creation_start_time, 0)
+        if self._trace.sampled:
+          self._trace.record(
+              tracing.Stage.HANDLER, creation_start_time, creation_end_time)
         if consumer_creation_outcome.return_value is None:
           with self._lock:
             self._abort_and_notify(self._failure_kind)
@@ -339,23 +405,18 @@ class _IngestionManager(_interfaces.IngestionManager):
 
           self._process(wrapped_ingestion_consumer, payload, complete)
 
-      self._pool.submit(
-          callable_util.with_exceptions_logged(
-              initialize, _constants.INTERNAL_ERROR_LOG_MESSAGE))
-      self._processing = True
+      self._submit(initialize)
 
   def consume(self, payload):
+    self._received += 1
     if self._ingestion_complete:
       self._abort_and_notify(self._failure_kind)
     elif self._pending_ingestion is not None:
       if self._processing:
         self._pending_ingestion.append(payload)
       else:
-        self._pool.submit(
-            callable_util.with_exceptions_logged(
-                self._process, _constants.INTERNAL_ERROR_LOG_MESSAGE),
-            self._wrapped_ingestion_consumer, payload, False)
-        self._processing = True
+        self._submit(
+            self._process, self._wrapped_ingestion_consumer, payload, False)
 
   def terminate(self):
     if self._ingestion_complete:
@@ -363,13 +424,11 @@ class _IngestionManager(_interfaces.IngestionManager):
     else:
       self._ingestion_complete = True
       if self._pending_ingestion is not None and not self._processing:
-        self._pool.submit(
-            callable_util.with_exceptions_logged(
-                self._process, _constants.INTERNAL_ERROR_LOG_MESSAGE),
-            self._wrapped_ingestion_consumer, None, True)
-        self._processing = True
+        self._submit(
+            self._process, self._wrapped_ingestion_consumer, None, True)
 
   def consume_and_terminate(self, payload):
+    self._received += 1
     if self._ingestion_complete:
       self._abort_and_notify(self._failure_kind)
     else:
@@ -378,62 +437,76 @@ class _IngestionManager(_interfaces.IngestionManager):
         if self._processing:
           self._pending_ingestion.append(payload)
         else:
-          self._pool.submit(
-              callable_util.with_exceptions_logged(
-                  self._process, _constants.INTERNAL_ERROR_LOG_MESSAGE),
-              self._wrapped_ingestion_consumer, payload, True)
-          self._processing = True
+          self._submit(
+              self._process, self._wrapped_ingestion_consumer, payload, True)
 
   def abort(self):
     """See _interfaces.IngestionManager.abort for specification."""
     self._abort_internal_only()
 
+  def inspect(self):
+    """See _interfaces.IngestionManager.inspect for specification."""
+    backlog = (
+        0 if self._pending_ingestion is None else len(self._pending_ingestion))
+    return self._received, backlog, self._processing
+
 
 def front_ingestion_manager(
-    lock, pool, subscription, termination_manager, transmission_manager,
-    operation_context):
+    lock, pool, name, subscription, termination_manager, transmission_manager,
+    operation_context, statistician, trace):
   """Creates an IngestionManager appropriate for front-side use.
 
   Args:
     lock: The operation-wide lock.
     pool: A thread pool in which to execute customer code.
+    name: The name of the method of the operation.
     subscription: A base_interfaces.ServicedSubscription indicating the
       customer's interest in the results of the operation.
     termination_manager: The _interfaces.TerminationManager for the operation.
     transmission_manager: The _interfaces.TransmissionManager for the
       operation.
     operation_context: A base_interfaces.OperationContext for the operation.
+    statistician: The _statistics.MethodStatistician for the operation's
+      method.
+    trace: The tracing.Trace for the operation.
 
   Returns:
     An IngestionManager appropriate for front-side use.
   """
   ingestion_manager = _IngestionManager(
-      lock, pool, _FrontConsumerCreator(subscription, operation_context),
-      packets.Kind.SERVICED_FAILURE, termination_manager, transmission_manager)
+      lock, pool, name, _FrontConsumerCreator(subscription, operation_context),
+      packets.Kind.SERVICED_FAILURE, termination_manager, transmission_manager,
+      statistician, trace)
   ingestion_manager.start(None)
   return ingestion_manager
 
 
 def back_ingestion_manager(
-    lock, pool, servicer, termination_manager, transmission_manager,
-    operation_context, emission_consumer):
+    lock, pool, activity, servicer, termination_manager, transmission_manager,
+    operation_context, emission_consumer, statistician, trace):
   """Creates an IngestionManager appropriate for back-side use.
 
   Args:
     lock: The operation-wide lock.
     pool: A thread pool in which to execute customer code.
+    activity: The profiling activity to which work calling customer code is
+      attributed, derived from the name of the method of the operation.
     servicer: A base_interfaces.Servicer for servicing the operation.
     termination_manager: The _interfaces.TerminationManager for the operation.
     transmission_manager: The _interfaces.TransmissionManager for the
       operation.
     operation_context: A base_interfaces.OperationContext for the operation.
     emission_consumer: The _interfaces.EmissionConsumer for the operation.
+    statistician: The _statistics.MethodStatistician for the operation's
+      method.
+    trace: The tracing.Trace for the operation.
 
   Returns:
     An IngestionManager appropriate for back-side use.
   """
   ingestion_manager = _IngestionManager(
-      lock, pool, _BackConsumerCreator(
+      lock, pool, activity, _BackConsumerCreator(
           servicer, operation_context, emission_consumer),
-      packets.Kind.SERVICER_FAILURE, termination_manager, transmission_manager)
+      packets.Kind.SERVICER_FAILURE, termination_manager, transmission_manager,
+      statistician, trace)
   return ingestion_manager
@@ -0,0 +1,96 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Inspection of operations in progress."""
+
+import collections
+
+from grpc.framework.base import interfaces
+
+
+class _EasyOperationSnapshot(
+    interfaces.OperationSnapshot,
+    collections.namedtuple(
+        '_EasyOperationSnapshot',
+        ('operation_id', 'name', 'age', 'time_remaining', 'payloads_received',
+         'payloads_emitted', 'ingestion_backlog', 'ingesting',
+         'transmission_backlog', 'transmitting'))):
+  """A trivial implementation of interfaces.OperationSnapshot."""
+
+
+class OperationInspector(object):
+  """Describes the state of a single operation in progress.
+
+  OperationInspectors are thread-safe.
+  """
+  __slots__ = (
+      '_lock', '_operation_id', '_name', '_transmission_manager',
+      '_ingestion_manager', '_expiration_manager')
+
+  def __init__(
+      self, lock, operation_id, name, transmission_manager, ingestion_manager,
+      expiration_manager):
+    """Constructor.
+
+    Args:
+      lock: The operation-wide lock.
+      operation_id: The operation's ID.
+      name: The name of the method of the operation.
+      transmission_manager: The _interfaces.TransmissionManager for the
+        operation.
+      ingestion_manager: The _interfaces.IngestionManager for the operation.
+      expiration_manager: The _interfaces.ExpirationManager for the operation.
+    """
+    self._lock = lock
+    self._operation_id = operation_id
+    self._name = name
+    self._transmission_manager = transmission_manager
+    self._ingestion_manager = ingestion_manager
+    self._expiration_manager = expiration_manager
+
+  def snapshot(self, commencement, now):
+    """Takes a snapshot of the operation.
+
+    Args:
+      commencement: The time in seconds since the epoch at which the operation
+        commenced.
+      now: The time in seconds since the epoch at which the snapshot is taken.
+
+    Returns:
+      An interfaces.OperationSnapshot.
+    """
+    with self._lock:
+      emitted, transmission_backlog, transmitting = (
+          self._transmission_manager.inspect())
+      received, ingestion_backlog, ingesting = self._ingestion_manager.inspect()
+      deadline = self._expiration_manager.deadline()
+    return _EasyOperationSnapshot(
+        self._operation_id, self._name, now - commencement,
+        max(0, deadline - now), received, emitted, ingestion_backlog,
+        ingesting, transmission_backlog, transmitting)
@@ -40,6 +40,7 @@ from grpc.framework.foundation import stream
 class TerminationManager(object):
   """An object responsible for handling the termination of an operation."""
   __metaclass__ = abc.ABCMeta
+  __slots__ = ()
 
   @abc.abstractmethod
   def set_expiration_manager(self, expiration_manager):
@@ -95,6 +96,7 @@ class TerminationManager(object):
 class TransmissionManager(object):
   """A manager responsible for transmitting to the other end of an operation."""
   __metaclass__ = abc.ABCMeta
+  __slots__ = ()
 
   @abc.abstractmethod
   def inmit(self, emission, complete):
@@ -117,10 +119,22 @@ class TransmissionManager(object):
     """
     raise NotImplementedError()
 
+  @abc.abstractmethod
+  def inspect(self):
+    """Describes the progress of transmission.
+
+    Returns:
+      A (emitted, backlog, transmitting) triple of the number of customer
+        values accepted for transmission, the number of those values waiting to
+        be transmitted, and whether or not transmission is underway.
+    """
+    raise NotImplementedError()
+
 
 class EmissionManager(stream.Consumer):
   """A manager of values emitted by customer code."""
   __metaclass__ = abc.ABCMeta
+  __slots__ = ()
 
   @abc.abstractmethod
   def set_ingestion_manager_and_expiration_manager(
@@ -170,6 +184,7 @@ class EmissionManager(stream.Consumer):
 class IngestionManager(stream.Consumer):
   """A manager responsible for executing customer code."""
   __metaclass__ = abc.ABCMeta
+  __slots__ = ()
 
   @abc.abstractmethod
   def set_expiration_manager(self, expiration_manager):
@@ -214,10 +229,23 @@ class IngestionManager(stream.Consumer):
     """Indicates to this manager that the operation has aborted."""
     raise NotImplementedError()
 
+  @abc.abstractmethod
+  def inspect(self):
+    """Describes the progress of ingestion.
+
+    Returns:
+      A (received, backlog, ingesting) triple of the number of
+        customer-significant values accepted for supply to customer code, the
+        number of those values waiting to be supplied, and whether or not work
+        calling customer code is underway or waiting to be run.
+    """
+    raise NotImplementedError()
+
 
 class ExpirationManager(object):
   """A manager responsible for aborting the operation if it runs out of time."""
   __metaclass__ = abc.ABCMeta
+  __slots__ = ()
 
   @abc.abstractmethod
   def change_timeout(self, timeout):
@@ -250,6 +278,7 @@ class ExpirationManager(object):
 class ReceptionManager(object):
   """A manager responsible for receiving packets from the other end."""
   __metaclass__ = abc.ABCMeta
+  __slots__ = ()
 
   @abc.abstractmethod
   def receive_packet(self, packet):
@@ -265,6 +294,7 @@ class ReceptionManager(object):
 class CancellationManager(object):
   """A manager of operation cancellation."""
   __metaclass__ = abc.ABCMeta
+  __slots__ = ()
 
   @abc.abstractmethod
   def cancel(self):
@@ -38,6 +38,7 @@ from grpc.framework.base.packets import packets
 class _Receiver(object):
   """Common specification of different packet-handling behavior."""
   __metaclass__ = abc.ABCMeta
+  __slots__ = ()
 
   @abc.abstractmethod
   def abort_if_abortive(self, packet):
@@ -120,6 +121,9 @@ def _reception_failure(
 
 class _BackReceiver(_Receiver):
   """Packet-handling specific to the back side of an operation."""
+  __slots__ = (
+      '_termination_manager', '_transmission_manager', '_ingestion_manager',
+      '_expiration_manager', '_first_packet_seen', '_last_packet_seen')
 
   def __init__(
       self, termination_manager, transmission_manager, ingestion_manager,
@@ -210,6 +214,9 @@ class _BackReceiver(_Receiver):
 
 class _FrontReceiver(_Receiver):
   """Packet-handling specific to the front side of an operation."""
+  __slots__ = (
+      '_termination_manager', '_transmission_manager', '_ingestion_manager',
+      '_expiration_manager', '_last_packet_seen')
 
   def __init__(
       self, termination_manager, transmission_manager, ingestion_manager,
@@ -278,6 +285,9 @@ class _FrontReceiver(_Receiver):
 
 class _ReceptionManager(_interfaces.ReceptionManager):
   """A ReceptionManager based around a _Receiver passed to it."""
+  __slots__ = (
+      '_lock', '_receiver', '_lowest_unseen_sequence_number',
+      '_out_of_sequence_packets', '_completed_sequence_number', '_aborted')
 
   def __init__(self, lock, receiver):
     """Constructor.
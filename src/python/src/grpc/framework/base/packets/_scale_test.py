@@ -0,0 +1,119 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Scale tests of idle operations through packets-based Fronts and Backs."""
+
+import gc
+import sys
+import threading
+import time
+import unittest
+
+from grpc.framework.base import interfaces_test_case
+from grpc.framework.base import util
+from grpc.framework.base.packets import implementations
+from grpc.framework.foundation import logging_pool
+from grpc.framework.foundation import stream_testing
+
+_POOL_MAX_WORKERS = 4
+_POOL_COUNT = 7
+_TIMEOUT = 60
+_IDLE_OPERATIONS = 1000
+# The most bytes of garbage-collector-tracked objects that may be retained
+# across the Front and the Back for each idle operation. Strings, numbers and
+# other untracked objects are not counted.
+_BYTES_PER_IDLE_OPERATION_BUDGET = 16 * 1024
+
+
+def _retained_objects(before):
+  gc.collect()
+  return [obj for obj in gc.get_objects() if id(obj) not in before]
+
+
+class IdleOperationsTest(unittest.TestCase):
+
+  def setUp(self):
+    self.pools = [
+        logging_pool.pool(_POOL_MAX_WORKERS) for _ in range(_POOL_COUNT)]
+    (front_work_pool, front_transmission_pool, front_utility_pool,
+     back_work_pool, back_transmission_pool, back_utility_pool,
+     test_pool) = self.pools
+    self.front = implementations.front(
+        front_work_pool, front_transmission_pool, front_utility_pool)
+    self.back = implementations.back(
+        interfaces_test_case.TestServicer(test_pool), back_work_pool,
+        back_transmission_pool, back_utility_pool, _TIMEOUT, _TIMEOUT)
+    self.front.join_rear_link(self.back)
+    self.back.join_fore_link(self.front)
+
+  def tearDown(self):
+    util.wait_for_idle(self.back)
+    util.wait_for_idle(self.front)
+    for pool in self.pools:
+      pool.shutdown(wait=True)
+
+  def _operate(self):
+    subscription = util.full_serviced_subscription(
+        interfaces_test_case.EasyServicedIngestor(
+            stream_testing.TestConsumer()))
+    return self.front.operate(
+        interfaces_test_case.SYNCHRONOUS_ECHO, None, False, _TIMEOUT,
+        subscription, None)
+
+  def _open_idle_operations(self, count):
+    operations = [self._operate() for _ in range(count)]
+    while len(self.back.operations()) < count:
+      time.sleep(interfaces_test_case.TICK)
+    return operations
+
+  def testIdleOperations(self):
+    # One operation is made first so that objects created once per Front and
+    # Back are not attributed to the measured operations.
+    self._operate().cancel()
+    util.wait_for_idle(self.back)
+    util.wait_for_idle(self.front)
+    gc.collect()
+    before = set(id(obj) for obj in gc.get_objects())
+    threads_before = threading.active_count()
+
+    operations = self._open_idle_operations(_IDLE_OPERATIONS)
+    thread_growth = threading.active_count() - threads_before
+    retained_bytes = sum(
+        sys.getsizeof(obj) for obj in _retained_objects(before))
+    for operation in operations:
+      operation.cancel()
+
+    self.assertLessEqual(thread_growth, _POOL_MAX_WORKERS * _POOL_COUNT + 1)
+    self.assertLess(
+        retained_bytes / float(_IDLE_OPERATIONS),
+        _BYTES_PER_IDLE_OPERATION_BUDGET)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,127 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Per-method statistics recorded during operations."""
+
+import collections
+import threading
+
+from grpc.framework.base import interfaces
+from grpc.framework.foundation import histogram
+
+
+class _EasyMethodStatistics(
+    interfaces.MethodStatistics,
+    collections.namedtuple(
+        '_EasyMethodStatistics',
+        ('in_flight', 'commenced', 'latency', 'queue_wait', 'servicer_time',
+         'payloads_ingested', 'payloads_emitted'))):
+  """A trivial implementation of interfaces.MethodStatistics."""
+
+
+class MethodStatistician(object):
+  """Records statistics about the operations of a single method.
+
+  MethodStatisticians are thread-safe and are shared among all the operations
+  of their method at an End.
+  """
+
+  def __init__(self, wait_observer=None):
+    """Constructor.
+
+    Args:
+      wait_observer: A callable to be called with each queue wait recorded by
+        this object, or None.
+    """
+    self._lock = threading.Lock()
+    self._wait_observer = wait_observer
+    self._in_flight = 0
+    self._commenced = 0
+    self._latency = histogram.Histogram()
+    self._queue_wait = histogram.Histogram()
+    self._servicer_time = histogram.Histogram()
+    self._payloads_ingested = 0
+    self._payloads_emitted = 0
+
+  def commence(self):
+    """Records the commencement of an operation."""
+    with self._lock:
+      self._in_flight += 1
+      self._commenced += 1
+
+  def terminate(self, latency):
+    """Records the termination of an operation.
+
+    Args:
+      latency: The length of time in seconds from the operation's commencement
+        to its termination.
+    """
+    with self._lock:
+      self._in_flight -= 1
+      self._latency.record(latency)
+
+  def wait(self, queue_wait):
+    """Records work calling customer code being started in a thread pool.
+
+    Args:
+      queue_wait: The length of time in seconds for which the work waited to be
+        run.
+    """
+    with self._lock:
+      self._queue_wait.record(queue_wait)
+    if self._wait_observer is not None:
+      self._wait_observer(queue_wait)
+
+  def ingest(self, servicer_time, payload_count):
+    """Records a call into customer code.
+
+    Args:
+      servicer_time: The length of time in seconds spent in customer code.
+      payload_count: The number of payloads passed into customer code.
+    """
+    with self._lock:
+      self._servicer_time.record(servicer_time)
+      self._payloads_ingested += payload_count
+
+  def emit(self):
+    """Records a payload being passed out of customer code."""
+    with self._lock:
+      self._payloads_emitted += 1
+
+  def snapshot(self):
+    """Takes a snapshot of the statistics recorded so far.
+
+    Returns:
+      An interfaces.MethodStatistics.
+    """
+    with self._lock:
+      return _EasyMethodStatistics(
+          self._in_flight, self._commenced, self._latency.snapshot(),
+          self._queue_wait.snapshot(), self._servicer_time.snapshot(),
+          self._payloads_ingested, self._payloads_emitted)
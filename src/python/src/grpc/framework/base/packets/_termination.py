@@ -67,6 +67,10 @@ _LISTENING_REQUIREMENTS = (
 
 class _TerminationManager(_interfaces.TerminationManager):
   """An implementation of _interfaces.TerminationManager."""
+  __slots__ = (
+      '_work_pool', '_utility_pool', '_action', '_local_failure',
+      '_has_locally_failed', '_expiration_manager', '_outstanding_requirements',
+      '_kind', '_callbacks')
 
   def __init__(
       self, work_pool, utility_pool, action, requirements, local_failure):
@@ -169,8 +173,6 @@ class _TerminationManager(_interfaces.TerminationManager):
 
   def abort(self, kind):
     """See _interfaces.TerminationManager.abort for specification."""
-    if kind == self._local_failure:
-      self._has_failed_locally = True
     if self._outstanding_requirements is not None:
       self._terminate(kind)
 
@@ -30,12 +30,14 @@
 """State and behavior for packet transmission during an operation."""
 
 import abc
+import time
 
 from grpc.framework.base import interfaces
 from grpc.framework.base.packets import _constants
 from grpc.framework.base.packets import _interfaces
 from grpc.framework.base.packets import packets
 from grpc.framework.foundation import callable_util
+from grpc.framework.foundation import tracing
 
 _TRANSMISSION_EXCEPTION_LOG_MESSAGE = 'Exception during transmission!'
 
@@ -51,6 +53,7 @@ _BACK_TO_FRONT_NO_TRANSMISSION_KINDS = (
 class _Packetizer(object):
   """Common specification of different packet-creating behavior."""
   __metaclass__ = abc.ABCMeta
+  __slots__ = ()
 
   @abc.abstractmethod
   def packetize(self, operation_id, sequence_number, payload, complete):
@@ -90,6 +93,7 @@ class _Packetizer(object):
 
 class _FrontPacketizer(_Packetizer):
   """Front-side packet-creating behavior."""
+  __slots__ = ('_name', '_subscription_kind', '_trace_id', '_timeout')
 
   def __init__(self, name, subscription_kind, trace_id, timeout):
     """Constructor.
@@ -133,6 +137,7 @@ class _FrontPacketizer(_Packetizer):
 
 class _BackPacketizer(_Packetizer):
   """Back-side packet-creating behavior."""
+  __slots__ = ()
 
   def packetize(self, operation_id, sequence_number, payload, complete):
     """See _Packetizer.packetize for specification."""
@@ -153,6 +158,7 @@ class _BackPacketizer(_Packetizer):
 class TransmissionManager(_interfaces.TransmissionManager):
   """A _interfaces.TransmissionManager on which other managers may be set."""
   __metaclass__ = abc.ABCMeta
+  __slots__ = ()
 
   @abc.abstractmethod
   def set_ingestion_and_expiration_managers(
@@ -170,6 +176,7 @@ class TransmissionManager(_interfaces.TransmissionManager):
 
 class _EmptyTransmissionManager(TransmissionManager):
   """A completely no-operative _interfaces.TransmissionManager."""
+  __slots__ = ()
 
   def set_ingestion_and_expiration_managers(
       self, ingestion_manager, expiration_manager):
@@ -181,13 +188,22 @@ class _EmptyTransmissionManager(TransmissionManager):
   def abort(self, category):
     """See _interfaces.TransmissionManager.abort for specification."""
 
+  def inspect(self):
+    """See _interfaces.TransmissionManager.inspect for specification."""
+    return 0, 0, False
+
 
 class _TransmittingTransmissionManager(TransmissionManager):
   """A TransmissionManager implementation that sends packets."""
+  __slots__ = (
+      '_lock', '_pool', '_callback', '_operation_id', '_packetizer',
+      '_termination_manager', '_trace', '_ingestion_manager',
+      '_expiration_manager', '_emissions', '_emission_complete', '_kind',
+      '_lowest_unused_sequence_number', '_transmitting', '_emitted')
 
   def __init__(
       self, lock, pool, callback, operation_id, packetizer,
-      termination_manager):
+      termination_manager, trace):
     """Constructor.
 
     Args:
@@ -200,6 +216,7 @@ class _TransmittingTransmissionManager(TransmissionManager):
       packetizer: A _Packetizer for packet creation.
       termination_manager: The _interfaces.TerminationManager associated with
         this operation.
+      trace: The tracing.Trace for the operation.
     """
     self._lock = lock
     self._pool = pool
@@ -207,6 +224,7 @@ class _TransmittingTransmissionManager(TransmissionManager):
     self._operation_id = operation_id
     self._packetizer = packetizer
     self._termination_manager = termination_manager
+    self._trace = trace
     self._ingestion_manager = None
     self._expiration_manager = None
 
@@ -215,6 +233,7 @@ class _TransmittingTransmissionManager(TransmissionManager):
     self._kind = None
     self._lowest_unused_sequence_number = 0
     self._transmitting = False
+    self._emitted = 0
 
   def set_ingestion_and_expiration_managers(
       self, ingestion_manager, expiration_manager):
@@ -288,10 +307,19 @@ class _TransmittingTransmissionManager(TransmissionManager):
     Args:
       packet: A packet to be sent to the other side of the operation.
     """
-    def transmit(packet):
+    def transmit(submission_time, packet):
+      trace = self._trace
+      if trace.sampled:
+        trace.record(
+            tracing.Stage.TRANSMISSION_QUEUE, submission_time, time.time())
       while True:
+        if trace.sampled:
+          transmission_start_time = time.time()
         transmission_outcome = callable_util.call_logging_exceptions(
             self._callback, _TRANSMISSION_EXCEPTION_LOG_MESSAGE, packet)
+        if trace.sampled:
+          trace.record(
+              tracing.Stage.TRANSMISSION, transmission_start_time, time.time())
         if transmission_outcome.exception is None:
           with self._lock:
             complete, packet = self._next_packet()
@@ -309,13 +337,17 @@ class _TransmittingTransmissionManager(TransmissionManager):
             self._transmitting = False
             return
 
-    self._pool.submit(callable_util.with_exceptions_logged(
-        transmit, _constants.INTERNAL_ERROR_LOG_MESSAGE), packet)
+    self._pool.submit(
+        callable_util.with_exceptions_logged(
+            transmit, _constants.INTERNAL_ERROR_LOG_MESSAGE),
+        time.time() if self._trace.sampled else None, packet)
     self._transmitting = True
 
   def inmit(self, emission, complete):
     """See _interfaces.TransmissionManager.inmit for specification."""
     if self._emissions is not None and self._kind is None:
+      if emission is not None:
+        self._emitted += 1
       self._emission_complete = complete
       if self._transmitting:
         self._emissions.append(emission)
@@ -332,10 +364,15 @@ class _TransmittingTransmissionManager(TransmissionManager):
         if packet is not None:
           self._transmit(packet)
 
+  def inspect(self):
+    """See _interfaces.TransmissionManager.inspect for specification."""
+    backlog = 0 if self._emissions is None else len(self._emissions)
+    return self._emitted, backlog, self._transmitting
+
 
 def front_transmission_manager(
     lock, pool, callback, operation_id, name, subscription_kind, trace_id,
-    timeout, termination_manager):
+    timeout, termination_manager, trace):
   """Creates a TransmissionManager appropriate for front-side use.
 
   Args:
@@ -353,6 +390,7 @@ def front_transmission_manager(
     timeout: A length of time in seconds to allow for the entire operation.
     termination_manager: The _interfaces.TerminationManager associated with
       this operation.
+    trace: The tracing.Trace for the operation.
 
   Returns:
     A TransmissionManager appropriate for front-side use.
@@ -360,12 +398,12 @@ def front_transmission_manager(
   return _TransmittingTransmissionManager(
       lock, pool, callback, operation_id, _FrontPacketizer(
           name, subscription_kind, trace_id, timeout),
-      termination_manager)
+      termination_manager, trace)
 
 
 def back_transmission_manager(
     lock, pool, callback, operation_id, termination_manager,
-    subscription_kind):
+    subscription_kind, trace):
   """Creates a TransmissionManager appropriate for back-side use.
 
   Args:
@@ -379,6 +417,7 @@ def back_transmission_manager(
       this operation.
     subscription_kind: An interfaces.ServicedSubscription.Kind value
       describing the interest the front has in packets sent from the back.
+    trace: The tracing.Trace for the operation.
 
   Returns:
     A TransmissionManager appropriate for back-side use.
@@ -388,4 +427,4 @@ def back_transmission_manager(
   else:
     return _TransmittingTransmissionManager(
         lock, pool, callback, operation_id, _BackPacketizer(),
-        termination_manager)
+        termination_manager, trace)
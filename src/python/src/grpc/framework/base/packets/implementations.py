@@ -34,7 +34,7 @@ from grpc.framework.base.packets import _ends
 from grpc.framework.base.packets import interfaces  # pylint: disable=unused-import
 
 
-def front(work_pool, transmission_pool, utility_pool):
+def front(work_pool, transmission_pool, utility_pool, tracer=None):
   """Factory function for creating interfaces.Fronts.
 
   Args:
@@ -44,22 +44,28 @@ def front(work_pool, transmission_pool, utility_pool):
       for transmitting values to some Back object.
     utility_pool: A thread pool to be used within the created Front object for
       utility tasks.
+    tracer: A tracing.Tracer with which to sample operations and record the
+      timing of their stages, or None.
 
   Returns:
     An interfaces.Front.
   """
-  return _ends.Front(work_pool, transmission_pool, utility_pool)
+  return _ends.Front(work_pool, transmission_pool, utility_pool, tracer=tracer)
 
 
 def back(
     servicer, work_pool, transmission_pool, utility_pool, default_timeout,
-    maximum_timeout):
+    maximum_timeout, method_pools=None, tracer=None, queue_wait_observer=None,
+    profiling_scope=None):
   """Factory function for creating interfaces.Backs.
 
   Args:
     servicer: An interfaces.Servicer for servicing operations.
     work_pool: A thread pool to be used for doing work within the created Back
-      object.
+      object. If a scheduling_pool.SchedulingPool, customer code servicing each
+      operation is run in order of the operation's deadline and in the
+      priority class named by the operation's method name, and is dropped if
+      the operation's deadline passes while the work is waiting to be run.
     transmission_pool: A thread pool to be used within the created Back object
       for transmitting values to some Front object.
     utility_pool: A thread pool to be used within the created Back object for
@@ -68,10 +74,25 @@ def back(
       time alloted for a single operation.
     maximum_timeout: A length of time in seconds to be used as the maximum
       time alloted for a single operation.
+    method_pools: A dictionary from method name to thread pool to be used in
+      place of work_pool for customer code servicing operations on that
+      method, or None. A pool that is a bulkhead.Bulkhead and that refuses
+      work causes the operation for which the work was submitted to fail.
+    tracer: A tracing.Tracer with which to sample operations and record the
+      timing of their stages, or None.
+    queue_wait_observer: A callable to be called (in whatever thread runs the
+      work) with the length of time in seconds that each piece of customer code
+      servicing an operation waited in its thread pool to be run, or None.
+    profiling_scope: A value with which to qualify the method names to which
+      the work of customer code is attributed for profiling, so that the work
+      of distinct Backs may be told apart, or None. Work is attributed to the
+      pair of this value and the method name if given and to the method name
+      alone if None.
 
   Returns:
     An interfaces.Back.
   """
   return _ends.Back(
       servicer, work_pool, transmission_pool, utility_pool, default_timeout,
-      maximum_timeout)
+      maximum_timeout, method_pools=method_pools, tracer=tracer,
+      queue_wait_observer=queue_wait_observer, profiling_scope=profiling_scope)
@@ -29,12 +29,18 @@
 
 """Tests for _framework.base.packets.implementations."""
 
+import time
 import unittest
+import uuid
 
 from grpc.framework.base import interfaces_test_case
 from grpc.framework.base import util
 from grpc.framework.base.packets import implementations
 from grpc.framework.foundation import logging_pool
+from grpc.framework.foundation import profiling
+from grpc.framework.foundation import scheduling_pool
+from grpc.framework.foundation import stream_testing
+from grpc.framework.foundation import tracing
 
 POOL_MAX_WORKERS = 100
 DEFAULT_TIMEOUT = 30
@@ -44,22 +50,31 @@ MAXIMUM_TIMEOUT = 60
 class ImplementationsTest(
     interfaces_test_case.FrontAndBackTest, unittest.TestCase):
 
+  def create_back_work_pool(self):
+    return logging_pool.pool(POOL_MAX_WORKERS)
+
+  def create_tracer(self):
+    return None
+
   def setUp(self):
     self.memory_transmission_pool = logging_pool.pool(POOL_MAX_WORKERS)
     self.front_work_pool = logging_pool.pool(POOL_MAX_WORKERS)
     self.front_transmission_pool = logging_pool.pool(POOL_MAX_WORKERS)
     self.front_utility_pool = logging_pool.pool(POOL_MAX_WORKERS)
-    self.back_work_pool = logging_pool.pool(POOL_MAX_WORKERS)
+    self.back_work_pool = self.create_back_work_pool()
     self.back_transmission_pool = logging_pool.pool(POOL_MAX_WORKERS)
     self.back_utility_pool = logging_pool.pool(POOL_MAX_WORKERS)
     self.test_pool = logging_pool.pool(POOL_MAX_WORKERS)
     self.test_servicer = interfaces_test_case.TestServicer(self.test_pool)
+    self.tracer = self.create_tracer()
+    self.queue_waits = []
     self.front = implementations.front(
         self.front_work_pool, self.front_transmission_pool,
-        self.front_utility_pool)
+        self.front_utility_pool, tracer=self.tracer)
     self.back = implementations.back(
         self.test_servicer, self.back_work_pool, self.back_transmission_pool,
-        self.back_utility_pool, DEFAULT_TIMEOUT, MAXIMUM_TIMEOUT)
+        self.back_utility_pool, DEFAULT_TIMEOUT, MAXIMUM_TIMEOUT,
+        tracer=self.tracer, queue_wait_observer=self.queue_waits.append)
     self.front.join_rear_link(self.back)
     self.back.join_fore_link(self.front)
 
@@ -75,6 +90,92 @@ class ImplementationsTest(
     self.back_utility_pool.shutdown(wait=True)
     self.test_pool.shutdown(wait=True)
 
+  def testProfiledMethodAttribution(self):
+    test_consumer = stream_testing.TestConsumer()
+    subscription = util.full_serviced_subscription(
+        interfaces_test_case.EasyServicedIngestor(test_consumer))
+
+    operation = self.front.operate(
+        interfaces_test_case.WAIT_ON_CONDITION, 'test payload', False,
+        interfaces_test_case.SMALL_TIMEOUT, subscription, 'test trace ID')
+    while not self.back.operations():
+      time.sleep(interfaces_test_case.TICK)
+    samples = profiling.profile(interfaces_test_case.TICK)
+    self.test_servicer.release()
+    operation.consumer.terminate()
+
+    stacks = samples[interfaces_test_case.WAIT_ON_CONDITION]
+    self.assertTrue(any('service' in stack for stack in stacks))
+
+  def testQueueWaitsObserved(self):
+    test_consumer = stream_testing.TestConsumer()
+    subscription = util.full_serviced_subscription(
+        interfaces_test_case.EasyServicedIngestor(test_consumer))
+
+    self.front.operate(
+        interfaces_test_case.SYNCHRONOUS_ECHO, 'test payload', True,
+        interfaces_test_case.SMALL_TIMEOUT, subscription, None)
+    util.wait_for_idle(self.front)
+    util.wait_for_idle(self.back)
+
+    self.assertTrue(self.queue_waits)
+    for queue_wait in self.queue_waits:
+      self.assertLessEqual(0, queue_wait)
+      self.assertLess(queue_wait, interfaces_test_case.SMALL_TIMEOUT)
+
+
+class SchedulingImplementationsTest(ImplementationsTest):
+
+  def create_back_work_pool(self):
+    return scheduling_pool.pool(POOL_MAX_WORKERS)
+
+
+class TracedImplementationsTest(ImplementationsTest):
+
+  def create_tracer(self):
+    return tracing.tracer(1.0)
+
+  def testSpans(self):
+    test_trace_id = 'test trace ID'
+    test_consumer = stream_testing.TestConsumer()
+    subscription = util.full_serviced_subscription(
+        interfaces_test_case.EasyServicedIngestor(test_consumer))
+
+    self.front.operate(
+        interfaces_test_case.ASYNCHRONOUS_ECHO, 'test payload', True,
+        interfaces_test_case.SMALL_TIMEOUT, subscription, test_trace_id)
+    util.wait_for_idle(self.front)
+    util.wait_for_idle(self.back)
+    spans = self.tracer.spans()
+
+    self.assertTrue(spans)
+    self.assertEqual(1, len(set(span.operation_id for span in spans)))
+    for span in spans:
+      self.assertEqual(test_trace_id, span.trace_id)
+      self.assertLessEqual(span.start, span.end)
+    stages = [span.stage for span in spans]
+    self.assertEqual(2, stages.count(tracing.Stage.OPERATION))
+    for stage in (
+        tracing.Stage.TRANSMISSION_QUEUE, tracing.Stage.TRANSMISSION,
+        tracing.Stage.INGESTION_QUEUE, tracing.Stage.HANDLER):
+      self.assertIn(stage, stages)
+    self.assertEqual([], self.tracer.spans())
+
+  def testTraceIdMadeWhenNoneGiven(self):
+    test_consumer = stream_testing.TestConsumer()
+    subscription = util.full_serviced_subscription(
+        interfaces_test_case.EasyServicedIngestor(test_consumer))
+
+    self.front.operate(
+        interfaces_test_case.ASYNCHRONOUS_ECHO, 'test payload', True,
+        interfaces_test_case.SMALL_TIMEOUT, subscription, None)
+    util.wait_for_idle(self.front)
+    util.wait_for_idle(self.back)
+    trace_ids = set(span.trace_id for span in self.tracer.spans())
+
+    self.assertEqual(1, len(trace_ids))
+    self.assertIsInstance(trace_ids.pop(), uuid.UUID)
+
 
 if __name__ == '__main__':
   unittest.main()
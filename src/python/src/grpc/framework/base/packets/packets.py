@@ -87,6 +87,7 @@ class FrontToBackPacket(
       to request time extensions (or even time reductions!) on in-progress
       operations.
   """
+  __slots__ = ()
 
 
 class BackToFrontPacket(
@@ -109,3 +110,4 @@ class BackToFrontPacket(
       kind is Kind.EXPIRATION, Kind.SERVICER_FAILURE, Kind.RECEPTION_FAILURE, or
       Kind.TRANSMISSION_FAILURE.
   """
+  __slots__ = ()
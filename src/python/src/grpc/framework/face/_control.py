@@ -196,3 +196,7 @@ def abortion_outcome_to_exception(abortion_outcome):
 
 def as_operation_termination_callback(rpc_abortion_callback):
   return _as_operation_termination_callback(rpc_abortion_callback)
+
+
+def operation_outcome_to_abortion(operation_outcome):
+  return _OPERATION_OUTCOME_TO_RPC_ABORTION.get(operation_outcome, None)
@@ -0,0 +1,148 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Behaviors for intercepting the RPCs of selected methods."""
+
+import threading
+import time
+
+# base_interfaces and interfaces are referenced from specification in this
+# module.
+from grpc.framework.base import interfaces as base_interfaces  # pylint: disable=unused-import
+from grpc.framework.face import _control
+from grpc.framework.face import interfaces  # pylint: disable=unused-import
+from grpc.framework.foundation import callable_util
+
+_BEFORE_EXCEPTION_LOG_MESSAGE = 'Exception calling interceptor before RPC!'
+_AFTER_EXCEPTION_LOG_MESSAGE = 'Exception calling interceptor after RPC!'
+
+
+def chain(interceptors, name):
+  """Selects the interceptors that intercept an RPC method.
+
+  Args:
+    interceptors: A sequence of interfaces.Interceptors.
+    name: An RPC method name.
+
+  Returns:
+    A tuple of those of the given interfaces.Interceptors that intercept the
+      named RPC method, in the order given.
+  """
+  return tuple(
+      interceptor for interceptor in interceptors
+      if interceptor.intercepts(name))
+
+
+def commence(interceptor_chain, name):
+  """Calls interceptors as an RPC commences.
+
+  Args:
+    interceptor_chain: A nonempty tuple of interfaces.Interceptors as returned
+      from chain.
+    name: The RPC method name.
+
+  Returns:
+    A base_interfaces.OperationContext termination callback that calls the
+      interceptors after the RPC has terminated.
+  """
+  memos = tuple(
+      callable_util.call_logging_exceptions(
+          interceptor.before, _BEFORE_EXCEPTION_LOG_MESSAGE, name).return_value
+      for interceptor in interceptor_chain)
+  commencement_time = time.time()
+
+  def termination_callback(operation_outcome):
+    duration = time.time() - commencement_time
+    abortion = _control.operation_outcome_to_abortion(operation_outcome)
+    for interceptor, memo in reversed(zip(interceptor_chain, memos)):
+      callable_util.call_logging_exceptions(
+          interceptor.after, _AFTER_EXCEPTION_LOG_MESSAGE, name, memo,
+          duration, abortion)
+  return termination_callback
+
+
+def intercepted_method(interceptor_chain, name, method):
+  """Wraps an adapted service-side method in interception.
+
+  Args:
+    interceptor_chain: A nonempty tuple of interfaces.Interceptors as returned
+      from chain.
+    name: The RPC method name.
+    method: A callable accepting a response stream.Consumer and a
+      base_interfaces.OperationContext and returning a request stream.Consumer.
+
+  Returns:
+    A callable with the same signature as the given method.
+  """
+  def intercepting_method(output_consumer, context):
+    context.add_termination_callback(commence(interceptor_chain, name))
+    return method(output_consumer, context)
+  return intercepting_method
+
+
+class InterceptingFront(object):
+  """Wraps a base_interfaces.Front's operate method in interception."""
+
+  def __init__(self, front, interceptors, names):
+    """Constructor.
+
+    Args:
+      front: A base_interfaces.Front.
+      interceptors: A sequence of interfaces.Interceptors.
+      names: A sequence of the RPC method names expected to be invoked through
+        this object, the interceptor chains of which are selected during
+        construction. The chains of other methods are selected as they are
+        first invoked.
+    """
+    self._front = front
+    self._interceptors = tuple(interceptors)
+    self._lock = threading.Lock()
+    self._chains = {name: chain(self._interceptors, name) for name in names}
+
+  def _chain(self, name):
+    interceptor_chain = self._chains.get(name)
+    if interceptor_chain is None:
+      with self._lock:
+        interceptor_chain = self._chains.get(name)
+        if interceptor_chain is None:
+          interceptor_chain = chain(self._interceptors, name)
+          self._chains[name] = interceptor_chain
+    return interceptor_chain
+
+  def operate(self, name, payload, complete, timeout, subscription, trace_id):
+    """See base_interfaces.Front.operate for specification."""
+    interceptor_chain = self._chain(name)
+    if not interceptor_chain:
+      return self._front.operate(
+          name, payload, complete, timeout, subscription, trace_id)
+    termination_callback = commence(interceptor_chain, name)
+    operation = self._front.operate(
+        name, payload, complete, timeout, subscription, trace_id)
+    operation.context.add_termination_callback(termination_callback)
+    return operation
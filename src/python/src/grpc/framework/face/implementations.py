@@ -29,9 +29,12 @@
 
 """Entry points into the Face layer of RPC Framework."""
 
+import threading
+
 from grpc.framework.base import exceptions as _base_exceptions
 from grpc.framework.base import interfaces as base_interfaces
 from grpc.framework.face import _calls
+from grpc.framework.face import _interception
 from grpc.framework.face import _service
 from grpc.framework.face import exceptions
 from grpc.framework.face import interfaces
@@ -39,15 +42,33 @@ from grpc.framework.face import interfaces
 
 class _BaseServicer(base_interfaces.Servicer):
 
-  def __init__(self, methods, multi_method):
+  def __init__(self, methods, multi_method, interceptors):
     self._methods = methods
     self._multi_method = multi_method
+    self._interceptors = interceptors
+    self._multi_method_chains_lock = threading.Lock()
+    self._multi_method_chains = {}
+
+  def _multi_method_chain(self, name):
+    interceptor_chain = self._multi_method_chains.get(name)
+    if interceptor_chain is None:
+      with self._multi_method_chains_lock:
+        interceptor_chain = self._multi_method_chains.get(name)
+        if interceptor_chain is None:
+          interceptor_chain = _interception.chain(self._interceptors, name)
+          self._multi_method_chains[name] = interceptor_chain
+    return interceptor_chain
 
   def service(self, name, context, output_consumer):
     method = self._methods.get(name, None)
     if method is not None:
       return method(output_consumer, context)
     elif self._multi_method is not None:
+      if self._interceptors:
+        interceptor_chain = self._multi_method_chain(name)
+        if interceptor_chain:
+          context.add_termination_callback(
+              _interception.commence(interceptor_chain, name))
       try:
         return self._multi_method.service(name, output_consumer, context)
       except exceptions.NoSuchMethodError:
@@ -64,11 +85,11 @@ class _UnaryUnarySyncAsync(interfaces.UnaryUnarySyncAsync):
 
   def __call__(self, request, timeout):
     return _calls.blocking_value_in_value_out(
-        self._front, self._name, request, timeout, 'unused trace ID')
+        self._front, self._name, request, timeout, None)
 
   def async(self, request, timeout):
     return _calls.future_value_in_value_out(
-        self._front, self._name, request, timeout, 'unused trace ID')
+        self._front, self._name, request, timeout, None)
 
 
 class _StreamUnarySyncAsync(interfaces.StreamUnarySyncAsync):
@@ -80,11 +101,11 @@ class _StreamUnarySyncAsync(interfaces.StreamUnarySyncAsync):
 
   def __call__(self, request_iterator, timeout):
     return _calls.blocking_stream_in_value_out(
-        self._front, self._name, request_iterator, timeout, 'unused trace ID')
+        self._front, self._name, request_iterator, timeout, None)
 
   def async(self, request_iterator, timeout):
     return _calls.future_stream_in_value_out(
-        self._front, self._name, request_iterator, timeout, 'unused trace ID',
+        self._front, self._name, request_iterator, timeout, None,
         self._pool)
 
 
@@ -101,53 +122,53 @@ class _Stub(interfaces.Stub):
 
   def blocking_value_in_value_out(self, name, request, timeout):
     return _calls.blocking_value_in_value_out(
-        self._front, name, request, timeout, 'unused trace ID')
+        self._front, name, request, timeout, None)
 
   def future_value_in_value_out(self, name, request, timeout):
     return _calls.future_value_in_value_out(
-        self._front, name, request, timeout, 'unused trace ID')
+        self._front, name, request, timeout, None)
 
   def inline_value_in_stream_out(self, name, request, timeout):
     return _calls.inline_value_in_stream_out(
-        self._front, name, request, timeout, 'unused trace ID')
+        self._front, name, request, timeout, None)
 
   def blocking_stream_in_value_out(self, name, request_iterator, timeout):
     return _calls.blocking_stream_in_value_out(
-        self._front, name, request_iterator, timeout, 'unused trace ID')
+        self._front, name, request_iterator, timeout, None)
 
   def future_stream_in_value_out(self, name, request_iterator, timeout):
     return _calls.future_stream_in_value_out(
-        self._front, name, request_iterator, timeout, 'unused trace ID',
+        self._front, name, request_iterator, timeout, None,
         self._pool)
 
   def inline_stream_in_stream_out(self, name, request_iterator, timeout):
     return _calls.inline_stream_in_stream_out(
-        self._front, name, request_iterator, timeout, 'unused trace ID',
+        self._front, name, request_iterator, timeout, None,
         self._pool)
 
   def event_value_in_value_out(
       self, name, request, response_callback, abortion_callback, timeout):
     return _calls.event_value_in_value_out(
         self._front, name, request, response_callback, abortion_callback,
-        timeout, 'unused trace ID')
+        timeout, None)
 
   def event_value_in_stream_out(
       self, name, request, response_consumer, abortion_callback, timeout):
     return _calls.event_value_in_stream_out(
         self._front, name, request, response_consumer, abortion_callback,
-        timeout, 'unused trace ID')
+        timeout, None)
 
   def event_stream_in_value_out(
       self, name, response_callback, abortion_callback, timeout):
     return _calls.event_stream_in_value_out(
         self._front, name, response_callback, abortion_callback, timeout,
-        'unused trace ID')
+        None)
 
   def event_stream_in_stream_out(
       self, name, response_consumer, abortion_callback, timeout):
     return _calls.event_stream_in_stream_out(
         self._front, name, response_consumer, abortion_callback, timeout,
-        'unused trace ID')
+        None)
 
   def unary_unary_sync_async(self, name):
     return _UnaryUnarySyncAsync(self._front, name)
@@ -158,6 +179,7 @@ class _Stub(interfaces.Stub):
 
 def _aggregate_methods(
     pool,
+    method_pools,
     inline_value_in_value_out_methods,
     inline_value_in_stream_out_methods,
     inline_stream_in_value_out_methods,
@@ -177,7 +199,8 @@ def _aggregate_methods(
   def adapt_pooled_methods(adapted_methods, unadapted_methods, adaptation):
     if unadapted_methods is not None:
       for name, unadapted_method in unadapted_methods.iteritems():
-        adapted_methods[name] = adaptation(unadapted_method, pool)
+        adapted_methods[name] = adaptation(
+            unadapted_method, method_pools.get(name, pool))
 
   adapt_unpooled_methods(
       methods, inline_value_in_value_out_methods,
@@ -217,7 +240,9 @@ def servicer(
     event_value_in_stream_out_methods=None,
     event_stream_in_value_out_methods=None,
     event_stream_in_stream_out_methods=None,
-    multi_method=None):
+    multi_method=None,
+    method_pools=None,
+    interceptors=None):
   """Creates a base_interfaces.Servicer.
 
   The key sets of the passed dictionaries must be disjoint. It is guaranteed
@@ -244,12 +269,18 @@ def servicer(
     event_stream_in_stream_out_methods: A dictionary mapping method names to
       interfaces.EventStreamInStreamOutMethod implementations.
     multi_method: An implementation of interfaces.MultiMethod.
+    method_pools: A dictionary mapping method names to thread pools to be used
+      in place of pool by the implementations of those methods.
+    interceptors: A sequence of interfaces.Interceptors with which to intercept
+      the RPCs serviced by the returned servicer, or None. Each RPC method is
+      checked against the interceptors only once.
 
   Returns:
     A base_interfaces.Servicer that services RPCs via the given implementations.
   """
   methods = _aggregate_methods(
       pool,
+      {} if method_pools is None else method_pools,
       inline_value_in_value_out_methods,
       inline_value_in_stream_out_methods,
       inline_stream_in_value_out_methods,
@@ -259,7 +290,15 @@ def servicer(
       event_stream_in_value_out_methods,
       event_stream_in_stream_out_methods)
 
-  return _BaseServicer(methods, multi_method)
+  interceptors = () if interceptors is None else tuple(interceptors)
+  if interceptors:
+    for name, method in methods.items():
+      interceptor_chain = _interception.chain(interceptors, name)
+      if interceptor_chain:
+        methods[name] = _interception.intercepted_method(
+            interceptor_chain, name, method)
+
+  return _BaseServicer(methods, multi_method, interceptors)
 
 
 def server():
@@ -271,14 +310,22 @@ def server():
   return _Server()
 
 
-def stub(front, pool):
+def stub(front, pool, interceptors=None, names=()):
   """Creates an interfaces.Stub.
 
   Args:
     front: A base_interfaces.Front.
     pool: A futures.ThreadPoolExecutor.
+    interceptors: A sequence of interfaces.Interceptors with which to intercept
+      the RPCs invoked through the returned stub, or None. Each RPC method is
+      checked against the interceptors only once.
+    names: A sequence of the RPC method names expected to be invoked through
+      the returned stub. These are checked against the interceptors as the
+      stub is created; other methods are checked as they are first invoked.
 
   Returns:
     An interfaces.Stub that performs RPCs via the given base_interfaces.Front.
   """
+  if interceptors:
+    front = _interception.InterceptingFront(front, interceptors, names)
   return _Stub(front, pool)
@@ -420,6 +420,57 @@ class MultiMethod(object):
     raise NotImplementedError()
 
 
+class Interceptor(object):
+  """Observes the RPCs of the methods that it chooses to intercept.
+
+  Whether or not an Interceptor intercepts a method is asked once per method,
+  when a stub or servicer first encounters the method; RPCs of methods that no
+  Interceptor intercepts incur no cost from interception.
+  """
+  __metaclass__ = abc.ABCMeta
+
+  @abc.abstractmethod
+  def intercepts(self, name):
+    """Describes whether or not this Interceptor intercepts an RPC method.
+
+    Args:
+      name: An RPC method name.
+
+    Returns:
+      True if the before and after methods of this Interceptor should be called
+        for RPCs of the named method; False otherwise.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def before(self, name):
+    """Called as an RPC of an intercepted method commences.
+
+    Args:
+      name: The RPC method name.
+
+    Returns:
+      A value to be passed to this Interceptor's after method when the RPC
+        terminates.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def after(self, name, memo, duration, abortion):
+    """Called after an RPC of an intercepted method has terminated.
+
+    Args:
+      name: The RPC method name.
+      memo: The value returned from this Interceptor's before method for the
+        RPC.
+      duration: The length of time in seconds from the RPC's commencement to
+        its termination.
+      abortion: None if the RPC completed successfully or an Abortion value
+        indicating why the RPC was aborted.
+    """
+    raise NotImplementedError()
+
+
 class Server(object):
   """Specification of a running server that services RPCs."""
   __metaclass__ = abc.ABCMeta
@@ -72,16 +72,20 @@ class PauseFailControl(Control):
     """Pauses code under control while controlling code is in context."""
     with self._condition:
       self._paused = True
-    yield
-    with self._condition:
-      self._paused = False
-      self._condition.notify_all()
+    try:
+      yield
+    finally:
+      with self._condition:
+        self._paused = False
+        self._condition.notify_all()
 
   @contextlib.contextmanager
   def fail(self):
     """Fails code under control while controlling code is in context."""
     with self._condition:
       self._fail = True
-    yield
-    with self._condition:
-      self._fail = False
+    try:
+      yield
+    finally:
+      with self._condition:
+        self._fail = False
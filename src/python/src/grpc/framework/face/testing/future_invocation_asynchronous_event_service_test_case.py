@@ -183,6 +183,28 @@ class FutureInvocationAsynchronousEventServiceTestCase(
 
         test_messages.verify(second_request, second_response, self)
 
+  def testDoneCallbackUnaryRequestUnaryResponse(self):
+    for name, test_messages_sequence in (
+        self.digest.unary_unary_messages_sequences.iteritems()):
+      for test_messages in test_messages_sequence:
+        request = test_messages.request()
+        callback_futures = []
+        callback_called = threading.Event()
+
+        def callback(response_future):
+          callback_futures.append(response_future)
+          callback_called.set()
+
+        with self.control.pause():
+          response_future = self.stub.future_value_in_value_out(
+              name, request, _TIMEOUT)
+          response_future.add_done_callback(callback)
+        response = response_future.result()
+        callback_called.wait(_TIMEOUT)
+
+        test_messages.verify(request, response, self)
+        self.assertEqual([response_future], callback_futures)
+
   def testExpiredUnaryRequestUnaryResponse(self):
     for name, test_messages_sequence in (
         self.digest.unary_unary_messages_sequences.iteritems()):
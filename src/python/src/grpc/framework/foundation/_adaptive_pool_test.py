@@ -0,0 +1,101 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Tests for _framework.foundation.adaptive_pool."""
+
+import threading
+import time
+import unittest
+
+from grpc.framework.foundation import adaptive_pool
+
+_MAXIMUM_WORKERS = 4
+_MINIMUM_WORKERS = 1
+_IDLE_TIMEOUT = 0.2
+
+
+class AdaptivePoolTest(unittest.TestCase):
+
+  def testUpAndDown(self):
+    pool = adaptive_pool.pool(_MAXIMUM_WORKERS)
+    pool.shutdown(wait=True)
+
+    with adaptive_pool.pool(_MAXIMUM_WORKERS) as pool:
+      self.assertIsNotNone(pool)
+
+  def testTaskExecuted(self):
+    test_list = []
+
+    with adaptive_pool.pool(_MAXIMUM_WORKERS) as pool:
+      pool.submit(lambda: test_list.append(object())).result()
+
+    self.assertTrue(test_list)
+
+  def testException(self):
+    with adaptive_pool.pool(_MAXIMUM_WORKERS) as pool:
+      raised_exception = pool.submit(lambda: 1/0).exception()
+
+    self.assertIsNotNone(raised_exception)
+
+  def testGrowthAndReaping(self):
+    gate = threading.Event()
+    with adaptive_pool.pool(
+        _MAXIMUM_WORKERS, minimum_workers=_MINIMUM_WORKERS,
+        idle_timeout=_IDLE_TIMEOUT) as pool:
+      self.assertEqual(_MINIMUM_WORKERS, pool.gauges().workers)
+
+      futures = [
+          pool.submit(gate.wait) for _ in range(_MAXIMUM_WORKERS + 2)]
+      self.assertEqual(_MAXIMUM_WORKERS, pool.gauges().workers)
+      while 2 < pool.gauges().queue_depth:
+        time.sleep(_IDLE_TIMEOUT / 10)
+      self.assertEqual(2, pool.gauges().queue_depth)
+
+      gate.set()
+      for future in futures:
+        future.result()
+      time.sleep(_IDLE_TIMEOUT * 3)
+      gauges = pool.gauges()
+      self.assertEqual(_MINIMUM_WORKERS, gauges.workers)
+      self.assertEqual(0, gauges.queue_depth)
+      self.assertEqual(len(futures), gauges.submitted)
+
+  def testShutdownReleasesThreads(self):
+    thread_count = threading.active_count()
+
+    for _ in range(10):
+      pool = adaptive_pool.pool(_MAXIMUM_WORKERS, minimum_workers=2)
+      pool.submit(lambda: None).result()
+      pool.shutdown(wait=True)
+
+    self.assertEqual(thread_count, threading.active_count())
+
+
+if __name__ == '__main__':
+  unittest.main()
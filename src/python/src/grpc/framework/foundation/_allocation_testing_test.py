@@ -0,0 +1,75 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Tests for _framework.foundation.allocation_testing."""
+
+import unittest
+
+from grpc.framework.foundation import adaptive_pool
+from grpc.framework.foundation import allocation_testing
+
+_CALLS = 100
+_POOL_SIZE = 2
+
+
+class AllocationTestingTest(unittest.TestCase):
+
+  def testNoCosts(self):
+    costs = allocation_testing.measure(lambda: None, _CALLS)
+
+    self.assertEqual(allocation_testing.Costs(0, 0, 0), costs)
+
+  def testGarbage(self):
+    def behavior():
+      cycle = []
+      cycle.append(cycle)
+
+    costs = allocation_testing.measure(behavior, _CALLS)
+
+    self.assertEqual(1, costs.garbage)
+    self.assertEqual(0, costs.retained)
+
+  def testRetained(self):
+    store = []
+
+    costs = allocation_testing.measure(lambda: store.append([]), _CALLS)
+
+    self.assertEqual(0, costs.garbage)
+    self.assertEqual(1, costs.retained)
+
+  def testHandoffs(self):
+    with adaptive_pool.pool(_POOL_SIZE) as pool:
+      costs = allocation_testing.measure(
+          lambda: pool.submit(lambda: None).result(), _CALLS)
+
+    self.assertEqual(1, costs.handoffs)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,82 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Tests for _framework.foundation.bulkhead."""
+
+import threading
+import unittest
+
+from grpc.framework.foundation import bulkhead
+from grpc.framework.foundation import logging_pool
+
+_POOL_SIZE = 16
+
+
+class BulkheadTest(unittest.TestCase):
+
+  def setUp(self):
+    self.pool = logging_pool.pool(_POOL_SIZE)
+
+  def tearDown(self):
+    self.pool.shutdown(wait=True)
+
+  def testTaskExecuted(self):
+    test_bulkhead = bulkhead.bulkhead(self.pool, 2, 2)
+
+    self.assertEqual(3, test_bulkhead.submit(lambda: 3).result())
+    test_bulkhead.shutdown(wait=True)
+
+  def testException(self):
+    test_bulkhead = bulkhead.bulkhead(self.pool, 2, 2)
+
+    self.assertIsNotNone(test_bulkhead.submit(lambda: 1/0).exception())
+    test_bulkhead.shutdown(wait=True)
+
+  def testSaturation(self):
+    gate = threading.Event()
+    test_bulkhead = bulkhead.bulkhead(self.pool, 2, 1)
+
+    running_futures = [test_bulkhead.submit(gate.wait) for _ in range(2)]
+    queued_future = test_bulkhead.submit(lambda: 7)
+    with self.assertRaises(bulkhead.Saturated):
+      test_bulkhead.submit(lambda: 8)
+    saturation = test_bulkhead.saturation()
+    gate.set()
+
+    self.assertEqual(bulkhead.Saturation(2, 1, 1, 2, 1), saturation)
+    self.assertEqual(7, queued_future.result())
+    for running_future in running_futures:
+      running_future.result()
+    test_bulkhead.shutdown(wait=True)
+    self.assertEqual(
+        bulkhead.Saturation(0, 0, 1, 2, 1), test_bulkhead.saturation())
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,103 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Tests for grpc.framework.foundation.histogram."""
+
+import unittest
+
+from grpc.framework.foundation import histogram
+
+
+class HistogramTest(unittest.TestCase):
+
+  def testEmpty(self):
+    snapshot = histogram.Histogram().snapshot()
+
+    self.assertEqual(0, snapshot.count)
+    self.assertIsNone(snapshot.minimum)
+    self.assertIsNone(snapshot.maximum)
+    self.assertIsNone(snapshot.mean())
+    self.assertIsNone(snapshot.percentile(50))
+
+  def testSummary(self):
+    test_histogram = histogram.Histogram()
+    for value in (0.25, 0.5, 1.0, 4.0):
+      test_histogram.record(value)
+    snapshot = test_histogram.snapshot()
+
+    self.assertEqual(4, snapshot.count)
+    self.assertEqual(0.25, snapshot.minimum)
+    self.assertEqual(4.0, snapshot.maximum)
+    self.assertAlmostEqual(1.4375, snapshot.mean())
+
+  def testPercentilesWithinPrecision(self):
+    test_histogram = histogram.Histogram()
+    for value in range(1, 1001):
+      test_histogram.record(value / 1000.0)
+    snapshot = test_histogram.snapshot()
+
+    for percentile in (1, 50, 90, 99, 100):
+      expected = percentile / 100.0
+      estimate = snapshot.percentile(percentile)
+      self.assertLessEqual(estimate, expected)
+      self.assertLess(expected - estimate, expected * 0.02 + 1e-6)
+
+  def testSnapshotIsIndependent(self):
+    test_histogram = histogram.Histogram()
+    test_histogram.record(1.0)
+    snapshot = test_histogram.snapshot()
+    test_histogram.record(2.0)
+
+    self.assertEqual(1, snapshot.count)
+    self.assertEqual(1.0, snapshot.maximum)
+
+  def testMerge(self):
+    first_histogram = histogram.Histogram()
+    second_histogram = histogram.Histogram()
+    for value in (0.25, 0.5):
+      first_histogram.record(value)
+    for value in (1.0, 4.0):
+      second_histogram.record(value)
+    merged_histogram = histogram.Histogram()
+    merged_histogram.merge(first_histogram.snapshot())
+    merged_histogram.merge(second_histogram.snapshot())
+    merged_histogram.merge(histogram.Histogram().snapshot())
+    snapshot = merged_histogram.snapshot()
+
+    self.assertEqual(4, snapshot.count)
+    self.assertEqual(0.25, snapshot.minimum)
+    self.assertEqual(4.0, snapshot.maximum)
+    self.assertAlmostEqual(1.4375, snapshot.mean())
+    self.assertAlmostEqual(1.0, snapshot.percentile(75), delta=0.02)
+    with self.assertRaises(ValueError):
+      merged_histogram.merge(histogram.Histogram(resolution=1e-3).snapshot())
+
+
+if __name__ == '__main__':
+  unittest.main()
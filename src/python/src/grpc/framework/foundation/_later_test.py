@@ -147,5 +147,15 @@ class LaterTest(unittest.TestCase):
       self.assertTrue(callback_called[0])
       self.assertEqual(return_value, future_passed_to_callback_cell[0].result())
 
+  def test_daemon(self):
+    threads_before = set(threading.enumerate())
+    computation_future = later.later(TICK * 2, lambda: None, daemon=True)
+    timer_threads = set(threading.enumerate()) - threads_before
+    computation_future.cancel()
+
+    self.assertTrue(timer_threads)
+    for timer_thread in timer_threads:
+      self.assertTrue(timer_thread.daemon)
+
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,114 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Tests for grpc.framework.foundation.profiling."""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from grpc.framework.foundation import profiling
+
+_DURATION = 0.2
+_INTERVAL = 0.01
+
+
+def _attributed_spin(name, started, stopped):
+  profiling.attribute(name)
+  started.set()
+  while not stopped.is_set():
+    pass
+  profiling.unattribute()
+
+
+def _unattributed_spin(started, stopped):
+  started.set()
+  while not stopped.is_set():
+    pass
+
+
+class ProfilingTest(unittest.TestCase):
+
+  def testProfile(self):
+    test_name = 'test activity'
+    stopped = threading.Event()
+    attributed_started = threading.Event()
+    unattributed_started = threading.Event()
+    attributed_thread = threading.Thread(
+        target=_attributed_spin, args=(test_name, attributed_started, stopped))
+    unattributed_thread = threading.Thread(
+        target=_unattributed_spin, args=(unattributed_started, stopped))
+    attributed_thread.start()
+    unattributed_thread.start()
+    attributed_started.wait()
+    unattributed_started.wait()
+    try:
+      samples = profiling.profile(_DURATION, interval=_INTERVAL)
+    finally:
+      stopped.set()
+      attributed_thread.join()
+      unattributed_thread.join()
+
+    self.assertEqual([test_name], samples.keys())
+    stacks = samples[test_name]
+    self.assertLess(0, sum(stacks.itervalues()))
+    for stack in stacks:
+      self.assertIn('_attributed_spin', stack)
+      self.assertNotIn('_unattributed_spin', stack)
+
+  def testUnattributedThreadsAreNotSampled(self):
+    profiling.attribute('test activity')
+    profiling.unattribute()
+
+    self.assertEqual({}, profiling.profile(_INTERVAL, interval=_INTERVAL))
+
+  def testWriteFolded(self):
+    samples = {
+        'method b': {'f (a.py:1);g (a.py:5)': 3},
+        'method a': {'f (a.py:1)': 1, 'f (a.py:1);h (b.py:2)': 2},
+    }
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'folded')
+    try:
+      self.assertEqual(3, profiling.write_folded(samples, path))
+      with open(path) as folded_file:
+        lines = folded_file.read().splitlines()
+    finally:
+      shutil.rmtree(directory)
+
+    self.assertEqual(
+        ['method a;f (a.py:1) 1', 'method a;f (a.py:1);h (b.py:2) 2',
+         'method b;f (a.py:1);g (a.py:5) 3'],
+        lines)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,114 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Tests for _framework.foundation.scheduling_pool."""
+
+import threading
+import time
+import unittest
+
+from grpc.framework.foundation import scheduling_pool
+
+_POOL_SIZE = 16
+_LONG_DEADLINE = 60
+
+
+class SchedulingPoolTest(unittest.TestCase):
+
+  def setUp(self):
+    self.pool = scheduling_pool.pool(1, priority_ranks={'interactive': -1})
+    self.gate = threading.Event()
+    # Occupy the pool's only worker until the test opens the gate.
+    self.pool.submit(self.gate.wait)
+
+  def tearDown(self):
+    self.gate.set()
+    self.pool.shutdown(wait=True)
+
+  def testUpAndDown(self):
+    pool = scheduling_pool.pool(_POOL_SIZE)
+    pool.shutdown(wait=True)
+
+    with scheduling_pool.pool(_POOL_SIZE) as pool:
+      self.assertIsNotNone(pool)
+
+  def testTaskExecuted(self):
+    self.gate.set()
+    now = time.time()
+    self.assertEqual(
+        3, self.pool.schedule(now + _LONG_DEADLINE, None, lambda: 3).result())
+    self.assertEqual(4, self.pool.submit(lambda: 4).result())
+
+  def testException(self):
+    self.gate.set()
+    raised_exception = self.pool.submit(lambda: 1/0).exception()
+
+    self.assertIsNotNone(raised_exception)
+
+  def testEarliestDeadlineFirst(self):
+    order = []
+    now = time.time()
+    later_future = self.pool.schedule(
+        now + 2 * _LONG_DEADLINE, None, order.append, 'later')
+    sooner_future = self.pool.schedule(
+        now + _LONG_DEADLINE, None, order.append, 'sooner')
+    self.gate.set()
+    later_future.result()
+    sooner_future.result()
+
+    self.assertEqual(['sooner', 'later'], order)
+
+  def testPriorityBeforeDeadline(self):
+    order = []
+    now = time.time()
+    batch_future = self.pool.schedule(
+        now + _LONG_DEADLINE, 'batch', order.append, 'batch')
+    interactive_future = self.pool.schedule(
+        now + 2 * _LONG_DEADLINE, 'interactive', order.append, 'interactive')
+    self.gate.set()
+    batch_future.result()
+    interactive_future.result()
+
+    self.assertEqual(['interactive', 'batch'], order)
+
+  def testExpiredWorkDropped(self):
+    order = []
+    expired_future = self.pool.schedule(
+        time.time(), None, order.append, 'expired')
+    submitted_future = self.pool.submit(order.append, 'submitted')
+    time.sleep(0.01)
+    self.gate.set()
+    submitted_future.result()
+
+    self.assertTrue(expired_future.cancelled())
+    self.assertEqual(['submitted'], order)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -39,16 +39,20 @@ from grpc.framework.foundation import future
 class TimerFuture(future.Future):
   """A Future implementation based around Timer objects."""
 
-  def __init__(self, compute_time, computation):
+  def __init__(self, compute_time, computation, daemon=False):
     """Constructor.
 
     Args:
       compute_time: The time after which to begin this future's computation.
       computation: The computation to be performed within this Future.
+      daemon: Whether or not the timer thread should be a daemon thread, which
+        does not keep the interpreter from exiting while the computation is
+        pending.
     """
     self._lock = threading.Lock()
     self._compute_time = compute_time
     self._computation = computation
+    self._daemon = daemon
     self._timer = None
     self._computing = False
     self._computed = False
@@ -58,6 +62,11 @@ class TimerFuture(future.Future):
     self._traceback = None
     self._waiting = []
 
+  def _start_timer(self, interval):
+    self._timer = threading.Timer(interval, self._compute)
+    self._timer.daemon = self._daemon
+    self._timer.start()
+
   def _compute(self):
     """Performs the computation embedded in this Future.
 
@@ -66,8 +75,7 @@ class TimerFuture(future.Future):
     with self._lock:
       time_remaining = self._compute_time - time.time()
       if 0 < time_remaining:
-        self._timer = threading.Timer(time_remaining, self._compute)
-        self._timer.start()
+        self._start_timer(time_remaining)
         return
       else:
         self._computing = True
@@ -98,9 +106,7 @@ class TimerFuture(future.Future):
     This must be called exactly once, immediately after construction.
     """
     with self._lock:
-      self._timer = threading.Timer(
-          self._compute_time - time.time(), self._compute)
-      self._timer.start()
+      self._start_timer(self._compute_time - time.time())
 
   def cancel(self):
     """See future.Future.cancel for specification."""
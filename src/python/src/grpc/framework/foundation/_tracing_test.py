@@ -0,0 +1,126 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Tests for grpc.framework.foundation.tracing."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import uuid
+
+from grpc.framework.foundation import tracing
+
+
+class TracingTest(unittest.TestCase):
+
+  def testNullTracer(self):
+    trace = tracing.NULL_TRACER.trace(uuid.uuid4(), object())
+    trace.record(tracing.Stage.HANDLER, 0, 1)
+
+    self.assertFalse(trace.sampled)
+    self.assertEqual([], tracing.NULL_TRACER.spans())
+
+  def testSampling(self):
+    never = tracing.tracer(0)
+    always = tracing.tracer(1)
+    half = tracing.tracer(0.5)
+    trace_ids = [uuid.uuid4() for _ in range(1000)]
+
+    self.assertFalse(any(
+        never.trace(trace_id, None).sampled for trace_id in trace_ids))
+    self.assertTrue(all(
+        always.trace(trace_id, None).sampled for trace_id in trace_ids))
+    sampled = [half.trace(trace_id, None).sampled for trace_id in trace_ids]
+    self.assertLess(300, sampled.count(True))
+    self.assertLess(300, sampled.count(False))
+    self.assertEqual(
+        sampled,
+        [tracing.tracer(0.5).trace(trace_id, object()).sampled
+         for trace_id in trace_ids])
+
+  def testSpans(self):
+    tracer = tracing.tracer(1)
+    trace = tracer.trace('test trace ID', 'test operation ID')
+
+    trace.record(tracing.Stage.HANDLER, 3, 4)
+    trace.finish(tracing.Stage.READ)
+    trace.start(tracing.Stage.WRITE)
+    trace.finish(tracing.Stage.WRITE)
+    spans = tracer.spans()
+
+    self.assertEqual(
+        [tracing.Stage.HANDLER, tracing.Stage.WRITE],
+        [span.stage for span in spans])
+    self.assertEqual(
+        tracing.Span(
+            'test trace ID', 'test operation ID', tracing.Stage.HANDLER, 3, 4),
+        spans[0])
+    self.assertLessEqual(spans[1].start, spans[1].end)
+    self.assertEqual([], tracer.spans())
+
+  def testCapacity(self):
+    tracer = tracing.tracer(1, capacity=3)
+    trace = tracer.trace(None, 'test operation ID')
+
+    for start in range(5):
+      trace.record(tracing.Stage.HANDLER, start, start + 1)
+
+    self.assertEqual([2, 3, 4], [span.start for span in tracer.spans()])
+
+  def testFlush(self):
+    tracer = tracing.tracer(1)
+    trace = tracer.trace('test trace ID', 'test operation ID')
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'spans')
+    try:
+      trace.record(tracing.Stage.SERIALIZATION, 1, 2)
+      self.assertEqual(1, tracer.flush(path))
+      trace.record(tracing.Stage.DESERIALIZATION, 3, 4)
+      self.assertEqual(1, tracer.flush(path))
+      self.assertEqual(0, tracer.flush(path))
+
+      with open(path) as span_file:
+        lines = [json.loads(line) for line in span_file]
+    finally:
+      shutil.rmtree(directory)
+
+    self.assertEqual(
+        [tracing.Stage.SERIALIZATION.value,
+         tracing.Stage.DESERIALIZATION.value],
+        [line['stage'] for line in lines])
+    self.assertEqual('test trace ID', lines[0]['trace_id'])
+    self.assertEqual('test operation ID', lines[0]['operation_id'])
+    self.assertEqual(1, lines[0]['start'])
+    self.assertEqual(4, lines[1]['end'])
+
+
+if __name__ == '__main__':
+  unittest.main()
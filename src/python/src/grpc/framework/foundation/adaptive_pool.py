@@ -0,0 +1,255 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""A thread pool that grows and shrinks with its load."""
+
+import abc
+import collections
+import logging
+import threading
+import time
+
+from concurrent import futures
+
+_DEFAULT_IDLE_TIMEOUT = 60
+_SATURATION_WARNING_INTERVAL = 10
+# The weight given to each newly-observed wait time in the pool's moving
+# average of wait times.
+_WAIT_TIME_WEIGHT = 0.1
+
+
+class Gauges(
+    collections.namedtuple(
+        'Gauges',
+        ('workers', 'idle_workers', 'queue_depth', 'wait_time', 'submitted'))):
+  """A snapshot of the load on an AdaptivePool.
+
+  Attributes:
+    workers: The number of worker threads in the pool.
+    idle_workers: The number of worker threads in the pool waiting for work.
+    queue_depth: The number of tasks waiting for a worker thread.
+    wait_time: A moving average of the length of time in seconds that tasks
+      have waited for a worker thread.
+    submitted: The number of tasks submitted to the pool since its creation.
+  """
+
+
+class AdaptivePool(futures.Executor):
+  """A futures.Executor that adapts its number of threads to its load.
+
+  The pool keeps at least its minimum number of worker threads alive, spawns
+  further threads up to its maximum as work arrives faster than it can be
+  run, and lets threads beyond its minimum exit after they have been idle for
+  a while. Exceptions raised by tasks run in the pool are logged.
+  """
+  __metaclass__ = abc.ABCMeta
+
+  @abc.abstractmethod
+  def gauges(self):
+    """Reports the load on this pool.
+
+    Returns:
+      A Gauges describing the pool's current load.
+    """
+    raise NotImplementedError()
+
+
+class _Task(object):
+
+  def __init__(self, future, fn, args, kwargs, enqueue_time):
+    self.future = future
+    self.fn = fn
+    self.args = args
+    self.kwargs = kwargs
+    self.enqueue_time = enqueue_time
+
+  def run(self):
+    if not self.future.set_running_or_notify_cancel():
+      return
+    try:
+      result = self.fn(*self.args, **self.kwargs)
+    except BaseException as e:
+      logging.exception('Unexpected exception from task run in adaptive pool!')
+      self.future.set_exception(e)
+    else:
+      self.future.set_result(result)
+
+
+class _AdaptivePool(AdaptivePool):
+  """An implementation of AdaptivePool."""
+
+  def __init__(self, maximum_workers, minimum_workers, idle_timeout):
+    self._maximum_workers = maximum_workers
+    self._minimum_workers = minimum_workers
+    self._idle_timeout = idle_timeout
+
+    lock = threading.Lock()
+    # Worker threads wait on _condition; the reaper waits on _reaper_condition
+    # so that notifications meant for workers are never taken by the reaper.
+    self._condition = threading.Condition(lock)
+    self._reaper_condition = threading.Condition(lock)
+    self._queue = collections.deque()
+    self._threads = set()
+    self._idle = 0
+    self._least_idle = 0
+    self._retirements = 0
+    self._wait_time = 0.0
+    self._submitted = 0
+    self._last_saturation_warning = None
+    self._shutdown = False
+
+    with self._condition:
+      for _ in range(minimum_workers):
+        self._spawn()
+    self._reaper = threading.Thread(target=self._reap)
+    self._reaper.daemon = True
+    self._reaper.start()
+
+  def _spawn(self):
+    thread = threading.Thread(target=self._work)
+    thread.daemon = True
+    self._threads.add(thread)
+    thread.start()
+
+  def _next(self):
+    """Takes the next task to be run by the calling worker thread.
+
+    Returns:
+      The next _Task to be run, or None if the calling worker thread should
+        exit.
+    """
+    with self._condition:
+      while True:
+        if self._queue:
+          task = self._queue.popleft()
+          self._wait_time += _WAIT_TIME_WEIGHT * (
+              time.time() - task.enqueue_time - self._wait_time)
+          return task
+        elif self._shutdown or self._retirements:
+          if self._retirements:
+            self._retirements -= 1
+          self._threads.discard(threading.current_thread())
+          return None
+        else:
+          self._idle += 1
+          self._condition.wait()
+          self._idle -= 1
+          self._least_idle = min(self._least_idle, self._idle)
+
+  def _reap(self):
+    """Retires worker threads that have been idle for a whole idle timeout."""
+    with self._condition:
+      while True:
+        deadline = time.time() + self._idle_timeout
+        while not self._shutdown:
+          remaining = deadline - time.time()
+          if remaining <= 0:
+            break
+          self._reaper_condition.wait(remaining)
+        if self._shutdown:
+          return
+        self._retirements = max(
+            0, min(self._least_idle,
+                   len(self._threads) - self._minimum_workers))
+        self._least_idle = self._idle
+        if self._retirements:
+          self._condition.notify(self._retirements)
+
+  def _work(self):
+    while True:
+      task = self._next()
+      if task is None:
+        return
+      task.run()
+
+  def _warn_if_saturated(self, now):
+    if (len(self._threads) == self._maximum_workers and
+        self._idle < len(self._queue)):
+      if (self._last_saturation_warning is None or
+          _SATURATION_WARNING_INTERVAL <= now - self._last_saturation_warning):
+        self._last_saturation_warning = now
+        logging.warning(
+            'Thread pool saturated: %d workers busy with %d tasks waiting!',
+            self._maximum_workers, len(self._queue))
+
+  def submit(self, fn, *args, **kwargs):
+    """See futures.Executor.submit for specification."""
+    now = time.time()
+    task = _Task(futures.Future(), fn, args, kwargs, now)
+    with self._condition:
+      if self._shutdown:
+        raise RuntimeError('Cannot submit work after shutdown!')
+      self._queue.append(task)
+      self._submitted += 1
+      if (self._idle < len(self._queue) and
+          len(self._threads) < self._maximum_workers):
+        self._spawn()
+      else:
+        self._condition.notify()
+        self._warn_if_saturated(now)
+    return task.future
+
+  def gauges(self):
+    """See AdaptivePool.gauges for specification."""
+    with self._condition:
+      return Gauges(
+          len(self._threads), self._idle, len(self._queue), self._wait_time,
+          self._submitted)
+
+  def shutdown(self, wait=True):
+    """See futures.Executor.shutdown for specification."""
+    with self._condition:
+      self._shutdown = True
+      self._condition.notify_all()
+      self._reaper_condition.notify_all()
+      threads = list(self._threads)
+      threads.append(self._reaper)
+    if wait:
+      for thread in threads:
+        thread.join()
+
+
+def pool(maximum_workers, minimum_workers=0, idle_timeout=None):
+  """Creates an AdaptivePool.
+
+  Args:
+    maximum_workers: The maximum number of worker threads to allow the pool.
+    minimum_workers: The number of worker threads to spawn immediately and to
+      keep alive while the pool is idle.
+    idle_timeout: The length of time in seconds for which a worker thread in
+      excess of minimum_workers may be idle before it exits, or None for a
+      default length of time.
+
+  Returns:
+    An AdaptivePool that is also a futures.ThreadPoolExecutor-compatible
+      thread pool that logs exceptions raised by the tasks executed within it.
+  """
+  return _AdaptivePool(
+      maximum_workers, minimum_workers,
+      _DEFAULT_IDLE_TIMEOUT if idle_timeout is None else idle_timeout)
@@ -0,0 +1,102 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Utilities for testing the allocation and thread-handoff costs of code.
+
+Python 2 offers no count of the objects a piece of code allocates, so the costs
+measured here are the ones that can be observed: the objects left for the
+cycle collector (whose collections are what lengthen garbage collection
+pauses), the net growth in objects tracked by the collector (which catches
+leaks), and the tasks handed off to other threads through AdaptivePools.
+"""
+
+import collections
+import gc
+
+from grpc.framework.foundation import adaptive_pool
+
+_DEFAULT_WARM_UP_CALLS = 10
+
+
+class Costs(
+    collections.namedtuple('Costs', ('garbage', 'retained', 'handoffs'))):
+  """The mean costs of one call of a behavior.
+
+  Attributes:
+    garbage: The number of objects left unreachable but uncollected by
+      reference counting, to be reclaimed by the cycle collector.
+    retained: The net number of objects tracked by the cycle collector that
+      remained alive after the calls.
+    handoffs: The number of tasks submitted to AdaptivePools.
+  """
+
+
+def _submitted(pools):
+  return sum(pool.gauges().submitted for pool in pools)
+
+
+def measure(behavior, calls, warm_up_calls=_DEFAULT_WARM_UP_CALLS):
+  """Measures the costs of calling a behavior.
+
+  Handoffs are counted only for AdaptivePools in existence when measurement
+  begins, so the behavior should be measured against long-lived objects (such
+  as an activated stub and a started server) rather than objects created and
+  destroyed within each call. Automatic garbage collection is disabled while
+  the behavior is called.
+
+  Args:
+    behavior: A callable that accepts no arguments.
+    calls: The number of times to call the behavior while measuring.
+    warm_up_calls: The number of times to call the behavior before measuring,
+      so that caches and lazily-created objects are not counted.
+
+  Returns:
+    A Costs describing the mean costs of one call of the behavior.
+  """
+  for _ in range(warm_up_calls):
+    behavior()
+  pools = [
+      obj for obj in gc.get_objects()
+      if isinstance(obj, adaptive_pool.AdaptivePool)]
+  enabled = gc.isenabled()
+  gc.disable()
+  try:
+    gc.collect()
+    submitted = _submitted(pools)
+    tracked = len(gc.get_objects())
+    for _ in range(calls):
+      behavior()
+    handoffs = _submitted(pools) - submitted
+    garbage = gc.collect()
+    retained = len(gc.get_objects()) - tracked
+  finally:
+    if enabled:
+      gc.enable()
+  calls = float(calls)
+  return Costs(garbage / calls, retained / calls, handoffs / calls)
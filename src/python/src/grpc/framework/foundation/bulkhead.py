@@ -0,0 +1,179 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Bulkheads: bounded partitions of a shared thread pool."""
+
+import abc
+import collections
+import logging
+import threading
+
+from concurrent import futures
+
+
+class Saturated(Exception):
+  """Indicates that a bulkhead has no room in which to accept work."""
+
+
+class Saturation(
+    collections.namedtuple(
+        'Saturation',
+        ('running', 'queued', 'rejected', 'maximum_concurrency',
+         'maximum_queue_length'))):
+  """A snapshot of the saturation of a bulkhead.
+
+  Attributes:
+    running: The number of tasks being run by the bulkhead.
+    queued: The number of tasks waiting to be run by the bulkhead.
+    rejected: The number of tasks the bulkhead has refused since its creation.
+    maximum_concurrency: The largest number of tasks the bulkhead will run at
+      once.
+    maximum_queue_length: The largest number of tasks the bulkhead will hold
+      waiting to be run.
+  """
+
+
+class Bulkhead(futures.Executor):
+  """A futures.Executor-compatible partition of a thread pool.
+
+  A bulkhead runs at most a fixed number of tasks at once in its underlying
+  thread pool, holds at most a fixed number of further tasks waiting to be run,
+  and refuses tasks beyond those by raising Saturated from submit.
+  """
+  __metaclass__ = abc.ABCMeta
+
+  @abc.abstractmethod
+  def saturation(self):
+    """Reports the saturation of this bulkhead.
+
+    Returns:
+      A Saturation describing this bulkhead's current load.
+    """
+    raise NotImplementedError()
+
+
+class _Task(object):
+
+  def __init__(self, future, fn, args, kwargs):
+    self.future = future
+    self.fn = fn
+    self.args = args
+    self.kwargs = kwargs
+
+  def run(self):
+    if not self.future.set_running_or_notify_cancel():
+      return
+    try:
+      result = self.fn(*self.args, **self.kwargs)
+    except BaseException as e:
+      logging.exception('Unexpected exception from task run in bulkhead!')
+      self.future.set_exception(e)
+    else:
+      self.future.set_result(result)
+
+
+class _Bulkhead(Bulkhead):
+  """An implementation of Bulkhead."""
+
+  def __init__(self, pool, maximum_concurrency, maximum_queue_length):
+    self._pool = pool
+    self._maximum_concurrency = maximum_concurrency
+    self._maximum_queue_length = maximum_queue_length
+
+    self._condition = threading.Condition()
+    self._queue = collections.deque()
+    self._running = 0
+    self._rejected = 0
+    self._shutdown = False
+
+  def _run(self, task):
+    while True:
+      task.run()
+      with self._condition:
+        if self._queue:
+          task = self._queue.popleft()
+        else:
+          self._running -= 1
+          self._condition.notify_all()
+          return
+
+  def submit(self, fn, *args, **kwargs):
+    """See futures.Executor.submit for specification.
+
+    Raises:
+      Saturated: If this bulkhead has no room in which to accept the task.
+    """
+    task = _Task(futures.Future(), fn, args, kwargs)
+    with self._condition:
+      if self._shutdown:
+        raise RuntimeError('Cannot submit work after shutdown!')
+      elif self._running < self._maximum_concurrency:
+        self._running += 1
+      elif len(self._queue) < self._maximum_queue_length:
+        self._queue.append(task)
+        return task.future
+      else:
+        self._rejected += 1
+        raise Saturated()
+    self._pool.submit(self._run, task)
+    return task.future
+
+  def saturation(self):
+    """See Bulkhead.saturation for specification."""
+    with self._condition:
+      return Saturation(
+          self._running, len(self._queue), self._rejected,
+          self._maximum_concurrency, self._maximum_queue_length)
+
+  def shutdown(self, wait=True):
+    """Shuts down this bulkhead but not its underlying thread pool.
+
+    See futures.Executor.shutdown for specification.
+    """
+    with self._condition:
+      self._shutdown = True
+      if wait:
+        while self._running:
+          self._condition.wait()
+
+
+def bulkhead(pool, maximum_concurrency, maximum_queue_length):
+  """Creates a Bulkhead.
+
+  Args:
+    pool: The thread pool in which the created Bulkhead will run tasks. The
+      created Bulkhead does not take ownership of the pool.
+    maximum_concurrency: The largest number of tasks to run at once.
+    maximum_queue_length: The largest number of tasks to hold waiting to be
+      run.
+
+  Returns:
+    A Bulkhead.
+  """
+  return _Bulkhead(pool, maximum_concurrency, maximum_queue_length)
@@ -0,0 +1,156 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""A compact log-linear histogram after HdrHistogram."""
+
+import collections
+
+_DEFAULT_RESOLUTION = 1e-6
+# Values are bucketed with 2 ** _SUB_BUCKET_BITS sub-buckets per power of two,
+# bounding each recorded value's relative error to less than 2%.
+_SUB_BUCKET_BITS = 7
+_SUB_BUCKET_COUNT = 1 << _SUB_BUCKET_BITS
+_SUB_BUCKET_HALF_COUNT = _SUB_BUCKET_COUNT >> 1
+
+
+def _index(units):
+  shift = max(0, units.bit_length() - _SUB_BUCKET_BITS)
+  return (units >> shift) + shift * _SUB_BUCKET_HALF_COUNT
+
+
+def _lowest_units(index):
+  if index < _SUB_BUCKET_COUNT:
+    return index
+  else:
+    shift = (index - _SUB_BUCKET_HALF_COUNT) // _SUB_BUCKET_HALF_COUNT
+    return (index - shift * _SUB_BUCKET_HALF_COUNT) << shift
+
+
+class Snapshot(
+    collections.namedtuple(
+        'Snapshot',
+        ('count', 'total', 'minimum', 'maximum', 'resolution', 'buckets'))):
+  """An immutable view of a Histogram's recorded values.
+
+  Attributes:
+    count: The number of values recorded.
+    total: The sum of the values recorded.
+    minimum: The least value recorded, or None if no values were recorded.
+    maximum: The greatest value recorded, or None if no values were recorded.
+    resolution: The smallest distinguishable difference between values.
+    buckets: A dictionary from bucket index to the number of values recorded
+      in the bucket.
+  """
+
+  def mean(self):
+    """Computes the mean of the recorded values, or None if there are none."""
+    return self.total / self.count if self.count else None
+
+  def percentile(self, percentile):
+    """Estimates the value at a percentile of the recorded values.
+
+    Args:
+      percentile: A number between 0 and 100.
+
+    Returns:
+      A value no greater than the requested percentile of the recorded values
+        and within the histogram's precision of it, or None if no values were
+        recorded.
+    """
+    if not self.count:
+      return None
+    target = max(1, int(round(self.count * percentile / 100.0)))
+    seen = 0
+    for index in sorted(self.buckets):
+      seen += self.buckets[index]
+      if target <= seen:
+        return max(self.minimum, _lowest_units(index) * self.resolution)
+    return self.maximum
+
+
+class Histogram(object):
+  """A histogram of nonnegative values with bounded relative error.
+
+  Histograms are not thread-safe; callers must synchronize access to them.
+  """
+
+  def __init__(self, resolution=_DEFAULT_RESOLUTION):
+    """Constructor.
+
+    Args:
+      resolution: The smallest distinguishable difference between values.
+    """
+    self._resolution = resolution
+    self._buckets = collections.defaultdict(int)
+    self._count = 0
+    self._total = 0
+    self._minimum = None
+    self._maximum = None
+
+  def record(self, value):
+    """Records a value.
+
+    Args:
+      value: A nonnegative number.
+    """
+    self._buckets[_index(int(value / self._resolution))] += 1
+    self._count += 1
+    self._total += value
+    if self._minimum is None or value < self._minimum:
+      self._minimum = value
+    if self._maximum is None or self._maximum < value:
+      self._maximum = value
+
+  def merge(self, snapshot):
+    """Records all the values recorded in a Snapshot.
+
+    Args:
+      snapshot: A Snapshot taken of a Histogram with the same resolution as
+        this Histogram.
+
+    Raises:
+      ValueError: If the Snapshot's resolution differs from this Histogram's.
+    """
+    if snapshot.resolution != self._resolution:
+      raise ValueError('Cannot merge histograms of different resolutions!')
+    if snapshot.count:
+      for index, count in snapshot.buckets.iteritems():
+        self._buckets[index] += count
+      self._count += snapshot.count
+      self._total += snapshot.total
+      if self._minimum is None or snapshot.minimum < self._minimum:
+        self._minimum = snapshot.minimum
+      if self._maximum is None or self._maximum < snapshot.maximum:
+        self._maximum = snapshot.maximum
+
+  def snapshot(self):
+    """Takes a Snapshot of the values recorded so far."""
+    return Snapshot(
+        self._count, self._total, self._minimum, self._maximum,
+        self._resolution, dict(self._buckets))
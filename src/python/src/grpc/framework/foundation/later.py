@@ -34,7 +34,7 @@ import time
 from grpc.framework.foundation import _timer_future
 
 
-def later(delay, computation):
+def later(delay, computation, daemon=False):
   """Schedules later execution of a callable.
 
   Args:
@@ -42,10 +42,13 @@ def later(delay, computation):
       to allow to pass before beginning the computation. No guarantees are made
       about the maximum length of time that will pass.
     computation: A callable that accepts no arguments.
+    daemon: Whether or not the pending computation may be abandoned if the
+      interpreter exits before it begins.
 
   Returns:
     A Future representing the scheduled computation.
   """
-  timer_future = _timer_future.TimerFuture(time.time() + delay, computation)
+  timer_future = _timer_future.TimerFuture(
+      time.time() + delay, computation, daemon=daemon)
   timer_future.start()
   return timer_future
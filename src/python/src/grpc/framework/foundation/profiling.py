@@ -0,0 +1,130 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Sampling of the stacks of threads doing work attributed to activities.
+
+Threads attribute the work they are doing to a named activity (such as an RPC
+method) by calling attribute and unattribute around it. While profile is
+running it periodically samples the stacks of all threads with a current
+attribution and aggregates them, by activity, as folded stacks suitable for
+rendering as flame graphs.
+"""
+
+import collections
+import sys
+import thread
+import time
+
+_DEFAULT_INTERVAL = 0.01
+
+# Dictionary from thread identifier to the name of the activity to which that
+# thread's current work is attributed. Single dictionary operations are atomic,
+# so attribution takes no lock.
+_ATTRIBUTIONS = {}
+
+
+def attribute(name):
+  """Attributes the calling thread's current work to an activity.
+
+  Args:
+    name: The name of the activity.
+  """
+  _ATTRIBUTIONS[thread.get_ident()] = name
+
+
+def unattribute():
+  """Ends the attribution of the calling thread's work to any activity."""
+  _ATTRIBUTIONS.pop(thread.get_ident(), None)
+
+
+def _label(frame):
+  code = frame.f_code
+  return '%s (%s:%d)' % (code.co_name, code.co_filename, code.co_firstlineno)
+
+
+def _folded_stack(frame):
+  labels = []
+  while frame is not None:
+    labels.append(_label(frame))
+    frame = frame.f_back
+  labels.reverse()
+  return ';'.join(labels)
+
+
+def profile(duration, interval=_DEFAULT_INTERVAL):
+  """Samples the stacks of threads doing attributed work.
+
+  This method blocks the calling thread for the given duration.
+
+  Args:
+    duration: The length of time in seconds for which to sample.
+    interval: The length of time in seconds between samples.
+
+  Returns:
+    A dictionary from activity name to a dictionary from folded stack (a string
+      of semicolon-separated frame descriptions, outermost first) to the number
+      of samples in which a thread doing work attributed to the activity was
+      found with that stack.
+  """
+  samples = collections.defaultdict(collections.Counter)
+  deadline = time.time() + duration
+  while True:
+    attributions = dict(_ATTRIBUTIONS)
+    if attributions:
+      frames = sys._current_frames()  # pylint: disable=protected-access
+      for thread_id, frame in frames.iteritems():
+        name = attributions.get(thread_id)
+        if name is not None:
+          samples[name][_folded_stack(frame)] += 1
+    remaining = deadline - time.time()
+    if remaining <= 0:
+      return {name: dict(stacks) for name, stacks in samples.iteritems()}
+    time.sleep(min(interval, remaining))
+
+
+def write_folded(samples, path):
+  """Writes sampled stacks to a file in the folded format of flame graph tools.
+
+  Each line of the file is the activity name followed by the frames of a stack,
+  all separated by semicolons, then a space and the number of samples.
+
+  Args:
+    samples: A dictionary of samples as returned by profile.
+    path: The path of the file to write.
+
+  Returns:
+    The number of lines written.
+  """
+  lines = 0
+  with open(path, 'w') as folded_file:
+    for name, stacks in sorted(samples.iteritems()):
+      for stack, count in sorted(stacks.iteritems()):
+        folded_file.write('%s;%s %d\n' % (name, stack, count))
+        lines += 1
+  return lines
@@ -0,0 +1,188 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""A thread pool that runs work in order of priority and deadline."""
+
+import abc
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+from concurrent import futures
+
+
+class SchedulingPool(futures.Executor):
+  """A futures.Executor that orders its work by priority and deadline.
+
+  Work is run in order of the rank of its priority class and then earliest
+  deadline first. Work submitted through submit is considered due immediately
+  and is never dropped; work scheduled through schedule is dropped (and its
+  future cancelled) if its deadline passes while it is waiting to be run.
+  """
+  __metaclass__ = abc.ABCMeta
+
+  @abc.abstractmethod
+  def schedule(self, deadline, priority_class, fn, *args, **kwargs):
+    """Schedules a callable to be run before a deadline.
+
+    Args:
+      deadline: The time in seconds since the epoch after which the callable
+        should no longer be started.
+      priority_class: The priority class of the work. May be None.
+      fn: The callable to run.
+      *args: Positional arguments to pass to the callable.
+      **kwargs: Keyword arguments to pass to the callable.
+
+    Returns:
+      A futures.Future representing the scheduled work. The future will be
+        cancelled if the work is dropped because its deadline passed.
+    """
+    raise NotImplementedError()
+
+
+class _Work(object):
+  """A unit of work waiting to be run."""
+
+  def __init__(self, future, droppable, deadline, fn, args, kwargs):
+    self.future = future
+    self.droppable = droppable
+    self.deadline = deadline
+    self.fn = fn
+    self.args = args
+    self.kwargs = kwargs
+
+  def run(self):
+    if not self.future.set_running_or_notify_cancel():
+      return
+    try:
+      result = self.fn(*self.args, **self.kwargs)
+    except BaseException as e:
+      logging.exception(
+          'Unexpected exception from task run in scheduling pool!')
+      self.future.set_exception(e)
+    else:
+      self.future.set_result(result)
+
+
+class _SchedulingPool(SchedulingPool):
+  """An implementation of SchedulingPool."""
+
+  def __init__(self, max_workers, priority_ranks):
+    self._max_workers = max_workers
+    self._priority_ranks = priority_ranks
+
+    self._condition = threading.Condition()
+    self._heap = []
+    self._sequence = itertools.count()
+    self._threads = []
+    self._idle = 0
+    self._shutdown = False
+
+  def _enqueue(self, droppable, deadline, priority_class, fn, args, kwargs):
+    rank = self._priority_ranks.get(priority_class, 0)
+    future = futures.Future()
+    work = _Work(future, droppable, deadline, fn, args, kwargs)
+    with self._condition:
+      if self._shutdown:
+        raise RuntimeError('Cannot schedule work after shutdown!')
+      heapq.heappush(self._heap, (rank, deadline, next(self._sequence), work))
+      if self._idle:
+        self._idle -= 1
+        self._condition.notify()
+      elif len(self._threads) < self._max_workers:
+        thread = threading.Thread(target=self._run)
+        thread.daemon = True
+        self._threads.append(thread)
+        thread.start()
+    return future
+
+  def _next(self):
+    """Takes the next work to be run, dropping expired work along the way.
+
+    Returns:
+      The next _Work to be run, or None if this pool has been shut down and
+        no work remains.
+    """
+    with self._condition:
+      while True:
+        if self._heap:
+          work = heapq.heappop(self._heap)[-1]
+          if work.droppable and work.deadline < time.time():
+            work.future.cancel()
+          else:
+            return work
+        elif self._shutdown:
+          return None
+        else:
+          self._idle += 1
+          self._condition.wait()
+
+  def _run(self):
+    while True:
+      work = self._next()
+      if work is None:
+        return
+      work.run()
+
+  def submit(self, fn, *args, **kwargs):
+    """See futures.Executor.submit for specification."""
+    return self._enqueue(False, time.time(), None, fn, args, kwargs)
+
+  def schedule(self, deadline, priority_class, fn, *args, **kwargs):
+    """See SchedulingPool.schedule for specification."""
+    return self._enqueue(True, deadline, priority_class, fn, args, kwargs)
+
+  def shutdown(self, wait=True):
+    """See futures.Executor.shutdown for specification."""
+    with self._condition:
+      self._shutdown = True
+      self._condition.notify_all()
+      threads = list(self._threads)
+    if wait:
+      for thread in threads:
+        thread.join()
+
+
+def pool(max_workers, priority_ranks=None):
+  """Creates a SchedulingPool.
+
+  Args:
+    max_workers: The maximum number of worker threads to allow the pool.
+    priority_ranks: A dictionary from priority class to integer rank, with work
+      of lower rank being run before work of higher rank. Priority classes
+      absent from the dictionary (including None) have rank zero.
+
+  Returns:
+    A SchedulingPool that is also a futures.ThreadPoolExecutor-compatible
+      thread pool.
+  """
+  return _SchedulingPool(
+      max_workers, {} if priority_ranks is None else dict(priority_ranks))
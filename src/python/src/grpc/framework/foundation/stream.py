@@ -35,6 +35,7 @@ import abc
 class Consumer(object):
   """Interface for consumers of finite streams of values or objects."""
   __metaclass__ = abc.ABCMeta
+  __slots__ = ()
 
   @abc.abstractmethod
   def consume(self, value):
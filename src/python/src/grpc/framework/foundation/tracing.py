@@ -0,0 +1,268 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Sampled recording of the timing of the stages of operations."""
+
+import abc
+import collections
+import enum
+import json
+import time
+
+_DEFAULT_CAPACITY = 65536
+_HASH_MASK = 0xffffffff
+
+
+@enum.unique
+class Stage(enum.Enum):
+  """The timed stages of an operation."""
+
+  OPERATION = 'operation'
+  TRANSMISSION_QUEUE = 'transmission queue'
+  TRANSMISSION = 'transmission'
+  SERIALIZATION = 'serialization'
+  WRITE = 'write'
+  READ = 'read'
+  DESERIALIZATION = 'deserialization'
+  INGESTION_QUEUE = 'ingestion queue'
+  HANDLER = 'handler'
+
+
+class Span(
+    collections.namedtuple(
+        'Span', ('trace_id', 'operation_id', 'stage', 'start', 'end'))):
+  """The timing of one stage of an operation.
+
+  Attributes:
+    trace_id: The identifier of the set of related operations to which the
+      operation belongs, or None.
+    operation_id: The identifier of the operation.
+    stage: The Stage that was timed.
+    start: The time at which the stage began, in seconds since the epoch.
+    end: The time at which the stage ended, in seconds since the epoch.
+  """
+
+
+class Trace(object):
+  """Records the Spans of a single operation.
+
+  Attributes:
+    sampled: Whether or not the operation was sampled. Callers may skip taking
+      timestamps for Traces that are not sampled.
+  """
+  __metaclass__ = abc.ABCMeta
+
+  @abc.abstractmethod
+  def record(self, stage, start, end):
+    """Records a stage of the operation.
+
+    Args:
+      stage: The Stage that was timed.
+      start: The time at which the stage began.
+      end: The time at which the stage ended.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def start(self, stage):
+    """Notes that a stage of the operation has begun.
+
+    Args:
+      stage: The Stage that has begun.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def finish(self, stage):
+    """Records a stage of the operation noted as begun with start.
+
+    Args:
+      stage: The Stage that has ended. Nothing is recorded if the stage was not
+        noted as having begun.
+    """
+    raise NotImplementedError()
+
+
+class Tracer(object):
+  """Samples operations and buffers the Spans of those sampled."""
+  __metaclass__ = abc.ABCMeta
+
+  @abc.abstractmethod
+  def trace(self, trace_id, operation_id):
+    """Creates a Trace for an operation.
+
+    The sampling decision is a deterministic function of the trace ID, or of
+    the operation ID if the trace ID is None. Fronts give a new trace ID to each
+    operation invoked without one and links carry it to the service side, so
+    Tracers with the same sampling rate make the same decision at every end of
+    such an operation and its Spans share its trace ID. Operations traced with
+    a trace ID of None are sampled independently at each end.
+
+    Args:
+      trace_id: The identifier of the set of related operations to which the
+        operation belongs, or None.
+      operation_id: The identifier of the operation.
+
+    Returns:
+      A Trace for the operation.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def spans(self):
+    """Removes and returns all buffered Spans.
+
+    Returns:
+      A list of Spans in the order in which they were recorded.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  def flush(self, path):
+    """Removes all buffered Spans and appends them to a file.
+
+    Each Span is written as one line of JSON.
+
+    Args:
+      path: The path of the file to which to append.
+
+    Returns:
+      The number of Spans written.
+    """
+    raise NotImplementedError()
+
+
+class _NullTrace(Trace):
+
+  sampled = False
+
+  def record(self, stage, start, end):
+    pass
+
+  def start(self, stage):
+    pass
+
+  def finish(self, stage):
+    pass
+
+
+class _NullTracer(Tracer):
+
+  def trace(self, trace_id, operation_id):
+    return NULL_TRACE
+
+  def spans(self):
+    return []
+
+  def flush(self, path):
+    return 0
+
+
+class _Trace(Trace):
+
+  sampled = True
+
+  def __init__(self, spans, trace_id, operation_id):
+    self._spans = spans
+    self._trace_id = trace_id
+    self._operation_id = operation_id
+    self._starts = {}
+
+  def record(self, stage, start, end):
+    self._spans.append(
+        Span(self._trace_id, self._operation_id, stage, start, end))
+
+  def start(self, stage):
+    self._starts[stage] = time.time()
+
+  def finish(self, stage):
+    start = self._starts.pop(stage, None)
+    if start is not None:
+      self.record(stage, start, time.time())
+
+
+def _line(span):
+  return json.dumps({
+      'trace_id': None if span.trace_id is None else str(span.trace_id),
+      'operation_id': str(span.operation_id),
+      'stage': span.stage.value,
+      'start': span.start,
+      'end': span.end,
+  })
+
+
+class _Tracer(Tracer):
+
+  def __init__(self, sampling_rate, capacity):
+    self._threshold = int(sampling_rate * (_HASH_MASK + 1))
+    # Appending to and popping from a bounded deque are atomic, so Spans are
+    # buffered without locking; the oldest are discarded when it is full.
+    self._spans = collections.deque(maxlen=capacity)
+
+  def trace(self, trace_id, operation_id):
+    key = operation_id if trace_id is None else trace_id
+    if hash(key) & _HASH_MASK < self._threshold:
+      return _Trace(self._spans, trace_id, operation_id)
+    else:
+      return NULL_TRACE
+
+  def spans(self):
+    spans = []
+    while True:
+      try:
+        spans.append(self._spans.popleft())
+      except IndexError:
+        return spans
+
+  def flush(self, path):
+    spans = self.spans()
+    if spans:
+      with open(path, 'a') as span_file:
+        for span in spans:
+          span_file.write(_line(span))
+          span_file.write('\n')
+    return len(spans)
+
+
+NULL_TRACE = _NullTrace()
+NULL_TRACER = _NullTracer()
+
+
+def tracer(sampling_rate, capacity=_DEFAULT_CAPACITY):
+  """Creates a Tracer.
+
+  Args:
+    sampling_rate: The fraction of operations to sample, between 0 and 1.
+    capacity: The largest number of Spans to buffer; once it is reached the
+      oldest buffered Spans are discarded as new Spans are recorded.
+
+  Returns:
+    A Tracer.
+  """
+  return _Tracer(sampling_rate, capacity)
@@ -0,0 +1,163 @@
+# Copyright 2015, Google Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     * Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following disclaimer
+# in the documentation and/or other materials provided with the
+# distribution.
+#     * Neither the name of Google Inc. nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Run performance benchmarks and compare their results with a baseline."""
+
+import collections
+import json
+import math
+import os
+import subprocess
+
+import jobset
+
+
+_RESULTS = '.run_benchmarks_results'
+# The baseline is checked in beside this file so that every checkout has one.
+_BASELINE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+
+# Each metric reported by a benchmark, and whether larger values are better.
+_METRICS = {
+    'ops_per_second': True,
+    'rpcs_per_second': True,
+    'events_per_second': True,
+    'messages_per_second': True,
+    'garbage_per_operation': False,
+    'handoffs_per_operation': False,
+    'gil_hold_seconds_per_rpc': False,
+    }
+
+
+class BenchmarkSpec(object):
+  """Specifies a benchmark that prints a JSON list of measurements."""
+
+  def __init__(self, name, cmdline, environ={}):
+    self.name = name
+    self.cmdline = cmdline
+    self.environ = environ
+
+
+def _key(name, measurement):
+  """Identify a measurement by its benchmark and its configuration."""
+  parameters = sorted(
+      '%s=%s' % (k, v) for k, v in measurement.iteritems()
+      if k not in _METRICS and isinstance(v, (basestring, int, long)))
+  return ' '.join([name] + parameters)
+
+
+def run(specs, runs):
+  """Run each benchmark several times, collecting the values of its metrics.
+
+  Returns a dictionary from measurement key to dictionary from metric name to
+  list of values, or None if any benchmark failed.
+  """
+  results = collections.defaultdict(lambda: collections.defaultdict(list))
+  for spec in specs:
+    env = os.environ.copy()
+    env.update(spec.environ)
+    for run_number in range(runs):
+      shortname = '%s [%d/%d]' % (spec.name, run_number + 1, runs)
+      jobset.message('START', shortname)
+      process = subprocess.Popen(
+          spec.cmdline, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+      stdout, stderr = process.communicate()
+      if process.returncode != 0:
+        jobset.message('FAILED', '%s [ret=%d]' % (
+            shortname, process.returncode), stderr)
+        return None
+      for measurement in json.loads(stdout):
+        metrics = results[_key(spec.name, measurement)]
+        for metric in _METRICS:
+          if metric in measurement:
+            metrics[metric].append(measurement[metric])
+      jobset.message('PASSED', shortname)
+  return results
+
+
+def _mean_and_deviation(values):
+  mean = sum(values) / float(len(values))
+  if len(values) < 2:
+    return mean, 0.0
+  variance = sum((v - mean) ** 2 for v in values) / (len(values) - 1)
+  return mean, math.sqrt(variance)
+
+
+def compare(baseline, results, threshold, noise):
+  """Find the metrics that regressed from the baseline.
+
+  A metric regresses when its mean worsens by more than threshold percent of
+  the baseline mean and also by more than noise times the combined standard
+  deviation of the baseline and current runs, so that a change within the
+  run-to-run variation of the machine is not reported.
+
+  Returns a list of human-readable descriptions of the regressions.
+  """
+  regressions = []
+  for key in sorted(results):
+    for metric, values in sorted(results[key].iteritems()):
+      baseline_values = baseline.get(key, {}).get(metric)
+      if not baseline_values:
+        continue
+      baseline_mean, baseline_deviation = _mean_and_deviation(baseline_values)
+      mean, deviation = _mean_and_deviation(values)
+      if baseline_mean == 0:
+        continue
+      change = 100.0 * (mean - baseline_mean) / abs(baseline_mean)
+      worsening = -change if _METRICS[metric] else change
+      spread = noise * math.sqrt(baseline_deviation ** 2 + deviation ** 2)
+      if worsening > threshold and abs(mean - baseline_mean) > spread:
+        regressions.append('%s: %s %.4g -> %.4g (%+.1f%%)' % (
+            key, metric, baseline_mean, mean, change))
+  return regressions
+
+
+def save_results(results):
+  with open(_RESULTS, 'w') as f:
+    f.write(json.dumps(results, indent=2, sort_keys=True))
+
+
+def baseline_path():
+  return _BASELINE
+
+
+def save_baseline(results):
+  """Record results as the baseline, keeping that of unrun benchmarks."""
+  baseline = maybe_load_baseline() or {}
+  baseline.update(results)
+  with open(_BASELINE, 'w') as f:
+    f.write(json.dumps(baseline, indent=2, sort_keys=True))
+    f.write('\n')
+
+
+def maybe_load_baseline():
+  if os.path.exists(_BASELINE):
+    with open(_BASELINE) as f:
+      return json.loads(f.read())
+  return None
@@ -95,6 +95,7 @@ _TAG_COLOR = {
     'PASSED': 'green',
     'START': 'gray',
     'WAITING': 'yellow',
+    'WARNING': 'yellow',
     'SUCCESS': 'green',
     'IDLE': 'gray',
     }
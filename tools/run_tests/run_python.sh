@@ -41,18 +41,34 @@ source python2.7_virtual_environment/bin/activate
 python2.7 -B test/compiler/python_plugin_test.py --build_mode=opt --port=40987
 python2.7 -B -m grpc._adapter._blocking_invocation_inline_service_test
 python2.7 -B -m grpc._adapter._c_test
+python2.7 -B -m grpc._adapter._common_test
 python2.7 -B -m grpc._adapter._event_invocation_synchronous_event_service_test
 python2.7 -B -m grpc._adapter._future_invocation_asynchronous_event_service_test
+python2.7 -B -m grpc._adapter._instrumentation_test
 python2.7 -B -m grpc._adapter._links_test
 python2.7 -B -m grpc._adapter._lonely_rear_link_test
 python2.7 -B -m grpc._adapter._low_test
+python2.7 -B -m grpc._adapter._proxy_test
+python2.7 -B -m grpc._adapter._ring_test
+python2.7 -B -m grpc._adapter._shared_memory_test
+python2.7 -B -m grpc.early_adopter._allocation_budget_test
+python2.7 -B -m grpc.early_adopter._in_process_test
+python2.7 -B -m grpc.early_adopter._lazy_test
 python2.7 -B -m grpc.early_adopter.implementations_test
 python2.7 -B -m grpc.framework.assembly.implementations_test
+python2.7 -B -m grpc.framework.base.packets._scale_test
 python2.7 -B -m grpc.framework.base.packets.implementations_test
 python2.7 -B -m grpc.framework.face.blocking_invocation_inline_service_test
 python2.7 -B -m grpc.framework.face.event_invocation_synchronous_event_service_test
 python2.7 -B -m grpc.framework.face.future_invocation_asynchronous_event_service_test
+python2.7 -B -m grpc.framework.foundation._adaptive_pool_test
+python2.7 -B -m grpc.framework.foundation._allocation_testing_test
+python2.7 -B -m grpc.framework.foundation._bulkhead_test
+python2.7 -B -m grpc.framework.foundation._histogram_test
 python2.7 -B -m grpc.framework.foundation._later_test
 python2.7 -B -m grpc.framework.foundation._logging_pool_test
+python2.7 -B -m grpc.framework.foundation._profiling_test
+python2.7 -B -m grpc.framework.foundation._scheduling_pool_test
+python2.7 -B -m grpc.framework.foundation._tracing_test
 # TODO(nathaniel): Get tests working under 3.4 (requires 3.X-friendly protobuf)
 # python3.4 -B -m unittest discover -s src/python -p '*.py'
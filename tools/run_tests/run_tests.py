@@ -40,6 +40,7 @@ import re
 import sys
 import time
 
+import benchmarks
 import jobset
 import watch_dirs
 
@@ -100,6 +101,9 @@ class CLanguage(object):
   def build_steps(self):
     return []
 
+  def benchmark_specs(self):
+    return []
+
 
 class NodeLanguage(object):
 
@@ -112,6 +116,9 @@ class NodeLanguage(object):
   def build_steps(self):
     return [['tools/run_tests/build_node.sh']]
 
+  def benchmark_specs(self):
+    return []
+
 
 class PhpLanguage(object):
 
@@ -124,6 +131,9 @@ class PhpLanguage(object):
   def build_steps(self):
     return [['tools/run_tests/build_php.sh']]
 
+  def benchmark_specs(self):
+    return []
+
 
 class PythonLanguage(object):
 
@@ -136,6 +146,18 @@ class PythonLanguage(object):
   def build_steps(self):
     return [['tools/run_tests/build_python.sh']]
 
+  def benchmark_specs(self):
+    return [
+        benchmarks.BenchmarkSpec(
+            'python framework',
+            ['tools/run_tests/run_python_benchmark.sh', 'framework',
+             '--operations', '500']),
+        benchmarks.BenchmarkSpec(
+            'python low',
+            ['tools/run_tests/run_python_benchmark.sh', 'low',
+             '--rpcs', '500']),
+        ]
+
 
 # different configurations we can run under
 _CONFIGS = {
@@ -183,6 +205,27 @@ argp.add_argument('-l', '--language',
                   choices=sorted(_LANGUAGES.keys()),
                   nargs='+',
                   default=sorted(_LANGUAGES.keys()))
+argp.add_argument('--benchmarks',
+                  default=False,
+                  action='store_const',
+                  const=True,
+                  help='run performance benchmarks instead of tests and '
+                  'compare their results with the stored baseline')
+argp.add_argument('--benchmark_runs', default=5, type=int,
+                  help='the number of times to run each benchmark')
+argp.add_argument('--benchmark_threshold', default=10.0, type=float,
+                  help='the percentage by which a metric must worsen to be '
+                  'reported as a regression')
+argp.add_argument('--benchmark_noise', default=2.0, type=float,
+                  help='the number of combined standard deviations by which '
+                  'a metric must worsen to be reported as a regression')
+argp.add_argument('--update_benchmark_baseline',
+                  default=False,
+                  action='store_const',
+                  const=True,
+                  help='store the results of this benchmark run as the '
+                  'baseline (tools/run_tests/benchmark_baseline.json, which '
+                  'is checked in) rather than comparing with it')
 args = argp.parse_args()
 
 # grab config
@@ -269,10 +312,56 @@ def _build_and_run(check_cancelled, newline_on_success, cache):
   return 0
 
 
+def _build_and_benchmark():
+  """Build, run the benchmarks, and compare them with the baseline."""
+  if not jobset.run(build_steps, maxjobs=1):
+    return 1
+
+  # benchmarks run one at a time so that they do not perturb one another
+  specs = [spec
+           for language in args.language
+           for spec in _LANGUAGES[language].benchmark_specs()
+           if re.search(args.regex, spec.name)]
+  results = benchmarks.run(specs, args.benchmark_runs)
+  if results is None:
+    return 2
+  benchmarks.save_results(results)
+
+  if args.update_benchmark_baseline:
+    benchmarks.save_baseline(results)
+    return 0
+  baseline = benchmarks.maybe_load_baseline()
+  if baseline is None:
+    jobset.message('FAILED', 'No benchmark baseline at %s; rerun with '
+                   '--update_benchmark_baseline to record one' %
+                   benchmarks.baseline_path(), do_newline=True)
+    return 4
+  unbaselined = sorted(key for key in results if key not in baseline)
+  if unbaselined:
+    jobset.message('WARNING', '%d measurements have no baseline' %
+                   len(unbaselined), '\n'.join(unbaselined), do_newline=True)
+  regressions = benchmarks.compare(baseline, results,
+                                   args.benchmark_threshold,
+                                   args.benchmark_noise)
+  if regressions:
+    jobset.message('FAILED', '%d benchmark regressions' % len(regressions),
+                   '\n'.join(regressions), do_newline=True)
+    return 3
+  return 0
+
+
 test_cache = TestCache(runs_per_test == 1)
 test_cache.maybe_load()
 
-if forever:
+if args.benchmarks:
+  result = _build_and_benchmark()
+  if result == 0:
+    jobset.message('SUCCESS', 'No benchmarks regressed', do_newline=True)
+  else:
+    jobset.message('FAILED', 'Benchmarks failed or regressed',
+                   do_newline=True)
+  sys.exit(result)
+elif forever:
   success = True
   while True:
     dw = watch_dirs.DirWatcher(['src', 'include', 'test'])